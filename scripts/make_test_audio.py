@@ -49,17 +49,16 @@ def generate_test_audio(
         modulation = (np.sin(2 * np.pi * am_freq * t[mask]) + 1) / 2
         speech_audio[mask] = tone * modulation * 0.5
 
-    # Sharp transients
+    # Sharp transients: one click shape scattered to every evenly spaced start
     transients = np.zeros_like(t)
-    for i in range(transient_count):
-        transient_time = duration / (transient_count + 1) * (i + 1)
-        idx = int(transient_time * sample_rate)
-        click_len = int(0.01 * sample_rate)  # 10ms
-        click = np.sin(2 * np.pi * 5000 * np.linspace(0, 0.01, click_len)) * np.exp(
-            -np.linspace(0, 10, click_len)
-        )
-        if idx + click_len < len(transients):
-            transients[idx : idx + click_len] = click * 0.8
+    click_len = int(0.01 * sample_rate)  # 10ms
+    click = np.sin(2 * np.pi * 5000 * np.linspace(0, 0.01, click_len)) * np.exp(
+        -np.linspace(0, 10, click_len)
+    )
+    transient_times = duration / (transient_count + 1) * np.arange(1, transient_count + 1)
+    starts = (transient_times * sample_rate).astype(int)
+    starts = starts[starts + click_len < len(transients)]
+    transients[np.add.outer(starts, np.arange(click_len))] = click * 0.8
 
     # Combine
     audio = pink_noise + speech_audio + transients
@@ -0,0 +1,65 @@
+"""Script to pre-render the SVG icons to PNG at the sizes the GUI uses."""
+
+import argparse
+import os
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QGuiApplication, QPainter, QPixmap
+from PySide6.QtSvg import QSvgRenderer
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+
+# Icon stem -> pixel sizes requested through ui_utils.load_svg_icon
+ICON_SIZES: dict[str, tuple[int, ...]] = {
+    "play": (24,),
+    "pause": (24,),
+    "stop": (32,),
+    "skipBack": (24,),
+    "skipForward": (24,),
+    "pointer": (24,),
+    "pencil": (24,),
+    "add": (24,),
+}
+
+
+def rasterize_icon(svg_path: Path, size: int) -> Path:
+    """Render ``svg_path`` to ``<stem>@<size>.png`` next to it.
+
+    Args:
+        svg_path: Source SVG file.
+        size: Width and height of the rendered image in pixels.
+
+    Returns:
+        Path to the written PNG.
+    """
+    renderer = QSvgRenderer(str(svg_path))
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    renderer.render(painter)
+    painter.end()
+    png_path = svg_path.with_name(f"{svg_path.stem}@{size}.png")
+    if not pixmap.save(str(png_path), "PNG"):
+        raise RuntimeError(f"Failed to write {png_path}")
+    return png_path
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Pre-render SVG icons to PNG")
+    parser.add_argument(
+        "--assets", type=Path, default=ASSETS_DIR, help="Assets directory (default: ./assets)"
+    )
+    args = parser.parse_args()
+
+    _app = QGuiApplication.instance() or QGuiApplication([])
+    for stem, sizes in ICON_SIZES.items():
+        for size in sizes:
+            print(f"Wrote {rasterize_icon(args.assets / f'{stem}.svg', size)}")
+
+
+if __name__ == "__main__":
+    main()
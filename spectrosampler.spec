@@ -5,7 +5,7 @@ a = Analysis(
     ['spectrosampler/gui/main.py'],
     pathex=[],
     binaries=[],
-    datas=[('spectrosampler/presets', 'presets')],
+    datas=[('spectrosampler/presets', 'presets'), ('assets', 'assets')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -6,9 +6,12 @@ import shlex
 import subprocess
 from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import soundfile as sf
+
 from spectrosampler.utils import compute_file_hash, ensure_dir
 
 
@@ -93,9 +96,13 @@ class AudioLoadAdvice:
     suggestion: str
 
 
+@lru_cache(maxsize=1)
 def check_ffmpeg() -> bool:
     """Check if FFmpeg is available in PATH.
 
+    The result is cached for the life of the process (installing FFmpeg already calls for
+    a restart); use ``check_ffmpeg.cache_clear()`` to probe again.
+
     Returns:
         True if ffmpeg is found, False otherwise.
     """
@@ -106,8 +113,52 @@ def check_ffmpeg() -> bool:
         return False
 
 
+# Bit depth of the uncompressed soundfile subtypes whose header metadata is exact
+_SOUNDFILE_BIT_DEPTHS = {
+    "PCM_S8": 8,
+    "PCM_U8": 8,
+    "PCM_16": 16,
+    "PCM_24": 24,
+    "PCM_32": 32,
+    "FLOAT": 32,
+    "DOUBLE": 64,
+}
+# soundfile major formats whose ffprobe format_name differs from the lowercased name
+_SOUNDFILE_FORMAT_NAMES = {"WAVEX": "wav", "RF64": "wav"}
+
+
+def _get_audio_info_soundfile(file_path: Path) -> dict | None:
+    """Read audio metadata from the file header with soundfile.
+
+    Args:
+        file_path: Path to audio file.
+
+    Returns:
+        Metadata in the same shape as get_audio_info, or None if soundfile cannot read the
+        file or its samples are lossy-compressed (ffprobe reports those more faithfully).
+    """
+    try:
+        info = sf.info(str(file_path))
+    except (RuntimeError, OSError, TypeError) as exc:
+        logging.debug("soundfile could not read %s: %s", file_path, exc, exc_info=exc)
+        return None
+    bit_depth = _SOUNDFILE_BIT_DEPTHS.get(info.subtype)
+    if bit_depth is None:
+        return None
+    return {
+        "duration": float(info.duration),
+        "sample_rate": int(info.samplerate),
+        "channels": int(info.channels),
+        "bit_depth": bit_depth,
+        "format": _SOUNDFILE_FORMAT_NAMES.get(info.format, info.format.lower()),
+    }
+
+
 def get_audio_info(file_path: Path) -> dict:
-    """Get audio file metadata using ffprobe.
+    """Get audio file metadata.
+
+    WAV, FLAC, AIFF and other files soundfile reads losslessly are inspected in-process;
+    everything else goes through ffprobe.
 
     Args:
         file_path: Path to audio file.
@@ -116,6 +167,10 @@ def get_audio_info(file_path: Path) -> dict:
         Dictionary with: duration (seconds), sample_rate (Hz), channels (int),
                           bit_depth (int), format (str).
     """
+    info = _get_audio_info_soundfile(file_path)
+    if info is not None:
+        return info
+
     cmd = [
         "ffprobe",
         "-v",
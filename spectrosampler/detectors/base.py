@@ -6,7 +6,7 @@ from typing import Any
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     """Represents a detected audio segment.
 
@@ -24,6 +24,11 @@ class Segment:
     score: float
     attrs: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Callers read and write attrs freely; never leave it None
+        if self.attrs is None:
+            self.attrs = {}
+
     def duration(self) -> float:
         """Return segment duration in seconds."""
         return self.end - self.start
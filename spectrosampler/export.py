@@ -51,9 +51,7 @@ def build_sample_filename(
         else:
             label = "multi"
     custom_name_fragment = ""
-    raw_custom_name = ""
-    if hasattr(segment, "attrs") and segment.attrs is not None:
-        raw_custom_name = str(segment.attrs.get("name", "")).strip()
+    raw_custom_name = str(segment.attrs.get("name", "")).strip()
     if raw_custom_name:
         sanitized_custom = sanitize_filename(raw_custom_name)
         # Replace whitespace and dot separators to keep the slug compact and extension-free.
@@ -94,6 +92,7 @@ def export_sample(
     bandpass_low_hz: float | None = None,
     bandpass_high_hz: float | None = None,
     metadata: dict[str, Any] | None = None,
+    source_duration: float | None = None,
 ) -> None:
     """Export a single sample segment.
 
@@ -103,12 +102,15 @@ def export_sample(
         segment: Segment to export.
         pre_pad_ms: Padding before segment start (milliseconds).
         post_pad_ms: Padding after segment end (milliseconds).
+        source_duration: Duration of ``input_path`` in seconds. Probed with ffprobe when
+            omitted; batch exports pass it to avoid one probe per sample.
 
     Raises:
         ValueError: If calculated times are invalid.
     """
-    info = get_audio_info(input_path)
-    total_dur = float(info.get("duration", 0.0))
+    if source_duration is None:
+        source_duration = float(get_audio_info(input_path).get("duration", 0.0))
+    total_dur = source_duration
     start_padded = max(0.0, segment.start - (pre_pad_ms / 1000.0))
     end_padded = min(total_dur, segment.end + (post_pad_ms / 1000.0))
     logging.debug(f"Exporting sample: {start_padded:.3f}s-{end_padded:.3f}s -> {output_path}")
@@ -1,14 +1,16 @@
 """Auto-save manager for periodic automatic saves."""
 
+import heapq
 import logging
+import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QObject, QThreadPool, QTimer, Signal
 
-from spectrosampler.gui.project import save_project
+from spectrosampler.gui.project import ProjectData, save_project
 
 logger = logging.getLogger(__name__)
 
@@ -28,11 +30,18 @@ class AutoSaveManager(QObject):
         super().__init__(parent)
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._on_timer_timeout)
+        # Timer-driven saves serialise and write on one worker thread so the GUI never waits
+        # on disk; a single thread keeps saves and cleanup ordered.
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
         self._autosave_dir = self._get_autosave_directory()
         self._autosave_dir.mkdir(parents=True, exist_ok=True)
         self._current_project_path: Path | None = None
         self._project_data_callback = None  # Callback to get current project data
         self._project_modified_callback = None  # Callback to check if project is modified
+        # Set by mark_dirty() on edits and cleared once a save captures them, so idle timer
+        # ticks return without collecting project data
+        self._dirty = False
 
     def _get_autosave_directory(self) -> Path:
         """Get auto-save directory path.
@@ -44,22 +53,44 @@ class AutoSaveManager(QObject):
         autosave_dir = temp_dir / "spectrosampler_autosave"
         return autosave_dir
 
+    def _scan_autosaves(self) -> list[tuple[float, str]]:
+        """Return ``(mtime, path)`` for every auto-save file, in directory order."""
+        # DirEntry answers is_file() from the directory listing and caches stat(), so each
+        # file costs at most one stat call
+        try:
+            with os.scandir(self._autosave_dir) as it:
+                entries = [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in it
+                    if entry.name.startswith("autosave_")
+                    and entry.name.endswith(".ssproj")
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+        except OSError as exc:
+            logger.debug("Failed to scan auto-save directory: %s", exc, exc_info=exc)
+            return []
+        return entries
+
     def get_autosave_files(self) -> list[Path]:
         """Get list of all auto-save files.
 
         Returns:
             List of auto-save file paths, sorted by modification time (newest first).
         """
-        if not self._autosave_dir.exists():
-            return []
+        return [Path(path) for _, path in sorted(self._scan_autosaves(), reverse=True)]
+
+    def get_newest_autosaves(self, count: int) -> list[Path]:
+        """Get the ``count`` most recent auto-save files without sorting the rest.
 
-        autosave_files = [
-            f
-            for f in self._autosave_dir.iterdir()
-            if f.is_file() and f.suffix == ".ssproj" and f.name.startswith("autosave_")
-        ]
-        autosave_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        return autosave_files
+        Args:
+            count: Number of files to return.
+
+        Returns:
+            Up to ``count`` auto-save file paths, newest first.
+        """
+        return [Path(path) for _, path in heapq.nlargest(count, self._scan_autosaves())]
 
     def start(self, interval_minutes: int = 5) -> None:
         """Start auto-save timer.
@@ -94,14 +125,27 @@ class AutoSaveManager(QObject):
         """
         self._project_modified_callback = callback
 
-    def save_now(self) -> bool:
+    def mark_dirty(self) -> None:
+        """Record that the project changed since the last auto-save."""
+        self._dirty = True
+
+    def save_now(self, background: bool = False) -> bool:
         """Immediately save current project if modified.
 
+        Project data is always collected on the calling (GUI) thread. With ``background`` the
+        file write and old auto-save cleanup run on the worker thread, and the result is
+        reported through ``autosave_completed`` / ``autosave_error``.
+
+        Args:
+            background: Write on the worker thread instead of blocking the caller.
+
         Returns:
-            True if save was successful, False otherwise.
+            True if save was successful (or, with ``background``, was queued), False otherwise.
         """
         if not self._project_data_callback:
             return False
+        if background and self._pool.activeThreadCount():
+            return False  # Previous auto-save still writing; stay dirty for the next tick
 
         # Check if project is modified
         if self._project_modified_callback:
@@ -116,6 +160,24 @@ class AutoSaveManager(QObject):
         if not project_data.audio_path:
             return False
 
+        # Edits made after this point mark the manager dirty again
+        self._dirty = False
+        if background:
+            self._pool.start(lambda: self._write_autosave(project_data))
+            return True
+        # A queued background save must not land after (and overwrite) this one
+        self._pool.waitForDone()
+        return self._write_autosave(project_data)
+
+    def _write_autosave(self, project_data: ProjectData) -> bool:
+        """Write ``project_data`` to a new auto-save file and prune old ones.
+
+        Args:
+            project_data: Project snapshot to write.
+
+        Returns:
+            True if save was successful, False otherwise.
+        """
         try:
             # Generate auto-save filename with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -125,12 +187,13 @@ class AutoSaveManager(QObject):
             save_project(project_data, autosave_path)
 
             # Clean up old auto-saves (keep last 3)
-            self.cleanup_old_autosaves(keep_count=3)
+            self._remove_old_autosaves(keep_count=3)
 
             logger.debug(f"Auto-save completed: {autosave_path}")
             self.autosave_completed.emit(autosave_path)
             return True
         except (OSError, ValueError) as exc:
+            self._dirty = True
             error_msg = f"Auto-save failed: {exc}"
             logger.error(error_msg, exc_info=exc)
             self.autosave_error.emit(error_msg)
@@ -138,22 +201,32 @@ class AutoSaveManager(QObject):
 
     def _on_timer_timeout(self) -> None:
         """Handle auto-save timer timeout."""
-        self.save_now()
+        if self._dirty:
+            self.save_now(background=True)
 
     def cleanup_old_autosaves(self, keep_count: int = 3) -> None:
         """Clean up old auto-save files, keeping only the most recent ones.
 
+        Waits for a background save in progress so it cannot recreate a file afterwards.
+
         Args:
             keep_count: Number of most recent auto-save files to keep.
         """
-        autosave_files = self.get_autosave_files()
+        self._pool.waitForDone()
+        self._remove_old_autosaves(keep_count)
 
-        if len(autosave_files) <= keep_count:
+    def _remove_old_autosaves(self, keep_count: int) -> None:
+        """Delete all but the ``keep_count`` newest auto-save files."""
+        entries = self._scan_autosaves()
+        if len(entries) <= keep_count:
             return
 
-        # Delete older files
-        files_to_delete = autosave_files[keep_count:]
-        for file_path in files_to_delete:
+        # Only the kept files need ranking; everything else is deleted in directory order
+        kept = {path for _, path in heapq.nlargest(keep_count, entries)}
+        for _, path in entries:
+            if path in kept:
+                continue
+            file_path = Path(path)
             try:
                 file_path.unlink()
                 logger.debug(f"Deleted old auto-save file: {file_path}")
@@ -164,8 +237,9 @@ class AutoSaveManager(QObject):
 
     def cleanup_all_autosaves(self) -> None:
         """Delete all auto-save files."""
-        autosave_files = self.get_autosave_files()
-        for file_path in autosave_files:
+        self._pool.waitForDone()
+        for _, path in self._scan_autosaves():
+            file_path = Path(path)
             try:
                 file_path.unlink()
                 logger.debug(f"Deleted auto-save file: {file_path}")
@@ -1,6 +1,7 @@
 """Detection settings dialog for processing parameters."""
 
 import logging
+import os
 from typing import Any
 
 from PySide6.QtCore import Qt
@@ -204,8 +205,6 @@ class DetectionDialog(QDialog):
         self._workers_spin = QSpinBox()
         self._workers_spin.setRange(1, 64)
         try:
-            import os
-
             default_workers = max(1, (os.cpu_count() or 4) - 1)
         except (ImportError, AttributeError, OSError, ValueError) as exc:
             logger.warning("Falling back to default worker count: %s", exc, exc_info=exc)
@@ -1,48 +1,28 @@
 """Detection manager for background sample detection."""
 
 import logging
-from concurrent.futures import CancelledError, Future
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QObject, Signal
 
 from spectrosampler.audio_io import FFmpegError
-from spectrosampler.gui.pipeline_wrapper import PipelineWrapper
+from spectrosampler.gui.pipeline_wrapper import (
+    PipelineWrapper,
+    create_detection_executor,
+    detection_worker_count,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class DetectionWorker(QThread):
-    """Legacy worker thread (unused when using process pool)."""
-
-    progress = Signal(str)
-    finished = Signal(dict)
-    error = Signal(object)
-
-    def __init__(self, pipeline_wrapper: PipelineWrapper, output_dir: Path | None = None):
-        super().__init__()
-        self.pipeline_wrapper = pipeline_wrapper
-        self.output_dir = output_dir
-        self._cancelled = False
-
-    def cancel(self) -> None:
-        self._cancelled = True
-
-    def run(self) -> None:
-        try:
-            self.progress.emit("Detecting samples...")
-            result = self.pipeline_wrapper.detect_samples(self.output_dir)
-            if not self._cancelled:
-                self.finished.emit(result)
-        except (FFmpegError, OSError, RuntimeError, ValueError) as exc:
-            logger.error("Detection error: %s", exc, exc_info=exc)
-            if not self._cancelled:
-                self.error.emit(exc)
-
-
 class DetectionManager(QObject):
-    """Manages detection processing in background thread."""
+    """Manages detection processing in a session-long process pool.
+
+    The pool outlives individual pipeline wrappers, so loading another file or re-running
+    detection reuses warm worker processes instead of spawning new ones.
+    """
 
     progress = Signal(str)  # Emitted with progress message
     finished = Signal(dict)  # Emitted with processing results
@@ -55,9 +35,12 @@ class DetectionManager(QObject):
             parent: Parent QObject.
         """
         super().__init__(parent)
-        self._worker: DetectionWorker | None = None
         self._future = None
+        # Cleared by the future's done callback so GUI polling never touches the future's lock
+        self._processing = False
         self._pipeline_wrapper: PipelineWrapper | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_workers = 0
 
     def set_pipeline_wrapper(self, pipeline_wrapper: PipelineWrapper) -> None:
         """Set pipeline wrapper.
@@ -85,13 +68,32 @@ class DetectionManager(QObject):
                 self.finished.emit(result)
 
             self._future = self._pipeline_wrapper.detect_samples_async(
-                output_dir=output_dir, callback=_cb
+                output_dir=output_dir,
+                callback=_cb,
+                executor=self._get_executor(self._pipeline_wrapper),
             )
+            self._processing = True
             self._future.add_done_callback(self._on_future_done)
         except (FFmpegError, OSError, RuntimeError, ValueError) as exc:
             logger.error("Detection start failed: %s", exc, exc_info=exc)
             self.error.emit(exc)
 
+    def _get_executor(self, pipeline_wrapper: PipelineWrapper) -> ProcessPoolExecutor:
+        """Return the shared pool, recreating it only if the worker count setting changed."""
+        workers = detection_worker_count(pipeline_wrapper.settings)
+        if self._executor is None or workers != self._executor_workers:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = create_detection_executor(workers)
+            self._executor_workers = workers
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; pending detections are cancelled."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
     def cancel_detection(self) -> None:
         """Cancel detection processing."""
         # ProcessPoolExecutor futures can't be easily cancelled once started; best-effort.
@@ -107,12 +109,12 @@ class DetectionManager(QObject):
         Returns:
             True if processing.
         """
-        if self._future is None:
-            return False
-        return not self._future.done()
+        return self._processing
 
     def _on_future_done(self, future: Future) -> None:
         """Inspect future completion and emit error if detection failed."""
+        if future is self._future:
+            self._processing = False
 
         if future.cancelled():
             logger.info("Detection future was cancelled.")
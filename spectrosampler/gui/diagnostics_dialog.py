@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import logging
+import os
 import platform
 import shutil
 import subprocess
 import sys
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from PySide6.QtGui import QColor
+from PySide6.QtCore import QCoreApplication, QThreadPool, Signal
+from PySide6.QtGui import QColor, QPalette, QShowEvent
 from PySide6.QtWidgets import (
+    QApplication,
     QDialog,
     QDialogButtonBox,
     QHBoxLayout,
@@ -26,9 +30,19 @@ except ImportError:  # pragma: no cover - handled gracefully in diagnostics
     QAudioDevice = None  # type: ignore[misc]
     QMediaDevices = None  # type: ignore[misc]
 
+logger = logging.getLogger(__name__)
+
 if TYPE_CHECKING:  # pragma: no cover
     from spectrosampler.gui.theme import ThemeManager
 
+# ``ffmpeg -version`` is a subprocess round trip; its answer only changes when the executable
+# on PATH is replaced, so it is keyed by path and modification time.
+_FFMPEG_VERSION_TIMEOUT_SEC = 5.0
+_ffmpeg_details_cache: tuple[tuple[str, int], FFmpegDiagnostics] | None = None
+# Audio devices are enumerated once and re-enumerated after Qt reports a device change.
+_audio_device_cache: dict[str, Any] | None = None
+_audio_device_watcher: QMediaDevices | None = None
+
 
 @dataclass(slots=True)
 class FFmpegDiagnostics:
@@ -43,6 +57,7 @@ class FFmpegDiagnostics:
 def _collect_ffmpeg_details() -> FFmpegDiagnostics:
     """Return FFmpeg availability and version information."""
 
+    global _ffmpeg_details_cache
     exe = shutil.which("ffmpeg")
     if not exe:
         return FFmpegDiagnostics(
@@ -51,12 +66,29 @@ def _collect_ffmpeg_details() -> FFmpegDiagnostics:
             executable=None,
         )
 
+    try:
+        key: tuple[str, int] | None = (exe, os.stat(exe).st_mtime_ns)
+    except OSError:
+        key = None
+    if key is not None and _ffmpeg_details_cache is not None and _ffmpeg_details_cache[0] == key:
+        return _ffmpeg_details_cache[1]
+
+    details = _probe_ffmpeg(exe)
+    if key is not None and details.available:
+        _ffmpeg_details_cache = (key, details)
+    return details
+
+
+def _probe_ffmpeg(exe: str) -> FFmpegDiagnostics:
+    """Run ``ffmpeg -version`` and summarise the result."""
+
     try:
         proc = subprocess.run(
             [exe, "-version"],
             capture_output=True,
             text=True,
             check=False,
+            timeout=_FFMPEG_VERSION_TIMEOUT_SEC,
         )
     except OSError as exc:  # pragma: no cover - defensive
         return FFmpegDiagnostics(
@@ -64,6 +96,12 @@ def _collect_ffmpeg_details() -> FFmpegDiagnostics:
             summary=f"Failed to launch FFmpeg: {exc}",
             executable=exe,
         )
+    except subprocess.TimeoutExpired:
+        return FFmpegDiagnostics(
+            available=False,
+            summary=f"FFmpeg did not respond within {_FFMPEG_VERSION_TIMEOUT_SEC:g} seconds.",
+            executable=exe,
+        )
 
     output = (proc.stdout or proc.stderr or "").strip()
     first_line = (
@@ -91,9 +129,18 @@ def _format_audio_device(device: QAudioDevice, *, default_id: bytes | None) -> d
     }
 
 
+def _invalidate_audio_device_cache() -> None:
+    """Forget cached audio device details so the next query re-enumerates them."""
+
+    global _audio_device_cache
+    _audio_device_cache = None
+
+
 def _collect_audio_device_details() -> dict[str, Any]:
     """Return details about audio input/output availability."""
 
+    global _audio_device_cache, _audio_device_watcher
+
     if QMediaDevices is None or QAudioDevice is None:
         return {
             "status": "unavailable",
@@ -103,8 +150,6 @@ def _collect_audio_device_details() -> dict[str, Any]:
         }
 
     # Qt requires an application instance; ensure one exists before probing.
-    from PySide6.QtCore import QCoreApplication
-
     if QCoreApplication.instance() is None:
         return {
             "status": "unavailable",
@@ -113,6 +158,9 @@ def _collect_audio_device_details() -> dict[str, Any]:
             "inputs": [],
         }
 
+    if _audio_device_cache is not None:
+        return _audio_device_cache
+
     try:
         default_output = QMediaDevices.defaultAudioOutput()
         default_input = QMediaDevices.defaultAudioInput()
@@ -134,18 +182,29 @@ def _collect_audio_device_details() -> dict[str, Any]:
             "inputs": [],
         }
 
-    return {
+    if _audio_device_watcher is None:
+        _audio_device_watcher = QMediaDevices()
+        _audio_device_watcher.audioOutputsChanged.connect(_invalidate_audio_device_cache)
+        _audio_device_watcher.audioInputsChanged.connect(_invalidate_audio_device_cache)
+    _audio_device_cache = {
         "status": "ok",
         "outputs": outputs,
         "inputs": inputs,
     }
+    return _audio_device_cache
 
 
-def collect_diagnostics_data() -> dict[str, Any]:
-    """Gather diagnostics details for display and testing."""
+def collect_diagnostics_data(audio_devices: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Gather diagnostics details for display and testing.
+
+    Args:
+        audio_devices: Audio device details already collected on the GUI thread. Collected
+            here when omitted.
+    """
 
     ffmpeg = _collect_ffmpeg_details()
-    audio_devices = _collect_audio_device_details()
+    if audio_devices is None:
+        audio_devices = _collect_audio_device_details()
 
     env = {
         "python": sys.version.split()[0],
@@ -167,70 +226,64 @@ def collect_diagnostics_data() -> dict[str, Any]:
     }
 
 
-def _build_summary_text(data: dict[str, Any]) -> str:
-    """Return a human-readable summary string for diagnostics."""
+def _iter_device_lines(title: str, devices: dict[str, Any], key: str) -> Iterator[str]:
+    """Yield the summary section for the ``key`` ("outputs" or "inputs") device list."""
 
-    lines: list[str] = []
-    ffmpeg: FFmpegDiagnostics = data["ffmpeg"]
+    yield ""
+    yield title
+    if devices.get("status") != "ok":
+        reason = devices.get("reason", "Audio device information unavailable.")
+        yield f"  Status: {devices.get('status', 'unavailable')}"
+        yield f"  Reason: {reason}"
+        return
+    entries: Iterable[dict[str, Any]] = devices.get(key, []) or []
+    if not entries:
+        yield "  None detected."
+        return
+    for device in entries:
+        default_marker = " (Default)" if device.get("is_default") else ""
+        yield f"  - {device.get('name', 'Unknown')}{default_marker}"
+        yield f"    {device.get('channels', '?')} channels @ {device.get('sample_rate', '?')} Hz"
+
+
+def _iter_summary_lines(data: dict[str, Any]) -> Iterator[str]:
+    """Yield the lines of the diagnostics summary."""
 
-    lines.append("FFmpeg")
-    status = "Available" if ffmpeg.available else "Unavailable"
-    lines.append(f"  Status: {status}")
-    lines.append(f"  Details: {ffmpeg.summary}")
+    ffmpeg: FFmpegDiagnostics = data["ffmpeg"]
+    yield "FFmpeg"
+    yield f"  Status: {'Available' if ffmpeg.available else 'Unavailable'}"
+    yield f"  Details: {ffmpeg.summary}"
     if ffmpeg.executable:
-        lines.append(f"  Executable: {ffmpeg.executable}")
+        yield f"  Executable: {ffmpeg.executable}"
     if ffmpeg.raw_output and ffmpeg.available:
-        lines.append("  Version Output:")
-        for line in ffmpeg.raw_output.splitlines():
-            lines.append(f"    {line}")
+        yield "  Version Output:"
+        yield from (f"    {line}" for line in ffmpeg.raw_output.splitlines())
 
-    lines.append("")
-    lines.append("Environment")
+    yield ""
+    yield "Environment"
     env: dict[str, Any] = data["environment"]
     for key in ("python", "pyside6", "platform", "executable"):
-        value = env.get(key, "unknown")
-        lines.append(f"  {key.capitalize()}: {value}")
+        yield f"  {key.capitalize()}: {env.get(key, 'unknown')}"
 
-    lines.append("")
-    lines.append("Audio Outputs")
     devices = data["audio_devices"]
-    outputs: Iterable[dict[str, Any]] = devices.get("outputs", []) or []
-    if devices.get("status") != "ok":
-        reason = devices.get("reason", "Audio device information unavailable.")
-        lines.append(f"  Status: {devices.get('status', 'unavailable')}")
-        lines.append(f"  Reason: {reason}")
-    elif not outputs:
-        lines.append("  None detected.")
-    else:
-        for device in outputs:
-            default_marker = " (Default)" if device.get("is_default") else ""
-            lines.append(f"  - {device.get('name', 'Unknown')}{default_marker}")
-            lines.append(
-                f"    {device.get('channels', '?')} channels @ {device.get('sample_rate', '?')} Hz"
-            )
-
-    inputs: Iterable[dict[str, Any]] = devices.get("inputs", []) or []
-    lines.append("")
-    lines.append("Audio Inputs")
-    if devices.get("status") != "ok":
-        reason = devices.get("reason", "Audio device information unavailable.")
-        lines.append(f"  Status: {devices.get('status', 'unavailable')}")
-        lines.append(f"  Reason: {reason}")
-    elif not inputs:
-        lines.append("  None detected.")
-    else:
-        for device in inputs:
-            default_marker = " (Default)" if device.get("is_default") else ""
-            lines.append(f"  - {device.get('name', 'Unknown')}{default_marker}")
-            lines.append(
-                f"    {device.get('channels', '?')} channels @ {device.get('sample_rate', '?')} Hz"
-            )
+    yield from _iter_device_lines("Audio Outputs", devices, "outputs")
+    yield from _iter_device_lines("Audio Inputs", devices, "inputs")
 
-    return "\n".join(lines)
+
+def _build_summary_text(data: dict[str, Any]) -> str:
+    """Return a human-readable summary string for diagnostics."""
+
+    return "\n".join(_iter_summary_lines(data))
 
 
 class DiagnosticsDialog(QDialog):
-    """Modal dialog that renders diagnostics information."""
+    """Modal dialog that renders diagnostics information.
+
+    Details are collected when the dialog is first shown. The FFmpeg probe runs on a worker
+    thread so the dialog appears immediately with a placeholder.
+    """
+
+    _data_ready = Signal(object)
 
     def __init__(self, parent: QDialog | None = None, *, theme_manager: ThemeManager | None = None):
         super().__init__(parent)
@@ -243,7 +296,10 @@ class DiagnosticsDialog(QDialog):
         self._text_area = QPlainTextEdit()
         self._text_area.setReadOnly(True)
         self._text_area.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self._text_area.setPlainText("Collecting diagnostics...")
         layout.addWidget(self._text_area)
+        self._collection_started = False
+        self._data_ready.connect(self._on_data_ready)
 
         buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         buttons.rejected.connect(self.reject)
@@ -262,12 +318,34 @@ class DiagnosticsDialog(QDialog):
         if theme_manager is not None:
             self._apply_theme(theme_manager)
 
-        self._refresh_contents()
+    def showEvent(self, event: QShowEvent) -> None:
+        """Start collecting diagnostics the first time the dialog is shown."""
+
+        super().showEvent(event)
+        if not self._collection_started:
+            self._collection_started = True
+            self._refresh_contents()
 
     def _refresh_contents(self) -> None:
         """Refresh the diagnostic information presented to the user."""
 
-        data = collect_diagnostics_data()
+        # Qt multimedia device queries stay on the GUI thread; only the FFmpeg probe and
+        # environment lookup move to the worker.
+        audio_devices = _collect_audio_device_details()
+        QThreadPool.globalInstance().start(lambda: self._collect_in_background(audio_devices))
+
+    def _collect_in_background(self, audio_devices: dict[str, Any]) -> None:
+        """Collect diagnostics on a worker thread and hand them back to the dialog."""
+
+        data = collect_diagnostics_data(audio_devices)
+        try:
+            self._data_ready.emit(data)
+        except RuntimeError as exc:  # dialog already destroyed
+            logger.debug("Diagnostics dialog closed before collection finished: %s", exc)
+
+    def _on_data_ready(self, data: dict[str, Any]) -> None:
+        """Render collected diagnostics."""
+
         self._text_area.setPlainText(_build_summary_text(data))
 
     def _copy_to_clipboard(self) -> None:
@@ -276,8 +354,6 @@ class DiagnosticsDialog(QDialog):
         text = self._text_area.toPlainText()
         if not text:
             return
-        from PySide6.QtWidgets import QApplication
-
         clipboard = QApplication.clipboard()
         clipboard.setText(text, mode=clipboard.Mode.Clipboard)
 
@@ -306,14 +382,22 @@ class DiagnosticsDialog(QDialog):
         secondary_hex = self._color_to_hex(palette_dict.get("background_secondary"), bg_hex)
         border_hex = self._color_to_hex(palette_dict.get("selection_border"), text_hex)
 
+        # Colors go through the palette; the stylesheet only carries what a palette cannot
+        # express (borders, padding, hover), keeping Qt's style sheet parsing small
+        palette = self.palette()
+        for role, hex_color in (
+            (QPalette.ColorRole.Window, bg_hex),
+            (QPalette.ColorRole.WindowText, text_hex),
+            (QPalette.ColorRole.Base, secondary_hex),
+            (QPalette.ColorRole.Text, text_hex),
+            (QPalette.ColorRole.Button, secondary_hex),
+            (QPalette.ColorRole.ButtonText, text_hex),
+        ):
+            palette.setColor(role, QColor(hex_color))
+        self.setPalette(palette)
+
         stylesheet = f"""
-            QDialog {{
-                background-color: {bg_hex};
-                color: {text_hex};
-            }}
             QPlainTextEdit {{
-                background-color: {secondary_hex};
-                color: {text_hex};
                 border: 1px solid {border_hex};
             }}
             QPushButton {{
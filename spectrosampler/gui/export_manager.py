@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 import threading
 import time
 from collections.abc import Iterable, Mapping, Sequence
@@ -11,6 +12,7 @@ from typing import Any
 
 from PySide6.QtCore import QObject, QThread, Signal
 
+from spectrosampler.audio_io import FFmpegError, get_audio_info
 from spectrosampler.detectors.base import Segment
 from spectrosampler.export import export_sample
 from spectrosampler.gui.export_models import (
@@ -25,6 +27,8 @@ from spectrosampler.gui.export_models import (
 )
 from spectrosampler.utils import sanitize_filename
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(slots=True)
 class ExportSampleResult:
@@ -97,6 +101,7 @@ class ExportWorker(QObject):
         self._pause_event.clear()
         self._start_time: float | None = None
         self._processed_count: int = 0
+        self._source_duration: float | None = None
 
     def cancel(self) -> None:
         """Request cancellation."""
@@ -199,6 +204,7 @@ class ExportWorker(QObject):
         override = task.override
         formats = self._resolve_formats(override)
         result = ExportSampleResult(sample_id=task.sample_id, index=task.index, formats=formats)
+        source_duration = self._resolve_source_duration()
 
         for fmt in formats:
             if self._cancel_event.is_set():
@@ -220,6 +226,7 @@ class ExportWorker(QObject):
                     bandpass_low_hz=self._resolve_bandpass_low(override),
                     bandpass_high_hz=self._resolve_bandpass_high(override),
                     metadata=self._build_metadata(task, override, fmt),
+                    source_duration=source_duration,
                 )
                 result.output_paths.append(output_path)
             except Exception as exc:  # pragma: no cover - defensive
@@ -229,6 +236,16 @@ class ExportWorker(QObject):
 
         return result
 
+    def _resolve_source_duration(self) -> float | None:
+        """Probe the source duration once per batch instead of once per exported file."""
+        if self._source_duration is None:
+            try:
+                self._source_duration = float(get_audio_info(self._audio_path)["duration"])
+            except (FFmpegError, OSError, ValueError, KeyError) as exc:
+                # Leave it to export_sample to probe (and report) per sample
+                logger.debug("Failed to probe %s: %s", self._audio_path, exc, exc_info=exc)
+        return self._source_duration
+
     def _build_output_path(self, task: _ExportTask, fmt: str) -> Path:
         filename = self._render_filename(task, fmt)
         return self._output_dir / f"{filename}.{fmt}"
@@ -165,6 +165,17 @@ def apply_template(template: str, context: Mapping[str, Any]) -> str:
     return template.format_map(_SafeDict(context))
 
 
+def render_filename(template: str, context: Mapping[str, Any]) -> str:
+    """Render a sanitized filename from an already built template context.
+
+    Returns an empty string when the template renders to nothing, so callers can fall
+    back to legacy naming.
+    """
+
+    rendered = apply_template(template, context).strip()
+    return sanitize_filename(rendered) if rendered else ""
+
+
 def render_filename_from_template(
     *,
     template: str,
@@ -206,20 +217,21 @@ def render_filename_from_template(
             bit_depth=bit_depth,
             channels=channels,
         )
-        rendered = apply_template(template, context)
-        rendered = rendered.strip()
+        rendered = render_filename(template, context)
     except Exception:
         rendered = ""
 
     if not rendered:
-        rendered = build_sample_filename(
-            base_name,
-            segment,
-            index,
-            total,
-            normalize=normalized,
+        rendered = sanitize_filename(
+            build_sample_filename(
+                base_name,
+                segment,
+                index,
+                total,
+                normalize=normalized,
+            )
         )
-    return sanitize_filename(rendered)
+    return rendered
 
 
 @dataclass(slots=True)
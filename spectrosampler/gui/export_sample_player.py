@@ -2,9 +2,8 @@
 
 from pathlib import Path
 
-from PySide6.QtCore import QSize, Qt, Signal
-from PySide6.QtGui import QColor, QIcon, QPainter, QPixmap
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtCore import QSize, Qt, QTimer, Signal, Slot
+from PySide6.QtGui import QColor, QShowEvent
 from PySide6.QtWidgets import (
     QCheckBox,
     QHBoxLayout,
@@ -15,6 +14,11 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from spectrosampler.gui.ui_utils import load_svg_icon
+
+# Minimum interval between live seeks while the progress slider is dragged
+SCRUB_SEEK_INTERVAL_MS = 50
+
 
 class ExportSamplePlayerWidget(QWidget):
     """Simplified sample player widget for export dialog preview."""
@@ -44,6 +48,17 @@ class ExportSamplePlayerWidget(QWidget):
         self._current_position = 0  # milliseconds
         self._duration = 0  # milliseconds
         self._is_scrubbing = False
+        # Last text written to the time labels; position ticks mostly repeat it
+        self._last_current_text = "0:00"
+        self._last_total_text = "0:00"
+
+        # Live seeks during a drag are coalesced so the media backend sees at most one
+        # seek per SCRUB_SEEK_INTERVAL_MS instead of one per mouse move
+        self._pending_seek_ms: int | None = None
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(SCRUB_SEEK_INTERVAL_MS)
+        self._seek_timer.timeout.connect(self._emit_pending_seek)
 
         # Theme colors
         self._theme_colors = {
@@ -52,11 +67,20 @@ class ExportSamplePlayerWidget(QWidget):
             "text_secondary": QColor(0x99, 0x99, 0x99),
         }
 
-        # Load icons
-        self._load_icons()
+        # Child widgets are built on first show; setters only record state until then
+        self._ui_built = False
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Build the child widgets the first time the player is shown.
 
-        # Setup UI
-        self._setup_ui()
+        Args:
+            event: Show event.
+        """
+        if not self._ui_built:
+            self._load_icons()
+            self._setup_ui()
+            self._ui_built = True
+        super().showEvent(event)
 
     def _setup_ui(self) -> None:
         """Setup UI components."""
@@ -84,7 +108,6 @@ class ExportSamplePlayerWidget(QWidget):
         self._pause_button.setToolTip("Pause")
         self._pause_button.setMaximumWidth(60)
         self._pause_button.clicked.connect(self._on_pause_clicked)
-        self._pause_button.setEnabled(False)  # Initially disabled
         controls_layout.addWidget(self._pause_button)
 
         # Stop button
@@ -101,6 +124,7 @@ class ExportSamplePlayerWidget(QWidget):
         # Loop checkbox
         self._loop_checkbox = QCheckBox("Loop")
         self._loop_checkbox.setToolTip("Loop playback")
+        self._loop_checkbox.setChecked(self._is_looping)
         self._loop_checkbox.toggled.connect(self._on_loop_toggled)
         controls_layout.addWidget(self._loop_checkbox)
 
@@ -109,6 +133,7 @@ class ExportSamplePlayerWidget(QWidget):
         self._autoplay_checkbox.setToolTip(
             "Automatically play when navigating samples with Next/Previous buttons"
         )
+        self._autoplay_checkbox.setChecked(self._auto_play)
         self._autoplay_checkbox.toggled.connect(self._on_autoplay_toggled)
         controls_layout.addWidget(self._autoplay_checkbox)
 
@@ -119,15 +144,15 @@ class ExportSamplePlayerWidget(QWidget):
         progress_layout.setSpacing(8)
 
         # Time label (current)
-        self._time_current_label = QLabel("0:00")
+        self._time_current_label = QLabel(self._last_current_text)
         self._time_current_label.setMinimumWidth(50)
         self._time_current_label.setAlignment(Qt.AlignmentFlag.AlignRight)
         progress_layout.addWidget(self._time_current_label)
 
         # Scrubbable slider
         self._progress_slider = QSlider(Qt.Orientation.Horizontal)
-        self._progress_slider.setRange(0, 0)
-        self._progress_slider.setValue(0)
+        self._progress_slider.setRange(0, self._duration)
+        self._progress_slider.setValue(self._current_position)
         self._progress_slider.setToolTip("Drag to seek")
         self._progress_slider.sliderPressed.connect(self._on_slider_pressed)
         self._progress_slider.sliderMoved.connect(self._on_slider_moved)
@@ -135,7 +160,7 @@ class ExportSamplePlayerWidget(QWidget):
         progress_layout.addWidget(self._progress_slider)
 
         # Time label (total)
-        self._time_total_label = QLabel("0:00")
+        self._time_total_label = QLabel(self._last_total_text)
         self._time_total_label.setMinimumWidth(50)
         self._time_total_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
         progress_layout.addWidget(self._time_total_label)
@@ -149,27 +174,17 @@ class ExportSamplePlayerWidget(QWidget):
 
         apply_checkbox_styling_to_all_checkboxes(self)
 
+        self._update_button_states()
+
     def _load_icons(self) -> None:
         """Load SVG icons from assets folder, preserving colors."""
         assets_dir = Path(__file__).parent.parent.parent / "assets"
         icon_size = 24  # Base size, can be adjusted
         stop_icon_size = 32  # Larger size for stop icon
 
-        def load_svg_icon(path: Path, size: int = icon_size) -> QIcon:
-            """Load SVG icon preserving colors by rendering to pixmap."""
-            if not path.exists():
-                return QIcon()
-            renderer = QSvgRenderer(str(path))
-            pixmap = QPixmap(size, size)
-            pixmap.fill(Qt.GlobalColor.transparent)
-            painter = QPainter(pixmap)
-            renderer.render(painter)
-            painter.end()
-            return QIcon(pixmap)
-
-        self._play_icon = load_svg_icon(assets_dir / "play.svg")
-        self._pause_icon = load_svg_icon(assets_dir / "pause.svg")
-        self._stop_icon = load_svg_icon(assets_dir / "stop.svg", size=stop_icon_size)
+        self._play_icon = load_svg_icon(assets_dir / "play.svg", icon_size)
+        self._pause_icon = load_svg_icon(assets_dir / "pause.svg", icon_size)
+        self._stop_icon = load_svg_icon(assets_dir / "stop.svg", stop_icon_size)
 
     def set_playing(self, is_playing: bool) -> None:
         """Set playing state.
@@ -178,13 +193,13 @@ class ExportSamplePlayerWidget(QWidget):
             is_playing: True if playing, False otherwise.
         """
         self._is_playing = is_playing
-        # Update button states based on playing state
-        if is_playing:
-            self._play_button.setEnabled(False)
-            self._pause_button.setEnabled(True)
-        else:
-            self._play_button.setEnabled(True)
-            self._pause_button.setEnabled(False)
+        if self._ui_built:
+            self._update_button_states()
+
+    def _update_button_states(self) -> None:
+        """Enable play or pause depending on the playing state."""
+        self._play_button.setEnabled(not self._is_playing)
+        self._pause_button.setEnabled(self._is_playing)
 
     def set_position(self, position_ms: int, duration_ms: int) -> None:
         """Set playback position.
@@ -196,29 +211,33 @@ class ExportSamplePlayerWidget(QWidget):
         if not self._is_scrubbing:
             self._current_position = position_ms
             self._duration = duration_ms
-            self._progress_slider.setRange(0, max(1, duration_ms))
-            self._progress_slider.setValue(position_ms)
+            if self._ui_built:
+                self._progress_slider.setRange(0, max(1, duration_ms))
+                self._progress_slider.setValue(position_ms)
             self._update_time_labels()
 
     def _update_time_labels(self) -> None:
-        """Update time labels."""
-        current_sec = self._current_position / 1000.0
-        total_sec = self._duration / 1000.0
-
-        # Format current time
-        current_mins = int(current_sec // 60)
-        current_secs = int(current_sec % 60)
-        self._time_current_label.setText(f"{current_mins}:{current_secs:02d}")
-
-        # Format total time
-        total_mins = int(total_sec // 60)
-        total_secs = int(total_sec % 60)
-        self._time_total_label.setText(f"{total_mins}:{total_secs:02d}")
-
+        """Update time labels, skipping setText when the displayed m:ss is unchanged."""
+        current_mins, current_secs = divmod(self._current_position // 1000, 60)
+        current_text = f"{current_mins}:{current_secs:02d}"
+        if current_text != self._last_current_text:
+            self._last_current_text = current_text
+            if self._ui_built:
+                self._time_current_label.setText(current_text)
+
+        total_mins, total_secs = divmod(self._duration // 1000, 60)
+        total_text = f"{total_mins}:{total_secs:02d}"
+        if total_text != self._last_total_text:
+            self._last_total_text = total_text
+            if self._ui_built:
+                self._time_total_label.setText(total_text)
+
+    @Slot()
     def _on_slider_pressed(self) -> None:
         """Handle slider pressed."""
         self._is_scrubbing = True
 
+    @Slot(int)
     def _on_slider_moved(self, value: int) -> None:
         """Handle slider moved during scrubbing.
 
@@ -228,12 +247,26 @@ class ExportSamplePlayerWidget(QWidget):
         if self._is_scrubbing:
             self._current_position = value
             self._update_time_labels()
-
+            self._pending_seek_ms = value
+            if not self._seek_timer.isActive():
+                self._seek_timer.start()
+
+    @Slot()
+    def _emit_pending_seek(self) -> None:
+        """Emit the latest scrub position, if one is pending."""
+        if self._pending_seek_ms is not None:
+            position_ms = self._pending_seek_ms
+            self._pending_seek_ms = None
+            self.seek_requested.emit(position_ms)
+
+    @Slot()
     def _on_slider_released(self) -> None:
         """Handle slider released."""
         if self._is_scrubbing:
             self._is_scrubbing = False
-            # Emit seek signal
+            # Drop any throttled seek; the final position always lands
+            self._seek_timer.stop()
+            self._pending_seek_ms = None
             self.seek_requested.emit(self._progress_slider.value())
 
     def set_looping(self, is_looping: bool) -> None:
@@ -243,7 +276,8 @@ class ExportSamplePlayerWidget(QWidget):
             is_looping: True if looping, False otherwise.
         """
         self._is_looping = is_looping
-        self._loop_checkbox.setChecked(is_looping)
+        if self._ui_built:
+            self._loop_checkbox.setChecked(is_looping)
 
     def set_auto_play(self, enabled: bool) -> None:
         """Set auto-play state.
@@ -252,7 +286,8 @@ class ExportSamplePlayerWidget(QWidget):
             enabled: True if auto-play should be enabled.
         """
         self._auto_play = enabled
-        self._autoplay_checkbox.setChecked(enabled)
+        if self._ui_built:
+            self._autoplay_checkbox.setChecked(enabled)
 
     def is_looping(self) -> bool:
         """Return current looping state."""
@@ -262,18 +297,22 @@ class ExportSamplePlayerWidget(QWidget):
         """Return current auto-play state."""
         return self._auto_play
 
+    @Slot()
     def _on_play_clicked(self) -> None:
         """Handle play button click."""
         self.play_requested.emit()
 
+    @Slot()
     def _on_pause_clicked(self) -> None:
         """Handle pause button click."""
         self.pause_requested.emit()
 
+    @Slot()
     def _on_stop_clicked(self) -> None:
         """Handle stop button click."""
         self.stop_requested.emit()
 
+    @Slot(bool)
     def _on_loop_toggled(self, checked: bool) -> None:
         """Handle loop checkbox toggle.
 
@@ -283,6 +322,7 @@ class ExportSamplePlayerWidget(QWidget):
         self._is_looping = checked
         self.loop_changed.emit(checked)
 
+    @Slot(bool)
     def _on_autoplay_toggled(self, checked: bool) -> None:
         """Handle auto-play checkbox toggle.
 
@@ -3,40 +3,141 @@
 import logging
 from typing import Any
 
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QBrush, QColor, QFont, QPainter, QPainterPath, QPaintEvent, QPen
-from PySide6.QtWidgets import QGraphicsDropShadowEffect, QLabel, QVBoxLayout, QWidget
+from PySide6.QtCore import SIGNAL, QObject, QRectF, Qt, QTimer, Signal, Slot
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QFont,
+    QHideEvent,
+    QPainter,
+    QPaintEvent,
+    QPen,
+    QPixmap,
+    QShowEvent,
+)
+from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
 from spectrosampler.gui.theme import ThemeManager
 
 logger = logging.getLogger(__name__)
 
+SPINNER_FRAME_INTERVAL_MS = 16  # ~60 FPS
+
+
+class _SpinnerClock(QObject):
+    """Single frame timer shared by every visible LoadingSpinner."""
+
+    tick = Signal()
+
+    def __init__(self) -> None:
+        """Initialize the shared clock; the timer runs only while spinners subscribe."""
+        super().__init__()
+        self._timer = QTimer(self)
+        self._timer.setInterval(SPINNER_FRAME_INTERVAL_MS)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def subscribe(self, slot: Any) -> None:
+        """Connect ``slot`` to the tick, starting the timer if it is idle.
+
+        Args:
+            slot: Callable invoked on every frame.
+        """
+        self.tick.connect(slot)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def unsubscribe(self, slot: Any) -> None:
+        """Disconnect ``slot``, stopping the timer once no subscribers remain.
+
+        Args:
+            slot: Callable previously passed to ``subscribe``.
+        """
+        self.tick.disconnect(slot)
+        self._stop_if_idle()
+
+    def _stop_if_idle(self) -> bool:
+        """Stop the timer if nothing is connected to the tick.
+
+        Subscribers are counted from the tick's live connections, so a spinner destroyed
+        while visible (whose connection Qt drops) cannot keep the timer running.
+
+        Returns:
+            True if the timer was stopped.
+        """
+        if self.receivers(SIGNAL("tick()")) > 0:
+            return False
+        self._timer.stop()
+        return True
+
+    @Slot()
+    def _on_timeout(self) -> None:
+        """Emit a frame tick, or stop the timer if every subscriber has gone."""
+        if not self._stop_if_idle():
+            self.tick.emit()
+
+    def is_running(self) -> bool:
+        """Return True while the shared timer is ticking."""
+        return self._timer.isActive()
+
+
+_spinner_clock: _SpinnerClock | None = None
+
+
+def _get_spinner_clock() -> _SpinnerClock:
+    """Return the process-wide spinner clock, creating it on first use."""
+    global _spinner_clock
+    if _spinner_clock is None:
+        _spinner_clock = _SpinnerClock()
+    return _spinner_clock
+
 
 class LoadingSpinner(QWidget):
     """Animated loading spinner widget."""
 
-    def __init__(
-        self,
-        parent: QWidget | None = None,
-        theme_manager: ThemeManager | None = None,
-    ):
+    def __init__(self, parent: QWidget | None, theme_manager: ThemeManager):
         """Initialize loading spinner.
 
         Args:
             parent: Parent widget.
+            theme_manager: Theme manager shared with the owning loading screen.
         """
         super().__init__(parent)
         self._angle = 0
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._on_timer)
-        self._timer.start(16)  # ~60 FPS
+        self._animating = False
         self.setFixedSize(48, 48)
-        # Cache theme manager
-        self._theme_manager = theme_manager or ThemeManager(self)
+        # Size is fixed, so the arc geometry never changes
+        radius = min(self.width(), self.height()) // 2 - 4
+        center = self.rect().center()
+        self._arc_rect = QRectF(center.x() - radius, center.y() - radius, radius * 2, radius * 2)
+        self._theme_manager = theme_manager
+        self._pen = self._make_pen(self._theme_manager.palette["accent"])
         # Ensure widget is visible and can receive paint events
         self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, False)
         self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, False)
 
+    def showEvent(self, event: QShowEvent) -> None:
+        """Start animating when the spinner becomes visible.
+
+        Args:
+            event: Show event.
+        """
+        super().showEvent(event)
+        if not self._animating:
+            self._animating = True
+            _get_spinner_clock().subscribe(self._on_timer)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        """Stop animating while hidden so no repaints are scheduled.
+
+        Args:
+            event: Hide event.
+        """
+        super().hideEvent(event)
+        if self._animating:
+            self._animating = False
+            _get_spinner_clock().unsubscribe(self._on_timer)
+
+    @Slot()
     def _on_timer(self) -> None:
         """Handle timer tick."""
         self._angle = (self._angle + 8) % 360
@@ -51,42 +152,43 @@ class LoadingSpinner(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Get theme colors
-        palette = self._theme_manager.palette
-        accent_color = palette["accent"]
-
-        # Draw spinner
-        center = self.rect().center()
-        radius = min(self.width(), self.height()) // 2 - 4
+        # Rebuild the pen only when the theme accent changes
+        accent_color = self._theme_manager.palette["accent"]
+        if self._pen.color() != accent_color:
+            self._pen = self._make_pen(accent_color)
 
-        # Draw spinner arc (no background circle)
-        pen = QPen(accent_color)
-        pen.setWidth(3)
-        painter.setPen(pen)
+        # Draw spinner arc (no background circle); angles are in 1/16 degree
+        painter.setPen(self._pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawArc(self._arc_rect, self._angle * 16, 270 * 16)
 
-        path = QPainterPath()
-        path.arcMoveTo(
-            center.x() - radius, center.y() - radius, radius * 2, radius * 2, self._angle
-        )
-        path.arcTo(
-            center.x() - radius, center.y() - radius, radius * 2, radius * 2, self._angle, 270
-        )
+    @staticmethod
+    def _make_pen(color: QColor) -> QPen:
+        """Build the spinner arc pen.
+
+        Args:
+            color: Arc color.
 
-        painter.drawPath(path)
+        Returns:
+            Pen for drawing the arc.
+        """
+        pen = QPen(color)
+        pen.setWidth(3)
+        return pen
 
 
 class LoadingContainer(QWidget):
     """Container widget with rounded rectangle background."""
 
-    def __init__(self, parent: QWidget | None = None):
+    def __init__(self, parent: QWidget | None, theme_manager: ThemeManager):
         """Initialize loading container.
 
         Args:
             parent: Parent widget.
+            theme_manager: Theme manager shared with the owning loading screen.
         """
         super().__init__(parent)
-        self._theme_manager = ThemeManager(self)
+        self._theme_manager = theme_manager
         # Make widget transparent so we can draw custom background
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
         self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, False)
@@ -94,6 +196,10 @@ class LoadingContainer(QWidget):
         self.hide()
         # Set initial geometry to 0 to prevent showing in wrong place
         self.setGeometry(0, 0, 0, 0)
+        # Paint resources are constant, so build them once rather than on every repaint
+        self._bg_brush = QBrush(QColor(40, 40, 40, 204))  # Darker grey, 80% opacity (204/255)
+        self._outline_pen = QPen(QColor(200, 200, 200, 255))  # Light grey
+        self._outline_pen.setWidth(1)
 
     def paintEvent(self, event: QPaintEvent | Any) -> None:
         """Paint rounded rectangle background.
@@ -104,29 +210,98 @@ class LoadingContainer(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Dark grey background with 80% opacity
-        bg_color = QColor(40, 40, 40, 204)  # Darker grey, 80% opacity (204/255)
-
-        # Light grey outline
-        outline_color = QColor(200, 200, 200, 255)  # Light grey
-
         # Draw rounded rectangle background
         rect = self.rect().adjusted(0, 0, -1, -1)  # Adjust for border
         corner_radius = 15
 
         # Background
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QBrush(bg_color))
+        painter.setBrush(self._bg_brush)
         painter.drawRoundedRect(rect, corner_radius, corner_radius)
 
         # Outline
-        pen = QPen(outline_color)
-        pen.setWidth(1)
-        painter.setPen(pen)
+        painter.setPen(self._outline_pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawRoundedRect(rect, corner_radius, corner_radius)
 
 
+class ShadowLabel(QLabel):
+    """Label drawn with a soft drop shadow for legibility over the application.
+
+    The text and its shadow are rendered into a pixmap that is reused until the text, size,
+    font or color changes, instead of a QGraphicsDropShadowEffect re-blurring the label
+    offscreen on every repaint.
+    """
+
+    SHADOW_OFFSET = 2
+    SHADOW_SPREAD = 1
+    # Plain RGBA so nothing Qt-side is constructed at import time
+    SHADOW_RGBA = (0, 0, 0, 200)
+
+    def __init__(self, text: str = "", parent: QWidget | None = None):
+        """Initialize shadow label.
+
+        Args:
+            text: Label text.
+            parent: Parent widget.
+        """
+        super().__init__(text, parent)
+        margin = self.SHADOW_OFFSET + self.SHADOW_SPREAD
+        self.setContentsMargins(margin, margin, margin, margin)
+        self._cache_key: tuple | None = None
+        self._cache = QPixmap()
+
+    def paintEvent(self, event: QPaintEvent | Any) -> None:
+        """Paint the cached text-and-shadow pixmap.
+
+        Args:
+            event: Paint event.
+        """
+        color = self.palette().color(self.foregroundRole())
+        ratio = self.devicePixelRatioF()
+        key = (self.text(), self.width(), self.height(), self.font().key(), color.rgba(), ratio)
+        if key != self._cache_key:
+            self._cache = self._render(color, ratio)
+            self._cache_key = key
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cache)
+
+    def _render(self, color: QColor, ratio: float) -> QPixmap:
+        """Render the text over a softened shadow.
+
+        Args:
+            color: Text color.
+            ratio: Device pixel ratio of the target screen.
+
+        Returns:
+            Pixmap covering the whole label.
+        """
+        pixmap = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        painter.setFont(self.font())
+        rect = self.contentsRect()
+        flags = int(self.alignment())
+        text = self.text()
+
+        # Approximate a blur by stacking faint copies around the shadow offset
+        spread = range(-self.SHADOW_SPREAD, self.SHADOW_SPREAD + 1)
+        red, green, blue, alpha = self.SHADOW_RGBA
+        shadow = QColor(red, green, blue, max(1, alpha // len(spread)))
+        painter.setPen(shadow)
+        for dx in spread:
+            for dy in spread:
+                offset_rect = rect.translated(self.SHADOW_OFFSET + dx, self.SHADOW_OFFSET + dy)
+                painter.drawText(offset_rect, flags, text)
+
+        painter.setPen(color)
+        painter.drawText(rect, flags, text)
+        painter.end()
+        return pixmap
+
+
 class LoadingScreen(QWidget):
     """Loading screen overlay widget."""
 
@@ -141,6 +316,8 @@ class LoadingScreen(QWidget):
         Args:
             parent: Parent widget.
             message: Loading message to display.
+            theme_manager: Theme manager to share with the overlay's children; a
+                private one is created if omitted.
         """
         super().__init__(parent)
         self._message = message
@@ -167,7 +344,7 @@ class LoadingScreen(QWidget):
         self.setLayout(None)
 
         # Container widget with rounded rectangle background
-        self._container = LoadingContainer(self)
+        self._container = LoadingContainer(self, self._theme_manager)
         # Hide container by default - it will be shown when overlay is shown
         self._container.hide()
         container_layout = QVBoxLayout()
@@ -175,23 +352,16 @@ class LoadingScreen(QWidget):
         container_layout.setSpacing(20)
 
         # Spinner
-        self._spinner = LoadingSpinner(self._container, theme_manager=self._theme_manager)
+        self._spinner = LoadingSpinner(self._container, self._theme_manager)
         container_layout.addWidget(self._spinner, alignment=Qt.AlignmentFlag.AlignCenter)
 
         # Message
-        self._message_label = QLabel(self._message, self._container)
+        self._message_label = ShadowLabel(self._message, self._container)
         message_font = QFont()
         message_font.setPointSize(14)
         self._message_label.setFont(message_font)
         self._message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        # Add drop shadow effect for better legibility
-        shadow = QGraphicsDropShadowEffect(self._message_label)
-        shadow.setBlurRadius(8)
-        shadow.setColor(QColor(0, 0, 0, 200))  # Black shadow with good opacity
-        shadow.setOffset(2, 2)  # Offset shadow slightly
-        self._message_label.setGraphicsEffect(shadow)
-
         container_layout.addWidget(self._message_label, alignment=Qt.AlignmentFlag.AlignCenter)
 
         self._container.setLayout(container_layout)
@@ -254,31 +424,24 @@ class LoadingScreen(QWidget):
         container_x = (parent.width() - container_width) // 2
         container_y = (parent.height() - container_height) // 2
 
-        # Ensure container exists and is properly parented and positioned
-        if hasattr(self, "_container"):
-            self._container.setParent(self)
-            # Position container first, then show
-            self._container.setGeometry(container_x, container_y, container_width, container_height)
-            self._container.show()
-            self._container.raise_()
+        # Ensure container is properly parented and positioned (created in _setup_ui)
+        self._container.setParent(self)
+        # Position container first, then show
+        self._container.setGeometry(container_x, container_y, container_width, container_height)
+        self._container.show()
+        self._container.raise_()
 
         # Make sure main widget is on top and visible
         self.raise_()
         self.show()
         self.update()  # Force update to ensure proper rendering
 
-        # Start the spinner animation if not already running
-        if hasattr(self, "_spinner") and hasattr(self._spinner, "_timer"):
-            if not self._spinner._timer.isActive():
-                self._spinner._timer.start(16)  # ~60 FPS
-
     def hide_overlay(self) -> None:
         """Hide loading screen overlay."""
         # Hide container first and reset its position
-        if hasattr(self, "_container"):
-            self._container.hide()
-            # Reset container position to prevent it from appearing in wrong place
-            self._container.setGeometry(0, 0, 0, 0)
+        self._container.hide()
+        # Reset container position to prevent it from appearing in wrong place
+        self._container.setGeometry(0, 0, 0, 0)
         # Hide main widget
         self.hide()
         # Reset main widget geometry
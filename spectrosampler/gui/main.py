@@ -6,9 +6,6 @@ import sys
 import warnings
 from pathlib import Path
 
-from spectrosampler.audio_io import check_ffmpeg
-from spectrosampler.utils import setup_logging
-
 logger = logging.getLogger(__name__)
 
 # Suppress third-party deprecation warning emitted by webrtcvad's pkg_resources import.
@@ -29,6 +26,11 @@ warnings.filterwarnings(
 )
 
 
+# Flags answered without parsing arguments, setting up logging, or importing Qt
+_HELP_FLAGS = frozenset({"--help"})
+_VERSION_FLAGS = frozenset({"--version"})
+
+
 def _print_help() -> None:
     print(
         "SpectroSampler GUI\n\n"
@@ -45,14 +47,14 @@ def _print_help() -> None:
 def _parse_args() -> argparse.Namespace:
     """Parse command-line arguments.
 
+    ``--help`` and ``--version`` are handled by ``main`` before parsing.
+
     Returns:
         Parsed arguments.
     """
     parser = argparse.ArgumentParser(description="SpectroSampler GUI", add_help=False)
     parser.add_argument("--project", type=str, help="Open specific project file")
     parser.add_argument("--audio", type=str, help="Open specific audio file")
-    parser.add_argument("--help", action="store_true", help="Show help and exit")
-    parser.add_argument("--version", action="store_true", help="Show version and exit")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose (DEBUG) logging")
     return parser.parse_args()
 
@@ -66,13 +68,12 @@ def _check_autosave_recovery() -> Path | None:
     from spectrosampler.gui.autosave import AutoSaveManager
 
     autosave_manager = AutoSaveManager()
-    autosave_files = autosave_manager.get_autosave_files()
+    newest = autosave_manager.get_newest_autosaves(1)
 
-    if not autosave_files:
+    if not newest:
         return None
 
-    # Find most recent auto-save file
-    most_recent = max(autosave_files, key=lambda p: p.stat().st_mtime)
+    most_recent = newest[0]
 
     # Show recovery dialog
     from PySide6.QtWidgets import QApplication, QMessageBox
@@ -111,20 +112,24 @@ def _check_autosave_recovery() -> Path | None:
 
 def main() -> None:
     """Main entry point for GUI application."""
-    # Parse arguments
-    args = _parse_args()
-
-    # Setup logging
-    setup_logging(verbose=getattr(args, "verbose", False))
-
     # Fast-path for CI/CLI flags before importing Qt (avoids EGL/X11 deps for --help/--version)
-    if args.help:
+    flags = set(sys.argv[1:])
+    if flags & _HELP_FLAGS:
         _print_help()
         return
-    if args.version:
+    if flags & _VERSION_FLAGS:
         print("SpectroSampler 0.1.0")
         return
 
+    # Parse arguments
+    args = _parse_args()
+
+    # Setup logging (imported here so the fast path above stays a bare print)
+    from spectrosampler.audio_io import check_ffmpeg
+    from spectrosampler.utils import setup_logging
+
+    setup_logging(verbose=getattr(args, "verbose", False))
+
     # Import Qt and window lazily to avoid loading GUI stack when not needed
     from PySide6.QtWidgets import QApplication, QFileDialog, QMainWindow, QMessageBox
 
@@ -1,16 +1,35 @@
 """Main window for SpectroSampler GUI."""
 
-import copy
+import bisect
+import dataclasses
+import itertools
 import logging
+import operator
+import os
 import subprocess
 import tempfile
+import time
 import uuid
 from collections.abc import Callable, Iterable
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from PySide6.QtCore import QItemSelectionModel, QPoint, QSize, Qt, QUrl
-from PySide6.QtGui import QAction, QActionGroup, QKeySequence
+import numpy as np
+from PySide6.QtCore import (
+    QBuffer,
+    QByteArray,
+    QIODevice,
+    QItemSelection,
+    QItemSelectionModel,
+    QPoint,
+    QSize,
+    Qt,
+    QThreadPool,
+    QTimer,
+    QUrl,
+)
+from PySide6.QtGui import QAction, QActionGroup, QColor, QKeySequence
 from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
 from PySide6.QtWidgets import (
     QApplication,
@@ -51,10 +70,28 @@ from spectrosampler.gui.export_progress_dialog import ExportProgressDialog
 from spectrosampler.gui.grid_manager import GridManager, GridMode, GridSettings, Subdivision
 from spectrosampler.gui.loading_screen import LoadingScreen
 from spectrosampler.gui.navigator_scrollbar import NavigatorScrollbar
+from spectrosampler.gui.overlap_detector import (
+    find_duplicates_within_segments,
+    find_overlaps,
+    find_overlaps_within_segments,
+    is_duplicate,
+)
 from spectrosampler.gui.overview_manager import OverviewManager
 from spectrosampler.gui.pipeline_wrapper import PipelineWrapper
+from spectrosampler.gui.playback_buffer import (
+    PlaybackDecodeRunnable,
+    PlaybackDecodeSignals,
+    WavSliceCache,
+    can_read_in_process,
+    ffmpeg_playback_command,
+    render_wav_slice,
+    run_ffmpeg_decode,
+    silent_wav,
+)
 from spectrosampler.gui.project import (
+    PROJECT_VERSION,
     ProjectData,
+    UIState,
     _dict_to_grid_settings,
     _dict_to_processing_settings,
     _dict_to_segment,
@@ -67,10 +104,21 @@ from spectrosampler.gui.project import (
 from spectrosampler.gui.sample_player import SamplePlayerWidget
 from spectrosampler.gui.sample_table_delegate import SampleTableDelegate
 from spectrosampler.gui.sample_table_model import SampleTableModel
+from spectrosampler.gui.segment_snapshot import (
+    SegmentSnapshot,
+    SnapshotHistory,
+    capture_snapshot,
+    copy_segments,
+    detector_name,
+    restore_snapshot,
+    segments_to_array,
+    snapshot_matches,
+)
 from spectrosampler.gui.settings import SettingsManager
 from spectrosampler.gui.spectrogram_tiler import SpectrogramTile, SpectrogramTiler
 from spectrosampler.gui.spectrogram_widget import SpectrogramWidget
 from spectrosampler.gui.theme import ThemeManager
+from spectrosampler.gui.tile_cache import TileCache
 from spectrosampler.gui.toolbar import ToolbarWidget, ToolMode
 from spectrosampler.gui.waveform_manager import WaveformData, WaveformManager
 from spectrosampler.gui.waveform_widget import WaveformWidget
@@ -79,6 +127,37 @@ from spectrosampler.pipeline_settings import ProcessingSettings
 logger = logging.getLogger(__name__)
 
 
+def _playback_source_key(path: Path | None) -> tuple[Path, int, int] | None:
+    """Return ``(path, mtime_ns, size)`` identifying the current contents of ``path``.
+
+    Args:
+        path: Audio file path.
+
+    Returns:
+        Identity tuple, or None if the file cannot be stat'ed.
+    """
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError as exc:
+        logger.debug("Failed to stat %s: %s", path, exc, exc_info=exc)
+        return None
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+_DETECTOR_COLORS = {
+    "voice_vad": QColor(0x00, 0xFF, 0xAA),
+    "transient_flux": QColor(0xFF, 0xCC, 0x00),
+    "nonsilence_energy": QColor(0xFF, 0x66, 0xAA),
+    "spectral_interestingness": QColor(0x66, 0xAA, 0xFF),
+}
+_DEFAULT_DETECTOR_COLOR = QColor(0xFF, 0xFF, 0xFF)
+_DISABLED_MARKER_COLOR = QColor(120, 120, 120, 160)
+
+_segment_start = operator.attrgetter("start")
+
+
 class MainWindow(QMainWindow):
     """Main window for SpectroSampler GUI."""
 
@@ -99,14 +178,30 @@ class MainWindow(QMainWindow):
 
         # Project management
         self._project_path: Path | None = None
-        self._project_modified: bool = False
+        self._project_modified_flag = False
+        # Mirrors of the "Show Disabled Samples" and "Auto Sample Order" menu toggles, kept
+        # in sync by their handlers so hot paths read a plain bool
+        self._show_disabled = True
+        self._auto_order = True
         self._suppress_settings_modified: bool = False
 
         # Audio playback
         self._media_player = QMediaPlayer(self)
         self._audio_output = QAudioOutput(self)
         self._media_player.setAudioOutput(self._audio_output)
-        self._temp_playback_file: Path | None = None
+        # Whole-file PCM copy for formats libsndfile cannot decode (see _decoded_playback_path)
+        self._decoded_playback_file: Path | None = None
+        # (path, mtime_ns, size) of the file being or already decoded, so edits on disk
+        # invalidate the copy
+        self._decoded_playback_source: tuple[Path, int, int] | None = None
+        self._playback_decode_signals: PlaybackDecodeSignals | None = None
+        self._playback_buffer: QBuffer | None = None
+        # Rendered slices of recently played samples, so replays skip decoding
+        self._playback_slice_cache = WavSliceCache()
+        # Throttle state for positionChanged-driven UI updates
+        self._position_update_interval_ms = 33.0
+        self._last_position_update_ms = 0.0
+        self._last_position_ms = 0
         self._loop_enabled = False
         self._auto_play_next_enabled = False
         self._current_playing_index: int | None = None
@@ -119,16 +214,30 @@ class MainWindow(QMainWindow):
             False  # Flag to prevent cleanup during sample transitions
         )
         self._media_status_handler: Callable[[QMediaPlayer.MediaStatus], None] | None = None
+        # True while the startup warm-up clip is the player's source (see _warm_up_media_player)
+        self._media_warmup_active = False
         self._selected_sample_indexes: list[int] = []
         self._active_sample_index: int | None = None
         self._syncing_table_selection = False
         self._suppress_auto_play_next_persist = False
 
         # Undo/redo stacks
-        self._undo_stack: list[list[Segment]] = []
-        self._redo_stack: list[list[Segment]] = []
         self._max_undo_stack_size = 50
-        self._baseline_segments: list[Segment] = []  # Initial state after load/save
+        self._undo_stack = SnapshotHistory(self._max_undo_stack_size)
+        self._redo_stack = SnapshotHistory(self._max_undo_stack_size)
+        # Bursts of edits to the same target (e.g. spinning a time value in the table) share
+        # the undo entry recorded by the first edit while this timer is running
+        self._undo_coalesce_key: tuple[Any, ...] | None = None
+        self._undo_coalesce_timer = QTimer(self)
+        self._undo_coalesce_timer.setSingleShot(True)
+        self._undo_coalesce_timer.setInterval(250)
+        self._baseline_segments: SegmentSnapshot = capture_snapshot([])  # State after load/save
+        # Bumped whenever segment order or enabled state changes; keys the display and
+        # enabled-mask caches
+        self._segments_version = 0
+        self._display_cache: tuple[tuple[int, bool, int, int], list[Segment]] | None = None
+        self._enabled_mask_cache: tuple[tuple[int, int, int], np.ndarray] | None = None
+        self._enabled_segments_cache: tuple[tuple[int, int, int], list[Segment]] | None = None
 
         # Detection manager
         self._detection_manager = DetectionManager(self)
@@ -136,8 +245,9 @@ class MainWindow(QMainWindow):
         self._detection_manager.finished.connect(self._on_detection_finished)
         self._detection_manager.error.connect(self._on_detection_error)
 
-        # Spectrogram tiler
-        self._tiler = SpectrogramTiler()
+        # Spectrogram tiler; overview and view tiles share one on-disk cache
+        self._tile_cache = TileCache()
+        self._tiler = SpectrogramTiler(disk_cache=self._tile_cache)
 
         # Grid manager
         self._grid_manager = GridManager()
@@ -227,6 +337,9 @@ class MainWindow(QMainWindow):
         self._grid_settings = GridSettings()
         self._grid_settings.snap_interval_sec = 1.0
         self._grid_settings.enabled = False
+        # Last settings pushed to the editor, so unchanged re-applies skip tile/overlay invalidation
+        self._applied_frequency_range: tuple[float | None, float | None] | None = None
+        self._applied_grid_state: tuple[Any, ...] | None = None
 
         # Export settings (stored in main window)
         self._export_batch_settings: ExportBatchSettings | None = None
@@ -238,6 +351,19 @@ class MainWindow(QMainWindow):
         self._ui_refresh_rate_hz = 60
         self._ui_refresh_timer = None
         self._pending_updates: dict[str, object] = {}
+        # Coalesces segment overlay/marker refreshes to at most one per frame (~16 ms)
+        self._segment_redraw_timer = QTimer(self)
+        self._segment_redraw_timer.setSingleShot(True)
+        self._segment_redraw_timer.setInterval(16)
+        self._segment_redraw_timer.timeout.connect(self._flush_segment_redraw)
+        # Throttles navigator drag/resize to at most ~30 editor view updates per second
+        self._pending_navigator_view: tuple[float, float] | None = None
+        self._navigator_view_timer = QTimer(self)
+        self._navigator_view_timer.setSingleShot(True)
+        self._navigator_view_timer.setInterval(33)
+        self._navigator_view_timer.timeout.connect(self._flush_navigator_view)
+        # Set while _set_view_range drives the editor, whose view_changed echo is then ignored
+        self._applying_view_range = False
         splitter.setStretchFactor(0, 0)
         # Set initial toolbar width (~75px, half of original)
         splitter.setSizes([75, 1])
@@ -265,9 +391,11 @@ class MainWindow(QMainWindow):
         # Connect media player position updates
         self._media_player.positionChanged.connect(self._on_media_position_changed)
         self._media_player.durationChanged.connect(self._on_media_duration_changed)
+        # Initialise the media backend once the event loop runs rather than on the first play
+        QTimer.singleShot(0, self._warm_up_media_player)
 
         # Spectrogram widget
-        self._spectrogram_widget = SpectrogramWidget()
+        self._spectrogram_widget = SpectrogramWidget(tile_cache=self._tile_cache)
         # Set initial tool mode
         self._spectrogram_widget.set_tool_mode(ToolMode.SELECT)
         self._spectrogram_widget.sample_selected.connect(self._on_sample_selected)
@@ -278,9 +406,7 @@ class MainWindow(QMainWindow):
         self._spectrogram_widget.sample_play_requested.connect(self._on_sample_play_requested)
         self._spectrogram_widget.time_clicked.connect(self._on_time_clicked)
         # New signals for context actions
-        self._spectrogram_widget.sample_disable_requested.connect(
-            lambda idx, dis: self._on_disable_sample(idx, dis)
-        )
+        self._spectrogram_widget.sample_disable_requested.connect(self._on_disable_sample)
         self._spectrogram_widget.sample_disable_others_requested.connect(
             self._on_disable_other_samples
         )
@@ -322,7 +448,7 @@ class MainWindow(QMainWindow):
         # Navigator scrollbar
         self._navigator: NavigatorScrollbar = NavigatorScrollbar()
         self._navigator.view_changed.connect(self._on_navigator_view_changed)
-        self._navigator.view_resized.connect(self._on_navigator_view_resized)
+        self._navigator.view_resized.connect(self._on_navigator_view_changed)
         self._navigator.setMinimumHeight(60)
         self._navigator.setMaximumHeight(300)
 
@@ -382,11 +508,6 @@ class MainWindow(QMainWindow):
         self._sample_table_model.timesEdited.connect(self._on_model_times_edited)
         self._sample_table_model.durationEdited.connect(self._on_model_duration_edited)
 
-        # Keep spectrogram selection in sync when user selects a column
-        selection_model = self._sample_table_view.selectionModel()
-        if selection_model is not None:
-            selection_model.selectionChanged.connect(lambda *_: None)
-
         # Main vertical splitter for editor/sample table
         self._main_splitter = QSplitter(Qt.Orientation.Vertical)
         self._main_splitter.addWidget(splitter)
@@ -814,6 +935,7 @@ class MainWindow(QMainWindow):
         # Spectrogram widget - operation start signals for undo
         self._spectrogram_widget.sample_drag_started.connect(self._on_sample_drag_started)
         self._spectrogram_widget.sample_resize_started.connect(self._on_sample_resize_started)
+        self._spectrogram_widget.sample_edit_finished.connect(self._flush_segment_redraw)
         self._spectrogram_widget.sample_create_started.connect(self._on_sample_create_started)
 
     def _apply_theme_mode(self, mode: str, persist: bool) -> None:
@@ -848,8 +970,7 @@ class MainWindow(QMainWindow):
 
     def _apply_theme(self) -> None:
         """Apply theme to application."""
-        stylesheet = self._theme_manager.get_stylesheet()
-        self.setStyleSheet(stylesheet)
+        self._theme_manager.install_stylesheet()
 
         # Apply theme colors to widgets
         palette = self._theme_manager.palette
@@ -879,11 +1000,10 @@ class MainWindow(QMainWindow):
         self._project_path = None
         self._project_modified = False
         self._current_audio_path = None
+        self._discard_decoded_playback_file()
         if self._pipeline_wrapper:
             self._pipeline_wrapper.current_segments = []
-        self._apply_segments_to_views([])
-        self._update_sample_table([])
-        self._update_navigator_markers()
+        self._refresh_all_views()
         # Make sure any loading screen is hidden and properly cleaned up
         self._loading_screen.hide_overlay()
         # Process events to ensure UI updates
@@ -1002,6 +1122,9 @@ class MainWindow(QMainWindow):
                 QApplication.processEvents()
 
             audio_info = self._pipeline_wrapper.load_audio(file_path)
+            if _playback_source_key(file_path) != self._decoded_playback_source:
+                self._discard_decoded_playback_file()
+            self._playback_slice_cache.clear()
             self._current_audio_path = file_path
             # Process events after loading
             for _ in range(3):
@@ -1016,9 +1139,7 @@ class MainWindow(QMainWindow):
             self._navigator.set_duration(duration)
 
             # Set initial time range
-            self._spectrogram_widget.set_time_range(0.0, min(60.0, duration))
-            self._waveform_widget.set_view_range(0.0, min(60.0, duration))
-            self._navigator.set_view_range(0.0, min(60.0, duration))
+            self._set_view_range(0.0, min(60.0, duration))
 
             # Add to recent audio files
             self._settings_manager.add_recent_audio_file(file_path)
@@ -1035,10 +1156,8 @@ class MainWindow(QMainWindow):
             # By default, show full frequency range up to Nyquist frequency (sample_rate / 2)
             fmin = 0.0
             fmax = (sample_rate / 2.0) if sample_rate > 0 else None
-            self._spectrogram_widget.set_frequency_range(fmin, fmax)
+            self._set_frequency_range(fmin, fmax)
             self._spectrogram_widget.set_audio_path(file_path)
-            self._tiler.fmin = fmin
-            self._tiler.fmax = fmax
 
             self._status_label.setText(f"Loaded: {file_path.name}")
             logger.info(f"Loaded audio file: {file_path}")
@@ -1046,9 +1165,7 @@ class MainWindow(QMainWindow):
             # Clear any existing segments and UI until detection is requested
             if self._pipeline_wrapper:
                 self._pipeline_wrapper.current_segments = []
-            self._apply_segments_to_views([])
-            self._update_sample_table([])
-            self._update_navigator_markers()
+            self._refresh_all_views()
 
             # Mark as modified (audio file loaded)
             self._project_modified = True
@@ -1086,10 +1203,6 @@ class MainWindow(QMainWindow):
         Returns:
             ProjectData object with current state.
         """
-        from datetime import datetime
-
-        from spectrosampler.gui.project import PROJECT_VERSION, UIState
-
         # Collect segments
         segments = []
         if self._pipeline_wrapper and self._pipeline_wrapper.current_segments:
@@ -1117,10 +1230,11 @@ class MainWindow(QMainWindow):
             grid_settings = _grid_settings_to_dict(self._grid_settings)
 
         # Collect UI state
+        view = self._spectrogram_widget.view_state()
         ui_state = UIState(
-            view_start=self._spectrogram_widget._start_time,
-            view_end=self._spectrogram_widget._end_time,
-            zoom_level=self._spectrogram_widget._zoom_level,
+            view_start=view.start,
+            view_end=view.end,
+            zoom_level=view.zoom,
             editor_splitter_sizes=(
                 list(self._editor_splitter.sizes()) if hasattr(self, "_editor_splitter") else []
             ),
@@ -1249,8 +1363,7 @@ class MainWindow(QMainWindow):
         if data.grid_settings:
             try:
                 self._grid_settings = _dict_to_grid_settings(data.grid_settings)
-                self._grid_manager.settings = self._grid_settings
-                self._spectrogram_widget.set_grid_manager(self._grid_manager)
+                self._apply_grid_settings()
                 # Update grid menu actions
                 if hasattr(self, "_grid_mode_free_action") and hasattr(
                     self, "_grid_mode_musical_action"
@@ -1270,17 +1383,13 @@ class MainWindow(QMainWindow):
                 try:
                     segments = [_dict_to_segment(s) for s in data.segments]
                     self._pipeline_wrapper.current_segments = segments
-                    self._apply_segments_to_views(self._get_display_segments())
-                    self._update_sample_table(segments)
-                    self._update_navigator_markers()
+                    self._refresh_all_views()
                 except (ValueError, KeyError, TypeError) as e:
                     logger.warning("Failed to restore segments: %s", e, exc_info=e)
             else:
                 # No segments in project - clear segments
                 self._pipeline_wrapper.current_segments = []
-                self._apply_segments_to_views([])
-                self._update_sample_table([])
-                self._update_navigator_markers()
+                self._refresh_all_views()
 
         # Restore UI state
         if data.ui_state:
@@ -1290,12 +1399,11 @@ class MainWindow(QMainWindow):
                     view_start = data.ui_state.view_start
                     view_end = data.ui_state.view_end
                     # Ensure view is within audio duration
-                    if self._spectrogram_widget._duration > 0:
-                        view_end = min(view_end, self._spectrogram_widget._duration)
+                    total = self._spectrogram_widget.view_state().duration
+                    if total > 0:
+                        view_end = min(view_end, total)
                         view_start = max(0.0, min(view_start, view_end - 0.1))
-                        self._spectrogram_widget.set_time_range(view_start, view_end)
-                        self._navigator.set_view_range(view_start, view_end)
-                        self._waveform_widget.set_view_range(view_start, view_end)
+                        self._set_view_range(view_start, view_end)
                 # Restore zoom level
                 if hasattr(data.ui_state, "zoom_level"):
                     self._spectrogram_widget.set_zoom_level(data.ui_state.zoom_level)
@@ -1392,9 +1500,9 @@ class MainWindow(QMainWindow):
         self._undo_stack.clear()
         self._redo_stack.clear()
         if self._pipeline_wrapper:
-            self._baseline_segments = copy.deepcopy(self._pipeline_wrapper.current_segments)
+            self._baseline_segments = capture_snapshot(self._pipeline_wrapper.current_segments)
         else:
-            self._baseline_segments = []
+            self._baseline_segments = capture_snapshot([])
         self._update_window_title()
 
     def save_project(self, path: Path | None = None) -> bool:
@@ -1410,8 +1518,6 @@ class MainWindow(QMainWindow):
             path = self._project_path
             if path is None:
                 # Generate recommended filename based on date and audio file
-                from datetime import datetime
-
                 recommended_name = "project.ssproj"
                 if self._current_audio_path:
                     date_str = datetime.now().strftime("%Y-%m-%d")
@@ -1438,8 +1544,6 @@ class MainWindow(QMainWindow):
 
             # If this is a new project, set created timestamp
             if not self._project_path or self._project_path != path:
-                from datetime import datetime
-
                 project_data.created = datetime.utcnow().isoformat() + "Z"
             else:
                 # Preserve created timestamp from existing project
@@ -1448,8 +1552,6 @@ class MainWindow(QMainWindow):
                     project_data.created = existing_data.created
                 except (OSError, ValueError) as exc:
                     # If we can't load existing, use current time
-                    from datetime import datetime
-
                     logger.warning(
                         "Could not load existing project metadata: %s", exc, exc_info=exc
                     )
@@ -1464,9 +1566,9 @@ class MainWindow(QMainWindow):
             self._undo_stack.clear()
             self._redo_stack.clear()
             if self._pipeline_wrapper:
-                self._baseline_segments = copy.deepcopy(self._pipeline_wrapper.current_segments)
+                self._baseline_segments = capture_snapshot(self._pipeline_wrapper.current_segments)
             else:
-                self._baseline_segments = []
+                self._baseline_segments = capture_snapshot([])
             self._update_window_title()
 
             # Add to recent projects
@@ -1584,16 +1686,31 @@ class MainWindow(QMainWindow):
             self._overview_manager.cancel()
         if self._waveform_manager.is_generating():
             self._waveform_manager.cancel()
+        self._detection_manager.shutdown()
 
         # Auto-save on close if enabled and modified
         if self._settings_manager.get_auto_save_enabled() and self._project_modified:
             self._autosave_manager.save_now()
 
+        self._discard_decoded_playback_file()
+
         # Save window geometry
         self._save_window_geometry()
 
         event.accept()
 
+    @property
+    def _project_modified(self) -> bool:
+        """Whether the project has unsaved changes."""
+        return self._project_modified_flag
+
+    @_project_modified.setter
+    def _project_modified(self, modified: bool) -> None:
+        self._project_modified_flag = modified
+        # Every edit passes through here, so auto-save can skip ticks with nothing new
+        if modified and hasattr(self, "_autosave_manager"):
+            self._autosave_manager.mark_dirty()
+
     def _update_window_title(self) -> None:
         """Update window title with project name and modified indicator."""
         title = "SpectroSampler"
@@ -1952,9 +2069,7 @@ class MainWindow(QMainWindow):
             if sample_rate > 0:
                 fmin = 0.0
                 fmax = sample_rate / 2.0
-                self._spectrogram_widget.set_frequency_range(fmin, fmax)
-                self._tiler.fmin = fmin
-                self._tiler.fmax = fmax
+                self._set_frequency_range(fmin, fmax)
 
         # Update menu actions to reflect actual visibility
         if hasattr(self, "_show_info_action"):
@@ -1987,8 +2102,6 @@ class MainWindow(QMainWindow):
 
     def _on_autosave_interval_settings(self) -> None:
         """Handle auto-save interval settings dialog."""
-        from PySide6.QtWidgets import QInputDialog
-
         current_interval = self._settings_manager.get_auto_save_interval()
         interval, ok = QInputDialog.getInt(
             self,
@@ -2046,9 +2159,8 @@ class MainWindow(QMainWindow):
         """Handle waveform generation completion."""
         self._waveform_widget.set_waveform_data(data)
         # Ensure the displayed range remains in sync with the spectrogram
-        self._waveform_widget.set_view_range(
-            self._spectrogram_widget._start_time, self._spectrogram_widget._end_time
-        )
+        view = self._spectrogram_widget.view_state()
+        self._waveform_widget.set_view_range(view.start, view.end)
         logger.info("Waveform generation completed for: %s", self._current_audio_path)
 
     def _on_waveform_error(self, error_msg: str) -> None:
@@ -2108,8 +2220,8 @@ class MainWindow(QMainWindow):
             try:
                 existing = getattr(self._pipeline_wrapper, "current_segments", [])
                 if existing:
-                    # Deep-copy to avoid in-place mutations during UI updates
-                    self._existing_segments_buffer = copy.deepcopy(existing)
+                    # Copy to avoid in-place mutations during UI updates
+                    self._existing_segments_buffer = copy_segments(existing)
                 else:
                     self._existing_segments_buffer = []
             except (AttributeError, TypeError) as exc:
@@ -2148,15 +2260,12 @@ class MainWindow(QMainWindow):
         segments = result.get("segments", [])
         # Ensure enabled flag defaults to True
         for s in segments:
-            if not hasattr(s, "attrs") or s.attrs is None:
-                s.attrs = {}
             s.attrs.setdefault("enabled", True)
         # If we have existing segments preserved before detection, resolve overlaps
         existing_segments = getattr(self, "_existing_segments_buffer", []) or []
         final_segments = segments
         if existing_segments:
             try:
-                from spectrosampler.gui.overlap_detector import find_overlaps
                 from spectrosampler.gui.overlap_resolution_dialog import (
                     OverlapResolutionDialog,
                 )
@@ -2280,7 +2389,8 @@ class MainWindow(QMainWindow):
             self._pipeline_wrapper.current_segments = final_segments
         # Apply auto-order if enabled (after merging new segments with existing)
         self._maybe_auto_reorder()
-        self._apply_segments_to_views(self._get_display_segments())
+        self._invalidate_display_segments()
+        # _update_sample_table also applies the display segments to the editor views
         self._update_sample_table(
             self._pipeline_wrapper.current_segments if self._pipeline_wrapper else final_segments
         )
@@ -2335,19 +2445,31 @@ class MainWindow(QMainWindow):
         QMessageBox.critical(self, "Detection Error", f"Failed to detect samples:\n{message}")
 
     def _on_settings_changed(self) -> None:
-        """Handle settings change."""
-        # Settings are now managed through the dialog, so this method is no longer needed
-        # but kept for compatibility in case it's called elsewhere
-        pass
+        """Handle grid settings change from the menu actions."""
+        # Detection settings are managed through the dialog; only grid settings flow through here
+        self._apply_grid_settings()
 
     def _apply_detection_settings(self, settings: ProcessingSettings) -> None:
         """Apply detection settings to dependent components."""
-        fmin = settings.hp
-        fmax = settings.lp
+        self._set_frequency_range(settings.hp, settings.lp)
+        self._apply_grid_settings()
+
+    def _set_frequency_range(self, fmin: float | None, fmax: float | None) -> None:
+        """Set the displayed frequency range, skipping the tile-cache flush if it is unchanged."""
+        if (fmin, fmax) == self._applied_frequency_range:
+            return
+        self._applied_frequency_range = (fmin, fmax)
         self._spectrogram_widget.set_frequency_range(fmin, fmax)
         self._tiler.fmin = fmin
         self._tiler.fmax = fmax
+
+    def _apply_grid_settings(self) -> None:
+        """Point the grid manager at the current grid settings and redraw overlays if they changed."""
         self._grid_manager.settings = self._grid_settings
+        grid_state = dataclasses.astuple(self._grid_settings)
+        if grid_state == self._applied_grid_state:
+            return
+        self._applied_grid_state = grid_state
         self._spectrogram_widget.set_grid_manager(self._grid_manager)
 
     def _persist_detection_settings(self, settings: ProcessingSettings) -> None:
@@ -2504,66 +2626,23 @@ class MainWindow(QMainWindow):
             start: New start time.
             end: New end time.
         """
-        if self._pipeline_wrapper and index < len(self._pipeline_wrapper.current_segments):
-            seg = self._pipeline_wrapper.current_segments[index]
-            old_start = seg.start
-            old_end = seg.end
-            seg.start = start
-            seg.end = end
-            # Fast path: notify model for this column only
-            self._sample_table_model.update_segment_times(index, seg.start, seg.end)
-
-            self._maybe_auto_reorder()
-            # Update overlays in the editors without requesting new tiles
-            self._apply_segments_to_views(self._get_display_segments())
-            self._update_navigator_markers()
-
-            # Update player widget if this is the currently playing sample
-            if index == self._current_playing_index:
-                # Calculate new duration in milliseconds
-                new_duration = seg.duration()
-                new_duration_ms = int(new_duration * 1000)
-
-                # Update segment boundaries for playback
-                self._current_playing_start = start
-                self._current_playing_end = end
+        self._on_sample_bounds_changed(index, start, end)
 
-                # Update player widget with new segment info
-                self._sample_player.set_sample(
-                    seg, index, len(self._pipeline_wrapper.current_segments)
-                )
-
-                # Adjust scrub bar position based on new segment boundaries
-                # Current media player position is relative to the old extracted segment
-                if self._media_player.duration() > 0:
-                    current_media_pos_ms = self._media_player.position()
-                    old_duration = old_end - old_start
-
-                    if old_duration > 0:
-                        # Calculate position as fraction of old segment duration
-                        relative_position = current_media_pos_ms / (old_duration * 1000.0)
-                        # Map to new segment duration
-                        new_position_ms = int(relative_position * new_duration_ms)
-                        # Clamp to new duration bounds
-                        new_position_ms = max(0, min(new_position_ms, new_duration_ms))
-                    else:
-                        new_position_ms = 0
-
-                    # Update scrub bar with adjusted position and new duration
-                    self._sample_player.set_position(new_position_ms, new_duration_ms)
+    def _on_sample_resized(self, index: int, start: float, end: float) -> None:
+        """Handle sample resized.
 
-                    # Update paused position if paused
-                    if self._is_paused:
-                        self._paused_position = new_position_ms
+        Args:
+            index: Sample index.
+            start: New start time.
+            end: New end time.
+        """
+        self._on_sample_bounds_changed(index, start, end)
 
-            # Mark as modified (sample moved)
-            self._project_modified = True
-            self._update_window_title()
-            # Update action states (overlaps/duplicates may have changed)
-            self._update_sample_action_states()
+    def _on_sample_bounds_changed(self, index: int, start: float, end: float) -> None:
+        """Apply new sample boundaries from a move or resize.
 
-    def _on_sample_resized(self, index: int, start: float, end: float) -> None:
-        """Handle sample resized.
+        The segment, table cell and player are updated immediately; editor overlays and
+        navigator markers are coalesced through ``_schedule_segment_redraw``.
 
         Args:
             index: Sample index.
@@ -2579,13 +2658,14 @@ class MainWindow(QMainWindow):
             # Fast path: notify model for this column only
             self._sample_table_model.update_segment_times(index, seg.start, seg.end)
 
+            # Check before re-ordering, which renumbers the playing index
+            is_playing = index == self._current_playing_index
             self._maybe_auto_reorder()
-            # Update overlays in the editors without requesting new tiles
-            self._apply_segments_to_views(self._get_display_segments())
-            self._update_navigator_markers()
+            # Overlays and navigator markers are refreshed once per frame
+            self._schedule_segment_redraw()
 
             # Update player widget if this is the currently playing sample
-            if index == self._current_playing_index:
+            if is_playing:
                 # Calculate new duration in milliseconds
                 new_duration = seg.duration()
                 new_duration_ms = int(new_duration * 1000)
@@ -2594,9 +2674,12 @@ class MainWindow(QMainWindow):
                 self._current_playing_start = start
                 self._current_playing_end = end
 
-                # Update player widget with new segment info
+                # Update player widget with new segment info, at its post-sort position
+                playing_index = self._current_playing_index
                 self._sample_player.set_sample(
-                    seg, index, len(self._pipeline_wrapper.current_segments)
+                    seg,
+                    index if playing_index is None else playing_index,
+                    len(self._pipeline_wrapper.current_segments),
                 )
 
                 # Adjust scrub bar position based on new segment boundaries
@@ -2622,11 +2705,27 @@ class MainWindow(QMainWindow):
                     if self._is_paused:
                         self._paused_position = new_position_ms
 
-            # Mark as modified (sample resized)
+            # Mark as modified
             self._project_modified = True
             self._update_window_title()
-            # Update action states (overlaps/duplicates may have changed)
-            self._update_sample_action_states()
+
+    def _schedule_segment_redraw(self) -> None:
+        """Request a coalesced refresh of segment overlays, markers and action states.
+
+        The editor's segment index is rebuilt now so culling and hit-testing see the edit;
+        only the repaint waits for the timer.
+        """
+        self._spectrogram_widget.set_segments(self._get_display_segments(), redraw=False)
+        self._segment_redraw_timer.start()
+
+    def _flush_segment_redraw(self) -> None:
+        """Apply a pending segment refresh immediately."""
+        self._segment_redraw_timer.stop()
+        # Update overlays in the editors without requesting new tiles
+        self._apply_segments_to_views(self._get_display_segments())
+        self._update_navigator_markers()
+        # Update action states (overlaps/duplicates may have changed)
+        self._update_sample_action_states()
 
     def _on_sample_created(self, start: float, end: float) -> None:
         """Handle sample created.
@@ -2635,18 +2734,22 @@ class MainWindow(QMainWindow):
             start: Start time.
             end: End time.
         """
-        from spectrosampler.detectors.base import Segment
-
         # Create new segment
         seg = Segment(start=start, end=end, detector="manual", score=1.0)
         if self._pipeline_wrapper:
             # Default enabled
             seg.attrs["enabled"] = True
-            self._pipeline_wrapper.current_segments.append(seg)
+            segments = self._pipeline_wrapper.current_segments
+            if self._auto_order:
+                # Keep the sorted invariant with one insertion instead of a full re-sort
+                pos = bisect.bisect_right(segments, start, key=_segment_start)
+                segments.insert(pos, seg)
+                if self._current_playing_index is not None and self._current_playing_index >= pos:
+                    self._current_playing_index += 1
+            else:
+                segments.append(seg)
             self._maybe_auto_reorder()
-            self._apply_segments_to_views(self._get_display_segments())
-            self._update_sample_table(self._pipeline_wrapper.current_segments)
-            self._update_navigator_markers()
+            self._refresh_all_views()
 
             # Mark as modified (sample created)
             self._project_modified = True
@@ -2666,22 +2769,20 @@ class MainWindow(QMainWindow):
         """Update navigator markers from current segments."""
         if not self._pipeline_wrapper:
             return
-        show_disabled = (
-            getattr(self, "_show_disabled_action", None) is None
-            or self._show_disabled_action.isChecked()
-        )
-        markers = []
-        for seg in self._pipeline_wrapper.current_segments:
-            enabled = seg.attrs.get("enabled", True)
-            if enabled:
-                color = self._get_segment_color(seg.detector)
-                markers.append((seg.start, seg.end, color))
-            elif show_disabled:
-                # Dim gray for disabled markers
-                from PySide6.QtGui import QColor
-
-                markers.append((seg.start, seg.end, QColor(120, 120, 120, 160)))
-        self._navigator.set_sample_markers(markers)
+        show_disabled = self._show_disabled
+        # One pass packs timing, enabled state and interned detector ids into arrays
+        rows = segments_to_array(self._pipeline_wrapper.current_segments)
+        if not show_disabled:
+            rows = rows[rows["enabled"]]
+        enabled = rows["enabled"]
+        # Palette slot 0 is the dim gray used for disabled markers; each detector present
+        # gets one slot, so colors are looked up per detector rather than per segment
+        detector_ids, slots = np.unique(rows["detector"][enabled], return_inverse=True)
+        palette = [_DISABLED_MARKER_COLOR]
+        palette.extend(self._get_segment_color(detector_name(int(i))) for i in detector_ids)
+        color_ids = np.zeros(len(rows), dtype=np.intp)
+        color_ids[enabled] = slots + 1
+        self._navigator.set_marker_array(rows["start"], rows["end"], color_ids, palette)
 
     def _on_sample_play_requested(self, index: int) -> None:
         """Handle sample play request.
@@ -2741,6 +2842,8 @@ class MainWindow(QMainWindow):
             if index is not None:
                 self._current_playing_index = index
 
+            self._media_warmup_active = False
+
             # Set playback_stopped flag to False BEFORE stopping to prevent cleanup handlers
             # from resetting _current_playing_index when we're starting a new playback
             self._playback_stopped = False
@@ -2749,63 +2852,12 @@ class MainWindow(QMainWindow):
             self._media_player.stop()
             self._media_player.setSource(QUrl())
 
-            # Clean up previous temp file
-            if self._temp_playback_file and self._temp_playback_file.exists():
-                try:
-                    self._temp_playback_file.unlink()
-                except OSError as exc:
-                    logger.debug(
-                        "Failed to remove temporary playback file %s: %s",
-                        self._temp_playback_file,
-                        exc,
-                        exc_info=exc,
-                    )
-                self._temp_playback_file = None
-
-            # Extract segment to temporary file with unique filename
-            temp_dir = Path(tempfile.gettempdir())
-            unique_id = uuid.uuid4().hex
-            self._temp_playback_file = temp_dir / f"spectrosampler_playback_{unique_id}.wav"
-
-            duration = end_time - start_time
-
-            # Use FFmpeg to extract segment
-            cmd = [
-                "ffmpeg",
-                "-hide_banner",
-                "-loglevel",
-                "error",
-                "-fflags",
-                "+genpts",
-                "-avoid_negative_ts",
-                "make_zero",
-                "-y",
-                "-i",
-                str(self._current_audio_path),
-                "-ss",
-                f"{start_time:.6f}",
-                "-t",
-                f"{duration:.6f}",
-                # Ensure presentation timestamps are generated so Qt's FFmpeg backend
-                # does not complain about AV_NOPTS_VALUE packets when demuxing.
-                "-af",
-                "asetpts=PTS-STARTPTS",
-                "-acodec",
-                "pcm_s16le",
-                "-ar",
-                "44100",
-                "-ac",
-                "2",
-                str(self._temp_playback_file),
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                logger.error(f"FFmpeg extraction failed: {result.stderr}")
+            # Release the previous in-memory source
+            self._release_playback_buffer()
+
+            wav_data = self._render_playback_slice(start_time, end_time)
+            if wav_data is None:
                 self._is_transitioning_to_new_sample = False  # Clear flag on error
-                QMessageBox.warning(
-                    self, "Playback Error", f"Failed to extract audio segment:\n{result.stderr}"
-                )
                 return
 
             # Store current playing info for looping
@@ -2841,7 +2893,7 @@ class MainWindow(QMainWindow):
                     paused=False,
                 )
 
-            # Clean up temp file when playback finishes and handle looping
+            # Handle looping/auto-advance when playback finishes
             def on_playback_finished(status):
                 if status == QMediaPlayer.MediaStatus.EndOfMedia:
                     self._handle_end_of_media()
@@ -2865,37 +2917,222 @@ class MainWindow(QMainWindow):
             self._media_player.mediaStatusChanged.connect(on_media_status_changed)
             self._media_status_handler = on_media_status_changed
 
-            # Load the extracted segment
-            url = QUrl.fromLocalFile(str(self._temp_playback_file))
-            self._media_player.setSource(url)
+            # Load the rendered slice from memory
+            buffer = QBuffer(self)
+            buffer.setData(QByteArray(wav_data))
+            buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+            self._playback_buffer = buffer
+            self._media_player.setSourceDevice(buffer, QUrl("memory://sample.wav"))
 
         except (subprocess.SubprocessError, OSError, RuntimeError, ValueError) as e:
             self._is_transitioning_to_new_sample = False  # Clear flag on error
             logger.error("Failed to play segment: %s", e, exc_info=e)
             QMessageBox.warning(self, "Playback Error", f"Failed to play audio segment:\n{str(e)}")
 
+    def _render_playback_slice(self, start_time: float, end_time: float) -> bytes | None:
+        """Return WAV bytes for a slice of the current audio file.
+
+        Slices are decoded in-process and cached; formats libsndfile cannot read are sliced
+        from a PCM copy that FFmpeg decodes once per file in the background.
+
+        Args:
+            start_time: Start time in seconds.
+            end_time: End time in seconds.
+
+        Returns:
+            WAV bytes, or None if the slice could not be decoded.
+        """
+        audio_path = self._current_audio_path
+        wav_data = self._playback_slice_cache.get(audio_path, start_time, end_time)
+        if wav_data is not None:
+            return wav_data
+        wav_data = render_wav_slice(audio_path, start_time, end_time)
+        # An empty slice of a readable file (e.g. past its end) has nothing to fall back to
+        if wav_data is None and end_time > start_time and not can_read_in_process(audio_path):
+            decoded_path = self._decoded_playback_path()
+            if decoded_path is not None:
+                wav_data = render_wav_slice(decoded_path, start_time, end_time)
+            else:
+                wav_data = self._extract_playback_slice(start_time, end_time)
+        if wav_data is not None:
+            self._playback_slice_cache.put(audio_path, start_time, end_time, wav_data)
+        return wav_data
+
+    def _decoded_playback_path(self) -> Path | None:
+        """Return the PCM WAV copy of the current audio file, if it is ready.
+
+        Only used for formats libsndfile cannot read. The first call for a file starts the
+        FFmpeg decode on the thread pool and returns None; callers extract single slices
+        with :meth:`_extract_playback_slice` until the copy is ready.
+
+        Returns:
+            Path to the decoded WAV, or None if it is not available yet.
+        """
+        source = self._current_audio_path
+        key = _playback_source_key(source)
+        if key is None:
+            return None
+        if key == self._decoded_playback_source:
+            # Pending or failed decodes leave the file unset
+            if self._decoded_playback_file is not None and self._decoded_playback_file.exists():
+                return self._decoded_playback_file
+            return None
+        self._discard_decoded_playback_file()
+
+        temp_dir = Path(tempfile.gettempdir())
+        decoded_path = temp_dir / f"spectrosampler_playback_{uuid.uuid4().hex}.wav"
+        runnable = PlaybackDecodeRunnable(source, decoded_path, key)
+        self._playback_decode_signals = runnable.signals
+        self._playback_decode_signals.finished.connect(self._on_playback_decode_finished)
+        self._playback_decode_signals.error.connect(self._on_playback_decode_error)
+        self._decoded_playback_source = key
+        QThreadPool.globalInstance().start(runnable)
+        return None
+
+    def _on_playback_decode_finished(self, key: tuple[Path, int, int], decoded_path: Path) -> None:
+        """Adopt a finished background decode if it is still for the current file.
+
+        Args:
+            key: Source identity the decode was started for.
+            decoded_path: Decoded WAV file.
+        """
+        if key != self._decoded_playback_source or self._decoded_playback_file is not None:
+            decoded_path.unlink(missing_ok=True)
+            return
+        self._decoded_playback_file = decoded_path
+
+    def _on_playback_decode_error(self, key: tuple[Path, int, int], error_msg: str) -> None:
+        """Log a failed background decode; playback keeps extracting single slices.
+
+        Args:
+            key: Source identity the decode was started for.
+            error_msg: FFmpeg error output.
+        """
+        logger.error("FFmpeg decode of %s failed: %s", key[0], error_msg)
+
+    def _extract_playback_slice(self, start_time: float, end_time: float) -> bytes | None:
+        """Decode one slice of the current audio file with FFmpeg.
+
+        Args:
+            start_time: Start time in seconds.
+            end_time: End time in seconds.
+
+        Returns:
+            WAV bytes, or None if FFmpeg failed.
+        """
+        temp_dir = Path(tempfile.gettempdir())
+        slice_path = temp_dir / f"spectrosampler_playback_{uuid.uuid4().hex}.wav"
+        cmd = ffmpeg_playback_command(
+            self._current_audio_path, slice_path, start_time, end_time - start_time
+        )
+        try:
+            error = run_ffmpeg_decode(cmd)
+            if error is not None:
+                logger.error("FFmpeg extraction failed: %s", error)
+                QMessageBox.warning(
+                    self, "Playback Error", f"Failed to extract audio segment:\n{error}"
+                )
+                return None
+            return slice_path.read_bytes()
+        finally:
+            slice_path.unlink(missing_ok=True)
+
+    def _discard_decoded_playback_file(self) -> None:
+        """Delete the decoded playback copy, if any, and drop any decode still running."""
+        # A decode still running finds its key stale when it finishes and deletes its output
+        self._decoded_playback_source = None
+        self._playback_decode_signals = None
+        if self._decoded_playback_file is None:
+            return
+        try:
+            self._decoded_playback_file.unlink(missing_ok=True)
+        except OSError as exc:
+            logger.debug(
+                "Failed to remove decoded playback file %s: %s",
+                self._decoded_playback_file,
+                exc,
+                exc_info=exc,
+            )
+        self._decoded_playback_file = None
+
+    def _warm_up_media_player(self) -> None:
+        """Load a short silent clip so the first real play does not pay backend start-up.
+
+        The first source a QMediaPlayer opens initialises its backend (demuxer, decoder and
+        audio output), which otherwise shows up as a noticeable delay on the first click.
+        """
+        if self._playback_buffer is not None or self._current_playing_start is not None:
+            return
+        buffer = QBuffer(self)
+        buffer.setData(QByteArray(silent_wav(0.1)))
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        self._playback_buffer = buffer
+        self._media_warmup_active = True
+        self._media_player.setSourceDevice(buffer, QUrl("memory://warmup.wav"))
+
+    def _release_playback_buffer(self) -> None:
+        """Close and discard the in-memory playback buffer, if any."""
+        if self._playback_buffer is not None:
+            self._playback_buffer.close()
+            self._playback_buffer.deleteLater()
+            self._playback_buffer = None
+
     def _on_navigator_view_changed(self, start_time: float, end_time: float) -> None:
-        """Handle navigator view change.
+        """Handle navigator view move or resize.
+
+        The navigator draws its own indicator immediately. The editor and waveform follow the
+        first range of a drag right away, then the latest range at most once per throttle
+        interval.
 
         Args:
             start_time: Start time.
             end_time: End time.
         """
-        self._spectrogram_widget.set_time_range(start_time, end_time)
-        self._waveform_widget.set_view_range(start_time, end_time)
+        if self._navigator_view_timer.isActive():
+            self._pending_navigator_view = (start_time, end_time)
+            return
+        self._set_view_range(start_time, end_time, update_navigator=False)
+        self._navigator_view_timer.start()
+
+    def _flush_navigator_view(self) -> None:
+        """Apply the most recent navigator range, if one is pending."""
+        self._navigator_view_timer.stop()
+        pending = self._pending_navigator_view
+        if pending is not None:
+            self._set_view_range(*pending, update_navigator=False)
+            # Keep coalescing while the drag continues
+            self._navigator_view_timer.start()
+
+    def _set_view_range(
+        self, start_time: float, end_time: float, *, update_navigator: bool = True
+    ) -> None:
+        """Apply a view range chosen by the main window to the editor and auxiliary views.
 
-    def _on_navigator_view_resized(self, start_time: float, end_time: float) -> None:
-        """Handle navigator view resize.
+        The range is clamped by the editor once and the clamped range is fanned out. The
+        editor's ``view_changed`` echo is ignored so each view is updated exactly once.
 
         Args:
-            start_time: Start time.
-            end_time: End time.
+            start_time: Start time in seconds.
+            end_time: End time in seconds.
+            update_navigator: False when the navigator itself originated the change.
         """
-        self._spectrogram_widget.set_time_range(start_time, end_time)
-        self._waveform_widget.set_view_range(start_time, end_time)
+        # Any explicit range supersedes a throttled navigator drag still in flight
+        self._pending_navigator_view = None
+        self._navigator_view_timer.stop()
+        self._applying_view_range = True
+        try:
+            self._spectrogram_widget.set_time_range(start_time, end_time)
+        finally:
+            self._applying_view_range = False
+        view = self._spectrogram_widget.view_state()
+        if update_navigator:
+            self._navigator.set_view_range(view.start, view.end)
+        self._waveform_widget.set_view_range(view.start, view.end)
 
     def _on_spectrogram_view_changed(self, start_time: float, end_time: float) -> None:
         """Handle spectrogram view updates and keep auxiliary widgets in sync."""
+        if self._applying_view_range:
+            return
         self._navigator.set_view_range(start_time, end_time)
         self._waveform_widget.set_view_range(start_time, end_time)
 
@@ -2906,14 +3143,19 @@ class MainWindow(QMainWindow):
             time: Time in seconds.
         """
         # Update view to center on clicked time
-        view_duration = self._spectrogram_widget._end_time - self._spectrogram_widget._start_time
-        new_start = max(
-            0.0, min(time - view_duration / 2, self._spectrogram_widget._duration - view_duration)
-        )
-        new_end = new_start + view_duration
-        self._spectrogram_widget.set_time_range(new_start, new_end)
-        self._navigator.set_view_range(new_start, new_end)
-        self._waveform_widget.set_view_range(new_start, new_end)
+        self._center_view_on(time)
+
+    def _center_view_on(self, center: float) -> None:
+        """Scroll the editor so ``center`` is mid-view, keeping zoom and staying in bounds.
+
+        Args:
+            center: Time in seconds to center on.
+        """
+        view = self._spectrogram_widget.view_state()
+        view_duration = max(0.01, view.span)
+        total = max(0.0, view.duration)
+        new_start = max(0.0, min(center - (view_duration / 2.0), max(0.0, total - view_duration)))
+        self._set_view_range(new_start, new_start + view_duration)
 
     def _on_player_play_requested(self, index: int) -> None:
         """Handle player play request.
@@ -2979,6 +3221,7 @@ class MainWindow(QMainWindow):
         # Stop playback and clear source
         self._media_player.stop()
         self._media_player.setSource(QUrl())
+        self._release_playback_buffer()
 
         # Update UI state
         self._sample_player.set_playing(False)
@@ -3147,12 +3390,10 @@ class MainWindow(QMainWindow):
         if not self._pipeline_wrapper or not self._pipeline_wrapper.current_segments:
             return None
 
-        segments = self._pipeline_wrapper.current_segments
-        for idx in range(from_index + 1, len(segments)):
-            seg = segments[idx]
-            if seg.attrs.get("enabled", True):
-                return idx
-        return None
+        following = np.flatnonzero(self._get_enabled_mask()[from_index + 1 :])
+        if following.size == 0:
+            return None
+        return from_index + 1 + int(following[0])
 
     def _finalize_completed_playback(self) -> None:
         """Clean up state after playback ends without auto-advancing."""
@@ -3170,28 +3411,35 @@ class MainWindow(QMainWindow):
         self._spectrogram_widget.set_playback_state(None, None)
         self._waveform_widget.set_playback_state(None, None)
 
-        if self._temp_playback_file and self._temp_playback_file.exists():
-            try:
-                self._temp_playback_file.unlink()
-                self._temp_playback_file = None
-            except OSError as exc:
-                logger.debug(
-                    "Failed to remove temporary playback file %s: %s",
-                    self._temp_playback_file,
-                    exc,
-                    exc_info=exc,
-                )
-
     def _on_media_position_changed(self, position: int) -> None:
         """Handle media player position change.
 
         Args:
             position: Position in milliseconds.
         """
+        if self._media_warmup_active:
+            return
         # Use player widget's duration if available (from actual segment), otherwise fall back to media player duration
         duration = self._media_player.duration()
         if hasattr(self._sample_player, "_duration") and self._sample_player._duration > 0:
             duration = self._sample_player._duration
+
+        # Backends can report positions every few ms; cap UI updates at ~30 Hz while playing.
+        # Seeks, pauses and the final stretch before the end always go through. A seek is a
+        # position that strays from where steady playback would be by more than an interval.
+        now_ms = time.monotonic() * 1000.0
+        elapsed_ms = now_ms - self._last_position_update_ms
+        expected_ms = self._last_position_ms + elapsed_ms
+        if (
+            self._media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
+            and elapsed_ms < self._position_update_interval_ms
+            and abs(position - expected_ms) <= self._position_update_interval_ms
+            and not (duration > 0 and position >= duration - self._position_update_interval_ms)
+        ):
+            return
+        self._last_position_update_ms = now_ms
+        self._last_position_ms = position
+
         if duration > 0:
             self._sample_player.set_position(position, duration)
         if self._current_playing_index is not None and self._current_playing_start is not None:
@@ -3215,6 +3463,8 @@ class MainWindow(QMainWindow):
         Args:
             duration: Duration in milliseconds.
         """
+        if self._media_warmup_active:
+            return
         # Use player widget's duration if available (from actual segment), otherwise fall back to media player duration
         if hasattr(self._sample_player, "_duration") and self._sample_player._duration > 0:
             duration = self._sample_player._duration
@@ -3283,17 +3533,7 @@ class MainWindow(QMainWindow):
         if not (0 <= index < len(segments)):
             return
         seg = segments[index]
-        center = (seg.start + seg.end) / 2.0
-        # Maintain current view duration
-        view_duration = max(
-            0.01, self._spectrogram_widget._end_time - self._spectrogram_widget._start_time
-        )
-        total = max(0.0, self._spectrogram_widget._duration)
-        new_start = max(0.0, min(center - (view_duration / 2.0), max(0.0, total - view_duration)))
-        new_end = new_start + view_duration
-        self._spectrogram_widget.set_time_range(new_start, new_end)
-        self._navigator.set_view_range(new_start, new_end)
-        self._waveform_widget.set_view_range(new_start, new_end)
+        self._center_view_on((seg.start + seg.end) / 2.0)
 
     def _on_fill_clicked(self, index: int) -> None:
         """Zoom so the sample fills the editor with a small margin, then center."""
@@ -3308,14 +3548,12 @@ class MainWindow(QMainWindow):
         margin = max(0.05, min(1.0, seg_dur * 0.05))
         desired_start = max(0.0, seg.start - margin)
         desired_end = seg.end + margin
-        total = max(0.0, self._spectrogram_widget._duration)
+        total = max(0.0, self._spectrogram_widget.view_state().duration)
         desired_end = min(desired_end, total)
         # Ensure non-empty
         if desired_end <= desired_start:
             desired_end = min(total, desired_start + seg_dur + 2 * margin)
-        self._spectrogram_widget.set_time_range(desired_start, desired_end)
-        self._navigator.set_view_range(desired_start, desired_end)
-        self._waveform_widget.set_view_range(desired_start, desired_end)
+        self._set_view_range(desired_start, desired_end)
 
     def _apply_segments_to_views(
         self, segments: list[Segment], *, update_tiles: bool = False
@@ -3324,12 +3562,22 @@ class MainWindow(QMainWindow):
         self._spectrogram_widget.set_segments(segments, update_tiles=update_tiles)
         self._waveform_widget.set_segments(segments)
 
+    def _refresh_all_views(self) -> None:
+        """Push the current segment list to every view after a structural change.
+
+        Invalidates the display cache, then rebuilds the sample table (which also applies the
+        display segments to the spectrogram and waveform) and the navigator markers.
+        """
+        self._invalidate_display_segments()
+        self._update_sample_table(
+            self._pipeline_wrapper.current_segments if self._pipeline_wrapper else []
+        )
+        self._update_navigator_markers()
+
     def _update_sample_table(self, segments: list[Segment]) -> None:
         """Update sample table model with new segments."""
         # Ensure enabled flag exists
         for seg in segments:
-            if not hasattr(seg, "attrs") or seg.attrs is None:
-                seg.attrs = {}
             seg.attrs.setdefault("enabled", True)
         self._sample_table_model.set_segments(segments)
         display_segments = self._get_display_segments()
@@ -3363,13 +3611,15 @@ class MainWindow(QMainWindow):
 
         self._syncing_table_selection = True
         try:
-            selection_model.clearSelection()
-            for col in normalized:
-                idx = self._sample_table_model.index(0, col)
-                selection_model.select(
-                    idx,
-                    QItemSelectionModel.Columns | QItemSelectionModel.Select,
+            # One selection change covering contiguous column runs instead of a signal per column
+            selection = QItemSelection()
+            last_row = self._sample_table_model.rowCount() - 1
+            for first, last in self._contiguous_runs(normalized):
+                selection.select(
+                    self._sample_table_model.index(0, first),
+                    self._sample_table_model.index(last_row, last),
                 )
+            selection_model.select(selection, QItemSelectionModel.ClearAndSelect)
             if (
                 self._active_sample_index is not None
                 and 0 <= self._active_sample_index < column_count
@@ -3382,6 +3632,17 @@ class MainWindow(QMainWindow):
 
         self._waveform_widget.set_selected_indexes(self._selected_sample_indexes)
 
+    @staticmethod
+    def _contiguous_runs(indexes: Iterable[int]) -> list[tuple[int, int]]:
+        """Group indexes into sorted ``(first, last)`` runs of consecutive values."""
+        runs: list[tuple[int, int]] = []
+        for idx in sorted(set(indexes)):
+            if runs and idx == runs[-1][1] + 1:
+                runs[-1] = (runs[-1][0], idx)
+            else:
+                runs.append((idx, idx))
+        return runs
+
     def _normalize_sample_indexes(self, indexes: Iterable[int]) -> list[int]:
         """Filter and de-duplicate sample indexes based on current segments."""
 
@@ -3470,12 +3731,9 @@ class MainWindow(QMainWindow):
 
     def _on_fit_to_window(self) -> None:
         """Handle fit to window."""
-        if self._spectrogram_widget._duration > 0:
-            view_duration = (
-                self._spectrogram_widget._end_time - self._spectrogram_widget._start_time
-            )
-            zoom = self._spectrogram_widget._duration / view_duration
-            self._spectrogram_widget.set_zoom_level(zoom)
+        view = self._spectrogram_widget.view_state()
+        if view.duration > 0 and view.span > 0:
+            self._spectrogram_widget.set_zoom_level(view.duration / view.span)
 
     def _on_toggle_info_table(self) -> None:
         """Handle toggle info table visibility."""
@@ -3556,9 +3814,7 @@ class MainWindow(QMainWindow):
             return
         self._push_undo_state()
         self._pipeline_wrapper.current_segments.clear()
-        self._apply_segments_to_views([])
-        self._update_sample_table([])
-        self._update_navigator_markers()
+        self._refresh_all_views()
 
         # Mark as modified (all samples deleted)
         self._project_modified = True
@@ -3568,10 +3824,8 @@ class MainWindow(QMainWindow):
         """Manually reorder samples chronologically."""
         if not self._pipeline_wrapper:
             return
-        self._pipeline_wrapper.current_segments.sort(key=lambda s: s.start)
-        self._apply_segments_to_views(self._get_display_segments())
-        self._update_sample_table(self._pipeline_wrapper.current_segments)
-        self._update_navigator_markers()
+        self._pipeline_wrapper.current_segments.sort(key=_segment_start)
+        self._refresh_all_views()
 
         # Mark as modified (samples reordered)
         self._project_modified = True
@@ -3579,15 +3833,14 @@ class MainWindow(QMainWindow):
 
     def _on_toggle_auto_order(self, enabled: bool) -> None:
         """Toggle Auto Sample Order and update dependent UI state."""
+        self._auto_order = enabled
         # Disable manual reorder when auto is enabled
         if hasattr(self, "_reorder_action"):
             self._reorder_action.setEnabled(not enabled)
         # If enabling auto-order, immediately enforce ordering
         if enabled and self._pipeline_wrapper:
-            self._pipeline_wrapper.current_segments.sort(key=lambda s: s.start)
-            self._apply_segments_to_views(self._get_display_segments())
-            self._update_sample_table(self._pipeline_wrapper.current_segments)
-            self._update_navigator_markers()
+            self._pipeline_wrapper.current_segments.sort(key=_segment_start)
+            self._refresh_all_views()
 
     def _on_info_splitter_moved(self, pos: int, index: int) -> None:
         """Handle info table splitter moved (manual resize).
@@ -3654,21 +3907,21 @@ class MainWindow(QMainWindow):
         if not self._pipeline_wrapper:
             return
 
-        any_changed = False
-        for seg in self._pipeline_wrapper.current_segments:
-            if not hasattr(seg, "attrs") or seg.attrs is None:
-                seg.attrs = {}
+        changed: list[int] = []
+        for idx, seg in enumerate(self._pipeline_wrapper.current_segments):
             if seg.attrs.get("enabled", True):
                 seg.attrs["enabled"] = False
-                any_changed = True
+                changed.append(idx)
 
-        if not any_changed:
+        if not changed:
             self._update_sample_action_states()
             return
 
-        self._update_sample_table(self._pipeline_wrapper.current_segments)
+        self._sample_table_model.refresh_columns(changed)
+        self._invalidate_display_segments()
         self._apply_segments_to_views(self._get_display_segments())
         self._update_navigator_markers()
+        self._update_sample_action_states()
         self._project_modified = True
         self._update_window_title()
         self._status_label.setText("Disabled all samples")
@@ -3678,27 +3931,28 @@ class MainWindow(QMainWindow):
         if not self._pipeline_wrapper:
             return
 
-        any_changed = False
-        for seg in self._pipeline_wrapper.current_segments:
-            if not hasattr(seg, "attrs") or seg.attrs is None:
-                seg.attrs = {}
+        changed: list[int] = []
+        for idx, seg in enumerate(self._pipeline_wrapper.current_segments):
             if not seg.attrs.get("enabled", True):
                 seg.attrs["enabled"] = True
-                any_changed = True
+                changed.append(idx)
 
-        if not any_changed:
+        if not changed:
             self._update_sample_action_states()
             return
 
-        self._update_sample_table(self._pipeline_wrapper.current_segments)
+        self._sample_table_model.refresh_columns(changed)
+        self._invalidate_display_segments()
         self._apply_segments_to_views(self._get_display_segments())
         self._update_navigator_markers()
+        self._update_sample_action_states()
         self._project_modified = True
         self._update_window_title()
         self._status_label.setText("Enabled all samples")
 
     def _on_toggle_show_disabled(self, show: bool) -> None:
         """Toggle visibility of disabled samples in views."""
+        self._show_disabled = show
         self._spectrogram_widget.set_show_disabled(show)
         self._waveform_widget.set_show_disabled(show)
         self._apply_segments_to_views(self._get_display_segments())
@@ -3726,8 +3980,6 @@ class MainWindow(QMainWindow):
         if len(normalized) == 1:
             idx = normalized[0]
             seg = segments[idx]
-            if not hasattr(seg, "attrs") or seg.attrs is None:
-                seg.attrs = {}
             current_name = str(seg.attrs.get("name", "")).strip()
             title = "Edit Sample Name"
             prompt = "Name (optional):"
@@ -3735,9 +3987,7 @@ class MainWindow(QMainWindow):
         else:
             existing_names = set()
             for idx in normalized:
-                seg = segments[idx]
-                if hasattr(seg, "attrs") and seg.attrs is not None:
-                    existing_names.add(str(seg.attrs.get("name", "")).strip())
+                existing_names.add(str(segments[idx].attrs.get("name", "")).strip())
             default_text = existing_names.pop() if len(existing_names) == 1 else ""
             title = "Edit Sample Names"
             prompt = "Name (optional) for selected samples:"
@@ -3748,11 +3998,9 @@ class MainWindow(QMainWindow):
 
         new_name = value.strip()
 
-        any_changed = False
+        changed: list[int] = []
         for idx in normalized:
             seg = segments[idx]
-            if not hasattr(seg, "attrs") or seg.attrs is None:
-                seg.attrs = {}
             current = str(seg.attrs.get("name", "")).strip()
             if new_name == current:
                 continue
@@ -3760,19 +4008,12 @@ class MainWindow(QMainWindow):
                 seg.attrs["name"] = new_name
             else:
                 seg.attrs.pop("name", None)
-            try:
-                self._sample_table_model.setData(
-                    self._sample_table_model.index(1, idx),
-                    new_name,
-                    Qt.EditRole,
-                )
-            except (RuntimeError, ValueError) as exc:
-                logger.debug("Failed to update sample name: %s", exc, exc_info=exc)
-            any_changed = True
+            changed.append(idx)
 
-        if not any_changed:
+        if not changed:
             return
 
+        self._sample_table_model.refresh_columns(changed)
         self._apply_segments_to_views(self._get_display_segments())
         if len(normalized) == 1:
             self._sample_table_view.selectColumn(normalized[0])
@@ -3791,12 +4032,11 @@ class MainWindow(QMainWindow):
             return
 
         segments = self._pipeline_wrapper.current_segments
-        any_changed = False
+        undo_snapshot = capture_snapshot(segments)
+        changed: list[int] = []
 
         for idx in normalized:
             seg = segments[idx]
-            if not hasattr(seg, "attrs") or seg.attrs is None:
-                seg.attrs = {}
             current_enabled = seg.attrs.get("enabled", True)
             if mode == "toggle":
                 new_enabled = not current_enabled
@@ -3809,18 +4049,13 @@ class MainWindow(QMainWindow):
                 continue
 
             seg.attrs["enabled"] = new_enabled
-            any_changed = True
-
-            try:
-                self._sample_table_model.setData(
-                    self._sample_table_model.index(0, idx),
-                    Qt.Checked if new_enabled else Qt.Unchecked,
-                    Qt.CheckStateRole,
-                )
-            except (RuntimeError, ValueError) as exc:
-                logger.debug("Failed to update sample enabled state: %s", exc, exc_info=exc)
+            changed.append(idx)
 
-        if any_changed:
+        if changed:
+            self._push_undo_snapshot(undo_snapshot)
+            # Refresh the table directly; setData would re-enter _on_model_enabled_toggled per column
+            self._sample_table_model.refresh_columns(changed)
+            self._invalidate_display_segments()
             self._apply_segments_to_views(self._get_display_segments())
             self._update_navigator_markers()
             self._project_modified = True
@@ -3855,22 +4090,19 @@ class MainWindow(QMainWindow):
             keep = {indexes}
 
         segments = self._pipeline_wrapper.current_segments
+        undo_snapshot = capture_snapshot(segments)
+        changed: list[int] = []
         for i, seg in enumerate(segments):
-            if not hasattr(seg, "attrs") or seg.attrs is None:
-                seg.attrs = {}
             new_enabled = i in keep
             if seg.attrs.get("enabled", True) == new_enabled:
                 continue
             seg.attrs["enabled"] = new_enabled
-            try:
-                self._sample_table_model.setData(
-                    self._sample_table_model.index(0, i),
-                    Qt.Checked if new_enabled else Qt.Unchecked,
-                    Qt.CheckStateRole,
-                )
-            except (RuntimeError, ValueError) as exc:
-                logger.debug("Failed to update sample enabled state: %s", exc, exc_info=exc)
+            changed.append(i)
 
+        if changed:
+            self._push_undo_snapshot(undo_snapshot)
+            self._sample_table_model.refresh_columns(changed)
+        self._invalidate_display_segments()
         self._apply_segments_to_views(self._get_display_segments())
         self._update_navigator_markers()
 
@@ -3896,9 +4128,7 @@ class MainWindow(QMainWindow):
             del segments[idx]
 
         self._maybe_auto_reorder()
-        self._apply_segments_to_views(self._get_display_segments())
-        self._update_sample_table(segments)
-        self._update_navigator_markers()
+        self._refresh_all_views()
 
         self._project_modified = True
         self._update_window_title()
@@ -3911,8 +4141,6 @@ class MainWindow(QMainWindow):
         if not self._pipeline_wrapper:
             return
 
-        from spectrosampler.gui.overlap_detector import find_overlaps_within_segments
-
         segments = self._pipeline_wrapper.current_segments
         if not segments:
             return
@@ -3940,9 +4168,7 @@ class MainWindow(QMainWindow):
                 del segments[idx]
 
             self._maybe_auto_reorder()
-            self._apply_segments_to_views(self._get_display_segments())
-            self._update_sample_table(segments)
-            self._update_navigator_markers()
+            self._refresh_all_views()
 
             self._project_modified = True
             self._update_window_title()
@@ -3960,9 +4186,6 @@ class MainWindow(QMainWindow):
         if not self._pipeline_wrapper:
             return
 
-        from spectrosampler.detectors.base import Segment
-        from spectrosampler.gui.overlap_detector import find_overlaps_within_segments
-
         segments = self._pipeline_wrapper.current_segments
         if not segments:
             return
@@ -3999,10 +4222,7 @@ class MainWindow(QMainWindow):
                 score=1.0,
             )
             # Preserve enabled state if all segments in group are enabled
-            all_enabled = all(
-                hasattr(seg, "attrs") and seg.attrs is not None and seg.attrs.get("enabled", True)
-                for seg in group_segments
-            )
+            all_enabled = all(seg.attrs.get("enabled", True) for seg in group_segments)
             merged_seg.attrs["enabled"] = all_enabled
 
             # Use the earliest index as insertion point
@@ -4028,9 +4248,7 @@ class MainWindow(QMainWindow):
                 segments.insert(adjusted_idx, merged_seg)
 
             self._maybe_auto_reorder()
-            self._apply_segments_to_views(self._get_display_segments())
-            self._update_sample_table(segments)
-            self._update_navigator_markers()
+            self._refresh_all_views()
 
             self._project_modified = True
             self._update_window_title()
@@ -4048,8 +4266,6 @@ class MainWindow(QMainWindow):
         if not self._pipeline_wrapper:
             return
 
-        from spectrosampler.gui.overlap_detector import find_duplicates_within_segments
-
         segments = self._pipeline_wrapper.current_segments
         if not segments:
             return
@@ -4077,9 +4293,7 @@ class MainWindow(QMainWindow):
                 del segments[idx]
 
             self._maybe_auto_reorder()
-            self._apply_segments_to_views(self._get_display_segments())
-            self._update_sample_table(segments)
-            self._update_navigator_markers()
+            self._refresh_all_views()
 
             self._project_modified = True
             self._update_window_title()
@@ -4120,28 +4334,14 @@ class MainWindow(QMainWindow):
             self._merge_overlaps_action.setEnabled(False)
             return
 
-        any_enabled = False
-        any_disabled = False
-        for seg in segments:
-            enabled = True
-            if hasattr(seg, "attrs") and seg.attrs is not None:
-                enabled = seg.attrs.get("enabled", True)
-            if enabled:
-                any_enabled = True
-            else:
-                any_disabled = True
-            if any_enabled and any_disabled:
-                break
+        enabled = self._get_enabled_mask()
+        any_enabled = bool(enabled.any())
+        any_disabled = not enabled.all()
 
         self._disable_all_action.setEnabled(any_enabled)
         self._enable_all_action.setEnabled(any_disabled)
 
         # Check for overlaps and duplicates
-        from spectrosampler.gui.overlap_detector import (
-            find_duplicates_within_segments,
-            find_overlaps_within_segments,
-        )
-
         overlap_groups = find_overlaps_within_segments(segments)
         duplicate_groups = find_duplicates_within_segments(segments, tolerance_ms=5.0)
 
@@ -4154,8 +4354,6 @@ class MainWindow(QMainWindow):
             for group in overlap_groups:
                 if len(group) >= 2:
                     # Check if segments in this overlap group are duplicates
-                    from spectrosampler.gui.overlap_detector import is_duplicate
-
                     for i in range(len(group)):
                         for j in range(i + 1, len(group)):
                             idx_i = group[i]
@@ -4190,10 +4388,7 @@ class MainWindow(QMainWindow):
         enabled_indices: list[int] = []
         enabled_segments: list[Segment] = []
         for index, segment in enumerate(self._pipeline_wrapper.current_segments):
-            enabled = True
-            if hasattr(segment, "attrs") and segment.attrs is not None:
-                enabled = segment.attrs.get("enabled", True)
-            if enabled:
+            if segment.attrs.get("enabled", True):
                 enabled_indices.append(index)
                 enabled_segments.append(segment)
 
@@ -4302,8 +4497,6 @@ class MainWindow(QMainWindow):
                     sid for sid in id_lookup.keys() if summary.resume_state.get(sid) != "completed"
                 ]
             if pending:
-                from datetime import datetime
-
                 self._export_resume_state = {
                     "pending_ids": pending,
                     "total_ids": list(id_lookup.keys()),
@@ -4348,8 +4541,6 @@ class MainWindow(QMainWindow):
     def _on_toggle_verbose_log(self, enabled: bool) -> None:
         """Toggle verbose logging level between DEBUG and INFO."""
         try:
-            import logging
-
             root_logger = logging.getLogger()
             root_logger.setLevel(logging.DEBUG if enabled else logging.INFO)
             for handler in root_logger.handlers:
@@ -4454,15 +4645,43 @@ class MainWindow(QMainWindow):
         if not self._pipeline_wrapper:
             return
 
-        # Create deep copy of current segments
-        segments_copy = copy.deepcopy(self._pipeline_wrapper.current_segments)
+        self._push_undo_snapshot(
+            capture_snapshot(self._pipeline_wrapper.current_segments, self._undo_stack.peek())
+        )
+
+    def _push_undo_state_coalesced(self, key: tuple[Any, ...]) -> None:
+        """Push the pre-edit state unless this edit continues a burst on the same target.
 
-        # Push to undo stack
-        self._undo_stack.append(segments_copy)
+        Args:
+            key: Identifies the edited target; consecutive edits with an equal key within the
+                coalesce interval keep only the state from before the first one.
+        """
+        if (
+            self._undo_coalesce_timer.isActive()
+            and key == self._undo_coalesce_key
+            and self._undo_stack
+        ):
+            self._undo_coalesce_timer.start()
+            return
+        self._push_undo_state()
+        self._undo_coalesce_key = key
+        self._undo_coalesce_timer.start()
+
+    def _push_undo_snapshot(self, snapshot: SegmentSnapshot) -> None:
+        """Push a snapshot taken before an edit onto the undo stack.
+
+        Args:
+            snapshot: Segment state to return to on undo.
+        """
+        self._undo_coalesce_key = None
+        previous = self._undo_stack.peek()
+
+        # Skip no-op gestures (e.g. a click that started a drag but never moved)
+        if previous is not None and snapshot == previous:
+            return
 
-        # Limit stack size
-        if len(self._undo_stack) > self._max_undo_stack_size:
-            self._undo_stack.pop(0)
+        # The history drops the oldest entry once the limit is reached
+        self._undo_stack.append(snapshot)
 
         # Clear redo stack when new action is performed
         self._redo_stack.clear()
@@ -4470,23 +4689,19 @@ class MainWindow(QMainWindow):
         # Update menu action states
         self._update_undo_redo_actions()
 
-    def _undo(self) -> None:
-        """Undo last action."""
-        if not self._undo_stack or not self._pipeline_wrapper:
-            return
-
-        # Push current state to redo stack
-        current_segments = copy.deepcopy(self._pipeline_wrapper.current_segments)
-        self._redo_stack.append(current_segments)
+    def _restore_segments_snapshot(self, snapshot: SegmentSnapshot) -> None:
+        """Replace current segments with ``snapshot`` and refresh views.
 
-        # Pop from undo stack and restore
-        previous_segments = self._undo_stack.pop()
-        self._pipeline_wrapper.current_segments = copy.deepcopy(previous_segments)
+        Args:
+            snapshot: Snapshot to restore.
+        """
+        if not self._pipeline_wrapper:
+            return
+        current = self._pipeline_wrapper.current_segments
+        self._pipeline_wrapper.current_segments = restore_snapshot(snapshot, current)
 
         # Update UI
-        self._apply_segments_to_views(self._get_display_segments())
-        self._update_sample_table(self._pipeline_wrapper.current_segments)
-        self._update_navigator_markers()
+        self._refresh_all_views()
 
         # Update menu action states
         self._update_undo_redo_actions()
@@ -4494,33 +4709,31 @@ class MainWindow(QMainWindow):
         # Check if we've returned to baseline state
         self._check_baseline_state()
 
+    def _undo(self) -> None:
+        """Undo last action."""
+        if not self._undo_stack or not self._pipeline_wrapper:
+            return
+        self._undo_coalesce_key = None
+
+        # Push current state to redo stack
+        current = self._pipeline_wrapper.current_segments
+        self._redo_stack.append(capture_snapshot(current, self._undo_stack.peek()))
+
+        # Pop from undo stack and restore
+        self._restore_segments_snapshot(self._undo_stack.pop())
+
     def _redo(self) -> None:
         """Redo last undone action."""
         if not self._redo_stack or not self._pipeline_wrapper:
             return
+        self._undo_coalesce_key = None
 
         # Push current state to undo stack
-        current_segments = copy.deepcopy(self._pipeline_wrapper.current_segments)
-        self._undo_stack.append(current_segments)
-
-        # Limit stack size
-        if len(self._undo_stack) > self._max_undo_stack_size:
-            self._undo_stack.pop(0)
+        current = self._pipeline_wrapper.current_segments
+        self._undo_stack.append(capture_snapshot(current, self._redo_stack.peek()))
 
         # Pop from redo stack and restore
-        next_segments = self._redo_stack.pop()
-        self._pipeline_wrapper.current_segments = copy.deepcopy(next_segments)
-
-        # Update UI
-        self._apply_segments_to_views(self._get_display_segments())
-        self._update_sample_table(self._pipeline_wrapper.current_segments)
-        self._update_navigator_markers()
-
-        # Update menu action states
-        self._update_undo_redo_actions()
-
-        # Check if we've returned to baseline state
-        self._check_baseline_state()
+        self._restore_segments_snapshot(self._redo_stack.pop())
 
     def _check_baseline_state(self) -> None:
         """Check if current state matches baseline and update modified flag accordingly."""
@@ -4529,56 +4742,13 @@ class MainWindow(QMainWindow):
 
         # If undo stack is empty, we're at the "beginning" of history - check if it matches baseline
         # (redo stack may have items, but that's fine - we're checking if we've undone back to baseline)
-        if len(self._undo_stack) == 0:
-            # Compare current segments with baseline
-            current_segments = self._pipeline_wrapper.current_segments
-
-            # Handle empty baseline case (project loaded/saved with no segments)
-            if len(self._baseline_segments) == 0:
-                if len(current_segments) == 0:
-                    # Both empty - clear modified flag
-                    self._project_modified = False
-                    self._update_window_title()
-                return
-
-            # If lengths don't match, not at baseline
-            if len(current_segments) != len(self._baseline_segments):
-                return
-
-            # Check if segments match (deep comparison with epsilon for floats)
-            matches = True
-            for curr, base in zip(current_segments, self._baseline_segments, strict=True):
-                # Compare basic attributes with epsilon for float comparison
-                if (
-                    abs(curr.start - base.start) > 1e-6
-                    or abs(curr.end - base.end) > 1e-6
-                    or curr.detector != base.detector
-                    or abs(curr.score - base.score) > 1e-6
-                ):
-                    matches = False
-                    break
-
-                # Compare enabled state (handle missing attrs)
-                curr_enabled = (
-                    curr.attrs.get("enabled", True)
-                    if hasattr(curr, "attrs") and curr.attrs
-                    else True
-                )
-                base_enabled = (
-                    base.attrs.get("enabled", True)
-                    if hasattr(base, "attrs") and base.attrs
-                    else True
-                )
-                if curr_enabled != base_enabled:
-                    matches = False
-                    break
-
-            if matches:
-                # Segments match baseline - clear modified flag
-                # Note: This doesn't check settings, but undoing all segment changes
-                # should reset modified status per user request
-                self._project_modified = False
-                self._update_window_title()
+        # Note: This doesn't check settings, but undoing all segment changes should reset
+        # modified status per user request
+        if len(self._undo_stack) == 0 and snapshot_matches(
+            self._baseline_segments, self._pipeline_wrapper.current_segments
+        ):
+            self._project_modified = False
+            self._update_window_title()
 
     def _update_undo_redo_actions(self) -> None:
         """Update undo/redo action enabled states."""
@@ -4614,15 +4784,7 @@ class MainWindow(QMainWindow):
         Returns:
             QColor object.
         """
-        from PySide6.QtGui import QColor
-
-        color_map = {
-            "voice_vad": QColor(0x00, 0xFF, 0xAA),
-            "transient_flux": QColor(0xFF, 0xCC, 0x00),
-            "nonsilence_energy": QColor(0xFF, 0x66, 0xAA),
-            "spectral_interestingness": QColor(0x66, 0xAA, 0xFF),
-        }
-        return color_map.get(detector, QColor(0xFF, 0xFF, 0xFF))
+        return _DETECTOR_COLORS.get(detector, _DEFAULT_DETECTOR_COLOR)
 
     # Model-view callbacks
     def _on_model_enabled_toggled(self, column: int, enabled: bool) -> None:
@@ -4634,10 +4796,9 @@ class MainWindow(QMainWindow):
         self._push_undo_state()
         # Update the segment in pipeline_wrapper to match model
         seg = self._pipeline_wrapper.current_segments[column]
-        if not hasattr(seg, "attrs") or seg.attrs is None:
-            seg.attrs = {}
         seg.attrs["enabled"] = enabled
         # Reflect enabled update into other views
+        self._invalidate_display_segments()
         self._apply_segments_to_views(self._get_display_segments())
         # Force spectrogram canvas to refresh
         self._spectrogram_widget._canvas.draw_idle()
@@ -4652,8 +4813,8 @@ class MainWindow(QMainWindow):
             0 <= column < len(self._pipeline_wrapper.current_segments)
         ):
             return
-        # Push undo state before change
-        self._push_undo_state()
+        # Push undo state before change; repeated edits of this sample's times coalesce
+        self._push_undo_state_coalesced(("times", column))
         # Update the segment in pipeline_wrapper to match model
         seg = self._pipeline_wrapper.current_segments[column]
         seg.start = start
@@ -4662,77 +4823,104 @@ class MainWindow(QMainWindow):
         self._sample_table_model.update_segment_times(column, seg.start, seg.end)
         # After start/end edits, reorder and refresh overlays
         self._maybe_auto_reorder()
-        self._apply_segments_to_views(self._get_display_segments())
-        # Force spectrogram canvas to refresh
-        self._spectrogram_widget._canvas.draw_idle()
-        self._update_navigator_markers()
+        self._schedule_segment_redraw()
         # Mark as modified
         self._project_modified = True
         self._update_window_title()
-        # Update action states (overlaps/duplicates may have changed)
-        self._update_sample_action_states()
 
     def _on_model_duration_edited(self, column: int, new_duration: float) -> None:
         if not self._pipeline_wrapper or not (
             0 <= column < len(self._pipeline_wrapper.current_segments)
         ):
             return
-        # Push undo state before change
-        self._push_undo_state()
+        # Push undo state before change; repeated duration edits coalesce
+        self._push_undo_state_coalesced(("duration", column))
         seg = self._pipeline_wrapper.current_segments[column]
         # Apply duration change according to current mode (this also updates the model)
         self._apply_duration_change(seg, new_duration, column)
         self._maybe_auto_reorder()
-        self._apply_segments_to_views(self._get_display_segments())
-        # Force spectrogram canvas to refresh
-        self._spectrogram_widget._canvas.draw_idle()
-        self._update_navigator_markers()
+        self._schedule_segment_redraw()
         # Mark as modified
         self._project_modified = True
         self._update_window_title()
-        # Update action states (overlaps/duplicates may have changed)
-        self._update_sample_action_states()
 
     def _get_enabled_segments(self) -> list[Segment]:
         """Return only enabled segments from current pipeline wrapper.
 
+        Cached alongside the enabled mask; callers must not mutate the result.
+
         Returns:
             List of enabled segments.
         """
         if not self._pipeline_wrapper:
             return []
-        result: list[Segment] = []
-        for s in self._pipeline_wrapper.current_segments:
-            if not hasattr(s, "attrs") or s.attrs is None:
-                s.attrs = {}
-            if s.attrs.get("enabled", True):
-                result.append(s)
-        return result
+        current = self._pipeline_wrapper.current_segments
+        key = (self._segments_version, id(current), len(current))
+        if self._enabled_segments_cache is not None and self._enabled_segments_cache[0] == key:
+            return self._enabled_segments_cache[1]
+        enabled = list(itertools.compress(current, self._get_enabled_mask()))
+        self._enabled_segments_cache = (key, enabled)
+        return enabled
+
+    def _get_enabled_mask(self) -> np.ndarray:
+        """Return a boolean array mirroring each segment's ``attrs["enabled"]`` flag.
+
+        Cached under the same conditions as the display segments, so bulk checks (any/all
+        enabled, next enabled index, marker colors) avoid per-segment dict lookups. Callers
+        must not mutate it.
+        """
+        if not self._pipeline_wrapper:
+            return np.zeros(0, dtype=bool)
+        current = self._pipeline_wrapper.current_segments
+        key = (self._segments_version, id(current), len(current))
+        if self._enabled_mask_cache is not None and self._enabled_mask_cache[0] == key:
+            return self._enabled_mask_cache[1]
+        mask = np.fromiter(
+            (seg.attrs.get("enabled", True) for seg in current),
+            dtype=bool,
+            count=len(current),
+        )
+        self._enabled_mask_cache = (key, mask)
+        return mask
 
     def _get_display_segments(self) -> list[Segment]:
         """Return segments list respecting show-disabled toggle.
 
-        When showing disabled, return all segments; otherwise only enabled.
+        When showing disabled, return all segments; otherwise only enabled. The result is
+        cached until ``_invalidate_display_segments`` is called, the toggle changes, or the
+        segment list is replaced or changes length. Callers must not mutate it.
         """
-        show_disabled = (
-            getattr(self, "_show_disabled_action", None) is None
-            or self._show_disabled_action.isChecked()
-        )
-        if show_disabled:
-            return list(self._pipeline_wrapper.current_segments) if self._pipeline_wrapper else []
-        return self._get_enabled_segments()
+        show_disabled = self._show_disabled
+        if not self._pipeline_wrapper:
+            return []
+        current = self._pipeline_wrapper.current_segments
+        key = (self._segments_version, show_disabled, id(current), len(current))
+        if self._display_cache is not None and self._display_cache[0] == key:
+            return self._display_cache[1]
+        display = list(current) if show_disabled else self._get_enabled_segments()
+        self._display_cache = (key, display)
+        return display
+
+    def _invalidate_display_segments(self) -> None:
+        """Mark segment order/enabled state as changed so display segments are recomputed."""
+        self._segments_version += 1
 
     def _maybe_auto_reorder(self) -> None:
         """Re-order samples by start if Auto Sample Order is enabled."""
-        try:
-            if (
-                getattr(self, "_auto_order_action", None)
-                and self._auto_order_action.isChecked()
-                and self._pipeline_wrapper
-            ):
-                self._pipeline_wrapper.current_segments.sort(key=lambda s: s.start)
-        except (AttributeError, TypeError) as exc:
-            logger.debug("Auto reorder failed: %s", exc, exc_info=exc)
+        if not self._auto_order or not self._pipeline_wrapper:
+            return
+        segments = self._pipeline_wrapper.current_segments
+        starts = np.fromiter((seg.start for seg in segments), float, count=len(segments))
+        # Most edits keep the list sorted; detect that with one vectorised comparison
+        if starts.size < 2 or bool(np.all(starts[1:] >= starts[:-1])):
+            return
+        order = np.argsort(starts, kind="stable")
+        segments[:] = [segments[i] for i in order]
+        if self._current_playing_index is not None:
+            moved = np.flatnonzero(order == self._current_playing_index)
+            if moved.size:
+                self._current_playing_index = int(moved[0])
+        self._invalidate_display_segments()
 
     # UI refresh rate handlers
     def _on_ui_refresh_rate_enabled_changed(self, enabled: bool) -> None:
@@ -4759,8 +4947,6 @@ class MainWindow(QMainWindow):
 
     def _setup_refresh_timer(self) -> None:
         """Setup UI refresh timer."""
-        from PySide6.QtCore import QTimer
-
         if self._ui_refresh_timer:
             self._ui_refresh_timer.stop()
         interval_ms = int(1000 / self._ui_refresh_rate_hz)
@@ -4790,8 +4976,6 @@ class MainWindow(QMainWindow):
 
     def _on_snap_interval_settings(self) -> None:
         """Handle snap interval settings dialog."""
-        from PySide6.QtWidgets import QInputDialog
-
         value_ms = int(self._grid_settings.snap_interval_sec * 1000)
         value_ms, ok = QInputDialog.getInt(
             self, "Snap Interval", "Snap interval (ms):", value_ms, 1, 10000, 0
@@ -4802,8 +4986,6 @@ class MainWindow(QMainWindow):
 
     def _on_bpm_settings(self) -> None:
         """Handle BPM settings dialog."""
-        from PySide6.QtWidgets import QInputDialog
-
         value, ok = QInputDialog.getInt(
             self, "BPM", "BPM:", int(self._grid_settings.bpm), 60, 200, 0
         )
@@ -4858,11 +5040,7 @@ class MainWindow(QMainWindow):
         """
         old_start = seg.start
         old_end = seg.end
-        audio_duration = (
-            self._spectrogram_widget._duration
-            if hasattr(self._spectrogram_widget, "_duration")
-            else float("inf")
-        )
+        audio_duration = self._spectrogram_widget.view_state().duration
 
         if self._duration_edit_mode == "expand_contract":
             # Expand/contract equally on both sides from middle
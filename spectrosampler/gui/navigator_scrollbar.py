@@ -1,9 +1,10 @@
 """Navigator scrollbar widget (Bitwig-style) showing spectrogram overview."""
 
 import logging
+from typing import Any
 
 import numpy as np
-from PySide6.QtCore import QRect, QRectF, Qt, Signal
+from PySide6.QtCore import QRect, QRectF, QSize, Qt, QTimer, Signal
 from PySide6.QtGui import QColor, QImage, QPainter, QPen
 from PySide6.QtWidgets import QWidget
 
@@ -11,6 +12,10 @@ from spectrosampler.gui.spectrogram_tiler import SpectrogramTile
 
 logger = logging.getLogger(__name__)
 
+# Navigator window zoom factor per wheel notch
+_WHEEL_ZOOM_STEP = 1.2
+_WHEEL_ZOOM_STEP_INV = 1.0 / _WHEEL_ZOOM_STEP
+
 
 class NavigatorScrollbar(QWidget):
     """Navigator scrollbar widget with spectrogram preview."""
@@ -33,13 +38,44 @@ class NavigatorScrollbar(QWidget):
         self._view_end_time = 0.0
         self._overview_tile: SpectrogramTile | None = None
         self._overview_image: QImage | None = None
-        self._sample_markers: list[tuple[float, float, QColor]] = []  # (start, end, color)
+        # Set when the tile changes; the QImage is rebuilt on the next paint
+        self._overview_dirty = False
+        # Pixel buffer wrapped zero-copy by _overview_image; must outlive it
+        self._overview_buffer: np.ndarray | None = None
+        # Overview cropped to the navigator window and scaled to the widget size; rebuilt
+        # only when the window or size changes instead of rescaling on every repaint
+        self._scaled_overview_key: tuple[float, float, int, int] | None = None
+        self._scaled_overview: QImage | None = None
+        # Overview at halving widths (level 0 is _overview_image); levels are added on
+        # demand so each scale reads at most about twice the destination width
+        self._overview_lods: list[QImage] = []
+        # Sample markers as parallel arrays; colors index into _marker_palette
+        self._marker_starts = np.empty(0, dtype=np.float64)
+        self._marker_ends = np.empty(0, dtype=np.float64)
+        self._marker_color_ids = np.empty(0, dtype=np.intp)
+        self._marker_palette: list[QColor] = []
+        self._marker_pens: list[QPen] = []
+        # Pens by QRgb, kept across marker updates so unchanged colors reuse their pen
+        self._pen_cache: dict[int, QPen] = {}
+        # Pixel rects for the current (width, navigator window); rebuilt lazily in paintEvent
+        self._marker_rects_key: tuple[int, float, float] | None = None
+        self._marker_rects: list[tuple[int, int, int]] = []  # (x, width, color id)
+        # The same rects as QRects grouped by color id, for one drawRects call per color
+        self._marker_groups_key: tuple[int, int, float, float] | None = None
+        self._marker_groups: list[tuple[int, list[QRect]]] = []
         self._dragging = False
         self._drag_start_x = 0
         self._drag_start_view_start = 0.0
         self._resizing_left = False
         self._resizing_right = False
         self._resize_handle_width = 8
+        # Drag/resize signals are coalesced to one emission per event-loop pass; mouse moves
+        # can arrive several times per frame and each emission moves the main views
+        self._pending_view_signal: tuple[Any, float, float] | None = None
+        self._view_signal_timer = QTimer(self)
+        self._view_signal_timer.setSingleShot(True)
+        self._view_signal_timer.setInterval(0)
+        self._view_signal_timer.timeout.connect(self._flush_view_signal)
         self._theme_colors = {
             "background": QColor(0x1E, 0x1E, 0x1E),
             "overview": QColor(0x25, 0x25, 0x26),
@@ -48,10 +84,15 @@ class NavigatorScrollbar(QWidget):
             "handle": QColor(0xFF, 0xFF, 0xFF, 0xA0),
             "marker": QColor(0x00, 0xFF, 0x6A, 0x80),
         }
+        self._view_border_pen = QPen(self._theme_colors["view_border"], 2)
         self._show_disabled: bool = True
         # Independent navigator display window (visual zoom only)
         self._nav_start_time = 0.0
         self._nav_end_time = 0.0
+        # Navigator-window mapping shared by painting and mouse hit-testing
+        self._pixels_per_second = 0.0
+        self._view_x1 = 0
+        self._view_x2 = 0
 
     def set_duration(self, duration: float) -> None:
         """Set total audio duration.
@@ -63,6 +104,7 @@ class NavigatorScrollbar(QWidget):
         # Reset navigator window to full range
         self._nav_start_time = 0.0
         self._nav_end_time = self._duration
+        self._recompute_geometry()
         self.update()
 
     def set_view_range(self, start_time: float, end_time: float) -> None:
@@ -72,9 +114,33 @@ class NavigatorScrollbar(QWidget):
             start_time: Start time in seconds.
             end_time: End time in seconds.
         """
+        old_rect = self._view_indicator_rect()
         self._view_start_time = max(0.0, min(start_time, self._duration))
         self._view_end_time = max(self._view_start_time, min(end_time, self._duration))
-        self.update()
+        self._recompute_geometry()
+        # Only the indicator moved: repaint where it was and where it is now
+        self.update(old_rect | self._view_indicator_rect())
+
+    def _view_indicator_rect(self) -> QRect:
+        """Return the area covered by the view indicator, including its border."""
+        width = self.width()
+        view_x1 = max(0, min(self._view_x1, width))
+        view_x2 = max(view_x1, min(self._view_x2, width))
+        return QRect(view_x1, 0, view_x2 - view_x1, self.height()).adjusted(-2, 0, 2, 0)
+
+    def _recompute_geometry(self) -> None:
+        """Refresh the cached time-to-pixel scale and view indicator edges.
+
+        Called whenever the duration, view range, navigator window or width changes so
+        paint and mouse handlers read plain attributes instead of re-deriving them.
+        """
+        nav_duration = max(
+            1e-6, (self._nav_end_time - self._nav_start_time) if self._duration > 0 else 0.0
+        )
+        pixels_per_second = self.width() / nav_duration
+        self._pixels_per_second = pixels_per_second
+        self._view_x1 = int((self._view_start_time - self._nav_start_time) * pixels_per_second)
+        self._view_x2 = int((self._view_end_time - self._nav_start_time) * pixels_per_second)
 
     def set_overview_tile(self, tile: SpectrogramTile | None) -> None:
         """Set overview spectrogram tile.
@@ -83,34 +149,120 @@ class NavigatorScrollbar(QWidget):
             tile: SpectrogramTile with overview data.
         """
         self._overview_tile = tile
-        self._update_overview_image()
+        self._overview_image = None
+        self._overview_buffer = None
+        self._scaled_overview_key = None
+        self._scaled_overview = None
+        # Deferred to paintEvent so repeated calls while loading only wrap the last tile
+        self._overview_dirty = True
         self.update()
 
     def _update_overview_image(self) -> None:
         """Update overview image from tile.
 
-        Uses precomputed RGBA if available and scales with QImage for speed.
+        Prefers the tile's 8-bit colormap indices with its palette, falling back to
+        precomputed RGBA, and scales with QImage for speed.
         """
+        self._overview_dirty = False
+        self._scaled_overview_key = None
+        self._scaled_overview = None
+        self._overview_lods = []
         if self._overview_tile is None:
             self._overview_image = None
+            self._overview_buffer = None
             return
 
         tile = self._overview_tile
+        magnitude = getattr(tile, "magnitude", None)
+        palette = getattr(tile, "palette", None)
+        if magnitude is not None and magnitude.size and palette:
+            # One byte per pixel plus a 256-entry color table: a quarter of the RGBA bytes
+            # to move when cropping and scaling to the widget
+            arr = np.ascontiguousarray(magnitude, dtype=np.uint8)
+            h, w = int(arr.shape[0]), int(arr.shape[1])
+            self._overview_buffer = arr
+            image = QImage(arr.data, w, h, w, QImage.Format.Format_Indexed8)
+            image.setColorTable(palette)
+            self._overview_image = image
+            return
+
         rgba = getattr(tile, "rgba", None)
         if rgba is None or rgba.size == 0:
             # Fallback to placeholder when no rgba present
             self._overview_image = None
+            self._overview_buffer = None
             return
-        # rgba is (freq x time x 4). Flip vertically so low freq at bottom.
-        arr = np.flip(rgba, axis=0)  # (freq, time, 4)
-        # Ensure C-contiguous buffer in (height, width, 4)
-        arr = np.ascontiguousarray(arr)
+        # rgba is (freq x time x 4) with low frequencies in row 0; it is wrapped as-is and
+        # flipped while scaling to the widget, so no full-size flipped copy is made
+        arr = np.ascontiguousarray(rgba, dtype=np.uint8)
         h = int(arr.shape[0])  # freq
         w = int(arr.shape[1])  # time
         bytes_per_line = 4 * w
-        image = QImage(arr.data, w, h, bytes_per_line, QImage.Format.Format_RGBA8888)
-        # Detach from numpy buffer
-        self._overview_image = image.copy()
+        # Wrap the buffer without copying; keeping a reference keeps the pixels alive
+        self._overview_buffer = arr
+        self._overview_image = QImage(arr.data, w, h, bytes_per_line, QImage.Format.Format_RGBA8888)
+
+    def _scaled_overview_image(self, overview: QImage, width: int, height: int) -> QImage:
+        """Return the overview cropped to the navigator window and scaled to ``width`` x ``height``.
+
+        Rows are flipped so low frequencies end up at the bottom. The result is cached until
+        the navigator window, widget size, or overview changes.
+
+        Args:
+            overview: Current full-resolution overview image.
+            width: Destination width in pixels.
+            height: Destination height in pixels.
+        """
+        nav_start = max(0.0, min(self._nav_start_time, self._duration))
+        nav_end = max(nav_start, min(self._nav_end_time, self._duration))
+        key = (nav_start, nav_end, width, height)
+        if self._scaled_overview_key == key and self._scaled_overview is not None:
+            return self._scaled_overview
+
+        # Source rect corresponds to [nav_start, nav_end] over full duration
+        crop = (nav_end - nav_start) / self._duration
+        image = self._overview_lod(overview, crop * overview.width(), width)
+        img_w = image.width()
+        img_h = image.height()
+        src_x = int((nav_start / self._duration) * img_w)
+        src_w = max(1, int(crop * img_w))
+        # Crop, scale (nearest neighbour) and flip in a single pass over the target pixels
+        scaled = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        scaled.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(scaled)
+        painter.translate(0, height)
+        painter.scale(1, -1)
+        painter.drawImage(QRectF(0, 0, width, height), image, QRectF(src_x, 0, src_w, img_h))
+        painter.end()
+        self._scaled_overview = scaled
+        self._scaled_overview_key = key
+        return self._scaled_overview
+
+    def _overview_lod(self, overview: QImage, crop_width: float, width: int) -> QImage:
+        """Return the smallest overview level whose cropped width still covers ``width``.
+
+        Args:
+            overview: Current full-resolution overview image, used as level 0.
+            crop_width: Width of the navigator window in full-resolution overview pixels.
+            width: Destination width in pixels.
+        """
+        lods = self._overview_lods
+        if not lods:
+            lods.append(overview)
+        level = 0
+        while crop_width / (2 ** (level + 1)) >= width and lods[level].width() >= 2:
+            if level + 1 == len(lods):
+                prev = lods[level]
+                lods.append(
+                    prev.scaled(
+                        prev.width() // 2,
+                        prev.height(),
+                        Qt.AspectRatioMode.IgnoreAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation,
+                    )
+                )
+            level += 1
+        return lods[level]
 
     def set_sample_markers(self, markers: list[tuple[float, float, QColor]]) -> None:
         """Set sample markers to display.
@@ -118,9 +270,112 @@ class NavigatorScrollbar(QWidget):
         Args:
             markers: List of (start_time, end_time, color) tuples.
         """
-        self._sample_markers = markers
+        palette: list[QColor] = []
+        palette_index: dict[int, int] = {}
+        color_ids = []
+        for _start, _end, color in markers:
+            rgba = color.rgba()
+            if rgba not in palette_index:
+                palette_index[rgba] = len(palette)
+                palette.append(color)
+            color_ids.append(palette_index[rgba])
+        self.set_marker_array(
+            np.fromiter((m[0] for m in markers), dtype=np.float64, count=len(markers)),
+            np.fromiter((m[1] for m in markers), dtype=np.float64, count=len(markers)),
+            np.asarray(color_ids, dtype=np.intp),
+            palette,
+        )
+
+    def set_marker_array(
+        self,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        color_ids: np.ndarray,
+        palette: list[QColor],
+    ) -> None:
+        """Set sample markers from parallel arrays.
+
+        Args:
+            starts: Marker start times in seconds.
+            ends: Marker end times in seconds.
+            color_ids: Index into ``palette`` for each marker.
+            palette: Marker colors.
+        """
+        self._marker_starts = np.asarray(starts, dtype=np.float64)
+        self._marker_ends = np.asarray(ends, dtype=np.float64)
+        self._marker_color_ids = np.asarray(color_ids, dtype=np.intp)
+        self._marker_palette = list(palette)
+        self._marker_pens = [self._pen_for(color) for color in self._marker_palette]
+        self._marker_rects_key = None
+        self._marker_groups_key = None
         self.update()
 
+    def _pen_for(self, color: QColor) -> QPen:
+        """Return a cached marker pen for ``color``."""
+        key = color.rgba()
+        pen = self._pen_cache.get(key)
+        if pen is None:
+            pen = QPen(color)
+            self._pen_cache[key] = pen
+        return pen
+
+    def _marker_pixel_rects(self, width: int) -> list[tuple[int, int, int]]:
+        """Map markers in the current navigator window to unique (x, width, color id) spans.
+
+        Recomputed only when the widget width or navigator window changes.
+        """
+        key = (width, self._nav_start_time, self._nav_end_time)
+        if self._marker_rects_key == key:
+            return self._marker_rects
+
+        nav_duration = max(
+            1e-6, (self._nav_end_time - self._nav_start_time) if self._duration > 0 else 0.0
+        )
+        pixels_per_second = width / nav_duration if nav_duration > 0 else 0
+        # Only markers overlapping the navigator window are mapped and drawn
+        visible = np.flatnonzero(
+            (self._marker_ends >= self._nav_start_time)
+            & (self._marker_starts <= self._nav_end_time)
+        )
+        starts = self._marker_starts[visible]
+        ends = self._marker_ends[visible]
+        color_ids = self._marker_color_ids[visible]
+        # Map to navigator-local coordinates, clamped to the viewport
+        x1 = ((starts - self._nav_start_time) * pixels_per_second).astype(np.int64)
+        x2 = ((ends - self._nav_start_time) * pixels_per_second).astype(np.int64)
+        x1 = np.clip(x1, 0, max(0, width - 1))
+        x2 = np.clip(x2, 0, width)
+        # Ensure at least 1px width so markers never disappear
+        x2 = np.where(x2 <= x1, np.minimum(width, x1 + 1), x2)
+        widths = np.maximum(1, x2 - x1)
+        if x1.size > 1:
+            # Dense markers often land on the same pixels; draw each span once per color
+            spans = np.stack([x1, widths, color_ids], axis=1)
+            _, first = np.unique(spans, axis=0, return_index=True)
+            first.sort()
+            x1, widths, color_ids = x1[first], widths[first], color_ids[first]
+        self._marker_rects = list(
+            zip(x1.tolist(), widths.tolist(), color_ids.tolist(), strict=True)
+        )
+        self._marker_rects_key = key
+        return self._marker_rects
+
+    def _marker_rect_groups(self, width: int, height: int) -> list[tuple[int, list[QRect]]]:
+        """Group marker rects by color id, in order of each color's first marker.
+
+        Recomputed only when the widget size or navigator window changes.
+        """
+        key = (width, height, self._nav_start_time, self._nav_end_time)
+        if self._marker_groups_key == key:
+            return self._marker_groups
+
+        groups: dict[int, list[QRect]] = {}
+        for x1, marker_width, color_id in self._marker_pixel_rects(width):
+            groups.setdefault(color_id, []).append(QRect(x1, 0, marker_width, height))
+        self._marker_groups = list(groups.items())
+        self._marker_groups_key = key
+        return self._marker_groups
+
     def set_show_disabled(self, show: bool) -> None:
         """Set whether disabled markers should be drawn when provided by caller."""
         self._show_disabled = bool(show)
@@ -154,12 +409,18 @@ class NavigatorScrollbar(QWidget):
             marker.setAlphaF(0.5)
             self._theme_colors["marker"] = marker
 
+        self._view_border_pen = QPen(self._theme_colors["view_border"], 2)
         self.update()
 
     def paintEvent(self, event) -> None:
         """Paint navigator scrollbar."""
+        if self.width() < 2 or self.height() < 2:
+            return
+        if self._overview_dirty:
+            self._update_overview_image()
+
+        # Everything drawn is axis-aligned, so antialiasing is left off
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         width = self.width()
         height = self.height()
@@ -171,61 +432,35 @@ class NavigatorScrollbar(QWidget):
             return
 
         # Draw overview spectrogram (respect navigator window zoom)
-        if self._overview_image and not self._overview_image.isNull():
-            # Source rect corresponds to [nav_start, nav_end] over full duration
-            img_w = self._overview_image.width()
-            img_h = self._overview_image.height()
+        overview = self._overview_image
+        if overview and not overview.isNull():
+            img_w = overview.width()
+            img_h = overview.height()
             if self._duration > 0 and img_w > 0 and img_h > 0:
-                nav_start = max(0.0, min(self._nav_start_time, self._duration))
-                nav_end = max(nav_start, min(self._nav_end_time, self._duration))
-                src_x = int((nav_start / self._duration) * img_w)
-                src_w = max(1, int(((nav_end - nav_start) / self._duration) * img_w))
-                src_rect = QRectF(src_x, 0, src_w, img_h)
-                dst_rect = QRectF(0, 0, width, height)
-                painter.drawImage(dst_rect, self._overview_image, src_rect)
+                painter.drawImage(0, 0, self._scaled_overview_image(overview, width, height))
             else:
                 image_rect = QRectF(0, 0, width, height)
-                painter.drawImage(image_rect, self._overview_image)
+                painter.drawImage(image_rect, overview)
         else:
             # Draw placeholder
             painter.fillRect(self.rect(), self._theme_colors["overview"])
 
         # Draw sample markers (map times through navigator window)
-        if self._sample_markers:
-            nav_duration = max(
-                1e-6, (self._nav_end_time - self._nav_start_time) if self._duration > 0 else 0.0
-            )
-            pixels_per_second = width / nav_duration if nav_duration > 0 else 0
-            marker_pen = QPen()
-            marker_pen.setWidth(2)
-            for start_time, end_time, color in self._sample_markers:
-                # Map to navigator-local coordinates
-                x1 = int((start_time - self._nav_start_time) * pixels_per_second)
-                x2 = int((end_time - self._nav_start_time) * pixels_per_second)
-                # Clamp to viewport
-                x1 = max(0, min(x1, max(0, width - 1)))
-                x2 = max(0, min(x2, width))
-                # Ensure at least 1px width so markers never disappear
-                if x2 <= x1:
-                    x2 = min(width, x1 + 1)
-                painter.setPen(color)
-                painter.drawRect(x1, 0, max(1, x2 - x1), height)
+        if self._marker_starts.size:
+            pens = self._marker_pens
+            for color_id, rects in self._marker_rect_groups(width, height):
+                painter.setPen(pens[color_id])
+                painter.drawRects(rects)
 
         # Draw view indicator using navigator window mapping
-        nav_duration = max(
-            1e-6, (self._nav_end_time - self._nav_start_time) if self._duration > 0 else 0.0
-        )
-        pixels_per_second = width / nav_duration if nav_duration > 0 else 0
-        view_x1 = int((self._view_start_time - self._nav_start_time) * pixels_per_second)
-        view_x2 = int((self._view_end_time - self._nav_start_time) * pixels_per_second)
-        view_x1 = max(0, min(view_x1, width))
-        view_x2 = max(view_x1, min(view_x2, width))
+        view_x1 = max(0, min(self._view_x1, width))
+        view_x2 = max(view_x1, min(self._view_x2, width))
 
         if view_x2 > view_x1:
             # Draw view indicator rectangle
             view_rect = QRect(view_x1, 0, view_x2 - view_x1, height)
             painter.fillRect(view_rect, self._theme_colors["view_indicator"])
-            painter.setPen(QPen(self._theme_colors["view_border"], 2))
+            painter.setPen(self._view_border_pen)
             painter.drawRect(view_rect)
 
     def mousePressEvent(self, event) -> None:
@@ -234,14 +469,9 @@ class NavigatorScrollbar(QWidget):
             return
 
         x = int(event.position().x())
-        width = self.width()
-        nav_duration = max(
-            1e-6, (self._nav_end_time - self._nav_start_time) if self._duration > 0 else 0.0
-        )
-        pixels_per_second = width / nav_duration if nav_duration > 0 else 0
-
-        view_x1 = int((self._view_start_time - self._nav_start_time) * pixels_per_second)
-        view_x2 = int((self._view_end_time - self._nav_start_time) * pixels_per_second)
+        pixels_per_second = self._pixels_per_second
+        view_x1 = self._view_x1
+        view_x2 = self._view_x2
         handle_width = self._resize_handle_width
 
         # Check if clicking on resize handles
@@ -276,19 +506,13 @@ class NavigatorScrollbar(QWidget):
     def mouseMoveEvent(self, event) -> None:
         """Handle mouse move for dragging/resizing and hover cursor updates."""
         x = int(event.position().x())
-        width = self.width()
-        nav_duration = max(
-            1e-6, (self._nav_end_time - self._nav_start_time) if self._duration > 0 else 0.0
-        )
-        pixels_per_second = width / nav_duration if nav_duration > 0 else 0
+        pixels_per_second = self._pixels_per_second
 
         # When not dragging/resizing, update cursor to indicate resizable edges
         if not (self._dragging or self._resizing_left or self._resizing_right):
             if pixels_per_second > 0:
-                view_x1 = int((self._view_start_time - self._nav_start_time) * pixels_per_second)
-                view_x2 = int((self._view_end_time - self._nav_start_time) * pixels_per_second)
                 handle_width = self._resize_handle_width
-                if abs(x - view_x1) < handle_width or abs(x - view_x2) < handle_width:
+                if abs(x - self._view_x1) < handle_width or abs(x - self._view_x2) < handle_width:
                     self.setCursor(Qt.CursorShape.SizeHorCursor)
                 else:
                     self.setCursor(Qt.CursorShape.ArrowCursor)
@@ -304,14 +528,14 @@ class NavigatorScrollbar(QWidget):
             # Resize left edge
             new_start = max(0.0, min(self._drag_start_view_start + dt, self._view_end_time - 0.1))
             self.set_view_range(new_start, self._view_end_time)
-            self.view_resized.emit(new_start, self._view_end_time)
+            self._queue_view_signal(self.view_resized, new_start, self._view_end_time)
         elif self._resizing_right:
             # Resize right edge
             new_end = max(
                 self._view_start_time + 0.1, min(self._drag_start_view_start + dt, self._duration)
             )
             self.set_view_range(self._view_start_time, new_end)
-            self.view_resized.emit(self._view_start_time, new_end)
+            self._queue_view_signal(self.view_resized, self._view_start_time, new_end)
         elif self._dragging:
             # Drag view
             view_duration = self._view_end_time - self._view_start_time
@@ -320,10 +544,33 @@ class NavigatorScrollbar(QWidget):
             )
             new_end = new_start + view_duration
             self.set_view_range(new_start, new_end)
-            self.view_changed.emit(new_start, new_end)
+            self._queue_view_signal(self.view_changed, new_start, new_end)
+
+    def _queue_view_signal(self, signal: Any, start_time: float, end_time: float) -> None:
+        """Emit ``signal`` with the latest range once control returns to the event loop.
+
+        Args:
+            signal: ``view_changed`` or ``view_resized``.
+            start_time: Start time in seconds.
+            end_time: End time in seconds.
+        """
+        self._pending_view_signal = (signal, start_time, end_time)
+        if not self._view_signal_timer.isActive():
+            self._view_signal_timer.start()
+
+    def _flush_view_signal(self) -> None:
+        """Emit the pending drag/resize signal, if any."""
+        self._view_signal_timer.stop()
+        pending = self._pending_view_signal
+        if pending is not None:
+            self._pending_view_signal = None
+            signal, start_time, end_time = pending
+            signal.emit(start_time, end_time)
 
     def mouseReleaseEvent(self, event) -> None:
         """Handle mouse release."""
+        # Deliver the final drag position before the gesture ends
+        self._flush_view_signal()
         self._dragging = False
         self._resizing_left = False
         self._resizing_right = False
@@ -336,15 +583,11 @@ class NavigatorScrollbar(QWidget):
     def resizeEvent(self, event) -> None:
         """Handle widget resize."""
         super().resizeEvent(event)
-        # Only scale existing image; avoid recomputing or re-colormapping
-        if self._overview_tile is not None and self._overview_image is None:
-            self._update_overview_image()
+        self._recompute_geometry()
         self.update()
 
     def sizeHint(self):
         """Return preferred size."""
-        from PySide6.QtCore import QSize
-
         return QSize(100, 80)
 
     # Helper to map x to absolute time using navigator window
@@ -361,23 +604,14 @@ class NavigatorScrollbar(QWidget):
         """
         if self._duration <= 0:
             return
-        dy = 0
-        dx = 0
-        try:
-            ad = event.angleDelta()
-            dy = int(ad.y()) if hasattr(ad, "y") else int(ad.y())
-            dx = int(ad.x()) if hasattr(ad, "x") else int(ad.x())
-        except (AttributeError, TypeError) as exc:
-            logger.debug("Navigator wheel angleDelta unavailable: %s", exc, exc_info=exc)
-            dy = dy or 0
-            dx = dx or 0
+        wheel_delta = event.angleDelta()
+        dy = wheel_delta.y()
+        dx = wheel_delta.x()
         if dy == 0 and dx == 0:
-            try:
-                pd = event.pixelDelta()
-                dy = int(pd.y()) if hasattr(pd, "y") else int(pd.y())
-                dx = int(pd.x()) if hasattr(pd, "x") else int(pd.x())
-            except (AttributeError, TypeError) as exc:
-                logger.debug("Navigator wheel pixelDelta unavailable: %s", exc, exc_info=exc)
+            # Some trackpads only report pixel deltas
+            wheel_delta = event.pixelDelta()
+            dy = wheel_delta.y()
+            dx = wheel_delta.x()
         if dy == 0 and dx == 0:
             return
         # ALT-held: horizontal pan
@@ -398,15 +632,15 @@ class NavigatorScrollbar(QWidget):
             new_start = max(0.0, min(nav_start + delta, max(0.0, self._duration - nav_dur)))
             self._nav_start_time = new_start
             self._nav_end_time = new_start + nav_dur
+            self._recompute_geometry()
             self.update()
             event.accept()
             return
 
         # Default: zoom around cursor
-        step = 1.2
         # Use vertical delta for zoom direction; if zero, use horizontal
         primary = dy if dy != 0 else dx
-        zoom = step if primary > 0 else 1.0 / step
+        zoom = _WHEEL_ZOOM_STEP if primary > 0 else _WHEEL_ZOOM_STEP_INV
 
         cursor_x = float(event.position().x())
         cursor_time = self._time_from_x(cursor_x)
@@ -428,5 +662,6 @@ class NavigatorScrollbar(QWidget):
 
         self._nav_start_time = new_start
         self._nav_end_time = new_end
+        self._recompute_geometry()
         self.update()
         event.accept()
@@ -1,76 +1,109 @@
 """Overview manager for background spectrogram overview generation."""
 
 import logging
+import threading
+from concurrent.futures import CancelledError
 from pathlib import Path
 
-from PySide6.QtCore import QObject, QThread, Signal
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, QThread, QThreadPool, Signal
 
 from spectrosampler.gui.spectrogram_tiler import SpectrogramTile, SpectrogramTiler
 
 logger = logging.getLogger(__name__)
 
 
-class OverviewWorker(QThread):
-    """Worker thread for generating spectrogram overview."""
+class OverviewSignals(QObject):
+    """Signals published by an OverviewRunnable."""
 
     progress = Signal(str)  # Emitted with progress message
     finished = Signal(SpectrogramTile)  # Emitted with generated tile
     error = Signal(str)  # Emitted with error message
 
+
+class OverviewRunnable(QRunnable):
+    """Thread-pool task that generates a spectrogram overview."""
+
     def __init__(
         self,
         tiler: SpectrogramTiler,
         audio_path: Path,
         duration: float,
         sample_rate: int | None = None,
-        parent: QObject | None = None,
+        cancel_event: threading.Event | None = None,
     ):
-        """Initialize overview worker.
+        """Initialize overview task.
 
         Args:
             tiler: SpectrogramTiler instance.
             audio_path: Path to audio file.
             duration: Audio file duration in seconds.
             sample_rate: Target sample rate. If None, uses file's sample rate.
-            parent: Parent QObject.
+            cancel_event: Set to cancel generation. A private event is used if None.
         """
-        super().__init__(parent)
+        super().__init__()
+        self.signals = OverviewSignals()
         self._tiler = tiler
         self._audio_path = audio_path
         self._duration = duration
         self._sample_rate = sample_rate
-        self._cancelled = False
+        self._cancel_event = cancel_event or threading.Event()
 
     def cancel(self) -> None:
         """Cancel overview generation."""
-        self._cancelled = True
+        self._cancel_event.set()
 
     def run(self) -> None:
-        """Run overview generation in background thread."""
+        """Run overview generation on a pool thread."""
+        thread = QThread.currentThread()
+        previous_priority = thread.priority()
+        if previous_priority == QThread.Priority.InheritPriority:
+            previous_priority = QThread.Priority.NormalPriority
+        # Run below normal priority so interactive tile work wins the CPU
+        thread.setPriority(QThread.Priority.LowPriority)
         try:
-            if self._cancelled:
+            self._generate()
+        finally:
+            thread.setPriority(previous_priority)
+
+    def _generate(self) -> None:
+        cancelled = self._cancel_event.is_set
+        try:
+            if cancelled():
                 return
 
-            self.progress.emit("Loading spectrogram...")
+            self.signals.progress.emit("Loading spectrogram...")
 
-            if self._cancelled:
+            if cancelled():
                 return
 
-            # Generate overview in background thread
             overview = self._tiler.generate_overview(
-                self._audio_path, self._duration, sample_rate=self._sample_rate
+                self._audio_path,
+                self._duration,
+                sample_rate=self._sample_rate,
+                cancel_event=self._cancel_event,
             )
-
-            if not self._cancelled:
-                self.finished.emit(overview)
+            # Hand the GUI thread C-contiguous uint8 buffers it can wrap as a QImage
+            # directly; any colormapping or copy happens here rather than on the GUI thread
+            if overview.rgba is None and overview.spectrogram.size:
+                overview.rgba = self._tiler._to_rgba(overview.spectrogram)
+            if overview.rgba is not None:
+                overview.rgba = np.ascontiguousarray(overview.rgba, dtype=np.uint8)
+            if overview.magnitude is not None:
+                overview.magnitude = np.ascontiguousarray(overview.magnitude, dtype=np.uint8)
+
+            if not cancelled():
+                self.signals.finished.emit(overview)
+        except CancelledError:
+            logger.debug("Overview generation cancelled: %s", self._audio_path)
         except (RuntimeError, ValueError, OSError) as e:
             logger.error("Overview generation error: %s", e, exc_info=e)
-            if not self._cancelled:
-                self.error.emit(str(e))
+            if not cancelled():
+                self.signals.error.emit(str(e))
 
 
 class OverviewManager(QObject):
-    """Manages overview generation in background thread."""
+    """Manages overview generation on the global thread pool."""
 
     progress = Signal(str)  # Emitted with progress message
     finished = Signal(SpectrogramTile)  # Emitted with generated tile
@@ -83,7 +116,8 @@ class OverviewManager(QObject):
             parent: Parent QObject.
         """
         super().__init__(parent)
-        self._worker: OverviewWorker | None = None
+        self._signals: OverviewSignals | None = None
+        self._cancel_event: threading.Event | None = None
         self._tiler: SpectrogramTiler | None = None
 
     def start_generation(
@@ -102,35 +136,32 @@ class OverviewManager(QObject):
             sample_rate: Target sample rate. If None, uses file's sample rate.
         """
         # Cancel any existing generation
-        if self._worker and self._worker.isRunning():
+        if self.is_generating():
             self.cancel()
 
         # Store tiler reference
         self._tiler = tiler
 
-        # Create and start worker thread
-        self._worker = OverviewWorker(tiler, audio_path, duration, sample_rate, self)
-        self._worker.progress.connect(self.progress.emit)
-        self._worker.finished.connect(self._on_worker_finished)
-        self._worker.error.connect(self._on_worker_error)
-        self._worker.finished.connect(self._worker.deleteLater)
-        self._worker.error.connect(self._worker.deleteLater)
-
-        # Start worker thread
-        self._worker.start()
+        # Pool threads are reused across files instead of starting one thread per request
+        self._cancel_event = threading.Event()
+        runnable = OverviewRunnable(
+            tiler, audio_path, duration, sample_rate, cancel_event=self._cancel_event
+        )
+        self._signals = runnable.signals
+        self._signals.progress.connect(self._on_worker_progress)
+        self._signals.finished.connect(self._on_worker_finished)
+        self._signals.error.connect(self._on_worker_error)
+        QThreadPool.globalInstance().start(runnable)
 
     def cancel(self) -> None:
-        """Cancel overview generation."""
-        if self._worker and self._worker.isRunning():
-            self._worker.cancel()
-            # Wait for thread to finish, but don't block indefinitely
-            if not self._worker.wait(2000):  # Wait up to 2 seconds
-                logger.warning("Overview worker thread did not finish in time, terminating")
-                self._worker.terminate()
-                self._worker.wait(1000)  # Wait for termination
-            # Clean up worker
-            self._worker.deleteLater()
-            self._worker = None
+        """Cancel overview generation.
+
+        The running task stops at its next cancellation check; its results are dropped.
+        """
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+        self._cancel_event = None
+        self._signals = None
 
     def is_generating(self) -> bool:
         """Check if overview generation is in progress.
@@ -138,7 +169,20 @@ class OverviewManager(QObject):
         Returns:
             True if generation is in progress, False otherwise.
         """
-        return self._worker is not None and self._worker.isRunning()
+        return self._signals is not None
+
+    def _is_current(self) -> bool:
+        """Return True if the signal being handled comes from the active task."""
+        return self._signals is not None and self.sender() is self._signals
+
+    def _on_worker_progress(self, message: str) -> None:
+        """Forward progress from the active task.
+
+        Args:
+            message: Progress message.
+        """
+        if self._is_current():
+            self.progress.emit(message)
 
     def _on_worker_finished(self, tile: SpectrogramTile) -> None:
         """Handle worker finished signal.
@@ -146,9 +190,11 @@ class OverviewManager(QObject):
         Args:
             tile: Generated overview tile.
         """
-        # Clean up worker reference
-        self._worker = None
-        # Emit finished signal (worker will be deleted via deleteLater)
+        # Results queued by a task cancelled after its last check are stale
+        if not self._is_current():
+            return
+        self._signals = None
+        self._cancel_event = None
         self.finished.emit(tile)
 
     def _on_worker_error(self, error_msg: str) -> None:
@@ -157,7 +203,8 @@ class OverviewManager(QObject):
         Args:
             error_msg: Error message.
         """
-        # Clean up worker reference
-        self._worker = None
-        # Emit error signal (worker will be deleted via deleteLater)
+        if not self._is_current():
+            return
+        self._signals = None
+        self._cancel_event = None
         self.error.emit(error_msg)
@@ -2,12 +2,14 @@
 
 import errno
 import logging
+import os
+import tempfile
 from collections.abc import Sequence
-from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures import CancelledError, Executor, Future, ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from spectrosampler.audio_io import FFmpegError
+from spectrosampler.audio_io import FFmpegError, get_audio_info
 from spectrosampler.detectors.base import Segment
 from spectrosampler.gui.export_manager import ExportManager
 from spectrosampler.gui.export_models import ExportBatchSettings, ExportSampleOverride
@@ -44,6 +46,30 @@ def _detect_task(
     return _invoke_process_file(input_path, output_dir, settings, cache=None)
 
 
+def detection_worker_count(settings: ProcessingSettings) -> int:
+    """Return the process count for detection pools: ``settings.max_workers`` or CPUs - 1."""
+    max_workers = getattr(settings, "max_workers", None)
+    if not isinstance(max_workers, int) or max_workers <= 0:
+        max_workers = max(1, (os.cpu_count() or 4) - 1)
+    return max_workers
+
+
+def create_detection_executor(max_workers: int) -> ProcessPoolExecutor:
+    """Create a process pool for detection runs.
+
+    Args:
+        max_workers: Number of worker processes.
+
+    Returns:
+        New executor; falls back to the default configuration if ``max_workers`` is rejected.
+    """
+    try:
+        return ProcessPoolExecutor(max_workers=max_workers)
+    except (OSError, ValueError, RuntimeError) as exc:
+        logger.warning("Falling back to default process pool configuration: %s", exc, exc_info=exc)
+        return ProcessPoolExecutor()
+
+
 class PipelineWrapper:
     """Wrapper for pipeline processing with GUI-friendly interface."""
 
@@ -71,8 +97,6 @@ class PipelineWrapper:
         try:
             if not audio_path.exists() or not audio_path.is_file():
                 raise FileNotFoundError(errno.ENOENT, "No such file or directory", str(audio_path))
-            from spectrosampler.audio_io import get_audio_info
-
             self.current_audio_path = audio_path
             self.current_audio_info = get_audio_info(audio_path)
             logger.info(f"Loaded audio: {audio_path}")
@@ -95,8 +119,6 @@ class PipelineWrapper:
 
         # Create temporary output directory if not provided
         if output_dir is None:
-            import tempfile
-
             output_dir = Path(tempfile.mkdtemp(prefix="spectrosampler_preview_"))
 
         # Create dry-run settings
@@ -124,21 +146,23 @@ class PipelineWrapper:
             raise
 
     def detect_samples_async(
-        self, output_dir: Path | None = None, callback: Any | None = None
+        self,
+        output_dir: Path | None = None,
+        callback: Any | None = None,
+        executor: Executor | None = None,
     ) -> Future:
         """Run sample detection in a background process and return a Future.
 
         Args:
             output_dir: Optional output directory for temporary files.
             callback: Optional function(result_dict) called on completion.
+            executor: Long-lived pool to run on. Defaults to a pool owned by this wrapper.
         """
         if not self.current_audio_path:
             raise ValueError("No audio file loaded")
 
         # Create temporary output directory if not provided
         if output_dir is None:
-            import tempfile
-
             output_dir = Path(tempfile.mkdtemp(prefix="spectrosampler_preview_"))
 
         # Prepare settings (dry run for GUI)
@@ -148,23 +172,14 @@ class PipelineWrapper:
         preview_settings.save_temp = True
 
         # Lazy init executor with user-configurable workers if present
-        if self._proc_executor is None:
-            try:
-                import os
-
-                max_workers = getattr(self.settings, "max_workers", None)
-                if not isinstance(max_workers, int) or max_workers <= 0:
-                    max_workers = max(1, (os.cpu_count() or 4) - 1)
-                self._proc_executor = ProcessPoolExecutor(max_workers=max_workers)
-            except (OSError, ValueError, RuntimeError) as exc:
-                logger.warning(
-                    "Falling back to default process pool configuration: %s", exc, exc_info=exc
+        if executor is None:
+            if self._proc_executor is None:
+                self._proc_executor = create_detection_executor(
+                    detection_worker_count(self.settings)
                 )
-                self._proc_executor = ProcessPoolExecutor()
+            executor = self._proc_executor
 
-        fut = self._proc_executor.submit(
-            _detect_task, self.current_audio_path, output_dir, preview_settings
-        )
+        fut = executor.submit(_detect_task, self.current_audio_path, output_dir, preview_settings)
         if callback is not None:
 
             def _done(f: Future) -> None:
@@ -0,0 +1,279 @@
+"""In-memory WAV rendering of audio slices for low-latency sample playback."""
+
+from __future__ import annotations
+
+import logging
+import struct
+import subprocess
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+logger = logging.getLogger(__name__)
+
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def read_pcm_slice(audio_path: Path, start_time: float, end_time: float) -> tuple[np.ndarray, int]:
+    """Read ``[start_time, end_time)`` from ``audio_path`` as 16-bit PCM.
+
+    Only the requested frames are decoded; the rest of the file is never read.
+
+    Args:
+        audio_path: Source audio file.
+        start_time: Slice start in seconds.
+        end_time: Slice end in seconds.
+
+    Returns:
+        Tuple of (int16 array shaped ``(frames, channels)``, sample rate).
+
+    Raises:
+        RuntimeError: If libsndfile cannot decode the file (e.g. unsupported codec).
+        OSError: If the file cannot be opened.
+    """
+    with sf.SoundFile(str(audio_path)) as handle:
+        sample_rate = int(handle.samplerate)
+        total = int(handle.frames)
+        start = min(max(0, int(round(start_time * sample_rate))), total)
+        end = min(max(start, int(round(end_time * sample_rate))), total)
+        handle.seek(start)
+        pcm = handle.read(end - start, dtype="int16", always_2d=True)
+    return pcm, sample_rate
+
+
+def encode_wav(pcm: np.ndarray, sample_rate: int) -> bytes:
+    """Encode 16-bit PCM frames as a complete RIFF/WAVE byte string.
+
+    Args:
+        pcm: int16 array shaped ``(frames, channels)``.
+        sample_rate: Sample rate in Hz.
+
+    Returns:
+        WAV file contents.
+    """
+    frames = np.ascontiguousarray(pcm, dtype="<i2")
+    channels = frames.shape[1] if frames.ndim == 2 else 1
+    block_align = channels * 2
+    data_size = frames.nbytes
+    header = _WAV_HEADER.pack(
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        16,
+        b"data",
+        data_size,
+    )
+    return header + frames.tobytes()
+
+
+def render_wav_slice(audio_path: Path, start_time: float, end_time: float) -> bytes | None:
+    """Render a slice of ``audio_path`` to WAV bytes, or None if it cannot be decoded in-process.
+
+    Args:
+        audio_path: Source audio file.
+        start_time: Slice start in seconds.
+        end_time: Slice end in seconds.
+
+    Returns:
+        WAV bytes, or None when libsndfile cannot read the file and callers should fall back
+        to FFmpeg.
+    """
+    try:
+        pcm, sample_rate = read_pcm_slice(audio_path, start_time, end_time)
+    except (RuntimeError, OSError, ValueError) as exc:
+        logger.debug("In-process decode unavailable for %s: %s", audio_path, exc, exc_info=exc)
+        return None
+    if pcm.shape[0] == 0:
+        return None
+    return encode_wav(pcm, sample_rate)
+
+
+def can_read_in_process(audio_path: Path) -> bool:
+    """Return True if libsndfile can open ``audio_path``.
+
+    Distinguishes files that need the FFmpeg fallback from readable files whose requested
+    slice is simply empty (e.g. a segment past the end of the audio).
+
+    Args:
+        audio_path: Source audio file.
+
+    Returns:
+        True if the file can be decoded in-process.
+    """
+    try:
+        sf.info(str(audio_path))
+    except (RuntimeError, OSError) as exc:
+        logger.debug("libsndfile cannot open %s: %s", audio_path, exc, exc_info=exc)
+        return False
+    return True
+
+
+def ffmpeg_playback_command(
+    source: Path,
+    output: Path,
+    start_time: float | None = None,
+    duration: float | None = None,
+) -> list[str]:
+    """Build the FFmpeg command that decodes ``source`` to a 16-bit stereo PCM WAV.
+
+    Args:
+        source: Source audio file.
+        output: WAV file to write.
+        start_time: Slice start in seconds. The whole file is decoded if None.
+        duration: Slice length in seconds, used together with ``start_time``.
+
+    Returns:
+        FFmpeg argument list.
+    """
+    # Regenerate timestamps so Qt's FFmpeg backend sees a stream starting at zero
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-fflags",
+        "+genpts",
+        "-avoid_negative_ts",
+        "make_zero",
+        "-y",
+        "-i",
+        str(source),
+    ]
+    if start_time is not None and duration is not None:
+        cmd += ["-ss", f"{start_time:.6f}", "-t", f"{duration:.6f}"]
+    cmd += [
+        "-af",
+        "asetpts=PTS-STARTPTS",
+        "-acodec",
+        "pcm_s16le",
+        "-ar",
+        "44100",
+        "-ac",
+        "2",
+        str(output),
+    ]
+    return cmd
+
+
+def run_ffmpeg_decode(cmd: list[str]) -> str | None:
+    """Run an FFmpeg decode command.
+
+    Args:
+        cmd: FFmpeg argument list, e.g. from :func:`ffmpeg_playback_command`.
+
+    Returns:
+        None on success, otherwise FFmpeg's error output.
+    """
+    # FFmpeg writes nothing useful to stdout here; keep only the (error-level) stderr bytes
+    # and decode them if the run actually failed.
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if result.returncode == 0:
+        return None
+    return (result.stderr or b"").decode("utf-8", errors="replace")
+
+
+class PlaybackDecodeSignals(QObject):
+    """Signals published by a PlaybackDecodeRunnable."""
+
+    finished = Signal(object, object)  # Emitted with (source key, decoded WAV path)
+    error = Signal(object, str)  # Emitted with (source key, error message)
+
+
+class PlaybackDecodeRunnable(QRunnable):
+    """Thread-pool task that decodes a whole audio file to a PCM WAV with FFmpeg."""
+
+    def __init__(self, source: Path, output: Path, source_key: object):
+        """Initialize decode task.
+
+        Args:
+            source: Source audio file.
+            output: WAV file to write.
+            source_key: Opaque identity of the source, echoed back in the signals.
+        """
+        super().__init__()
+        self.signals = PlaybackDecodeSignals()
+        self._source = source
+        self._output = output
+        self._source_key = source_key
+
+    def run(self) -> None:
+        """Run the decode on a pool thread."""
+        try:
+            error = run_ffmpeg_decode(ffmpeg_playback_command(self._source, self._output))
+        except (subprocess.SubprocessError, OSError) as exc:
+            error = str(exc)
+        if error is None:
+            self.signals.finished.emit(self._source_key, self._output)
+            return
+        self._output.unlink(missing_ok=True)
+        self.signals.error.emit(self._source_key, error)
+
+
+def silent_wav(duration: float, sample_rate: int = 44100, channels: int = 2) -> bytes:
+    """Encode ``duration`` seconds of digital silence as WAV bytes.
+
+    Args:
+        duration: Length in seconds.
+        sample_rate: Sample rate in Hz.
+        channels: Channel count.
+
+    Returns:
+        WAV file contents.
+    """
+    frames = max(1, int(round(duration * sample_rate)))
+    return encode_wav(np.zeros((frames, channels), dtype=np.int16), sample_rate)
+
+
+class WavSliceCache:
+    """Least-recently-used cache of rendered WAV slices, bounded by total size.
+
+    Keys include the slice bounds, so editing a sample simply misses the cache rather than
+    requiring explicit invalidation.
+    """
+
+    def __init__(self, max_bytes: int = 64 << 20):
+        """Initialize slice cache.
+
+        Args:
+            max_bytes: Total size budget for cached WAV bytes.
+        """
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[Path, float, float], bytes] = OrderedDict()
+        self._total_bytes = 0
+
+    def get(self, audio_path: Path, start_time: float, end_time: float) -> bytes | None:
+        """Return cached WAV bytes for the slice, or None on a miss."""
+        key = (audio_path, start_time, end_time)
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+        return data
+
+    def put(self, audio_path: Path, start_time: float, end_time: float, data: bytes) -> None:
+        """Store WAV bytes for the slice, evicting least-recently-used entries if over budget."""
+        if len(data) > self.max_bytes:
+            return
+        key = (audio_path, start_time, end_time)
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._total_bytes -= len(previous)
+        self._entries[key] = data
+        self._total_bytes += len(data)
+        while self._total_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop all cached slices."""
+        self._entries.clear()
+        self._total_bytes = 0
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import os
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -232,15 +233,19 @@ def save_project(project_data: ProjectData, path: Path) -> None:
         },
     }
 
-    # Write to file
+    # Write to a sibling temp file and swap it in, so a crash never leaves a truncated project
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
     try:
-        with open(path, "w", encoding="utf-8") as f:
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(data_dict, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
         logger.info(f"Project saved to {path}")
     except OSError as exc:
+        tmp_path.unlink(missing_ok=True)
         logger.error("Failed to save project to %s: %s", path, exc, exc_info=exc)
         raise OSError(f"Failed to save project file: {exc}") from exc
     except (TypeError, ValueError) as exc:
+        tmp_path.unlink(missing_ok=True)
         logger.error("Project data serialisation failed for %s: %s", path, exc, exc_info=exc)
         raise ValueError(f"Project data could not be serialised: {exc}") from exc
 
@@ -3,8 +3,7 @@
 from pathlib import Path
 
 from PySide6.QtCore import QSize, Qt, Signal
-from PySide6.QtGui import QColor, QIcon, QPainter, QPixmap
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QCheckBox,
     QHBoxLayout,
@@ -16,6 +15,7 @@ from PySide6.QtWidgets import (
 )
 
 from spectrosampler.detectors.base import Segment
+from spectrosampler.gui.ui_utils import load_svg_icon
 
 
 class SamplePlayerWidget(QWidget):
@@ -218,23 +218,11 @@ class SamplePlayerWidget(QWidget):
         icon_size = 24  # Base size, can be adjusted
         stop_icon_size = 32  # Larger size for stop icon
 
-        def load_svg_icon(path: Path, size: int = icon_size) -> QIcon:
-            """Load SVG icon preserving colors by rendering to pixmap."""
-            if not path.exists():
-                return QIcon()
-            renderer = QSvgRenderer(str(path))
-            pixmap = QPixmap(size, size)
-            pixmap.fill(Qt.GlobalColor.transparent)
-            painter = QPainter(pixmap)
-            renderer.render(painter)
-            painter.end()
-            return QIcon(pixmap)
-
-        self._play_icon = load_svg_icon(assets_dir / "play.svg")
-        self._pause_icon = load_svg_icon(assets_dir / "pause.svg")
-        self._stop_icon = load_svg_icon(assets_dir / "stop.svg", size=stop_icon_size)
-        self._skip_back_icon = load_svg_icon(assets_dir / "skipBack.svg")
-        self._skip_forward_icon = load_svg_icon(assets_dir / "skipForward.svg")
+        self._play_icon = load_svg_icon(assets_dir / "play.svg", icon_size)
+        self._pause_icon = load_svg_icon(assets_dir / "pause.svg", icon_size)
+        self._stop_icon = load_svg_icon(assets_dir / "stop.svg", stop_icon_size)
+        self._skip_back_icon = load_svg_icon(assets_dir / "skipBack.svg", icon_size)
+        self._skip_forward_icon = load_svg_icon(assets_dir / "skipForward.svg", icon_size)
 
     def set_sample(self, segment: Segment | None, index: int | None, total: int) -> None:
         """Set current sample to display.
@@ -1,11 +1,14 @@
 """Sample scrubber widget for quick navigation between samples."""
 
-from PySide6.QtCore import QPoint, Qt, Signal
+from PySide6.QtCore import QPoint, Qt, QTimer, Signal
 from PySide6.QtGui import QCursor, QKeyEvent, QMouseEvent
 from PySide6.QtWidgets import QSlider, QToolTip
 
 from spectrosampler.detectors.base import Segment
 
+# Minimum interval between tooltip updates while scrubbing (~60 Hz)
+TOOLTIP_INTERVAL_MS = 16
+
 
 class SampleScrubber(QSlider):
     """Slider widget for scrubbing through samples with tooltip preview."""
@@ -31,9 +34,18 @@ class SampleScrubber(QSlider):
         self._scrub_start_value = 0
         self._pending_value = 0
         self._segments: list[Segment] = []
+        # Formatted tooltips by index; rebuilt only when the segment list is replaced
+        self._tooltip_cache: dict[int, str] = {}
         self._current_index = 0
         self._last_mouse_pos: QPoint | None = None
 
+        # Mouse moves only record the position; the tooltip is shown at most once per
+        # TOOLTIP_INTERVAL_MS with the latest slider value
+        self._tip_timer = QTimer(self)
+        self._tip_timer.setSingleShot(True)
+        self._tip_timer.setInterval(TOOLTIP_INTERVAL_MS)
+        self._tip_timer.timeout.connect(self._flush_tooltip)
+
     def set_segments(self, segments: list[Segment]) -> None:
         """Set the list of segments for tooltip display.
 
@@ -41,6 +53,7 @@ class SampleScrubber(QSlider):
             segments: List of segment objects.
         """
         self._segments = segments
+        self._tooltip_cache = {}
         self.setRange(0, max(0, len(segments) - 1))
 
     def set_current_index(self, index: int) -> None:
@@ -64,6 +77,22 @@ class SampleScrubber(QSlider):
     def _get_sample_tooltip(self, index: int) -> str:
         """Get tooltip text for a sample index.
 
+        Args:
+            index: Sample index (0-based).
+
+        Returns:
+            Tooltip text string.
+        """
+        cached = self._tooltip_cache.get(index)
+        if cached is not None:
+            return cached
+        text = self._format_sample_tooltip(index)
+        self._tooltip_cache[index] = text
+        return text
+
+    def _format_sample_tooltip(self, index: int) -> str:
+        """Format tooltip text for a sample index.
+
         Args:
             index: Sample index (0-based).
 
@@ -135,6 +164,7 @@ class SampleScrubber(QSlider):
             # Commit the final value (even if released outside widget)
             final_value = self.value()
             # Hide tooltip
+            self._tip_timer.stop()
             QToolTip.hideText()
             # Clear stored mouse position
             self._last_mouse_pos = None
@@ -155,6 +185,7 @@ class SampleScrubber(QSlider):
         self.setValue(self._scrub_start_value)
         self._pending_value = self._scrub_start_value
         self._last_mouse_pos = None
+        self._tip_timer.stop()
         QToolTip.hideText()
         self.scrubbing_cancelled.emit()
 
@@ -171,7 +202,12 @@ class SampleScrubber(QSlider):
         super().keyPressEvent(event)
 
     def _update_tooltip_from_slider_value(self) -> None:
-        """Update tooltip based on current slider value."""
+        """Schedule a tooltip update for the current slider value."""
+        if self._is_scrubbing and not self._tip_timer.isActive():
+            self._tip_timer.start()
+
+    def _flush_tooltip(self) -> None:
+        """Show the tooltip for the current slider value and mouse position."""
         if not self._is_scrubbing:
             return
 
@@ -11,10 +11,19 @@ Numeric editors use default delegate editors.
 
 from __future__ import annotations
 
-from PySide6.QtCore import QModelIndex, QPoint, QRect, Qt, Signal
-from PySide6.QtGui import QBrush, QColor, QPainter, QPen
+from PySide6.QtCore import QEvent, QModelIndex, QPoint, QRect, Qt, Signal
+from PySide6.QtGui import QBrush, QColor, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import QStyledItemDelegate
 
+# Paint resources shared by every cell instead of being rebuilt on each paint call
+_BUTTON_PEN = QPen(QColor(180, 180, 180))
+_BUTTON_BRUSH = QBrush(QColor(60, 60, 60))
+_BUTTON_TEXT_COLOR = QColor(230, 230, 230)
+_CHECKBOX_OUTLINE_PEN = QPen(QColor(255, 255, 255, 190), 1)
+_CHECKMARK_PEN = QPen(QColor(255, 255, 255), 2)
+# Distinct cell sizes only change when columns are resized; bound the cache anyway
+_MAX_CACHED_CELLS = 64
+
 
 class SampleTableDelegate(QStyledItemDelegate):
     centerClicked = Signal(int)  # column
@@ -22,29 +31,50 @@ class SampleTableDelegate(QStyledItemDelegate):
     playClicked = Signal(int)  # column
     deleteClicked = Signal(int)  # column
 
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        # Button cells look identical across columns: render each (row, state, size) once
+        self._cell_pixmaps: dict[tuple, QPixmap] = {}
+
     def paint(self, painter: QPainter, option, index: QModelIndex) -> None:  # type: ignore[override]
         row = index.row()
         if row not in (0, 2, 7, 8):
             return super().paint(painter, option, index)
 
-        painter.save()
+        rect = option.rect
+        checked = row == 0 and index.data(Qt.CheckStateRole) == Qt.Checked
+        dpr = painter.device().devicePixelRatioF()
+        key = (row, checked, rect.width(), rect.height(), dpr, option.font.key())
+        pixmap = self._cell_pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self._render_cell(row, checked, rect, dpr, option.font)
+            if len(self._cell_pixmaps) >= _MAX_CACHED_CELLS:
+                self._cell_pixmaps.clear()
+            self._cell_pixmaps[key] = pixmap
+        painter.drawPixmap(rect.topLeft(), pixmap)
+
+    def _render_cell(self, row: int, checked: bool, rect: QRect, dpr: float, font) -> QPixmap:
+        pixmap = QPixmap(round(rect.width() * dpr), round(rect.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        local = QRect(0, 0, rect.width(), rect.height())
+        painter = QPainter(pixmap)
         try:
-            rect = option.rect
+            painter.setFont(font)
             if row == 0:
                 # Custom checkbox with white outline/check, centered
-                self._paint_checkbox(painter, rect, index.data(Qt.CheckStateRole) == Qt.Checked)
+                self._paint_checkbox(painter, local, checked)
             elif row == 2:
-                self._paint_dual_button(painter, rect, "Center", "Fill")
+                self._paint_dual_button(painter, local, "Center", "Fill")
             elif row == 7:
-                self._paint_single_button(painter, rect, "▶")
+                self._paint_single_button(painter, local, "▶")
             elif row == 8:
-                self._paint_single_button(painter, rect, "×")
+                self._paint_single_button(painter, local, "×")
         finally:
-            painter.restore()
+            painter.end()
+        return pixmap
 
     def editorEvent(self, event, model, option, index: QModelIndex):  # type: ignore[override]
-        from PySide6.QtCore import QEvent
-
         if event.type() not in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease):
             return super().editorEvent(event, model, option, index)
         if event.type() == QEvent.MouseButtonRelease:
@@ -96,12 +126,10 @@ class SampleTableDelegate(QStyledItemDelegate):
 
     def _draw_button(self, painter: QPainter, rect: QRect, text: str) -> None:
         radius = 4
-        pen = QPen(QColor(180, 180, 180))
-        brush = QBrush(QColor(60, 60, 60))
-        painter.setPen(pen)
-        painter.setBrush(brush)
+        painter.setPen(_BUTTON_PEN)
+        painter.setBrush(_BUTTON_BRUSH)
         painter.drawRoundedRect(rect, radius, radius)
-        painter.setPen(QColor(230, 230, 230))
+        painter.setPen(_BUTTON_TEXT_COLOR)
         painter.drawText(rect, int(Qt.AlignCenter), text)
 
     def _paint_checkbox(self, painter: QPainter, rect: QRect, checked: bool) -> None:
@@ -111,17 +139,17 @@ class SampleTableDelegate(QStyledItemDelegate):
         box = QRect(x, y, size, size)
         radius = 4
         # Base button-like box (matches buttons style)
-        painter.setPen(QPen(QColor(180, 180, 180)))
-        painter.setBrush(QBrush(QColor(60, 60, 60)))
+        painter.setPen(_BUTTON_PEN)
+        painter.setBrush(_BUTTON_BRUSH)
         painter.drawRoundedRect(box, radius, radius)
         # Thin white outline inside to make it visible on dark theme
         inner = box.adjusted(2, 2, -2, -2)
-        painter.setPen(QPen(QColor(255, 255, 255, 190), 1))
+        painter.setPen(_CHECKBOX_OUTLINE_PEN)
         painter.setBrush(Qt.NoBrush)
         painter.drawRoundedRect(inner, radius - 1, radius - 1)
         if checked:
             # Draw white check mark
-            painter.setPen(QPen(QColor(255, 255, 255), 2))
+            painter.setPen(_CHECKMARK_PEN)
             p1 = QPoint(inner.left() + 4, inner.top() + inner.height() // 2)
             p2 = QPoint(inner.left() + inner.width() // 2 - 1, inner.bottom() - 4)
             p3 = QPoint(inner.right() - 3, inner.top() + 4)
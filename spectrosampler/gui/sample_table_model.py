@@ -15,6 +15,7 @@ Rows:
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from typing import Any
 
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt, QTimer, Signal
@@ -24,6 +25,24 @@ from spectrosampler.detectors.base import Segment
 
 logger = logging.getLogger(__name__)
 
+_ROW_LABELS = (
+    "Enable",
+    "Name",
+    "Center",
+    "Start",
+    "End",
+    "Duration",
+    "Detector",
+    "Play",
+    "Delete",
+)
+_ALIGN_CENTER = int(Qt.AlignCenter)
+_PLACEHOLDER_BRUSH = QBrush(QColor(160, 160, 160))
+# Roles data() answers; views also query font, background, tooltip, etc. for every cell
+_DATA_ROLES = frozenset(
+    (Qt.DisplayRole, Qt.EditRole, Qt.CheckStateRole, Qt.ForegroundRole, Qt.TextAlignmentRole)
+)
+
 
 class SampleTableModel(QAbstractTableModel):
     """Table model mapping one sample per column and 9 logical rows.
@@ -42,16 +61,35 @@ class SampleTableModel(QAbstractTableModel):
         self._visible_count: int = 0
         self._chunk_timer: QTimer | None = None
         self._chunk_size: int = 300
+        # Displayed values per column, used to diff successive set_segments calls
+        self._column_states: list[tuple[Any, ...]] = []
 
     # Public API
     def set_segments(self, segments: list[Segment]) -> None:
         """Set the underlying segments; reveals columns incrementally.
 
-        For very large lists, insert columns in chunks to keep UI responsive.
+        For very large lists, insert columns in chunks to keep UI responsive. When the
+        sample count is unchanged, only columns whose displayed values changed are
+        refreshed instead of resetting the whole model.
         """
+        new_segments = list(segments) if segments else []
+        new_states = [self._column_state(seg) for seg in new_segments]
+
+        if self._segments and len(new_segments) == len(self._segments):
+            changed = [
+                col
+                for col, (old, new) in enumerate(zip(self._column_states, new_states, strict=True))
+                if old != new
+            ]
+            self._segments = new_segments
+            self._column_states = new_states
+            self._emit_columns_changed(changed)
+            return
+
         # Reset model structure
         self.beginResetModel()
-        self._segments = list(segments) if segments else []
+        self._segments = new_segments
+        self._column_states = new_states
         self._visible_count = 0
         self.endResetModel()
 
@@ -63,10 +101,26 @@ class SampleTableModel(QAbstractTableModel):
             seg = self._segments[column]
             seg.start = start
             seg.end = end
+            self._column_states[column] = self._column_state(seg)
             top_left = self.index(3, column)
             bottom_right = self.index(5, column)
             self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole, Qt.EditRole])
 
+    def refresh_columns(self, columns: Iterable[int]) -> None:
+        """Re-read the given columns from their segments after the controller edited them.
+
+        Unlike ``setData`` this emits no edit signals, so bulk changes refresh the view once
+        per contiguous run of changed columns without re-entering the controller.
+        """
+        changed = []
+        for col in sorted(set(columns)):
+            if 0 <= col < len(self._segments):
+                state = self._column_state(self._segments[col])
+                if state != self._column_states[col]:
+                    self._column_states[col] = state
+                    changed.append(col)
+        self._emit_columns_changed(changed)
+
     def segments(self) -> list[Segment]:
         return self._segments
 
@@ -83,24 +137,16 @@ class SampleTableModel(QAbstractTableModel):
         if orientation == Qt.Horizontal:
             return str(section)
         # Vertical headers: fixed row labels
-        labels = [
-            "Enable",
-            "Name",
-            "Center",
-            "Start",
-            "End",
-            "Duration",
-            "Detector",
-            "Play",
-            "Delete",
-        ]
-        if 0 <= section < len(labels):
-            return labels[section]
+        if 0 <= section < len(_ROW_LABELS):
+            return _ROW_LABELS[section]
         return None
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
-        if not index.isValid():
+        # Cheap exits first: this runs for every visible cell and role on each repaint
+        if role not in _DATA_ROLES or not index.isValid():
             return None
+        if role == Qt.TextAlignmentRole:
+            return _ALIGN_CENTER
         row = index.row()
         col = index.column()
         if col >= len(self._segments):
@@ -109,65 +155,42 @@ class SampleTableModel(QAbstractTableModel):
 
         if row == 0:
             if role == Qt.CheckStateRole:
-                enabled = (
-                    seg.attrs.get("enabled", True)
-                    if hasattr(seg, "attrs") and seg.attrs is not None
-                    else True
-                )
-                return Qt.Checked if enabled else Qt.Unchecked
-            if role == Qt.TextAlignmentRole:
-                return int(Qt.AlignCenter)
+                return Qt.Checked if seg.attrs.get("enabled", True) else Qt.Unchecked
             return None
         if row == 1:
-            name_value = ""
-            if hasattr(seg, "attrs") and seg.attrs is not None:
-                name_value = str(seg.attrs.get("name", "")).strip()
+            name_value = str(seg.attrs.get("name", "")).strip()
             if role in (Qt.DisplayRole, Qt.EditRole):
                 if role == Qt.DisplayRole:
                     return name_value if name_value else "Name (optional)"
                 return name_value
             if role == Qt.ForegroundRole and not name_value:
-                return QBrush(QColor(160, 160, 160))
-            if role == Qt.TextAlignmentRole:
-                return int(Qt.AlignCenter)
+                return _PLACEHOLDER_BRUSH
             return None
         if row == 2:
             # Center/Fill buttons are painted by delegate
             if role == Qt.DisplayRole:
                 return "Center/Fill"
-            if role == Qt.TextAlignmentRole:
-                return int(Qt.AlignCenter)
             return None
         if row == 3:
             if role in (Qt.DisplayRole, Qt.EditRole):
                 return f"{seg.start:.3f}" if role == Qt.DisplayRole else seg.start
-            if role == Qt.TextAlignmentRole:
-                return int(Qt.AlignCenter)
             return None
         if row == 4:
             if role in (Qt.DisplayRole, Qt.EditRole):
                 return f"{seg.end:.3f}" if role == Qt.DisplayRole else seg.end
-            if role == Qt.TextAlignmentRole:
-                return int(Qt.AlignCenter)
             return None
         if row == 5:
             if role in (Qt.DisplayRole, Qt.EditRole):
                 dur = max(0.0, seg.end - seg.start)
                 return f"{dur:.3f}" if role == Qt.DisplayRole else dur
-            if role == Qt.TextAlignmentRole:
-                return int(Qt.AlignCenter)
             return None
         if row == 6:
             if role == Qt.DisplayRole:
                 return seg.detector
-            if role == Qt.TextAlignmentRole:
-                return int(Qt.AlignCenter)
             return None
         if row in (7, 8):
             if role == Qt.DisplayRole:
                 return "▶" if row == 7 else "×"
-            if role == Qt.TextAlignmentRole:
-                return int(Qt.AlignCenter)
             return None
         return None
 
@@ -193,8 +216,6 @@ class SampleTableModel(QAbstractTableModel):
 
         if row == 0 and role == Qt.CheckStateRole:
             enabled = value == Qt.Checked
-            if not hasattr(seg, "attrs") or seg.attrs is None:
-                seg.attrs = {}
             seg.attrs["enabled"] = enabled
             self.dataChanged.emit(index, index, [Qt.CheckStateRole, Qt.DisplayRole])
             self.enabledToggled.emit(col, enabled)
@@ -202,8 +223,6 @@ class SampleTableModel(QAbstractTableModel):
         try:
             if row == 1 and role == Qt.EditRole:
                 name_value = str(value).strip()
-                if not hasattr(seg, "attrs") or seg.attrs is None:
-                    seg.attrs = {}
                 if name_value:
                     seg.attrs["name"] = name_value
                 else:
@@ -246,6 +265,33 @@ class SampleTableModel(QAbstractTableModel):
             return False
         return False
 
+    # Internal: change tracking
+    @staticmethod
+    def _column_state(seg: Segment) -> tuple[Any, ...]:
+        attrs = seg.attrs
+        return (
+            id(seg),
+            seg.start,
+            seg.end,
+            bool(attrs.get("enabled", True)),
+            str(attrs.get("name", "")).strip(),
+            seg.detector,
+        )
+
+    def _emit_columns_changed(self, columns: list[int]) -> None:
+        """Emit one dataChanged per contiguous run of visible changed columns."""
+        visible = [col for col in columns if col < self._visible_count]
+        if not visible:
+            return
+        run_start = prev = visible[0]
+        for col in visible[1:] + [None]:
+            if col is not None and col == prev + 1:
+                prev = col
+                continue
+            self.dataChanged.emit(self.index(0, run_start), self.index(self.rowCount() - 1, prev))
+            if col is not None:
+                run_start = prev = col
+
     # Internal: incremental reveal
     def _start_chunk_timer(self) -> None:
         total = len(self._segments)
@@ -0,0 +1,340 @@
+"""Compact, structurally shared snapshots of segment lists for undo/redo history."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from spectrosampler.detectors.base import Segment
+
+SEGMENT_SNAPSHOT_DTYPE = np.dtype(
+    [
+        ("start", "f8"),
+        ("end", "f8"),
+        ("score", "f8"),
+        ("enabled", "?"),
+        ("detector", "i4"),
+    ]
+)
+
+# Detector names are interned once per process so that snapshot rows stay purely numeric
+# and compare directly across snapshots.
+_detector_names: list[str] = []
+_detector_ids: dict[str, int] = {}
+
+
+def _detector_id(name: str) -> int:
+    """Return the interned integer id for a detector name."""
+    idx = _detector_ids.get(name)
+    if idx is None:
+        idx = len(_detector_names)
+        _detector_names.append(name)
+        _detector_ids[name] = idx
+    return idx
+
+
+def detector_name(detector_id: int) -> str:
+    """Return the detector name for an id stored in a snapshot row."""
+    return _detector_names[detector_id]
+
+
+def _copy_attrs(attrs: dict[str, Any]) -> dict[str, Any]:
+    """Copy segment attrs, detaching mutable containers one level deep."""
+    copied: dict[str, Any] = {}
+    for key, value in attrs.items():
+        if isinstance(value, set | list | dict):
+            value = value.copy()
+        copied[key] = value
+    return copied
+
+
+@dataclass(frozen=True)
+class SegmentSnapshot:
+    """Immutable snapshot of a segment list.
+
+    Attributes:
+        rows: Structured array with one ``SEGMENT_SNAPSHOT_DTYPE`` row per segment.
+        attrs: Per-segment attrs dictionaries. Entries are never mutated after capture, so
+            consecutive snapshots share the dictionaries of unchanged segments.
+        keys: ``id()`` of the captured segment objects, used to find shareable attrs.
+    """
+
+    rows: np.ndarray
+    attrs: tuple[dict[str, Any], ...]
+    keys: tuple[int, ...]
+
+    def __len__(self) -> int:
+        return int(self.rows.shape[0])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SegmentSnapshot):
+            return NotImplemented
+        return bool(np.array_equal(self.rows, other.rows)) and self.attrs == other.attrs
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+@dataclass(frozen=True)
+class _SnapshotDelta:
+    """A snapshot stored as the entries where it differs from the next-newer snapshot."""
+
+    length: int
+    indexes: np.ndarray
+    rows: np.ndarray
+    attrs: tuple[dict[str, Any], ...]
+    keys: tuple[int, ...]
+
+
+def _diff_snapshot(old: SegmentSnapshot, newer: SegmentSnapshot) -> _SnapshotDelta:
+    """Encode ``old`` relative to ``newer``."""
+    length = len(old)
+    overlap = min(length, len(newer))
+    differs = np.ones(length, dtype=bool)
+    if overlap:
+        same = old.rows[:overlap] == newer.rows[:overlap]
+        for idx in np.flatnonzero(same):
+            # Unchanged segments share their attrs dict between consecutive snapshots
+            old_attrs = old.attrs[idx]
+            new_attrs = newer.attrs[idx]
+            if old.keys[idx] == newer.keys[idx] and (
+                old_attrs is new_attrs or old_attrs == new_attrs
+            ):
+                differs[idx] = False
+    indexes = np.flatnonzero(differs)
+    return _SnapshotDelta(
+        length=length,
+        indexes=indexes,
+        rows=old.rows[indexes],
+        attrs=tuple(old.attrs[idx] for idx in indexes),
+        keys=tuple(old.keys[idx] for idx in indexes),
+    )
+
+
+def _apply_delta(delta: _SnapshotDelta, newer: SegmentSnapshot) -> SegmentSnapshot:
+    """Rebuild the snapshot that ``delta`` was diffed from."""
+    overlap = min(delta.length, len(newer))
+    rows = np.empty(delta.length, dtype=SEGMENT_SNAPSHOT_DTYPE)
+    rows[:overlap] = newer.rows[:overlap]
+    attrs: list[Any] = list(newer.attrs[:overlap]) + [None] * (delta.length - overlap)
+    keys: list[int] = list(newer.keys[:overlap]) + [0] * (delta.length - overlap)
+    rows[delta.indexes] = delta.rows
+    for idx, entry_attrs, key in zip(delta.indexes, delta.attrs, delta.keys, strict=True):
+        attrs[idx] = entry_attrs
+        keys[idx] = key
+    return SegmentSnapshot(rows=rows, attrs=tuple(attrs), keys=tuple(keys))
+
+
+class SnapshotHistory:
+    """Bounded stack of snapshots that keeps only the newest one in full.
+
+    Each older entry is stored as a delta against the entry above it, so a history of edits
+    that each touch a few segments costs memory proportional to the changed rows rather
+    than to the whole segment list. Pushing and popping re-encode at most one entry.
+    """
+
+    def __init__(self, maxlen: int):
+        """Initialize history.
+
+        Args:
+            maxlen: Maximum number of entries; the oldest entry is dropped beyond it.
+        """
+        self.maxlen = max(1, int(maxlen))
+        self._top: SegmentSnapshot | None = None
+        self._older: deque[_SnapshotDelta] = deque(maxlen=self.maxlen - 1)
+
+    def __len__(self) -> int:
+        return 0 if self._top is None else len(self._older) + 1
+
+    def peek(self) -> SegmentSnapshot | None:
+        """Return the newest snapshot without removing it."""
+        return self._top
+
+    def append(self, snapshot: SegmentSnapshot) -> None:
+        """Push ``snapshot`` as the newest entry, dropping the oldest when full."""
+        if self._top is not None:
+            self._older.append(_diff_snapshot(self._top, snapshot))
+        self._top = snapshot
+
+    def pop(self) -> SegmentSnapshot:
+        """Remove and return the newest snapshot.
+
+        Raises:
+            IndexError: If the history is empty.
+        """
+        top = self._top
+        if top is None:
+            raise IndexError("pop from empty snapshot history")
+        self._top = _apply_delta(self._older.pop(), top) if self._older else None
+        return top
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._top = None
+        self._older.clear()
+
+
+def segments_to_array(segments: Sequence[Segment]) -> np.ndarray:
+    """Pack segment timing, score, enabled state and detector into a structured array.
+
+    Args:
+        segments: Segments to pack.
+
+    Returns:
+        Array of ``SEGMENT_SNAPSHOT_DTYPE`` with one row per segment.
+    """
+    return np.fromiter(
+        (
+            (
+                seg.start,
+                seg.end,
+                seg.score,
+                bool(seg.attrs.get("enabled", True)) if seg.attrs else True,
+                _detector_id(seg.detector),
+            )
+            for seg in segments
+        ),
+        dtype=SEGMENT_SNAPSHOT_DTYPE,
+        count=len(segments),
+    )
+
+
+def capture_snapshot(
+    segments: Sequence[Segment], previous: SegmentSnapshot | None = None
+) -> SegmentSnapshot:
+    """Capture a snapshot of ``segments``.
+
+    Attrs dictionaries of segments that are unchanged relative to ``previous`` are shared
+    with it instead of being copied again.
+
+    Args:
+        segments: Current segment list.
+        previous: Most recent snapshot, if any.
+
+    Returns:
+        New snapshot.
+    """
+    rows = segments_to_array(segments)
+    keys = tuple(id(seg) for seg in segments)
+    shared: dict[int, dict[str, Any]] = {}
+    if previous is not None:
+        shared = dict(zip(previous.keys, previous.attrs, strict=True))
+
+    attrs: list[dict[str, Any]] = []
+    for key, seg in zip(keys, segments, strict=True):
+        prev_attrs = shared.get(key)
+        if prev_attrs is not None and prev_attrs == seg.attrs:
+            attrs.append(prev_attrs)
+        else:
+            attrs.append(_copy_attrs(seg.attrs))
+    return SegmentSnapshot(rows=rows, attrs=tuple(attrs), keys=keys)
+
+
+def restore_snapshot(snapshot: SegmentSnapshot, current: Sequence[Segment]) -> list[Segment]:
+    """Rebuild a segment list from ``snapshot``.
+
+    Segment objects from ``current`` are reused for rows that did not change, whether they
+    are still at the same index or were shifted by an insert or delete; only the differing
+    rows are materialised as new ``Segment`` instances.
+
+    Args:
+        snapshot: Snapshot to restore.
+        current: Segment list currently shown in the UI.
+
+    Returns:
+        Segment list matching the snapshot.
+    """
+    count = len(snapshot)
+    overlap = min(count, len(current))
+    current_rows = segments_to_array(current)
+    unchanged = np.zeros(count, dtype=bool)
+    if overlap:
+        unchanged[:overlap] = current_rows[:overlap] == snapshot.rows[:overlap]
+    # Snapshot keys are the ids of the captured objects; ones still in ``current`` can be
+    # found again after an insert or delete shifted them
+    positions = {id(seg): pos for pos, seg in enumerate(current)}
+    reused: set[int] = set()
+
+    restored: list[Segment] = []
+    for idx in range(count):
+        attrs = snapshot.attrs[idx]
+        if unchanged[idx] and idx not in reused and current[idx].attrs == attrs:
+            reused.add(idx)
+            restored.append(current[idx])
+            continue
+        row = snapshot.rows[idx]
+        pos = positions.get(snapshot.keys[idx])
+        if (
+            pos is not None
+            and pos not in reused
+            and current_rows[pos] == row
+            and current[pos].attrs == attrs
+        ):
+            reused.add(pos)
+            restored.append(current[pos])
+            continue
+        restored.append(
+            Segment(
+                start=float(row["start"]),
+                end=float(row["end"]),
+                detector=detector_name(int(row["detector"])),
+                score=float(row["score"]),
+                attrs=_copy_attrs(attrs),
+            )
+        )
+    return restored
+
+
+def copy_segments(segments: Sequence[Segment]) -> list[Segment]:
+    """Copy segments field by field, detaching their attrs.
+
+    Equivalent to ``copy.deepcopy`` for segment lists (attrs hold scalars and small
+    containers) without deepcopy's recursion and memo bookkeeping.
+
+    Args:
+        segments: Segments to copy.
+
+    Returns:
+        New, independent segment list.
+    """
+    return [
+        Segment(
+            start=seg.start,
+            end=seg.end,
+            detector=seg.detector,
+            score=seg.score,
+            attrs=_copy_attrs(seg.attrs),
+        )
+        for seg in segments
+    ]
+
+
+def snapshot_matches(
+    snapshot: SegmentSnapshot, segments: Sequence[Segment], tolerance: float = 1e-6
+) -> bool:
+    """Return True if ``segments`` match ``snapshot`` in timing, score, detector and state.
+
+    Args:
+        snapshot: Reference snapshot.
+        segments: Segments to compare.
+        tolerance: Absolute tolerance for float fields.
+
+    Returns:
+        True when every segment matches the corresponding snapshot row.
+    """
+    if len(segments) != len(snapshot):
+        return False
+    if not segments:
+        return True
+    rows = segments_to_array(segments)
+    ref = snapshot.rows
+    return bool(
+        np.all(np.abs(rows["start"] - ref["start"]) <= tolerance)
+        and np.all(np.abs(rows["end"] - ref["end"]) <= tolerance)
+        and np.all(np.abs(rows["score"] - ref["score"]) <= tolerance)
+        and np.array_equal(rows["enabled"], ref["enabled"])
+        and np.array_equal(rows["detector"], ref["detector"])
+    )
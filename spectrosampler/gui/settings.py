@@ -3,6 +3,7 @@
 import json
 import logging
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -291,6 +292,21 @@ class SettingsManager:
         snapshot = {"items": serialise_overrides(overrides)}
         self._store_json_dict("exportOverrides", snapshot)
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def format_recent_timestamp(timestamp: datetime) -> str:
+        """Format a recent-file timestamp for display.
+
+        Memoized on the timestamp, so re-listing the same recent files reuses the strings.
+
+        Args:
+            timestamp: Timestamp returned with a recent project or audio file.
+
+        Returns:
+            Timestamp formatted as ``YYYY-MM-DD HH:MM``.
+        """
+        return timestamp.strftime("%Y-%m-%d %H:%M")
+
     def get_recent_projects(self, max_count: int = 10) -> list[tuple[Path, datetime]]:
         """Get list of recent projects.
 
@@ -1,9 +1,10 @@
 """Spectrogram tiling system for efficient rendering of long files."""
 
 import logging
-from collections import OrderedDict
+import os
+import threading
 from collections.abc import Callable
-from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from concurrent.futures import CancelledError, Future
 from functools import cached_property
 from pathlib import Path
 from typing import Any, cast
@@ -11,9 +12,57 @@ from typing import Any, cast
 import numpy as np
 import numpy.typing as npt
 import soundfile as sf
+from PySide6.QtCore import QRunnable, QThreadPool
+
+from spectrosampler.gui.tile_cache import TileCache
 
 logger = logging.getLogger(__name__)
 
+# QThreadPool priorities: queued visible-view tiles run ahead of speculative prefetches
+TILE_PRIORITY_VISIBLE = 9
+TILE_PRIORITY_PREFETCH = 1
+# Whole-file decodes only speed up later tiles, so they wait behind all tile work
+_AUDIO_DECODE_PRIORITY = 0
+# Frames per block when decoding a whole file, so the multichannel buffer stays small
+_AUDIO_DECODE_BLOCK_FRAMES = 1 << 16
+
+# Power floor added before log10; float32 so spectrograms stay single precision
+_DB_FLOOR = np.float32(1e-10)
+# dB values are colormapped as uint16 fixed point: 1/64 dB steps from -128 dB up to
+# about +896 dB. Code 0 is reserved for NaN so percentiles can skip it.
+_DB_CODE_MIN = -128.0
+_DB_CODE_STEPS = 64.0
+# Largest per-thread scratch buffer kept between tiles; bigger ones are freed after use
+_MAX_SCRATCH_BYTES = 32 * 1024 * 1024
+
+
+def _evict_oldest(cache: dict[Any, Any]) -> None:
+    """Remove the least recently used (first inserted) entry of an insertion-ordered cache."""
+    try:
+        del cache[next(iter(cache))]
+    except (StopIteration, KeyError, RuntimeError) as exc:
+        # Another tile worker emptied or resized the cache concurrently
+        logger.debug("Spectrogram cache eviction skipped: %s", exc, exc_info=exc)
+
+
+class _TileTask(QRunnable):
+    """QRunnable that runs a callable and publishes its outcome to a Future."""
+
+    def __init__(self, fn: Callable[[], Any], future: Future):
+        super().__init__()
+        self._fn = fn
+        self._future = future
+
+    def run(self) -> None:
+        if not self._future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self._fn()
+        except Exception as exc:  # forwarded to the Future for the caller to inspect
+            self._future.set_exception(exc)
+        else:
+            self._future.set_result(result)
+
 
 class SpectrogramTile:
     """Represents a single spectrogram tile."""
@@ -26,6 +75,8 @@ class SpectrogramTile:
         frequencies: np.ndarray,
         sample_rate: int,
         rgba: np.ndarray | None = None,
+        magnitude: np.ndarray | None = None,
+        palette: list[int] | None = None,
     ):
         """Initialize spectrogram tile.
 
@@ -35,6 +86,9 @@ class SpectrogramTile:
             spectrogram: Spectrogram data (frequencies x time).
             frequencies: Frequency array in Hz.
             sample_rate: Audio sample rate.
+            rgba: Optional precolored image (freq x time x 4, uint8).
+            magnitude: Optional colormap indices (freq x time, uint8) for ``palette``.
+            palette: 256 QRgb values mapping ``magnitude`` indices to colors.
         """
         self.start_time = start_time
         self.end_time = end_time
@@ -42,6 +96,8 @@ class SpectrogramTile:
         self.frequencies = frequencies
         self.sample_rate = sample_rate
         self.rgba = rgba  # Optional precolored image (freq x time x 4, uint8)
+        self.magnitude = magnitude
+        self.palette = palette
 
     @property
     def duration(self) -> float:
@@ -59,6 +115,7 @@ class SpectrogramTiler:
         hop_length: int | None = None,
         fmin: float | None = None,
         fmax: float | None = None,
+        disk_cache: TileCache | None = None,
     ):
         """Initialize spectrogram tiler.
 
@@ -68,29 +125,53 @@ class SpectrogramTiler:
             hop_length: Hop length for STFT. If None, uses nfft // 4.
             fmin: Minimum frequency in Hz. If None, uses 0.
             fmax: Maximum frequency in Hz. If None, uses sample_rate / 2.
+            disk_cache: Optional persistent cache for overviews across sessions.
         """
         self.tile_duration_sec = tile_duration_sec
         self.nfft = nfft
         self.hop_length = hop_length or (nfft // 4)
         self.fmin = fmin
         self.fmax = fmax
-        # Simple LRU caches with bounded size
-        self._tile_cache: OrderedDict[str, SpectrogramTile] = OrderedDict()
+        # Time columns the view can show; tiles with many more frames are max-pooled
+        # down to it before colormapping. None keeps full resolution.
+        self.target_time_bins: int | None = None
+        self._disk_cache = disk_cache
+        # Simple LRU caches with bounded size; plain dicts keep insertion order, so a
+        # pop-and-reinsert marks an entry recently used and the first key is the oldest
+        self._tile_cache: dict[str, SpectrogramTile] = {}
         self._max_cache_items: int = 64
-        self._info_cache: OrderedDict[Path, tuple[float, Any]] = OrderedDict()
+        self._info_cache: dict[Path, tuple[int, Any]] = {}
         self._max_info_cache_items: int = 32
+        # Decoded mono float32 audio by path, so tiles slice memory instead of re-reading
+        self._audio_cache: dict[Path, tuple[int, npt.NDArray[np.float32]]] = {}
+        self._max_audio_cache_bytes: int = 512 * 1024 * 1024
+        self._audio_lock = threading.Lock()
+        # Paths whose background decode is queued or running
+        self._audio_decoding: set[Path] = set()
         # Background executor for async tile generation
         try:
-            import os
-
             max_workers = max(2, min(8, (os.cpu_count() or 4) // 2))
         except (ImportError, AttributeError, OSError, ValueError) as exc:
             logger.warning(
                 "Falling back to default spectrogram worker count: %s", exc, exc_info=exc
             )
             max_workers = 4
-        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="SpecTile")
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max_workers)
         self._colormap = self._build_colormap_lut()
+        # Same LUT with one RGBA pixel per uint32, so applying it is a single gather per pixel
+        self._colormap_u32: npt.NDArray[np.uint32] = self._colormap.view(np.uint32).reshape(256)
+        # STFT windows by length; tiles and overview blocks reuse the same few sizes
+        self._window_cache: dict[int, npt.NDArray[np.float32]] = {}
+        # Per-thread scratch arrays for colormapping, reused while the tile shape repeats
+        self._scratch = threading.local()
+        # Frequency bin bounds by (sr, nfft, bins, fmin, fmax); see _freq_slice
+        self._freq_slice_cache: dict[tuple[Any, ...], tuple[int, int, np.ndarray]] = {}
+        # Same colors as QRgb (0xAARRGGBB) for wrapping indices as Format_Indexed8 images
+        self._palette: list[int] = [
+            (int(a) << 24) | (int(r) << 16) | (int(g) << 8) | int(b)
+            for r, g, b, a in self._colormap
+        ]
 
     @cached_property
     def _signal(self):
@@ -99,6 +180,13 @@ class SpectrogramTiler:
 
         return _signal
 
+    @cached_property
+    def _fft(self):
+        """Lazy import of scipy.fft (single-precision, multi-threaded pocketfft)."""
+        from scipy import fft as _fft
+
+        return _fft
+
     def _build_colormap_lut(self) -> npt.NDArray[np.uint8]:
         """Build a 256-entry viridis-like RGBA lookup table without matplotlib."""
         # Key color stops sampled from viridis gradient (approximate)
@@ -120,24 +208,118 @@ class SpectrogramTiler:
             lut[:, channel] = np.clip(channel_values, 0, 255).astype(np.uint8)
         return lut
 
-    def _get_file_info(self, audio_path: Path) -> Any:
-        """Retrieve cached soundfile info with basic invalidation by mtime."""
+    @staticmethod
+    def _mtime_ns(audio_path: Path) -> int:
+        """Return the file's modification time in ns for cache validation, or -1."""
         try:
-            mtime = audio_path.stat().st_mtime
+            return os.stat(audio_path).st_mtime_ns
         except OSError:
-            mtime = -1.0
-        cached = self._info_cache.get(audio_path)
-        if cached and abs(cached[0] - mtime) < 1e-6:
-            self._info_cache.move_to_end(audio_path, last=True)
+            return -1
+
+    def _get_file_info(self, audio_path: Path, mtime_ns: int | None = None) -> Any:
+        """Retrieve cached soundfile info with basic invalidation by mtime.
+
+        Args:
+            audio_path: Path to audio file.
+            mtime_ns: ``_mtime_ns(audio_path)`` if the caller already has it.
+
+        Returns:
+            Soundfile info for ``audio_path``.
+        """
+        if mtime_ns is None:
+            mtime_ns = self._mtime_ns(audio_path)
+        cached = self._info_cache.pop(audio_path, None)
+        if cached is not None and cached[0] == mtime_ns:
+            self._info_cache[audio_path] = cached
             return cached[1]
 
         info = sf.info(audio_path)
-        self._info_cache[audio_path] = (mtime, info)
-        self._info_cache.move_to_end(audio_path, last=True)
+        self._info_cache[audio_path] = (mtime_ns, info)
         if len(self._info_cache) > self._max_info_cache_items:
-            self._info_cache.popitem(last=False)
+            _evict_oldest(self._info_cache)
         return info
 
+    def _get_decoded_audio(
+        self, audio_path: Path, file_info: Any, mtime_ns: int
+    ) -> npt.NDArray[np.float32] | None:
+        """Return the whole file as read-only mono float32, if it has been decoded.
+
+        Args:
+            audio_path: Path to audio file.
+            file_info: Soundfile info for ``audio_path``.
+            mtime_ns: ``_mtime_ns(audio_path)``, used to invalidate the decoded copy.
+
+        Returns:
+            Decoded samples, or None if they are not ready or do not fit the cache budget.
+        """
+        if int(file_info.frames) * 4 > self._max_audio_cache_bytes:
+            return None
+        with self._audio_lock:
+            cached = self._audio_cache.pop(audio_path, None)
+            if cached is not None and cached[0] == mtime_ns:
+                self._audio_cache[audio_path] = cached
+                return cached[1]
+        return None
+
+    def _queue_audio_decode(self, audio_path: Path, file_info: Any, mtime_ns: int) -> None:
+        """Decode ``audio_path`` on the tile pool so later tiles can slice it in memory.
+
+        Called after a cold tile has been served from a partial read, so the tile never
+        waits on (or competes with) the whole-file decode.
+
+        Args:
+            audio_path: Path to audio file.
+            file_info: Soundfile info for ``audio_path``.
+            mtime_ns: ``_mtime_ns(audio_path)``, used to invalidate the decoded copy.
+        """
+        if int(file_info.frames) * 4 > self._max_audio_cache_bytes:
+            return
+        with self._audio_lock:
+            if audio_path in self._audio_decoding:
+                return
+            self._audio_decoding.add(audio_path)
+        self._pool.start(
+            _TileTask(lambda: self._decode_audio(audio_path, mtime_ns), Future()),
+            _AUDIO_DECODE_PRIORITY,
+        )
+
+    def _decode_audio(self, audio_path: Path, mtime_ns: int) -> None:
+        """Decode ``audio_path`` to mono float32 and add it to the decoded-audio cache.
+
+        Blocks are mixed down as they are read, so peak memory is the mono result plus one
+        block rather than the full multichannel file.
+
+        Args:
+            audio_path: Path to audio file.
+            mtime_ns: Modification time the decoded copy is valid for.
+        """
+        try:
+            with sf.SoundFile(str(audio_path)) as handle:
+                data = np.empty(int(handle.frames), dtype=np.float32)
+                filled = 0
+                for block in handle.blocks(
+                    blocksize=_AUDIO_DECODE_BLOCK_FRAMES, dtype="float32", always_2d=True
+                ):
+                    count = min(block.shape[0], data.size - filled)
+                    np.mean(block[:count], axis=1, dtype=np.float32, out=data[filled:][:count])
+                    filled += count
+            data = data[:filled]
+        except (RuntimeError, OSError, ValueError) as exc:
+            logger.debug("Background decode failed for %s: %s", audio_path, exc, exc_info=exc)
+            with self._audio_lock:
+                self._audio_decoding.discard(audio_path)
+            return
+        data.setflags(write=False)
+        with self._audio_lock:
+            self._audio_decoding.discard(audio_path)
+            self._audio_cache[audio_path] = (mtime_ns, data)
+            while (
+                len(self._audio_cache) > 1
+                and sum(entry[1].nbytes for entry in self._audio_cache.values())
+                > self._max_audio_cache_bytes
+            ):
+                _evict_oldest(self._audio_cache)
+
     def _get_cache_key(self, audio_path: Path, start_time: float, end_time: float) -> str:
         """Generate cache key for tile.
 
@@ -149,7 +331,7 @@ class SpectrogramTiler:
         Returns:
             Cache key string.
         """
-        return f"{audio_path}:{start_time:.3f}:{end_time:.3f}:{self.nfft}:{self.hop_length}:{self.fmin}:{self.fmax}"
+        return f"{audio_path}:{start_time:.3f}:{end_time:.3f}:{self.nfft}:{self.hop_length}:{self.fmin}:{self.fmax}:{self.target_time_bins}"
 
     def generate_tile(
         self,
@@ -160,6 +342,9 @@ class SpectrogramTiler:
     ) -> SpectrogramTile:
         """Generate spectrogram tile for time range.
 
+        Tiles are served from the in-memory LRU first, then from the on-disk cache when one
+        is configured, so reopening a file skips the FFT work for views seen before.
+
         Args:
             audio_path: Path to audio file.
             start_time: Start time in seconds.
@@ -170,17 +355,60 @@ class SpectrogramTiler:
             SpectrogramTile object.
         """
         cache_key = self._get_cache_key(audio_path, start_time, end_time)
-        if cache_key in self._tile_cache:
-            # Move to end to mark as recently used
-            tile = self._tile_cache.pop(cache_key)
+        tile = self._tile_cache.pop(cache_key, None)
+        if tile is not None:
+            # Reinsert at the end to mark as recently used
             self._tile_cache[cache_key] = tile
             logger.debug(f"Using cached tile: {cache_key}")
             return tile
 
+        disk_cache = self._disk_cache
+        disk_key = None
+        if disk_cache is not None:
+            disk_key = TileCache.make_key(
+                audio_path,
+                "tile",
+                round(start_time, 3),
+                round(end_time, 3),
+                self.nfft,
+                self.hop_length,
+                sample_rate,
+                self.fmin,
+                self.fmax,
+                self.target_time_bins,
+            )
+            cached = disk_cache.get(disk_key)
+            if cached is not None:
+                logger.debug(f"Using disk-cached tile: {cache_key}")
+                frequencies = cached["frequencies"]
+                shared = self._freq_slice_cache.get(
+                    (
+                        int(cached["sample_rate"]),
+                        self.nfft,
+                        self.nfft // 2 + 1,
+                        self.fmin,
+                        self.fmax,
+                    )
+                )
+                if shared is not None and np.array_equal(shared[2], frequencies):
+                    frequencies = shared[2]
+                tile = SpectrogramTile(
+                    start_time=start_time,
+                    end_time=end_time,
+                    spectrogram=cached["spectrogram"],
+                    frequencies=frequencies,
+                    sample_rate=int(cached["sample_rate"]),
+                    rgba=cached["rgba"],
+                )
+                self._remember_tile(cache_key, tile)
+                return tile
+
         logger.debug(f"Generating tile: {audio_path} [{start_time:.2f}s - {end_time:.2f}s]")
 
-        # Probe file sample rate without loading full data
-        file_info = self._get_file_info(audio_path)
+        # Probe file sample rate without loading full data; one stat validates both the
+        # info and decoded-audio caches
+        mtime_ns = self._mtime_ns(audio_path)
+        file_info = self._get_file_info(audio_path, mtime_ns)
         sr = int(file_info.samplerate)
 
         # Resample if needed
@@ -208,91 +436,45 @@ class SpectrogramTiler:
                 sample_rate=sr,
             )
 
-        # Read only the needed frames
-        audio_segment, _ = sf.read(audio_path, start=start_sample, stop=end_sample, always_2d=False)
-        if getattr(audio_segment, "ndim", 1) > 1:
-            audio_segment = np.mean(audio_segment, axis=1)
+        decoded = self._get_decoded_audio(audio_path, file_info, mtime_ns)
+        if decoded is not None:
+            audio_segment = decoded[start_sample:end_sample]
+        else:
+            # Not decoded yet, or too large to keep decoded; read only the needed frames
+            audio_segment, _ = sf.read(
+                audio_path, start=start_sample, stop=end_sample, dtype="float32", always_2d=False
+            )
+            if getattr(audio_segment, "ndim", 1) > 1:
+                audio_segment = np.mean(audio_segment, axis=1, dtype=np.float32)
         # Optional resample of the visible window only
         if target_sr != sr and len(audio_segment) > 0:
             resample = self._signal.resample
             num_samples = int(len(audio_segment) * target_sr / sr)
-            audio_segment = resample(audio_segment, num_samples)
+            audio_segment = resample(audio_segment, num_samples).astype(np.float32, copy=False)
             sr = target_sr
 
-        # Compute spectrogram
-        sig = self._signal
-        frequencies, times, spectrogram = sig.spectrogram(
-            audio_segment,
-            fs=sr,
-            nperseg=self.nfft,
-            noverlap=self.nfft - self.hop_length,
-            nfft=self.nfft,
-        )
-
-        # Apply frequency filtering
-        if self.fmin is not None or self.fmax is not None:
-            fmin_idx = 0
-            fmax_idx = len(frequencies)
-
-            if len(frequencies) > 0:
-                logger.debug(
-                    f"Frequency filtering: original range=[{frequencies[0]:.1f}, {frequencies[-1]:.1f}] Hz, requested=[{self.fmin}, {self.fmax}]"
-                )
-            else:
-                logger.warning(
-                    f"Frequency filtering: original frequencies array is empty, requested=[{self.fmin}, {self.fmax}]"
-                )
-
-            if self.fmin is not None:
-                # Use searchsorted to find the first index where frequency >= fmin
-                # This correctly handles edge cases where all frequencies are below fmin
-                fmin_idx = np.searchsorted(frequencies, self.fmin)
-                if fmin_idx >= len(frequencies):
-                    # All frequencies are below fmin
-                    logger.warning(
-                        f"All frequencies ({frequencies[-1]:.1f} Hz) are below fmin ({self.fmin:.1f} Hz)"
-                    )
-                    fmin_idx = len(frequencies)  # This will result in empty slice, which is correct
-                else:
-                    logger.debug(
-                        f"fmin_idx={fmin_idx}, frequency[{fmin_idx}]={frequencies[fmin_idx]:.1f} Hz"
-                    )
-
-            if self.fmax is not None:
-                # Use searchsorted with side='right' to find the first index where frequency > fmax
-                # This correctly handles edge cases where all frequencies are below fmax
-                fmax_idx = np.searchsorted(frequencies, self.fmax, side="right")
-                if fmax_idx == 0:
-                    # All frequencies are above fmax
-                    logger.warning(
-                        f"All frequencies ({frequencies[0]:.1f} Hz) are above fmax ({self.fmax:.1f} Hz)"
-                    )
-                else:
-                    logger.debug(
-                        f"fmax_idx={fmax_idx}, frequency[{fmax_idx-1}]={frequencies[fmax_idx-1]:.1f} Hz"
-                    )
+        # Compute spectrogram: one batched real FFT over strided frames, with scipy's
+        # shrinking-window behaviour kept for segments shorter than one window
+        if audio_segment.size >= self.nfft:
+            frequencies, times, spectrogram = self._batched_spectrogram(
+                audio_segment, sr, self.nfft, self.hop_length
+            )
+        else:
+            frequencies, times, spectrogram = self._signal.spectrogram(
+                audio_segment,
+                fs=sr,
+                nperseg=self.nfft,
+                noverlap=self.nfft - self.hop_length,
+                nfft=self.nfft,
+            )
 
-            # Validate indices before slicing
-            if fmin_idx >= fmax_idx:
-                logger.warning(
-                    f"Invalid frequency filter range: fmin_idx={fmin_idx}, fmax_idx={fmax_idx}. This will result in empty data."
-                )
-                # Return empty arrays when filter results in no valid range
-                frequencies = np.array([])
-                # Preserve time dimension if spectrogram has data, otherwise use empty shape
-                if spectrogram.size > 0 and spectrogram.shape[1] > 0:
-                    spectrogram = np.array([]).reshape(0, spectrogram.shape[1])
-                else:
-                    spectrogram = np.array([]).reshape(0, 0)
-            else:
-                frequencies = frequencies[fmin_idx:fmax_idx]
-                spectrogram = spectrogram[fmin_idx:fmax_idx, :]
-                logger.debug(
-                    f"Frequency filtering applied: filtered range=[{frequencies[0]:.1f}, {frequencies[-1]:.1f}] Hz, bins={len(frequencies)}"
-                )
+        # Apply frequency filtering; also swaps in the frequency array shared by all tiles
+        # with this configuration
+        fmin_idx, fmax_idx, frequencies = self._freq_slice(frequencies, sr, self.nfft)
+        spectrogram = self._slice_bins(spectrogram, fmin_idx, fmax_idx)
 
         # Convert to dB
-        spectrogram_db = 10 * np.log10(spectrogram + 1e-10)
+        spectrogram_db = self._pool_time_bins(self._to_db(spectrogram))
 
         # Precompute RGBA once for fast drawing (freq x time x 4)
         rgba = self._to_rgba(spectrogram_db)
@@ -309,28 +491,91 @@ class SpectrogramTiler:
             rgba=rgba,
         )
 
-        # Cache tile with LRU eviction
+        if disk_cache is not None and disk_key is not None and spectrogram_db.size:
+            arrays = {
+                "spectrogram": spectrogram_db,
+                "frequencies": frequencies,
+                "sample_rate": np.asarray(sr),
+                "rgba": rgba,
+            }
+            disk_cache.put(disk_key, arrays)
+        self._remember_tile(cache_key, tile)
+        if decoded is None:
+            self._queue_audio_decode(audio_path, file_info, mtime_ns)
+        return tile
+
+    def _remember_tile(self, cache_key: str, tile: SpectrogramTile) -> None:
+        """Add ``tile`` to the in-memory LRU cache, evicting the oldest entry if full."""
         self._tile_cache[cache_key] = tile
         if len(self._tile_cache) > self._max_cache_items:
-            try:
-                self._tile_cache.popitem(last=False)
-            except KeyError as exc:
-                logger.debug("Spectrogram tile cache pop failed: %s", exc, exc_info=exc)
-        return tile
+            _evict_oldest(self._tile_cache)
 
     def generate_overview(
-        self, audio_path: Path, duration: float, sample_rate: int | None = None
+        self,
+        audio_path: Path,
+        duration: float,
+        sample_rate: int | None = None,
+        cancel_event: threading.Event | None = None,
     ) -> SpectrogramTile:
         """Generate low-resolution overview spectrogram for entire file.
 
+        Results are reused from the on-disk cache when one is configured and the file and
+        spectrogram parameters are unchanged.
+
         Args:
             audio_path: Path to audio file.
             duration: Total duration in seconds.
             sample_rate: Target sample rate. If None, uses file's sample rate.
+            cancel_event: When set, generation stops at the next block boundary.
 
         Returns:
             SpectrogramTile object with overview.
+
+        Raises:
+            CancelledError: If ``cancel_event`` was set before generation finished.
         """
+        disk_cache = self._disk_cache
+        disk_key = None
+        if disk_cache is not None:
+            disk_key = TileCache.make_key(
+                audio_path, "overview", self.nfft, sample_rate, self.fmin, self.fmax
+            )
+            cached = disk_cache.get(disk_key)
+            if cached is not None:
+                logger.debug(f"Using cached overview: {audio_path}")
+                return SpectrogramTile(
+                    start_time=0.0,
+                    end_time=duration,
+                    spectrogram=cached["spectrogram"],
+                    frequencies=cached["frequencies"],
+                    sample_rate=int(cached["sample_rate"]),
+                    rgba=cached.get("rgba"),
+                    magnitude=cached.get("magnitude"),
+                    palette=self._palette if "magnitude" in cached else None,
+                )
+
+        overview = self._compute_overview(audio_path, duration, sample_rate, cancel_event)
+        if disk_cache is not None and disk_key is not None and overview.spectrogram.size:
+            arrays = {
+                "spectrogram": overview.spectrogram,
+                "frequencies": overview.frequencies,
+                "sample_rate": np.asarray(overview.sample_rate),
+            }
+            if overview.rgba is not None:
+                arrays["rgba"] = overview.rgba
+            if overview.magnitude is not None:
+                arrays["magnitude"] = overview.magnitude
+            disk_cache.put(disk_key, arrays)
+        return overview
+
+    def _compute_overview(
+        self,
+        audio_path: Path,
+        duration: float,
+        sample_rate: int | None = None,
+        cancel_event: threading.Event | None = None,
+    ) -> SpectrogramTile:
+        """Compute the overview spectrogram by streaming the whole file."""
         # Use larger hop length for overview
         overview_nfft = self.nfft * 4
         overview_hop = overview_nfft // 2
@@ -346,10 +591,12 @@ class SpectrogramTiler:
                 # Fallback to one-shot read when explicit resampling requested.
                 audio_data = sf_file.read(dtype="float32", always_2d=False)
                 if getattr(audio_data, "ndim", 1) > 1:
-                    audio_data = np.mean(audio_data, axis=1)
+                    audio_data = np.mean(audio_data, axis=1, dtype=np.float32)
+                if cancel_event is not None and cancel_event.is_set():
+                    raise CancelledError(f"Overview generation cancelled: {audio_path}")
                 target_sr = int(sample_rate)
                 num_samples = int(len(audio_data) * target_sr / sr)
-                audio_data = sig.resample(audio_data, num_samples)
+                audio_data = sig.resample(audio_data, num_samples).astype(np.float32, copy=False)
                 frequencies, times, spectrogram = sig.spectrogram(
                     audio_data,
                     fs=target_sr,
@@ -359,57 +606,72 @@ class SpectrogramTiler:
                 )
             else:
                 target_sr = sr
-                blocksize = max(overview_nfft * 4, target_sr)
-                buffer = np.empty(0, dtype=np.float32)
-                spec_chunks: list[np.ndarray] = []
-                time_chunks: list[np.ndarray] = []
-                offset = 0.0
+                # Large blocks keep the Python loop short; each block is one batched FFT
+                blocksize = max(overview_nfft * 4, target_sr, overview_hop * 256)
+                channels = sf_file.channels
+                # Reused buffers: raw reads, and mono samples with the previous block's
+                # unconsumed tail (always shorter than one window) kept at the front
+                read_buf = np.empty((blocksize, channels), dtype=np.float32)
+                work = np.empty(blocksize + overview_nfft, dtype=np.float32)
+                carry = 0
+                # Frames are written straight into one output array sized from the file
+                # length (grown only if the header undercounts), so no final concatenate
+                n_bins = overview_nfft // 2 + 1
+                capacity = max(1, int(sf_file.frames) // overview_hop + 2)
+                spectrogram = np.empty((n_bins, capacity), dtype=np.float32)
+                n_cols = 0
                 frequencies = np.array([])
 
+                def append(spec_block: np.ndarray) -> None:
+                    nonlocal spectrogram, n_cols
+                    end = n_cols + spec_block.shape[1]
+                    if end > spectrogram.shape[1]:
+                        grown = np.empty((n_bins, max(end, 2 * n_cols)), dtype=np.float32)
+                        grown[:, :n_cols] = spectrogram[:, :n_cols]
+                        spectrogram = grown
+                    spectrogram[:, n_cols:end] = spec_block
+                    n_cols = end
+
                 while True:
-                    block = sf_file.read(blocksize, dtype="float32", always_2d=False)
-                    if block.size == 0:
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise CancelledError(f"Overview generation cancelled: {audio_path}")
+                    block = sf_file.read(blocksize, dtype="float32", always_2d=True, out=read_buf)
+                    n_read = block.shape[0]
+                    if n_read == 0:
                         break
-                    if getattr(block, "ndim", 1) > 1:
-                        block = np.mean(block, axis=1)
-                    data = np.concatenate([buffer, block])
+                    mono = work[carry : carry + n_read]
+                    if channels > 1:
+                        np.mean(block, axis=1, dtype=np.float32, out=mono)
+                    else:
+                        mono[:] = block[:, 0]
+                    data = work[: carry + n_read]
                     if data.size < overview_nfft:
-                        buffer = data
+                        carry = data.size
                         continue
 
-                    frequencies, times_block, spec_block = sig.spectrogram(
-                        data,
-                        fs=target_sr,
-                        nperseg=overview_nfft,
-                        noverlap=overview_nfft - overview_hop,
-                        nfft=overview_nfft,
+                    frequencies, _, spec_block = self._batched_spectrogram(
+                        data, target_sr, overview_nfft, overview_hop
                     )
-                    if spec_block.size == 0:
-                        buffer = data
-                        continue
+                    append(spec_block)
 
                     n_frames = spec_block.shape[1]
-                    consumed = overview_nfft + (n_frames - 1) * overview_hop
-                    consumed = min(consumed, data.size)
-                    buffer = data[consumed:]
-
-                    spec_chunks.append(spec_block.astype(np.float32, copy=False))
-                    time_chunks.append(times_block + offset)
-                    offset += consumed / target_sr
-
-                if buffer.size >= overview_hop:
-                    frequencies, times_block, spec_block = sig.spectrogram(
-                        buffer,
+                    consumed = min(overview_nfft + (n_frames - 1) * overview_hop, data.size)
+                    carry = data.size - consumed
+                    work[:carry] = data[consumed:]
+
+                if carry >= overview_hop:
+                    # Tail shorter than one window: scipy shrinks nperseg to fit
+                    frequencies, _, spec_block = sig.spectrogram(
+                        work[:carry],
                         fs=target_sr,
                         nperseg=overview_nfft,
                         noverlap=overview_nfft - overview_hop,
                         nfft=overview_nfft,
                     )
                     if spec_block.size:
-                        spec_chunks.append(spec_block.astype(np.float32, copy=False))
-                        time_chunks.append(times_block + offset)
+                        append(spec_block.astype(np.float32, copy=False))
 
-                if not spec_chunks:
+                if n_cols == 0:
                     return SpectrogramTile(
                         start_time=0.0,
                         end_time=duration,
@@ -420,79 +682,17 @@ class SpectrogramTiler:
                     )
 
                 frequencies = cast(np.ndarray, frequencies)
-                spectrogram = (
-                    np.concatenate(spec_chunks, axis=1)
-                    if len(spec_chunks) > 1
-                    else np.array(spec_chunks[0], copy=True)
-                )
+                spectrogram = spectrogram[:, :n_cols]
 
         sr_overview = target_sr
 
         # Apply frequency filtering
-        if self.fmin is not None or self.fmax is not None:
-            fmin_idx = 0
-            fmax_idx = len(frequencies)
-
-            if len(frequencies) > 0:
-                logger.debug(
-                    f"Frequency filtering (overview): original range=[{frequencies[0]:.1f}, {frequencies[-1]:.1f}] Hz, requested=[{self.fmin}, {self.fmax}]"
-                )
-            else:
-                logger.warning(
-                    f"Frequency filtering (overview): original frequencies array is empty, requested=[{self.fmin}, {self.fmax}]"
-                )
-
-            if self.fmin is not None:
-                # Use searchsorted to find the first index where frequency >= fmin
-                # This correctly handles edge cases where all frequencies are below fmin
-                fmin_idx = np.searchsorted(frequencies, self.fmin)
-                if fmin_idx >= len(frequencies):
-                    # All frequencies are below fmin
-                    logger.warning(
-                        f"All frequencies ({frequencies[-1]:.1f} Hz) are below fmin ({self.fmin:.1f} Hz)"
-                    )
-                    fmin_idx = len(frequencies)  # This will result in empty slice, which is correct
-                else:
-                    logger.debug(
-                        f"fmin_idx={fmin_idx}, frequency[{fmin_idx}]={frequencies[fmin_idx]:.1f} Hz"
-                    )
-
-            if self.fmax is not None:
-                # Use searchsorted with side='right' to find the first index where frequency > fmax
-                # This correctly handles edge cases where all frequencies are below fmax
-                fmax_idx = np.searchsorted(frequencies, self.fmax, side="right")
-                if fmax_idx == 0:
-                    # All frequencies are above fmax
-                    logger.warning(
-                        f"All frequencies ({frequencies[0]:.1f} Hz) are above fmax ({self.fmax:.1f} Hz)"
-                    )
-                else:
-                    logger.debug(
-                        f"fmax_idx={fmax_idx}, frequency[{fmax_idx-1}]={frequencies[fmax_idx-1]:.1f} Hz"
-                    )
+        fmin_idx, fmax_idx, frequencies = self._freq_slice(frequencies, sr_overview, overview_nfft)
+        spectrogram = self._slice_bins(spectrogram, fmin_idx, fmax_idx)
 
-            # Validate indices before slicing
-            if fmin_idx >= fmax_idx:
-                logger.warning(
-                    f"Invalid frequency filter range: fmin_idx={fmin_idx}, fmax_idx={fmax_idx}. This will result in empty data."
-                )
-                # Return empty arrays when filter results in no valid range
-                frequencies = np.array([])
-                # Preserve time dimension if spectrogram has data, otherwise use empty shape
-                if spectrogram.size > 0 and spectrogram.shape[1] > 0:
-                    spectrogram = np.array([]).reshape(0, spectrogram.shape[1])
-                else:
-                    spectrogram = np.array([]).reshape(0, 0)
-            else:
-                frequencies = frequencies[fmin_idx:fmax_idx]
-                spectrogram = spectrogram[fmin_idx:fmax_idx, :]
-                logger.debug(
-                    f"Frequency filtering applied (overview): filtered range=[{frequencies[0]:.1f}, {frequencies[-1]:.1f}] Hz, bins={len(frequencies)}"
-                )
-
-        # Convert to dB and precompute RGBA
-        spectrogram_db = 10 * np.log10(spectrogram + 1e-10)
-        rgba = self._to_rgba(spectrogram_db)
+        # Convert to dB and precompute colormap indices plus RGBA
+        spectrogram_db = self._to_db(spectrogram)
+        magnitude = self._to_indices(spectrogram_db)
 
         return SpectrogramTile(
             start_time=0.0,
@@ -500,39 +700,294 @@ class SpectrogramTiler:
             spectrogram=spectrogram_db,
             frequencies=frequencies,
             sample_rate=sr_overview,
-            rgba=rgba,
+            rgba=self._colormap[magnitude],
+            magnitude=magnitude,
+            palette=self._palette,
         )
 
     def clear_cache(self) -> None:
         """Clear tile cache."""
         self._tile_cache.clear()
         self._info_cache.clear()
+        with self._audio_lock:
+            self._audio_cache.clear()
         logger.debug("Cleared spectrogram tile cache")
 
     # --- Helpers ---
-    def _to_rgba(self, spec_db: np.ndarray) -> np.ndarray:
-        """Convert dB spectrogram to RGBA uint8 array (freq x time x 4).
+    def _freq_slice(
+        self, frequencies: np.ndarray, sr: int, nfft: int
+    ) -> tuple[int, int, np.ndarray]:
+        """Return the bin range kept by ``fmin``/``fmax`` and the matching frequencies.
+
+        Bin frequencies depend only on the sample rate and FFT size, so the bounds are
+        computed once per ``(sr, nfft, fmin, fmax)`` and reused for every tile. The returned
+        frequencies are one read-only array per configuration, shared by all its tiles.
+
+        Args:
+            frequencies: Bin center frequencies of the spectrogram being filtered.
+            sr: Sample rate the spectrogram was computed at.
+            nfft: FFT size the spectrogram was computed with.
 
-        Uses robust normalization (5th-95th percentile) to improve contrast.
+        Returns:
+            Tuple of (fmin_idx, fmax_idx, filtered frequencies). The frequencies are empty
+            when the requested range selects no bins.
+        """
+        key = (sr, nfft, len(frequencies), self.fmin, self.fmax)
+        cached = self._freq_slice_cache.get(key)
+        if cached is not None:
+            return cached
+
+        fmin_idx = 0
+        fmax_idx = len(frequencies)
+        if len(frequencies) > 0:
+            logger.debug(
+                f"Frequency filtering: original range=[{frequencies[0]:.1f}, {frequencies[-1]:.1f}] Hz, requested=[{self.fmin}, {self.fmax}]"
+            )
+        else:
+            logger.warning(
+                f"Frequency filtering: original frequencies array is empty, requested=[{self.fmin}, {self.fmax}]"
+            )
+
+        if self.fmin is not None:
+            # Use searchsorted to find the first index where frequency >= fmin
+            # This correctly handles edge cases where all frequencies are below fmin
+            fmin_idx = int(np.searchsorted(frequencies, self.fmin))
+            if fmin_idx >= len(frequencies):
+                # All frequencies are below fmin
+                logger.warning(
+                    f"All frequencies ({frequencies[-1]:.1f} Hz) are below fmin ({self.fmin:.1f} Hz)"
+                )
+                fmin_idx = len(frequencies)  # This will result in empty slice, which is correct
+
+        if self.fmax is not None:
+            # Use searchsorted with side='right' to find the first index where frequency > fmax
+            # This correctly handles edge cases where all frequencies are below fmax
+            fmax_idx = int(np.searchsorted(frequencies, self.fmax, side="right"))
+            if fmax_idx == 0:
+                # All frequencies are above fmax
+                logger.warning(
+                    f"All frequencies ({frequencies[0]:.1f} Hz) are above fmax ({self.fmax:.1f} Hz)"
+                )
+
+        if fmin_idx >= fmax_idx:
+            logger.warning(
+                f"Invalid frequency filter range: fmin_idx={fmin_idx}, fmax_idx={fmax_idx}. This will result in empty data."
+            )
+            sliced = np.array([])
+        else:
+            sliced = frequencies[fmin_idx:fmax_idx].copy()
+            sliced.setflags(write=False)
+            logger.debug(
+                f"Frequency filtering: filtered range=[{sliced[0]:.1f}, {sliced[-1]:.1f}] Hz, bins={len(sliced)}"
+            )
+        result = (fmin_idx, fmax_idx, sliced)
+        self._freq_slice_cache[key] = result
+        return result
+
+    @staticmethod
+    def _slice_bins(spectrogram: np.ndarray, fmin_idx: int, fmax_idx: int) -> np.ndarray:
+        """Keep frequency rows ``fmin_idx:fmax_idx``, preserving the time dimension."""
+        if fmin_idx < fmax_idx:
+            return spectrogram[fmin_idx:fmax_idx, :]
+        # Preserve time dimension if spectrogram has data, otherwise use empty shape
+        if spectrogram.size > 0 and spectrogram.shape[1] > 0:
+            return np.array([]).reshape(0, spectrogram.shape[1])
+        return np.array([]).reshape(0, 0)
+
+    def _stft_window(self, nperseg: int) -> npt.NDArray[np.float32]:
+        """Return the cached float32 Tukey(0.25) window scipy uses by default."""
+        window = self._window_cache.get(nperseg)
+        if window is None:
+            window = self._signal.get_window(("tukey", 0.25), nperseg).astype(np.float32)
+            window.setflags(write=False)
+            self._window_cache[nperseg] = window
+        return window
+
+    def _batched_spectrogram(
+        self, data: np.ndarray, fs: int, nperseg: int, hop: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute a PSD spectrogram with one batched real FFT over all frames.
+
+        Equivalent to ``scipy.signal.spectrogram`` with its defaults (Tukey 0.25 window,
+        constant detrend, one-sided density scaling) for inputs of at least ``nperseg``
+        samples, but frames the signal with a strided view instead of copying segments.
+
+        Args:
+            data: Mono float32 signal with at least ``nperseg`` samples.
+            fs: Sample rate in Hz.
+            nperseg: Window/FFT length.
+            hop: Hop between frames in samples.
+
+        Returns:
+            Tuple of (frequencies, frame center times, spectrogram [freq x time]).
+        """
+        window = self._stft_window(nperseg)
+        frames = np.lib.stride_tricks.sliding_window_view(data, nperseg)[::hop]
+        frames = frames - frames.mean(axis=1, keepdims=True, dtype=np.float32)
+        frames *= window
+        spec = self._fft.rfft(frames, n=nperseg, axis=1, workers=-1)
+        power = np.abs(spec) ** 2
+        power *= np.float32(1.0 / (fs * float(np.sum(window * window))))
+        # One-sided spectrum: double everything except DC (and Nyquist for even lengths)
+        if nperseg % 2:
+            power[:, 1:] *= 2.0
+        else:
+            power[:, 1:-1] *= 2.0
+        frequencies = np.fft.rfftfreq(nperseg, 1.0 / fs)
+        times = (nperseg / 2 + np.arange(frames.shape[0]) * hop) / float(fs)
+        return frequencies, times, power.T
+
+    @staticmethod
+    def _db_codes(
+        spec_db: np.ndarray,
+        scratch: npt.NDArray[np.float32] | None = None,
+        out: npt.NDArray[np.uint16] | None = None,
+    ) -> npt.NDArray[np.uint16]:
+        """Quantize dB values to uint16 codes (see ``_DB_CODE_MIN``/``_DB_CODE_STEPS``).
+
+        Args:
+            spec_db: Spectrogram values in dB.
+            scratch: Optional float32 work array of ``spec_db``'s shape.
+            out: Optional uint16 array of ``spec_db``'s shape to write the codes into.
+
+        Returns:
+            Codes in 1..65535 for numbers (clamped at the ends) and 0 for NaN.
+        """
+        scaled = np.subtract(
+            spec_db, np.float32(_DB_CODE_MIN), out=scratch, dtype=np.float32, casting="unsafe"
+        )
+        scaled *= np.float32(_DB_CODE_STEPS)
+        # clip() passes NaN through, so NaN alone becomes code 0 afterwards
+        np.clip(scaled, 1.0, 65535.0, out=scaled)
+        np.nan_to_num(scaled, copy=False, nan=0.0)
+        if out is None:
+            return scaled.astype(np.uint16)
+        np.copyto(out, scaled, casting="unsafe")
+        return out
+
+    @staticmethod
+    def _code_range(codes: np.ndarray) -> tuple[int, int]:
+        """Return the codes at the 5th and 95th percentiles, ignoring NaN (code 0).
+
+        Falls back to the smallest and largest codes present when that range is empty.
+        """
+        hist = np.bincount(codes.ravel(), minlength=65536)
+        hist[0] = 0
+        cdf = np.cumsum(hist)
+        total = int(cdf[-1])
+        if total == 0:
+            return 0, 0
+        lo, hi = (int(v) for v in np.searchsorted(cdf, [0.05 * total, 0.95 * total]))
+        if hi <= lo:
+            present = np.flatnonzero(hist)
+            lo, hi = int(present[0]), int(present[-1])
+        return lo, hi
+
+    @staticmethod
+    def _robust_range(spec_db: np.ndarray) -> tuple[float, float]:
+        """Estimate the 5th and 95th percentiles of ``spec_db``, ignoring NaNs.
+
+        Counts values on the 1/64 dB grid used for colormapping rather than sorting, so
+        the estimate is within 1/64 dB of the exact percentile for values inside the grid.
+
+        Args:
+            spec_db: Spectrogram values in dB.
+
+        Returns:
+            Tuple of (low, high) values.
         """
         if spec_db.size == 0:
-            return np.zeros((0, 0, 4), dtype=np.uint8)
+            return 0.0, 0.0
+        lo, hi = SpectrogramTiler._code_range(SpectrogramTiler._db_codes(spec_db))
+        if hi == 0:
+            return 0.0, 0.0
+        return (
+            lo / _DB_CODE_STEPS + _DB_CODE_MIN,
+            (hi + 1) / _DB_CODE_STEPS + _DB_CODE_MIN,
+        )
+
+    def _scratch_like(self, name: str, like: np.ndarray, dtype: Any) -> np.ndarray:
+        """Return this thread's reusable ``name`` buffer with the shape and layout of ``like``.
+
+        Scratch buffers never leave the tiler, so pool threads generating same-sized tiles
+        reuse one allocation instead of allocating (and page-faulting) a new one per tile.
+        """
+        buf = getattr(self._scratch, name, None)
+        if (
+            buf is None
+            or buf.shape != like.shape
+            or buf.dtype != dtype
+            or buf.flags.f_contiguous != like.flags.f_contiguous
+        ):
+            buf = np.empty_like(like, dtype=dtype)
+            setattr(self._scratch, name, buf if buf.nbytes <= _MAX_SCRATCH_BYTES else None)
+        return buf
+
+    def _pool_time_bins(self, spec_db: np.ndarray) -> np.ndarray:
+        """Max-pool time columns so at most about ``2 * target_time_bins`` remain.
+
+        Columns are merged in groups of ``T // target_time_bins``, with a shorter last
+        group, so the tile still spans its full time range. Taking the maximum keeps
+        short transients visible after decimation.
+        """
+        target = self.target_time_bins
+        n_cols = spec_db.shape[1] if spec_db.ndim == 2 else 0
+        if not target or target <= 0 or n_cols <= 2 * target:
+            return spec_db
+        group = n_cols // target
+        return np.maximum.reduceat(spec_db, np.arange(0, n_cols, group), axis=1)
+
+    @staticmethod
+    def _to_db(spectrogram: np.ndarray) -> npt.NDArray[np.float32]:
+        """Convert a power spectrogram to float32 dB in a single new buffer."""
+        spectrogram_db = np.add(spectrogram, _DB_FLOOR, dtype=np.float32)
+        np.log10(spectrogram_db, out=spectrogram_db)
+        spectrogram_db *= np.float32(10)
+        return spectrogram_db
+
+    def _to_indices(
+        self, spec_db: np.ndarray, out: npt.NDArray[np.uint8] | None = None
+    ) -> npt.NDArray[np.uint8]:
+        """Convert dB spectrogram to colormap indices (freq x time, uint8).
+
+        Uses robust normalization (5th-95th percentile) to improve contrast. Values are
+        quantized once to uint16 codes; the percentiles come from a count of the codes and
+        indices from a 64K-entry code -> index table, so only one pass touches floats.
+
+        Args:
+            spec_db: Spectrogram in dB.
+            out: Optional array of ``spec_db``'s shape to write the indices into.
+
+        Returns:
+            The indices; ``out`` when given.
+        """
+        if spec_db.size == 0:
+            return np.zeros((0, 0), dtype=np.uint8)
         try:
-            lo = float(np.nanpercentile(spec_db, 5))
-            hi = float(np.nanpercentile(spec_db, 95))
-            if hi <= lo:
-                lo = float(np.nanmin(spec_db))
-                hi = float(np.nanmax(spec_db) + 1e-6)
-            norm = (spec_db - lo) / (hi - lo)
-            norm = np.clip(np.nan_to_num(norm, nan=0.0, posinf=1.0, neginf=0.0), 0.0, 1.0)
-            indices = np.rint(norm * 255.0).astype(np.int16)
-            indices = np.clip(indices, 0, 255).astype(np.uint8)
-            rgba = self._colormap[indices]
-            return cast(npt.NDArray[np.uint8], rgba)
+            codes = self._db_codes(
+                spec_db,
+                scratch=self._scratch_like("scaled", spec_db, np.float32),
+                out=self._scratch_like("codes", spec_db, np.uint16),
+            )
+            lo, hi = self._code_range(codes)
+            # Code -> index table; the +0.5 makes the uint8 cast round to nearest, and
+            # NaN (code 0, below any lo) maps to the lowest color
+            scale = np.float32(255.0 / max(hi - lo, 1))
+            table = np.arange(-lo, 65536 - lo, dtype=np.float32)
+            table *= scale
+            table += np.float32(0.5)
+            np.clip(table, 0.0, 255.5, out=table)
+            return np.take(table.astype(np.uint8), codes, out=out)
         except (FloatingPointError, OverflowError, ValueError, ZeroDivisionError, TypeError) as exc:
             logger.warning("Failed to convert spectrogram data to RGBA: %s", exc, exc_info=exc)
             # Fallback to zeros on any failure
-            return np.zeros((*spec_db.shape, 4), dtype=np.uint8)
+            return np.zeros(spec_db.shape, dtype=np.uint8)
+
+    def _to_rgba(self, spec_db: np.ndarray) -> np.ndarray:
+        """Convert dB spectrogram to RGBA uint8 array (freq x time x 4)."""
+        indices = self._to_indices(spec_db, out=self._scratch_like("indices", spec_db, np.uint8))
+        pixels = np.take(self._colormap_u32, indices)
+        return pixels.view(np.uint8).reshape(*indices.shape, 4)
 
     # --- Async API ---
     def request_tile(
@@ -542,10 +997,13 @@ class SpectrogramTiler:
         end_time: float,
         sample_rate: int | None = None,
         callback: Callable[[SpectrogramTile], None] | None = None,
+        priority: int = TILE_PRIORITY_VISIBLE,
     ) -> Future:
-        """Submit tile generation to background executor and return a Future.
+        """Submit tile generation to the background thread pool and return a Future.
 
         If callback is provided, it will be called with the resulting tile in the worker's completion context.
+        Queued requests with a higher ``priority`` are started first, so the tile for the visible view is
+        not stuck behind neighbour prefetches.
         """
 
         cache_key = self._get_cache_key(audio_path, start_time, end_time)
@@ -553,7 +1011,8 @@ class SpectrogramTiler:
         def task() -> SpectrogramTile:
             return self.generate_tile(audio_path, start_time, end_time, sample_rate=sample_rate)
 
-        fut = self._executor.submit(task)
+        fut: Future = Future()
+        self._pool.start(_TileTask(task, fut), priority)
         if callback is not None:
 
             def _done(f: Future) -> None:
@@ -604,15 +1063,33 @@ class SpectrogramTiler:
         center_end: float,
         sample_rate: int | None = None,
     ) -> None:
-        """Prefetch tiles adjacent to the current view to improve perceived responsiveness."""
+        """Prefetch tiles adjacent to the current view to improve perceived responsiveness.
+
+        Neighbours already in the memory cache are skipped, and the rest are generated
+        one after the other in a single low-priority pool task, so a viewport move queues
+        at most one prefetch job.
+        """
         dur = max(0.0, center_end - center_start)
         if dur <= 0:
             return
-        left_start = max(0.0, center_start - dur)
-        left_end = center_start
-        right_start = center_end
-        right_end = center_end + dur
+        neighbours = [
+            (self._get_cache_key(audio_path, start, end), start, end)
+            for start, end in (
+                (max(0.0, center_start - dur), center_start),
+                (center_end, center_end + dur),
+            )
+            if end > start
+        ]
+        missing = [entry for entry in neighbours if entry[0] not in self._tile_cache]
+        if not missing:
+            return
+
+        def task() -> None:
+            for cache_key, start, end in missing:
+                try:
+                    self.generate_tile(audio_path, start, end, sample_rate=sample_rate)
+                except (RuntimeError, ValueError, OSError) as exc:
+                    logger.debug("Prefetch failed for %s: %s", cache_key, exc, exc_info=exc)
 
         # Fire-and-forget; callbacks not necessary
-        self.request_tile(audio_path, left_start, left_end, sample_rate=sample_rate)
-        self.request_tile(audio_path, right_start, right_end, sample_rate=sample_rate)
+        self._pool.start(_TileTask(task, Future()), TILE_PRIORITY_PREFETCH)
@@ -3,20 +3,23 @@
 import logging
 import warnings
 from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
 
 import numpy as np
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
 from matplotlib.ticker import NullLocator
 from PySide6.QtCore import QEvent, QPoint, Qt, QTimer, Signal
-from PySide6.QtGui import QColor, QResizeEvent
+from PySide6.QtGui import QColor, QKeyEvent, QResizeEvent
 from PySide6.QtWidgets import QMenu, QVBoxLayout, QWidget
 
 from spectrosampler.detectors.base import Segment
 from spectrosampler.gui.grid_manager import GridManager
 from spectrosampler.gui.spectrogram_tiler import SpectrogramTiler
+from spectrosampler.gui.tile_cache import TileCache
 from spectrosampler.gui.toolbar import ToolMode
 
 # Suppress matplotlib ticker warnings about too many ticks
@@ -27,6 +30,21 @@ warnings.filterwarnings("ignore", category=UserWarning, module="matplotlib.ticke
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class ViewState:
+    """Snapshot of the spectrogram's visible window."""
+
+    start: float
+    end: float
+    duration: float
+    zoom: float
+
+    @property
+    def span(self) -> float:
+        """Visible time span in seconds."""
+        return self.end - self.start
+
+
 class SpectrogramWidget(QWidget):
     """Interactive spectrogram widget with zoom, pan, and sample markers."""
 
@@ -40,6 +58,7 @@ class SpectrogramWidget(QWidget):
     sample_drag_started = Signal(int)  # Emitted when sample drag starts (index)
     sample_resize_started = Signal(int)  # Emitted when sample resize starts (index)
     sample_create_started = Signal()  # Emitted when sample creation starts
+    sample_edit_finished = Signal()  # Emitted on mouse release after a move/resize
     # New actions
     sample_disable_requested = Signal(int, bool)  # (index, disabled)
     sample_disable_others_requested = Signal(int)  # (index)
@@ -54,11 +73,13 @@ class SpectrogramWidget(QWidget):
     view_changed = Signal(float, float)
     selection_changed = Signal(list)
 
-    def __init__(self, parent: QWidget | None = None):
+    def __init__(self, parent: QWidget | None = None, tile_cache: TileCache | None = None):
         """Initialize spectrogram widget.
 
         Args:
             parent: Parent widget.
+            tile_cache: On-disk cache for view tiles, so reopening a file skips the STFT.
+                A cache in the default directory is used if None.
         """
         super().__init__(parent)
 
@@ -78,9 +99,13 @@ class SpectrogramWidget(QWidget):
             "selection": QColor(0xEF, 0x7F, 0x22, 0xA0),
             "selection_border": QColor(0xEF, 0x7F, 0x22),
         }
+        # Detector -> marker color name, derived from _theme_colors on first use
+        self._segment_color_names: dict[str, str] | None = None
 
         # Spectrogram data/state placeholders (initialized early to allow theme calls)
-        self._tiler = SpectrogramTiler()
+        self._tiler = SpectrogramTiler(
+            disk_cache=tile_cache if tile_cache is not None else TileCache()
+        )
         self._current_tile: Any = None
         self._overview_tile: Any = None
         self._im: Any | None = None  # persistent AxesImage for spectrogram
@@ -95,6 +120,12 @@ class SpectrogramWidget(QWidget):
 
         # Segments
         self._segments: list[Segment] = []
+        # Interval index over _segments for O(log N) visibility culling (see set_segments)
+        self._segment_order = np.empty(0, dtype=np.intp)
+        self._sorted_starts = np.empty(0, dtype=np.float64)
+        self._sorted_ends = np.empty(0, dtype=np.float64)
+        self._running_max_end = np.empty(0, dtype=np.float64)
+        self._segment_enabled = np.empty(0, dtype=bool)
         self._selected_index: int | None = None
         self._selected_indexes: set[int] = set()
         self._selection_anchor: int | None = None
@@ -184,14 +215,24 @@ class SpectrogramWidget(QWidget):
         self._figure.subplots_adjust(0.0, 0.0, 1.0, 1.0)
         self._ax.set_position([0.0, 0.0, 1.0, 1.0])
 
+    def _update_tile_resolution(self) -> None:
+        """Let the tiler decimate tiles to about the canvas's device-pixel width.
+
+        The width is rounded up to a power of two so small resizes keep hitting cached tiles.
+        """
+        width = int(self._canvas.width() * self._canvas.devicePixelRatioF())
+        self._tiler.target_time_bins = 1 << (width - 1).bit_length() if width > 1 else None
+
     def resizeEvent(self, event: QResizeEvent) -> None:
         super().resizeEvent(event)
         self._adjust_figure_geometry()
+        self._update_tile_resolution()
         self._canvas.draw_idle()
 
     def showEvent(self, event) -> None:
         super().showEvent(event)
         self._adjust_figure_geometry()
+        self._update_tile_resolution()
         self._canvas.draw_idle()
 
     @staticmethod
@@ -244,6 +285,10 @@ class SpectrogramWidget(QWidget):
             spine.set_visible(False)
         self._adjust_figure_geometry()
 
+    def view_state(self) -> ViewState:
+        """Return the current view window, total duration and zoom level in one read."""
+        return ViewState(self._start_time, self._end_time, self._duration, self._zoom_level)
+
     def _emit_view_changed(self) -> None:
         """Emit view_changed signal with defensive logging."""
         try:
@@ -283,15 +328,19 @@ class SpectrogramWidget(QWidget):
         self._pixels_per_second = 100.0 * self._zoom_level
         self._update_display()
 
-    def set_segments(self, segments: list[Segment], update_tiles: bool = False) -> None:
+    def set_segments(
+        self, segments: list[Segment], update_tiles: bool = False, redraw: bool = True
+    ) -> None:
         """Set detected segments.
 
         Args:
             segments: List of segments.
             update_tiles: If True, request tiles (for time range changes).
                           If False, only update overlays (for segment-only changes).
+            redraw: If False, only re-index the segments; the caller repaints later.
         """
         self._segments = segments
+        self._rebuild_segment_index()
         self._selected_index = None
         self._selected_indexes.clear()
         self._selection_anchor = None
@@ -300,11 +349,50 @@ class SpectrogramWidget(QWidget):
                 self._playback_segment_index = None
                 self._playback_time = None
                 self._playback_paused = False
+        if not redraw:
+            return
         if update_tiles:
             self._update_display()
         else:
             self._update_overlays_only()
 
+    def _rebuild_segment_index(self) -> None:
+        """Index segments by start time so visible ones can be found by binary search."""
+        count = len(self._segments)
+        starts = np.fromiter((seg.start for seg in self._segments), dtype=np.float64, count=count)
+        ends = np.fromiter((seg.end for seg in self._segments), dtype=np.float64, count=count)
+        # Enabled flags change only through set_segments, so overlay drawing reads this array
+        # instead of each segment's attrs dict
+        self._segment_enabled = np.fromiter(
+            (seg.attrs.get("enabled", True) for seg in self._segments), dtype=bool, count=count
+        )
+        self._segment_order = np.argsort(starts, kind="stable")
+        self._sorted_starts = starts[self._segment_order]
+        self._sorted_ends = ends[self._segment_order]
+        # Non-decreasing, so the first candidate that can reach t0 is found by searchsorted
+        self._running_max_end = np.maximum.accumulate(self._sorted_ends) if count else ends
+
+    def _segment_indexes_in_range(self, t0: float, t1: float) -> list[int]:
+        """Return ascending indexes of segments overlapping ``[t0, t1]``.
+
+        Only the selected segment can be edited in place (drag/resize preview) between
+        ``set_segments`` calls, so it is always re-checked against its live values.
+        """
+        lo = int(np.searchsorted(self._running_max_end, t0, side="left"))
+        hi = int(np.searchsorted(self._sorted_starts, t1, side="right"))
+        candidates: set[int] = set()
+        if hi > lo:
+            hits = self._sorted_ends[lo:hi] >= t0
+            candidates.update(self._segment_order[lo:hi][hits].tolist())
+        if self._selected_index is not None and 0 <= self._selected_index < len(self._segments):
+            candidates.add(self._selected_index)
+        result = []
+        for i in sorted(candidates):
+            seg = self._segments[i]
+            if seg.end >= t0 and seg.start <= t1:
+                result.append(i)
+        return result
+
     def set_playback_state(
         self,
         segment_index: int | None,
@@ -617,6 +705,7 @@ class SpectrogramWidget(QWidget):
             colors: Dictionary with color definitions.
         """
         self._theme_colors.update(colors)
+        self._segment_color_names = None
         self._apply_theme_to_axes()
         self._update_display()
 
@@ -836,9 +925,8 @@ class SpectrogramWidget(QWidget):
             self._grid_artists.append(label)
 
         # Segments
-        for i, seg in enumerate(self._segments):
-            if seg.end < self._start_time or seg.start > self._end_time:
-                continue
+        for i in self._segment_indexes_in_range(self._start_time, self._end_time):
+            seg = self._segments[i]
             color = self._get_segment_color(seg.detector)
             is_selected = i in self._selected_indexes
             alpha = 0.35 if i == self._selected_index else (0.28 if is_selected else 0.2)
@@ -862,12 +950,7 @@ class SpectrogramWidget(QWidget):
             seg_start = max(seg.start, self._start_time)
             seg_end = min(seg.end, self._end_time)
             seg_width = seg_end - seg_start
-            is_enabled = True
-            try:
-                is_enabled = seg.attrs.get("enabled", True)
-            except (AttributeError, TypeError) as exc:
-                logger.debug("Segment attrs missing 'enabled': %s", exc, exc_info=exc)
-                is_enabled = True
+            is_enabled = bool(self._segment_enabled[i])
             if not is_enabled and not self._show_disabled:
                 continue
             draw_alpha = alpha if is_enabled else 0.1
@@ -985,8 +1068,6 @@ class SpectrogramWidget(QWidget):
             preview_start = max(self._pending_create_start, self._start_time)
             preview_end = min(self._pending_create_end, self._end_time)
             if preview_end > preview_start:
-                from matplotlib.patches import Rectangle
-
                 ylim = self._ax.get_ylim()
                 rect = Rectangle(
                     (preview_start, ylim[0]),
@@ -1015,8 +1096,6 @@ class SpectrogramWidget(QWidget):
             box_start = max(raw_start, self._start_time)
             box_end = min(raw_end, self._end_time)
             if box_end > box_start:
-                from matplotlib.patches import Rectangle
-
                 ylim = self._ax.get_ylim()
                 selection_color = self._theme_colors.get(
                     "selection", QColor(0xEF, 0x7F, 0x22, 0xA0)
@@ -1193,12 +1272,14 @@ class SpectrogramWidget(QWidget):
         Returns:
             Color name or hex code.
         """
-        color_map = {
-            "voice_vad": self._theme_colors["marker_voice"].name(),
-            "transient_flux": self._theme_colors["marker_transient"].name(),
-            "nonsilence_energy": self._theme_colors["marker_nonsilence"].name(),
-            "spectral_interestingness": self._theme_colors["marker_spectral"].name(),
-        }
+        color_map = self._segment_color_names
+        if color_map is None:
+            color_map = self._segment_color_names = {
+                "voice_vad": self._theme_colors["marker_voice"].name(),
+                "transient_flux": self._theme_colors["marker_transient"].name(),
+                "nonsilence_energy": self._theme_colors["marker_nonsilence"].name(),
+                "spectral_interestingness": self._theme_colors["marker_spectral"].name(),
+            }
         return color_map.get(detector, "#FFFFFF")
 
     def _get_handle_width(self) -> float:
@@ -1511,6 +1592,9 @@ class SpectrogramWidget(QWidget):
                 self._selection_box_start_time = 0.0
                 self._selection_box_end_time = 0.0
 
+            if self._dragging or self._resizing_left or self._resizing_right:
+                self.sample_edit_finished.emit()
+
             # Reset all interaction states
             self._dragging = False
             self._resizing_left = False
@@ -1532,8 +1616,6 @@ class SpectrogramWidget(QWidget):
                 clicked_index = self._find_segment_at_time(time)
                 if clicked_index is not None:
                     # Convert matplotlib figure coordinates to widget coordinates
-                    from PySide6.QtCore import QPoint
-
                     canvas_pos = self._canvas.mapToGlobal(QPoint(0, 0))
                     widget_pos = canvas_pos + QPoint(int(event.x), int(event.y))
                     self._show_context_menu(clicked_index, widget_pos)
@@ -1764,8 +1846,6 @@ class SpectrogramWidget(QWidget):
                             "Double-click coordinate transform failed: %s", exc, exc_info=exc
                         )
             elif event.type() == QEvent.Type.KeyPress:
-                from PySide6.QtGui import QKeyEvent
-
                 if isinstance(event, QKeyEvent) and event.key() == Qt.Key.Key_Escape:
                     # Cancel any pending drag timer
                     if self._drag_start_timer is not None:
@@ -1838,11 +1918,7 @@ class SpectrogramWidget(QWidget):
         enabled_states: list[bool] = []
         for idx in selected_indexes:
             seg = self._segments[idx]
-            enabled_states.append(
-                seg.attrs.get("enabled", True)
-                if hasattr(seg, "attrs") and seg.attrs is not None
-                else True
-            )
+            enabled_states.append(seg.attrs.get("enabled", True))
 
         unique_states = set(enabled_states)
         if len(unique_states) == 1:
@@ -1919,7 +1995,5 @@ class SpectrogramWidget(QWidget):
         Returns:
             Segment index or None.
         """
-        for i, seg in enumerate(self._segments):
-            if seg.start <= time <= seg.end:
-                return i
-        return None
+        matches = self._segment_indexes_in_range(time, time)
+        return matches[0] if matches else None
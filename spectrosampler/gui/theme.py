@@ -7,6 +7,7 @@ from typing import Any
 
 from PySide6.QtCore import QObject, QSettings, Qt, Signal
 from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication
 
 logger = logging.getLogger(__name__)
 
@@ -418,4 +419,54 @@ class ThemeManager(QObject):
             QSplitter::handle:hover {{
                 background-color: {p['border_light'].name()};
             }}
+            WelcomeScreen {{
+                background-color: {p['background'].name()};
+            }}
+            WelcomeScreen QLabel {{
+                color: {p['text'].name()};
+            }}
+            WelcomeScreen QLabel#subtitleLabel {{
+                color: {p['text_secondary'].name()};
+            }}
+            WelcomeScreen QPushButton {{
+                background-color: {p['background_secondary'].name()};
+                color: {p['text'].name()};
+                border: 1px solid {p['border'].name()};
+                border-radius: 6px;
+                padding: 12px;
+            }}
+            WelcomeScreen QPushButton:hover {{
+                background-color: {p['accent_hover'].name()};
+            }}
+            WelcomeScreen QPushButton:pressed {{
+                background-color: {p['accent'].name()};
+                color: {p['text_bright'].name()};
+            }}
+            WelcomeScreen QListView {{
+                background-color: {p['background_secondary'].name()};
+                border: 1px solid {p['border'].name()};
+                color: {p['text'].name()};
+            }}
+            WelcomeScreen QListView::item {{
+                padding: 8px;
+            }}
+            WelcomeScreen QListView::item:selected {{
+                background-color: {p['selection'].name()};
+            }}
+            WelcomeScreen QListView::item:hover {{
+                background-color: {p['accent_hover'].name()};
+            }}
+        """
+
+    def install_stylesheet(self) -> None:
+        """Install the current theme's stylesheet on the application.
+
+        One application-wide sheet is parsed once and styles every window, instead of each
+        window reparsing its own copy. Does nothing if the sheet is already installed.
         """
+        app = QApplication.instance()
+        if not isinstance(app, QApplication):
+            return
+        stylesheet = self.get_stylesheet()
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
@@ -0,0 +1,133 @@
+"""On-disk LRU cache for computed spectrogram arrays shared across sessions."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import zipfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_CACHE_ERRORS = (OSError, ValueError, EOFError, KeyError, zipfile.BadZipFile)
+
+
+class TileCache:
+    """Directory of ``.npz`` entries evicted least-recently-used once over a size budget.
+
+    Entries are keyed by a hash of everything that affects the computed arrays (source path,
+    modification time, FFT and frequency parameters, time range), so stale entries are never
+    returned; they simply age out.
+    """
+
+    def __init__(self, directory: Path | None = None, max_bytes: int = 1 << 30):
+        """Initialize tile cache.
+
+        Args:
+            directory: Cache directory. Defaults to ``<tempdir>/spectrosampler_tiles``.
+            max_bytes: Total size budget before least-recently-used entries are removed.
+        """
+        self.directory = directory or Path(tempfile.gettempdir()) / "spectrosampler_tiles"
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def make_key(audio_path: Path, *params: Any) -> str | None:
+        """Build a cache key for ``audio_path`` and the parameters that shaped the result.
+
+        Args:
+            audio_path: Source audio file.
+            *params: Additional parameters (FFT size, frequency range, time range, ...).
+
+        Returns:
+            Hex key, or None if the file cannot be stat'ed.
+        """
+        try:
+            stat = audio_path.stat()
+        except OSError as exc:
+            logger.debug("Cannot key tile cache for %s: %s", audio_path, exc, exc_info=exc)
+            return None
+        ident = repr((str(audio_path.resolve()), stat.st_mtime_ns, stat.st_size, params))
+        return hashlib.sha1(ident.encode("utf-8")).hexdigest()[:16]
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.npz"
+
+    def get(self, key: str) -> dict[str, np.ndarray] | None:
+        """Load arrays stored under ``key``.
+
+        Args:
+            key: Key from ``make_key``.
+
+        Returns:
+            Mapping of array name to array, or None on a miss or unreadable entry.
+        """
+        path = self._entry_path(key)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+            # Refresh mtime so eviction sees this entry as recently used
+            os.utime(path)
+        except _CACHE_ERRORS as exc:
+            logger.debug("Discarding unreadable tile cache entry %s: %s", path, exc, exc_info=exc)
+            path.unlink(missing_ok=True)
+            return None
+        return arrays
+
+    def put(self, key: str, arrays: dict[str, np.ndarray]) -> None:
+        """Store ``arrays`` under ``key`` and evict old entries if over budget.
+
+        Args:
+            key: Key from ``make_key``.
+            arrays: Arrays to store.
+        """
+        path = self._entry_path(key)
+        # Unique per writer so concurrent tile workers never share a temp file
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as handle:
+                np.savez(handle, **arrays)
+            os.replace(tmp_path, path)
+        except _CACHE_ERRORS as exc:
+            logger.debug("Failed to write tile cache entry %s: %s", path, exc, exc_info=exc)
+            # Eviction only scans finished entries, so a stray temp file would never be removed
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError as unlink_exc:
+                logger.debug(
+                    "Failed to remove tile cache temp file %s: %s",
+                    tmp_path,
+                    unlink_exc,
+                    exc_info=unlink_exc,
+                )
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least-recently-used entries until the cache fits ``max_bytes``."""
+        try:
+            entries = []
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".npz"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError as exc:
+            logger.debug("Failed to scan tile cache: %s", exc, exc_info=exc)
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(entry_path)
+                total -= size
+            except OSError as exc:
+                logger.debug("Failed to evict %s: %s", entry_path, exc, exc_info=exc)
@@ -3,9 +3,7 @@
 from enum import Enum
 from pathlib import Path
 
-from PySide6.QtCore import QSize, Qt, Signal
-from PySide6.QtGui import QIcon, QPainter, QPixmap
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtCore import QSize, Signal
 from PySide6.QtWidgets import (
     QButtonGroup,
     QGroupBox,
@@ -14,6 +12,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from spectrosampler.gui.ui_utils import load_svg_icon
+
 
 class ToolMode(Enum):
     """Tool mode enumeration."""
@@ -47,21 +47,9 @@ class ToolbarWidget(QWidget):
         icon_size = 24
         assets_dir = Path(__file__).parent.parent.parent / "assets"
 
-        def load_svg_icon(path: Path, size: int = icon_size) -> QIcon:
-            """Load SVG icon preserving colors by rendering to pixmap."""
-            if not path.exists():
-                return QIcon()
-            renderer = QSvgRenderer(str(path))
-            pixmap = QPixmap(size, size)
-            pixmap.fill(Qt.GlobalColor.transparent)
-            painter = QPainter(pixmap)
-            renderer.render(painter)
-            painter.end()
-            return QIcon(pixmap)
-
-        select_icon = load_svg_icon(assets_dir / "pointer.svg")
-        edit_icon = load_svg_icon(assets_dir / "pencil.svg")
-        create_icon = load_svg_icon(assets_dir / "add.svg")
+        select_icon = load_svg_icon(assets_dir / "pointer.svg", icon_size)
+        edit_icon = load_svg_icon(assets_dir / "pencil.svg", icon_size)
+        create_icon = load_svg_icon(assets_dir / "add.svg", icon_size)
 
         # Create tool mode group box
         tool_group = QGroupBox("Tool")
@@ -3,11 +3,45 @@
 from pathlib import Path
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QPixmap
+from PySide6.QtGui import QIcon, QPainter, QPixmap, QPixmapCache
 from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtWidgets import QCheckBox, QComboBox
 
 
+def load_svg_icon(path: Path, size: int) -> QIcon:
+    """Load an SVG icon preserving its colors by rendering it to a pixmap.
+
+    A pre-rendered ``<stem>@<size>.png`` next to the SVG (see scripts/rasterize_icons.py)
+    is used when present, so the SVG is only parsed for sizes that were not shipped.
+    Pixmaps are kept in the application-wide QPixmapCache, so repeated widget
+    construction shares one pixmap per (path, size).
+
+    Args:
+        path: Path to the SVG file.
+        size: Width and height of the rendered pixmap in pixels.
+
+    Returns:
+        Rendered icon, or an empty QIcon if the file does not exist.
+    """
+    key = f"spectrosampler/{path}@{size}"
+    pixmap = QPixmap()
+    if not QPixmapCache.find(key, pixmap):
+        png_path = path.with_name(f"{path.stem}@{size}.png")
+        if png_path.exists():
+            pixmap = QPixmap(str(png_path))
+        elif path.exists():
+            renderer = QSvgRenderer(str(path))
+            pixmap = QPixmap(size, size)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            renderer.render(painter)
+            painter.end()
+        else:
+            return QIcon()
+        QPixmapCache.insert(key, pixmap)
+    return QIcon(pixmap)
+
+
 def apply_combo_styling(widget: QComboBox | None = None) -> str:
     """Apply consistent dropdown arrow styling to QComboBox widgets.
 
@@ -124,20 +158,9 @@ def apply_checkbox_styling(widget: QCheckBox | None = None) -> str:
     assets_dir = Path(__file__).parent.parent.parent / "assets"
     checkmark_icon_path = assets_dir / "checkmark.svg"
 
-    # Render SVG to pixmap for use in stylesheet
+    # Stylesheets load the SVG themselves, so only the path is needed
     icon_path_str = ""
     if checkmark_icon_path.exists():
-        # Render the SVG to a pixmap
-        renderer = QSvgRenderer(str(checkmark_icon_path))
-        # Use a reasonable size for the checkbox indicator
-        size = 16
-        pixmap = QPixmap(size, size)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-        # Save to a temporary location or use data URI
-        # For stylesheet, we'll use the file path approach
         icon_path_str = str(checkmark_icon_path.resolve()).replace("\\", "/")
 
     checkbox_style = f"""
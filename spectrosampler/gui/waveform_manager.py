@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -42,11 +43,11 @@ class WaveformWorker(QThread):
         super().__init__(parent)
         self._audio_path = audio_path
         self._max_bins = max(1000, max_bins)
-        self._cancelled = False
+        self._cancelled = threading.Event()
 
     def cancel(self) -> None:
         """Request cancellation of the worker."""
-        self._cancelled = True
+        self._cancelled.set()
 
     def run(self) -> None:
         """Generate waveform envelope data."""
@@ -60,7 +61,7 @@ class WaveformWorker(QThread):
                     dtype = np.float32
                     empty = np.empty(0, dtype=dtype)
                     data = WaveformData(empty, empty, empty, duration, sample_rate, 1.0)
-                    if not self._cancelled:
+                    if not self._cancelled.is_set():
                         self.finished.emit(data)
                     return
 
@@ -77,7 +78,7 @@ class WaveformWorker(QThread):
                 frame_cursor = 0
                 buffer = np.empty(0, dtype=np.float32)
 
-                while not self._cancelled:
+                while not self._cancelled.is_set():
                     block = sf_file.read(block_size, dtype="float32", always_2d=False)
                     if block.size == 0:
                         break
@@ -104,7 +105,7 @@ class WaveformWorker(QThread):
                     frame_cursor += usable
                     buffer = data[usable:]
 
-                if not self._cancelled and buffer.size:
+                if not self._cancelled.is_set() and buffer.size:
                     max_val = float(np.max(buffer))
                     min_val = float(np.min(buffer))
                     peaks_pos.append(np.float32(max_val))
@@ -112,7 +113,7 @@ class WaveformWorker(QThread):
                     center = (frame_cursor + buffer.size / 2.0) / sample_rate
                     times.append(np.float32(center))
 
-                if self._cancelled:
+                if self._cancelled.is_set():
                     return
 
                 dtype = np.float32
@@ -144,7 +145,7 @@ class WaveformWorker(QThread):
                 )
                 self.finished.emit(payload)
         except (RuntimeError, ValueError, OSError) as exc:
-            if self._cancelled:
+            if self._cancelled.is_set():
                 return
             logger.error(
                 "Waveform generation failed for %s: %s", self._audio_path, exc, exc_info=exc
@@ -3,13 +3,13 @@
 import logging
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt, Signal
+from PySide6.QtGui import QFont, QShowEvent
 from PySide6.QtWidgets import (
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QPushButton,
     QVBoxLayout,
     QWidget,
@@ -21,6 +21,123 @@ from spectrosampler.gui.theme import ThemeManager
 logger = logging.getLogger(__name__)
 
 
+class RecentFilesModel(QAbstractListModel):
+    """List model over ``(path, timestamp)`` entries from the settings manager.
+
+    Row text is formatted on demand in ``data()`` rather than stored per item. With no
+    entries a single disabled placeholder row is shown.
+    """
+
+    def __init__(self, name_attr: str, placeholder: str, parent: QObject | None = None) -> None:
+        """Initialize the model.
+
+        Args:
+            name_attr: ``Path`` attribute shown as the entry name (``"stem"`` or ``"name"``).
+            placeholder: Text of the row shown when there are no entries.
+            parent: Parent QObject.
+        """
+        super().__init__(parent)
+        self._name_attr = name_attr
+        self._placeholder = placeholder
+        self._entries: list[tuple[Path, datetime]] = []
+        # Entry -> (display text, tooltip)
+        self._display: dict[tuple[Path, datetime], tuple[str, str]] = {}
+
+    def set_entries(self, entries: list[tuple[Path, datetime]]) -> None:
+        """Replace the listed entries, touching only the rows that changed.
+
+        Rows shared as a common prefix and suffix of paths are kept (their timestamps are
+        refreshed in place); only the differing middle is removed and reinserted. After
+        opening a file that usually means a row or two instead of the whole list.
+
+        Display text is built here once per update rather than on every paint.
+        """
+        entries = list(entries)
+        old = self._entries
+        if entries == old:
+            return
+        self._display = {
+            entry: self._display.get(entry) or self._format(entry) for entry in entries
+        }
+        if not old or not entries:
+            # Switching to or from the placeholder row
+            self.beginResetModel()
+            self._entries = entries
+            self.endResetModel()
+            return
+
+        n_old, n_new = len(old), len(entries)
+        prefix = 0
+        while prefix < min(n_old, n_new) and old[prefix][0] == entries[prefix][0]:
+            prefix += 1
+        suffix = 0
+        while (
+            suffix < min(n_old, n_new) - prefix
+            and old[n_old - 1 - suffix][0] == entries[n_new - 1 - suffix][0]
+        ):
+            suffix += 1
+
+        if not prefix and not suffix:
+            # Every row changed (e.g. the reopened file moved to the top); removing them all
+            # would briefly leave the model empty and report the placeholder row
+            self.beginResetModel()
+            self._entries = entries
+            self.endResetModel()
+            return
+
+        if n_old - suffix > prefix:
+            self.beginRemoveRows(QModelIndex(), prefix, n_old - suffix - 1)
+            self._entries = old[:prefix] + old[n_old - suffix :]
+            self.endRemoveRows()
+        kept = self._entries
+        if n_new - suffix > prefix:
+            self.beginInsertRows(QModelIndex(), prefix, n_new - suffix - 1)
+            self._entries = entries
+            self.endInsertRows()
+        self._entries = entries
+
+        changed = [
+            row
+            for row, kept_row in zip(
+                [*range(prefix), *range(n_new - suffix, n_new)], kept, strict=True
+            )
+            if kept_row != entries[row]
+        ]
+        if changed:
+            self.dataChanged.emit(self.index(changed[0]), self.index(changed[-1]))
+
+    def _format(self, entry: tuple[Path, datetime]) -> tuple[str, str]:
+        """Return the display text and tooltip of an entry."""
+        path, timestamp = entry
+        name = getattr(path, self._name_attr)
+        return f"{name} ({SettingsManager.format_recent_timestamp(timestamp)})", str(path)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        if parent.isValid():
+            return 0
+        return len(self._entries) or 1
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:  # type: ignore[override]
+        if not self._entries:
+            return Qt.ItemFlag.NoItemFlags  # Non-selectable placeholder
+        return super().flags(index)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:  # type: ignore[override]
+        if not index.isValid():
+            return None
+        if not self._entries:
+            return self._placeholder if role == Qt.ItemDataRole.DisplayRole else None
+        entry = self._entries[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return entry[0]
+        if role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return None
+        # Rows mid-update may still hold an outgoing entry; format those on the fly
+        text, tooltip = self._display.get(entry) or self._format(entry)
+        # Show full path on hover
+        return text if role == Qt.ItemDataRole.DisplayRole else tooltip
+
+
 class WelcomeScreen(QWidget):
     """Welcome screen widget with project options and recent files."""
 
@@ -43,19 +160,32 @@ class WelcomeScreen(QWidget):
 
         # Theme manager
         self._theme_manager = ThemeManager(self)
-        pref = self._settings_manager.get_theme_preference()
-        self._theme_manager.apply_theme(pref)
-        self._theme_manager.theme_changed.connect(lambda _: self._apply_theme())
 
-        # Setup UI
-        self._setup_ui()
+        # Recent file entries; the views over them are created with the rest of the UI
+        self._recent_projects_model = RecentFilesModel("stem", "No recent projects", self)
+        self._recent_audio_model = RecentFilesModel("name", "No recent audio files", self)
 
-        # Apply theme
-        self._apply_theme()
+        # The widget tree, theme and recent-file lists are set up on first show, so an
+        # application that opens a project straight away never pays for them
+        self._ui_built = False
 
-        # Load recent files
-        self.update_recent_projects()
-        self.update_recent_audio_files()
+    def showEvent(self, event: QShowEvent) -> None:
+        """Build the UI and load recent files the first time the screen is shown.
+
+        Args:
+            event: Show event.
+        """
+        if not self._ui_built:
+            self._ui_built = True
+            pref = self._settings_manager.get_theme_preference()
+            self._theme_manager.apply_theme(pref)
+            # Welcome screen rules are part of the application-wide theme stylesheet, so
+            # this widget sets no sheet of its own
+            self._theme_manager.install_stylesheet()
+            self._setup_ui()
+            self.update_recent_projects()
+            self.update_recent_audio_files()
+        super().showEvent(event)
 
     def _setup_ui(self) -> None:
         """Setup UI components."""
@@ -105,9 +235,8 @@ class WelcomeScreen(QWidget):
         recent_projects_label.setFont(QFont("", 12, QFont.Weight.Bold))
         layout.addWidget(recent_projects_label)
 
-        self._recent_projects_list = QListWidget()
-        self._recent_projects_list.setMaximumHeight(200)
-        self._recent_projects_list.itemDoubleClicked.connect(self._on_recent_project_double_clicked)
+        self._recent_projects_list = self._create_recent_list(self._recent_projects_model)
+        self._recent_projects_list.doubleClicked.connect(self._on_recent_project_double_clicked)
         layout.addWidget(self._recent_projects_list)
 
         # Clear recent projects button
@@ -122,9 +251,8 @@ class WelcomeScreen(QWidget):
         recent_audio_label.setFont(QFont("", 12, QFont.Weight.Bold))
         layout.addWidget(recent_audio_label)
 
-        self._recent_audio_list = QListWidget()
-        self._recent_audio_list.setMaximumHeight(200)
-        self._recent_audio_list.itemDoubleClicked.connect(self._on_recent_audio_double_clicked)
+        self._recent_audio_list = self._create_recent_list(self._recent_audio_model)
+        self._recent_audio_list.doubleClicked.connect(self._on_recent_audio_double_clicked)
         layout.addWidget(self._recent_audio_list)
 
         # Clear recent audio files button
@@ -136,92 +264,50 @@ class WelcomeScreen(QWidget):
 
         self.setLayout(layout)
 
-    def _apply_theme(self) -> None:
-        """Apply theme to welcome screen."""
-        stylesheet = self._theme_manager.get_stylesheet()
-
-        # Add welcome screen specific styles
-        palette = self._theme_manager.palette
-        bg = palette["background"].name()
-        bg_secondary = palette["background_secondary"].name()
-        text = palette["text"].name()
-        text_secondary = palette["text_secondary"].name()
-        border = palette["border"].name()
-        accent = palette["accent"].name()
-        accent_hover = palette["accent_hover"].name()
-        selection = palette["selection"].name()
-
-        welcome_styles = f"""
-            WelcomeScreen {{
-                background-color: {bg};
-            }}
-            WelcomeScreen QLabel {{
-                color: {text};
-            }}
-            WelcomeScreen QLabel#subtitleLabel {{
-                color: {text_secondary};
-            }}
-            WelcomeScreen QPushButton {{
-                background-color: {bg_secondary};
-                color: {text};
-                border: 1px solid {border};
-                border-radius: 6px;
-                padding: 12px;
-            }}
-            WelcomeScreen QPushButton:hover {{
-                background-color: {accent_hover};
-            }}
-            WelcomeScreen QPushButton:pressed {{
-                background-color: {accent};
-                color: {palette['text_bright'].name()};
-            }}
-            WelcomeScreen QListWidget {{
-                background-color: {bg_secondary};
-                border: 1px solid {border};
-                color: {text};
-            }}
-            WelcomeScreen QListWidget::item {{
-                padding: 8px;
-            }}
-            WelcomeScreen QListWidget::item:selected {{
-                background-color: {selection};
-            }}
-            WelcomeScreen QListWidget::item:hover {{
-                background-color: {accent_hover};
-            }}
-        """
+    @staticmethod
+    def _create_recent_list(model: RecentFilesModel) -> QListView:
+        """Create a view for a recent files model.
 
-        self.setStyleSheet(stylesheet + welcome_styles)
-
-    def _on_recent_project_double_clicked(self, item: QListWidgetItem) -> None:
+        Rows are identical single-line entries, so the view measures one row instead of
+        each item and lays rows out in batches rather than all at once.
+        """
+        view = QListView()
+        view.setModel(model)
+        view.setMaximumHeight(200)
+        view.setUniformItemSizes(True)
+        view.setLayoutMode(QListView.LayoutMode.Batched)
+        view.setBatchSize(50)
+        return view
+
+    def _on_recent_project_double_clicked(self, index: QModelIndex) -> None:
         """Handle recent project double-click.
 
         Args:
-            item: List widget item that was clicked.
+            index: Model index of the row that was clicked.
         """
-        path = item.data(Qt.ItemDataRole.UserRole)
+        path = index.data(Qt.ItemDataRole.UserRole)
         if path and isinstance(path, Path):
             self.recent_project_clicked.emit(path)
 
-    def _on_recent_audio_double_clicked(self, item: QListWidgetItem) -> None:
+    def _on_recent_audio_double_clicked(self, index: QModelIndex) -> None:
         """Handle recent audio file double-click.
 
         Args:
-            item: List widget item that was clicked.
+            index: Model index of the row that was clicked.
         """
-        path = item.data(Qt.ItemDataRole.UserRole)
+        path = index.data(Qt.ItemDataRole.UserRole)
         if path and isinstance(path, Path):
             self.recent_audio_file_clicked.emit(path)
 
     def _on_clear_recent_projects(self) -> None:
         """Handle clear recent projects button click."""
         self._settings_manager.clear_recent_projects()
-        self._update_recent_projects()
+        self.update_recent_projects()
 
     def _on_clear_recent_audio(self) -> None:
         """Handle clear recent audio files button click."""
         self._settings_manager.clear_recent_audio_files()
-        self._update_recent_audio_files()
+        self.update_recent_audio_files()
 
     def update_recent_projects(self, projects: list[tuple[Path, datetime]] | None = None) -> None:
         """Update recent projects list.
@@ -233,24 +319,7 @@ class WelcomeScreen(QWidget):
             max_count = self._settings_manager.get_max_recent_projects()
             projects = self._settings_manager.get_recent_projects(max_count=max_count)
 
-        self._recent_projects_list.clear()
-
-        if not projects:
-            item = QListWidgetItem("No recent projects")
-            item.setFlags(Qt.ItemFlag.NoItemFlags)  # Non-selectable
-            self._recent_projects_list.addItem(item)
-            return
-
-        for path, timestamp in projects:
-            # Format display text
-            filename = path.stem
-            time_str = timestamp.strftime("%Y-%m-%d %H:%M")
-            display_text = f"{filename} ({time_str})"
-
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.ItemDataRole.UserRole, path)
-            item.setToolTip(str(path))  # Show full path on hover
-            self._recent_projects_list.addItem(item)
+        self._recent_projects_model.set_entries(projects)
 
     def update_recent_audio_files(self, files: list[tuple[Path, datetime]] | None = None) -> None:
         """Update recent audio files list.
@@ -262,21 +331,4 @@ class WelcomeScreen(QWidget):
             max_count = self._settings_manager.get_max_recent_audio_files()
             files = self._settings_manager.get_recent_audio_files(max_count=max_count)
 
-        self._recent_audio_list.clear()
-
-        if not files:
-            item = QListWidgetItem("No recent audio files")
-            item.setFlags(Qt.ItemFlag.NoItemFlags)  # Non-selectable
-            self._recent_audio_list.addItem(item)
-            return
-
-        for path, timestamp in files:
-            # Format display text
-            filename = path.name
-            time_str = timestamp.strftime("%Y-%m-%d %H:%M")
-            display_text = f"{filename} ({time_str})"
-
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.ItemDataRole.UserRole, path)
-            item.setToolTip(str(path))  # Show full path on hover
-            self._recent_audio_list.addItem(item)
+        self._recent_audio_model.set_entries(files)
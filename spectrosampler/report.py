@@ -5,6 +5,8 @@ import logging
 from pathlib import Path
 from typing import Any, cast
 
+import numpy as np
+
 from spectrosampler.detectors.base import Segment
 from spectrosampler.utils import ensure_dir
 
@@ -21,7 +23,8 @@ def create_annotated_spectrogram(
     sample_rate: int | None = None,
     background_png: Path | None = None,
     duration: float | None = None,
-) -> None:
+    return_array: bool = False,
+) -> np.ndarray | None:
     """Create annotated spectrogram PNG with segment overlays.
 
     Args:
@@ -32,6 +35,14 @@ def create_annotated_spectrogram(
         post_pad_ms: Post-padding used (for overlay visualization).
         size: Image size (width, height).
         sample_rate: Audio sample rate (for time axis).
+        background_png: Optional spectrogram image drawn behind the overlays.
+        duration: Audio duration in seconds (time axis extent).
+        return_array: If True, also return the rendered figure so callers can inspect it
+            without decoding the written PNG.
+
+    Returns:
+        Rendered figure as an (height, width, 4) uint8 RGBA array if ``return_array`` is
+        True, otherwise None.
 
     Raises:
         ValueError: If audio cannot be loaded.
@@ -48,7 +59,6 @@ def create_annotated_spectrogram(
     dur = dur if dur > 0 else 1.0
     if background_png and background_png.exists():
         import matplotlib.image as mpimg
-        import numpy as np
 
         img = mpimg.imread(str(background_png))
         # FFmpeg showspectrumpic typically outputs with low freq at bottom, high at top
@@ -59,7 +69,6 @@ def create_annotated_spectrogram(
     ax.set_ylim(0, 1)
     # Time axis: major ticks every 60s (labeled), medium ticks every 10s (lines only), minor ticks every 2s
     try:
-        import numpy as np
         from matplotlib.ticker import FixedFormatter, FixedLocator, MultipleLocator
 
         span = max(dur, 0.0)
@@ -120,7 +129,16 @@ def create_annotated_spectrogram(
     ax.set_yticks([])
     plt.tight_layout()
     plt.savefig(output_path, dpi=100, bbox_inches="tight")
+    rendered = None
+    if return_array:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        # Raster backends (Agg, QtAgg) all derive from FigureCanvasAgg
+        canvas = cast(FigureCanvasAgg, fig.canvas)
+        canvas.draw()
+        rendered = np.asarray(canvas.buffer_rgba()).copy()
     plt.close()
+    return rendered
 
 
 def create_html_report(
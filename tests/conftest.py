@@ -0,0 +1,46 @@
+"""Shared pytest configuration."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtCore import QSettings
+from PySide6.QtWidgets import QApplication
+
+from spectrosampler.gui.settings import SettingsManager
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_qsettings(tmp_path_factory: pytest.TempPathFactory) -> None:
+    """Point QSettings at a temporary directory so tests never touch the user's config.
+
+    Qt caches the settings location on first use, so this has to be in place before any
+    test constructs a SettingsManager (or a widget that owns one).
+    """
+    settings_dir = str(tmp_path_factory.mktemp("qsettings"))
+    for settings_format in (QSettings.Format.NativeFormat, QSettings.Format.IniFormat):
+        QSettings.setPath(settings_format, QSettings.Scope.UserScope, settings_dir)
+
+
+@pytest.fixture(scope="session")
+def qapp() -> QApplication:
+    """Return the QApplication shared by every GUI test in the session."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture
+def new_settings_manager() -> Callable[[], SettingsManager]:
+    """Return a SettingsManager factory over an emptied copy of the isolated settings store.
+
+    Managers made by the factory share one store, so values written through one are read
+    back by the next, as they would be across application runs.
+    """
+    QSettings("SpectroSampler", "SpectroSampler").clear()
+    return SettingsManager
@@ -8,6 +8,7 @@ import numpy as np
 import pytest
 import soundfile as sf
 
+from spectrosampler import audio_io
 from spectrosampler.audio_io import FFmpegError, get_audio_info
 from spectrosampler.detectors.base import Segment
 from spectrosampler.export import export_sample
@@ -17,9 +18,9 @@ def _write_sine_wave(path: Path, duration_sec: float, sample_rate: int = 16_000)
     """Generate a deterministic sine wave for testing."""
 
     samples = max(1, int(sample_rate * duration_sec))
-    timeline = np.arange(samples, dtype=np.float64) / sample_rate
-    wave = 0.1 * np.sin(2 * np.pi * 440.0 * timeline)
-    sf.write(path, wave, sample_rate)
+    timeline = np.arange(samples, dtype=np.float32) * np.float32(1.0 / sample_rate)
+    wave = np.float32(0.1 * 32767) * np.sin(np.float32(2 * np.pi * 440.0) * timeline)
+    sf.write(path, wave.astype(np.int16), sample_rate, subtype="PCM_16")
 
 
 def test_export_sample_supports_sub_10ms_segments(tmp_path: Path) -> None:
@@ -88,3 +89,26 @@ def test_get_audio_info_rejects_corrupt_file(tmp_path: Path) -> None:
 
     with pytest.raises(FFmpegError):
         get_audio_info(bogus)
+
+
+def test_get_audio_info_reads_pcm_headers_without_ffprobe(tmp_path: Path, monkeypatch) -> None:
+    """WAV and FLAC metadata should come from the file header, not an ffprobe process."""
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("ffprobe should not run for PCM files")
+
+    monkeypatch.setattr(audio_io, "_run_media_tool", fail)
+    wav = tmp_path / "tone.wav"
+    _write_sine_wave(wav, duration_sec=2.0)
+    flac = tmp_path / "tone.flac"
+    sf.write(flac, np.zeros((24_000, 2), dtype=np.float32), 48_000, subtype="PCM_24")
+
+    assert get_audio_info(wav) == {
+        "duration": pytest.approx(2.0),
+        "sample_rate": 16_000,
+        "channels": 1,
+        "bit_depth": 16,
+        "format": "wav",
+    }
+    flac_info = get_audio_info(flac)
+    assert (flac_info["channels"], flac_info["bit_depth"], flac_info["format"]) == (2, 24, "flac")
@@ -11,6 +11,9 @@ import spectrosampler.audio_io as audio_io
 import spectrosampler.export as export_mod
 from spectrosampler.detectors.base import Segment
 
+# Result returned by the fake failing ffmpeg run below
+_FAKE_FFMPEG_FAIL = SimpleNamespace(returncode=1, stderr="simulated ffmpeg failure", stdout="")
+
 
 def test_export_sample_surfaces_ffmpeg_failure(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
@@ -25,7 +28,7 @@ def test_export_sample_surfaces_ffmpeg_failure(
 
     def fake_run(*args, **kwargs):
         calls.append(list(args[0]))
-        return SimpleNamespace(returncode=1, stderr="simulated ffmpeg failure", stdout="")
+        return _FAKE_FFMPEG_FAIL
 
     monkeypatch.setattr(audio_io.subprocess, "run", fake_run)
 
@@ -50,6 +53,25 @@ def test_describe_audio_load_error_prompts_ffmpeg_install(monkeypatch: pytest.Mo
     assert "install" in advice.suggestion.lower()
 
 
+def test_check_ffmpeg_probes_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The FFmpeg availability probe should spawn ffmpeg only on the first call."""
+
+    calls: list[list[str]] = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(list(cmd))
+        raise FileNotFoundError(cmd[0])
+
+    monkeypatch.setattr(audio_io.subprocess, "run", fake_run)
+    audio_io.check_ffmpeg.cache_clear()
+    try:
+        assert audio_io.check_ffmpeg() is False
+        assert audio_io.check_ffmpeg() is False
+        assert calls == [["ffmpeg", "-version"]]
+    finally:
+        audio_io.check_ffmpeg.cache_clear()
+
+
 def test_describe_ffmpeg_failure_provides_actionable_hints() -> None:
     """FFmpeg failure summaries should include contextual remediation hints."""
 
@@ -11,50 +11,49 @@ import soundfile as sf
 from spectrosampler.export import build_sample_filename
 from spectrosampler.utils import sanitize_filename
 
+# Keep the FFmpeg-backed tests on one worker when run in parallel
+pytestmark = pytest.mark.xdist_group("ffmpeg")
 
-@pytest.fixture
-def test_audio_file(tmp_path: Path) -> Path:
+
+@pytest.fixture(scope="session")
+def test_audio_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Generate synthetic test audio file (10-15 seconds).
 
     Creates: pink-noise "rain" bed + a few "speech-like" AM tones (200-3kHz) + sharp transients.
+    The file is written once per session and is seeded, so every test sees the same audio.
     """
+    rng = np.random.default_rng(0)
     sample_rate = 16000
     duration = 12.0  # seconds
-    t = np.linspace(0, duration, int(sample_rate * duration))
+    n_samples = int(sample_rate * duration)
+    t = np.arange(n_samples, dtype=np.float32) * np.float32(1.0 / sample_rate)
 
-    # Pink noise bed (rain)
-    pink_noise = np.random.randn(len(t))
-    # Simple pink noise approximation: use cumulative sum as approximation
-    pink_noise = np.cumsum(pink_noise) * 0.01
-    pink_noise = pink_noise / np.std(pink_noise) * 0.3  # Normalize
+    # Pink noise bed (rain): shape white noise by 1/sqrt(f) in the frequency domain
+    spectrum = np.fft.rfft(rng.standard_normal(n_samples, dtype=np.float32))
+    freqs = np.fft.rfftfreq(n_samples, 1 / sample_rate)
+    spectrum /= np.sqrt(np.maximum(freqs, 1.0))
+    pink_noise = np.fft.irfft(spectrum, n=n_samples).astype(np.float32)
+    pink_noise *= 0.3 / np.std(pink_noise)  # Normalize
 
     # Speech-like AM tones (200-3kHz range)
-    # Tone at 1000 Hz, amplitude modulated
+    # Tone at 1000 Hz, amplitude modulated, active in segments: 1-2s, 5-6s, 9-10s
     am_freq = 5.0  # 5 Hz modulation
     tone_freq = 1000.0
-    tone = np.sin(2 * np.pi * tone_freq * t)
-    modulation = (np.sin(2 * np.pi * am_freq * t) + 1) / 2
-    speech_segment = tone * modulation * 0.5
-
-    # Activate speech in segments: 1-2s, 5-6s, 9-10s
-    mask = np.zeros_like(t)
-    mask[(t >= 1.0) & (t < 2.0)] = 1.0
-    mask[(t >= 5.0) & (t < 6.0)] = 1.0
-    mask[(t >= 9.0) & (t < 10.0)] = 1.0
-    speech_segment = speech_segment * mask
-
-    # Sharp transients (clicks) at 3s, 7s
+    speech_segment = np.zeros_like(t)
+    bounds = np.searchsorted(t, [1.0, 2.0, 5.0, 6.0, 9.0, 10.0]).reshape(-1, 2)
+    for lo, hi in bounds:
+        seg_t = t[lo:hi]
+        modulation = (np.sin(np.float32(2 * np.pi * am_freq) * seg_t) + 1) / 2
+        speech_segment[lo:hi] = np.sin(np.float32(2 * np.pi * tone_freq) * seg_t) * modulation * 0.5
+
+    # Sharp transients (clicks) at 3s, 7s: short bursts of high frequency
     transients = np.zeros_like(t)
-    transient_times = [3.0, 7.0]
-    for tt in transient_times:
-        idx = int(tt * sample_rate)
-        # Sharp click: short burst of high frequency
-        click_len = int(0.01 * sample_rate)  # 10ms
-        click = np.sin(2 * np.pi * 5000 * np.linspace(0, 0.01, click_len)) * np.exp(
-            -np.linspace(0, 10, click_len)
-        )
-        if idx + click_len < len(transients):
-            transients[idx : idx + click_len] = click * 0.8
+    click_len = int(0.01 * sample_rate)  # 10ms
+    click_t = np.arange(click_len, dtype=np.float32) * np.float32(1.0 / sample_rate)
+    click = np.sin(np.float32(2 * np.pi * 5000) * click_t) * np.exp(np.float32(-1000.0) * click_t)
+    click_starts = (np.array([3.0, 7.0]) * sample_rate).astype(int)
+    click_starts = click_starts[click_starts + click_len < n_samples]
+    transients[np.add.outer(click_starts, np.arange(click_len))] = click * 0.8
 
     # Combine all
     audio = pink_noise + speech_segment + transients
@@ -62,7 +61,7 @@ def test_audio_file(tmp_path: Path) -> Path:
     # Normalize to prevent clipping
     audio = audio / np.max(np.abs(audio)) * 0.8
 
-    output_file = tmp_path / "test_audio.wav"
+    output_file = tmp_path_factory.mktemp("audio") / "test_audio.wav"
     sf.write(output_file, audio, sample_rate)
 
     return output_file
@@ -213,10 +212,13 @@ def test_marked_spectrogram_overlay_smoke(tmp_path: Path, test_audio_file: Path)
     # overlay with one segment
     marked = tmp_path / "marked.png"
     segs = [Segment(start=1.0, end=2.0, detector="transient_flux", score=1.0)]
-    create_annotated_spectrogram(test_audio_file, marked, segs, background_png=clean, duration=12.0)
+    rendered = create_annotated_spectrogram(
+        test_audio_file, marked, segs, background_png=clean, duration=12.0, return_array=True
+    )
     assert clean.exists() and marked.exists()
+    assert rendered is not None and rendered.dtype == np.uint8 and rendered.shape[2] == 4
     a = mpimg.imread(str(clean))
-    b = mpimg.imread(str(marked))
+    b = rendered / 255.0
     assert abs(float(b.var()) - float(a.var())) > 0.0
 
 
@@ -0,0 +1,60 @@
+"""Tests for DetectionManager process pool reuse."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+
+from spectrosampler.gui.detection_manager import DetectionManager
+from spectrosampler.pipeline_settings import ProcessingSettings
+
+
+class _FakeWrapper:
+    def __init__(self, max_workers: int) -> None:
+        self.settings = ProcessingSettings()
+        self.settings.max_workers = max_workers
+        self.executors: list = []
+
+    def detect_samples_async(self, output_dir=None, callback=None, executor=None) -> Future:
+        self.executors.append(executor)
+        fut: Future = Future()
+        fut.set_result({"segments": []})
+        return fut
+
+
+def test_detection_reuses_pool_across_runs_and_wrappers():
+    manager = DetectionManager()
+    first = _FakeWrapper(max_workers=1)
+    manager.set_pipeline_wrapper(first)
+    manager.start_detection()
+    manager.start_detection()
+
+    second = _FakeWrapper(max_workers=1)
+    manager.set_pipeline_wrapper(second)
+    manager.start_detection()
+
+    assert first.executors[0] is not None
+    assert first.executors[0] is first.executors[1] is second.executors[0]
+
+    resized = _FakeWrapper(max_workers=2)
+    manager.set_pipeline_wrapper(resized)
+    manager.start_detection()
+    assert resized.executors[0] is not first.executors[0]
+
+    manager.shutdown()
+    assert manager._executor is None
+
+
+def test_is_processing_tracks_future_completion():
+    manager = DetectionManager()
+    wrapper = _FakeWrapper(max_workers=1)
+    pending: Future = Future()
+    wrapper.detect_samples_async = lambda **_kwargs: pending
+    manager.set_pipeline_wrapper(wrapper)
+
+    assert not manager.is_processing()
+    manager.start_detection()
+    assert manager.is_processing()
+
+    pending.set_result({"segments": []})
+    assert not manager.is_processing()
+    manager.shutdown()
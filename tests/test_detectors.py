@@ -84,7 +84,7 @@ def test_voice_vad_prefilter_invokes_bandpass(monkeypatch: pytest.MonkeyPatch) -
     monkeypatch.setattr(vad_module, "bandpass_filter", fake_bandpass)
 
     detector = vad_module.VoiceVADDetector(low_freq=120.0, high_freq=3200.0)
-    audio = np.random.randn(4096).astype(np.float32)
+    audio = np.random.default_rng(0).standard_normal(4096, dtype=np.float32)
     result = detector._prefilter_audio(audio)
 
     assert call_args == [(120.0, 3200.0)]
@@ -111,7 +111,7 @@ def test_voice_vad_prefilter_skips_when_full_band(monkeypatch: pytest.MonkeyPatc
     monkeypatch.setattr(vad_module, "bandpass_filter", fake_bandpass)
 
     detector = vad_module.VoiceVADDetector(low_freq=None, high_freq=None)
-    audio = np.random.randn(4096).astype(np.float32)
+    audio = np.random.default_rng(0).standard_normal(4096, dtype=np.float32)
     result = detector._prefilter_audio(audio)
 
     assert call_args == []
@@ -148,7 +148,7 @@ def test_voice_vad_detect_filters_audio(monkeypatch: pytest.MonkeyPatch) -> None
     detector = vad_module.VoiceVADDetector(
         sample_rate=16000, aggressiveness=2, low_freq=100.0, high_freq=2500.0
     )
-    audio = np.random.randn(detector.frame_size * 10).astype(np.float32)
+    audio = np.random.default_rng(0).standard_normal(detector.frame_size * 10, dtype=np.float32)
     segments = detector.detect(audio)
 
     assert segments == []
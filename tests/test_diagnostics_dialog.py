@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
 from types import SimpleNamespace
 
 from spectrosampler.gui.diagnostics_dialog import collect_diagnostics_data
 
+# Result returned by the fake ``ffmpeg -version`` runs below
+_FFMPEG_VERSION_RESULT = SimpleNamespace(returncode=0, stdout="ffmpeg version 6.0-abc\nCopyright")
+
 
 def test_collect_diagnostics_handles_missing_ffmpeg(monkeypatch):
     """collect_diagnostics_data should report FFmpeg absence gracefully."""
@@ -31,8 +36,8 @@ def test_collect_diagnostics_returns_ffmpeg_summary(monkeypatch):
         "spectrosampler.gui.diagnostics_dialog.shutil.which", lambda exe: "/usr/bin/ffmpeg"
     )
 
-    def fake_run(cmd, capture_output, text, check):
-        return SimpleNamespace(returncode=0, stdout="ffmpeg version 6.0-abc\nCopyright")
+    def fake_run(cmd, capture_output, text, check, timeout):
+        return _FFMPEG_VERSION_RESULT
 
     monkeypatch.setattr("spectrosampler.gui.diagnostics_dialog.subprocess.run", fake_run)
 
@@ -42,3 +47,90 @@ def test_collect_diagnostics_returns_ffmpeg_summary(monkeypatch):
     assert ffmpeg.available
     assert ffmpeg.summary.startswith("ffmpeg version")
     assert "ffmpeg version 6.0-abc" in (ffmpeg.raw_output or "")
+
+
+def test_ffmpeg_details_are_cached_per_executable(monkeypatch, tmp_path):
+    """The FFmpeg version probe should run once until the executable changes."""
+
+    exe = tmp_path / "ffmpeg"
+    exe.write_bytes(b"")
+    monkeypatch.setattr("spectrosampler.gui.diagnostics_dialog.shutil.which", lambda _exe: str(exe))
+    calls: list[list[str]] = []
+
+    def fake_run(cmd, capture_output, text, check, timeout):
+        calls.append(cmd)
+        return _FFMPEG_VERSION_RESULT
+
+    monkeypatch.setattr("spectrosampler.gui.diagnostics_dialog.subprocess.run", fake_run)
+
+    first = collect_diagnostics_data()["ffmpeg"]
+    assert collect_diagnostics_data()["ffmpeg"] is first
+    assert len(calls) == 1
+
+    os.utime(exe, ns=(0, 0))
+    collect_diagnostics_data()
+    assert len(calls) == 2
+
+
+def test_dialog_collects_details_after_show(monkeypatch):
+    """The dialog should open with a placeholder and fill in details from the worker."""
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import QThreadPool
+    from PySide6.QtWidgets import QApplication
+
+    from spectrosampler.gui.diagnostics_dialog import DiagnosticsDialog
+
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr("spectrosampler.gui.diagnostics_dialog.shutil.which", lambda exe: None)
+
+    dialog = DiagnosticsDialog()
+    assert dialog._text_area.toPlainText() == "Collecting diagnostics..."
+
+    dialog.show()
+    QThreadPool.globalInstance().waitForDone(5000)
+    app.processEvents()
+
+    assert dialog._text_area.toPlainText().startswith("FFmpeg")
+    dialog.close()
+    dialog.deleteLater()
+
+
+def test_collect_diagnostics_reports_hung_ffmpeg(monkeypatch):
+    """A non-responsive FFmpeg should be reported instead of blocking diagnostics."""
+
+    monkeypatch.setattr(
+        "spectrosampler.gui.diagnostics_dialog.shutil.which", lambda exe: "/missing/ffmpeg"
+    )
+
+    def fake_run(cmd, capture_output, text, check, timeout):
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+    monkeypatch.setattr("spectrosampler.gui.diagnostics_dialog.subprocess.run", fake_run)
+
+    ffmpeg = collect_diagnostics_data()["ffmpeg"]
+
+    assert not ffmpeg.available
+    assert "did not respond" in ffmpeg.summary
+
+
+def test_dialog_theme_uses_palette_colors():
+    """Theme colors should be applied through the dialog palette."""
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtGui import QColor, QPalette
+    from PySide6.QtWidgets import QApplication
+
+    from spectrosampler.gui.diagnostics_dialog import DiagnosticsDialog
+
+    _app = QApplication.instance() or QApplication([])
+    theme = SimpleNamespace(
+        palette={"background": QColor("#101010"), "background_secondary": "#202020"}
+    )
+
+    dialog = DiagnosticsDialog(theme_manager=theme)
+
+    assert dialog.palette().color(QPalette.ColorRole.Window).name() == "#101010"
+    assert dialog._text_area.palette().color(QPalette.ColorRole.Base).name() == "#202020"
+    assert "background-color: #101010" not in dialog.styleSheet()
+    dialog.deleteLater()
@@ -11,6 +11,8 @@ from spectrosampler.export import (
     export_markers_reaper,
     export_timestamps_csv,
 )
+from spectrosampler.gui import export_manager
+from spectrosampler.gui.export_models import ExportBatchSettings
 
 
 def _build_segments() -> list[Segment]:
@@ -140,3 +142,37 @@ def test_export_timestamps_csv_includes_padding(tmp_path: Path) -> None:
         ["0", "0.200", "0.925", "0.725", "flux", "0.420"],
         ["1", "0.950", "2.375", "1.425", "vad", "0.870"],
     ]
+
+
+def test_export_worker_probes_source_duration_once(tmp_path: Path, monkeypatch) -> None:
+    """Batch exports reuse one ffprobe result instead of probing per sample and format."""
+
+    probes: list[Path] = []
+    durations: list[float | None] = []
+    monkeypatch.setattr(
+        export_manager,
+        "get_audio_info",
+        lambda path: probes.append(path) or {"duration": 12.5},
+    )
+    monkeypatch.setattr(
+        export_manager,
+        "export_sample",
+        lambda **kwargs: durations.append(kwargs["source_duration"]),
+    )
+    tasks = [
+        export_manager._ExportTask(sample_id=f"s{i}", index=i, segment=seg, override=None)
+        for i, seg in enumerate(_build_segments())
+    ]
+    worker = export_manager.ExportWorker(
+        audio_path=tmp_path / "source.wav",
+        base_name="source",
+        output_dir=tmp_path / "out",
+        batch_settings=ExportBatchSettings(formats=["wav", "flac"]),
+        tasks=tasks,
+    )
+
+    summary = worker.run_blocking()
+
+    assert summary.successful_count == 2
+    assert probes == [tmp_path / "source.wav"]
+    assert durations == [12.5] * 4
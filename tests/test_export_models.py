@@ -8,6 +8,7 @@ from spectrosampler.gui.export_models import (
     apply_template,
     build_template_context,
     derive_sample_title,
+    render_filename,
     render_filename_from_template,
 )
 
@@ -88,25 +89,7 @@ def test_template_context_exposes_metadata_and_sample_fields() -> None:
         == "Title=sample; Artist=SpectroSampler; Start=0.900; Detector=flux; Enabled=False"
     )
 
-    default_name = render_filename_from_template(
-        template=DEFAULT_FILENAME_TEMPLATE,
-        base_name="source",
-        sample_id="seg-000",
-        index=0,
-        total=1,
-        segment=segment,
-        fmt="flac",
-        normalized=True,
-        pre_pad_ms=100.0,
-        post_pad_ms=50.0,
-        title=title,
-        artist="SpectroSampler",
-        album="Field Notes",
-        year=2025,
-        sample_rate_hz=48000,
-        bit_depth="24",
-        channels="stereo",
-    )
+    default_name = render_filename(DEFAULT_FILENAME_TEMPLATE, context)
     # With 0-based indexing, id="0000", and padded times: start=0.900, duration=0.650
     # Default template is "{id}_{title}_start-{start}s_duration-{duration}s"
     assert default_name.startswith("0000_sample_start-0.900s_duration-0.650s")
@@ -0,0 +1,66 @@
+"""Tests for the export dialog sample player widget."""
+
+from __future__ import annotations
+
+from spectrosampler.gui.export_sample_player import ExportSamplePlayerWidget
+
+
+def test_scrub_seeks_are_throttled_and_release_lands_final_position(qapp):
+    player = ExportSamplePlayerWidget()
+    player.show()
+    player.set_position(0, 5000)
+    seeks: list[int] = []
+    player.seek_requested.connect(seeks.append)
+
+    player._on_slider_pressed()
+    for value in (100, 200, 300):
+        player._on_slider_moved(value)
+    assert seeks == []
+    assert player._seek_timer.isActive()
+
+    player._seek_timer.timeout.emit()
+    assert seeks == [300]
+
+    player._on_slider_moved(400)
+    player._progress_slider.setValue(450)
+    player._on_slider_released()
+
+    assert seeks == [300, 450]
+    assert not player._seek_timer.isActive()
+
+
+def test_time_labels_only_update_when_text_changes(qapp, monkeypatch):
+    player = ExportSamplePlayerWidget()
+    player.show()
+    written: list[str] = []
+    original = player._time_current_label.setText
+
+    def record(text: str) -> None:
+        written.append(text)
+        original(text)
+
+    monkeypatch.setattr(player._time_current_label, "setText", record)
+
+    for position in (61000, 61250, 61999, 62000):
+        player.set_position(position, 125000)
+
+    assert written == ["1:01", "1:02"]
+    assert player._time_total_label.text() == "2:05"
+
+
+def test_child_widgets_are_built_on_first_show_with_recorded_state(qapp):
+    player = ExportSamplePlayerWidget()
+    player.set_playing(True)
+    player.set_looping(True)
+    player.set_position(3000, 65000)
+
+    assert not hasattr(player, "_progress_slider")
+
+    player.show()
+
+    assert player._loop_checkbox.isChecked()
+    assert not player._play_button.isEnabled()
+    assert player._pause_button.isEnabled()
+    assert player._progress_slider.value() == 3000
+    assert player._time_current_label.text() == "0:03"
+    assert player._time_total_label.text() == "1:05"
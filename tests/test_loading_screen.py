@@ -0,0 +1,97 @@
+"""Tests for the loading screen overlay."""
+
+from __future__ import annotations
+
+import shiboken6
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QWidget
+
+from spectrosampler.gui import loading_screen
+from spectrosampler.gui.loading_screen import LoadingScreen
+
+
+def test_spinner_animates_only_while_overlay_is_shown(qapp):
+    host = QWidget()
+    host.resize(600, 400)
+    host.show()
+    screen = LoadingScreen()
+
+    assert not screen._spinner._animating
+
+    screen.show_overlay(host)
+    assert screen._spinner._animating
+    assert loading_screen._get_spinner_clock().is_running()
+
+    screen.hide_overlay()
+    assert not screen._spinner._animating
+    assert not loading_screen._get_spinner_clock().is_running()
+
+
+def test_visible_spinners_share_one_clock(qapp):
+    host = QWidget()
+    host.resize(600, 400)
+    host.show()
+    first = LoadingScreen()
+    second = LoadingScreen()
+    clock = loading_screen._get_spinner_clock()
+
+    first.show_overlay(host)
+    second.show_overlay(host)
+    clock.tick.emit()
+    assert (first._spinner._angle, second._spinner._angle) == (8, 8)
+
+    first.hide_overlay()
+    assert clock.is_running()
+    second.hide_overlay()
+    assert not clock.is_running()
+
+
+def test_clock_stops_when_a_visible_spinner_is_destroyed(qapp):
+    host = QWidget()
+    host.resize(600, 400)
+    host.show()
+    screen = LoadingScreen()
+    clock = loading_screen._get_spinner_clock()
+
+    screen.show_overlay(host)
+    assert clock.is_running()
+    shiboken6.delete(screen)
+    clock._timer.timeout.emit()
+
+    assert not clock.is_running()
+
+
+def test_spinner_reuses_pen_until_accent_changes(qapp):
+    screen = LoadingScreen()
+    spinner = screen._spinner
+    pen = spinner._pen
+    assert spinner._theme_manager is screen._container._theme_manager is screen._theme_manager
+
+    spinner.grab()
+    assert spinner._pen is pen
+
+    screen._theme_manager.palette["accent"] = QColor(1, 2, 3)
+    spinner.grab()
+    assert spinner._pen.color() == QColor(1, 2, 3)
+
+
+def test_message_shadow_is_rendered_once_per_text(qapp):
+    host = QWidget()
+    host.resize(600, 400)
+    host.show()
+    screen = LoadingScreen()
+    screen.show_overlay(host)
+    label = screen._message_label
+    label.resize(240, 40)
+
+    label.grab()
+    cached = label._cache
+    assert not cached.isNull()
+    label.grab()
+    assert label._cache is cached
+
+    screen.set_message("Detecting samples...")
+    label.resize(240, 40)
+    label.grab()
+    assert label._cache is not cached
+    assert label.graphicsEffect() is None
@@ -3,16 +3,26 @@
 from __future__ import annotations
 
 import os
+import subprocess
+from pathlib import Path
 from types import SimpleNamespace
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
+import numpy as np
 import pytest
+import soundfile as sf
+from PySide6.QtCore import Qt
+from PySide6.QtMultimedia import QMediaPlayer
 from PySide6.QtWidgets import QApplication
 
 from spectrosampler.audio_io import FFmpegError
 from spectrosampler.detectors.base import Segment
+from spectrosampler.gui import main_window as main_window_module
+from spectrosampler.gui import playback_buffer as playback_buffer_module
 from spectrosampler.gui.main_window import MainWindow
+from spectrosampler.gui.playback_buffer import encode_wav
+from spectrosampler.pipeline_settings import ProcessingSettings
 
 
 def _ensure_qapp() -> QApplication:
@@ -83,6 +93,23 @@ def test_samples_enable_state_requested_toggle_swaps_each_segment():
     app.processEvents()
 
 
+def test_disable_sample_sets_single_flag_and_is_idempotent():
+    app = _ensure_qapp()
+    window = _make_window_with_segments([True, True])
+    segments = window._pipeline_wrapper.current_segments  # type: ignore[attr-defined]
+
+    window._on_disable_sample(1, True)
+    window._on_disable_sample(1, True)
+    assert [seg.attrs["enabled"] for seg in segments] == [True, False]
+    assert len(window._undo_stack) == 1
+
+    window._on_disable_sample(1, False)
+    assert [seg.attrs["enabled"] for seg in segments] == [True, True]
+
+    window.deleteLater()
+    app.processEvents()
+
+
 def test_disable_other_samples_preserves_selected_and_disables_rest():
     app = _ensure_qapp()
     window = _make_window_with_segments([True, True, True, False])
@@ -220,9 +247,9 @@ def test_handle_end_of_media_without_autoplay_cleans_up(tmp_path):
     window._is_paused = False
     window._paused_position = 0
 
-    temp_file = tmp_path / "playback.wav"
-    temp_file.write_bytes(b"data")
-    window._temp_playback_file = temp_file
+    decoded_file = tmp_path / "playback.wav"
+    decoded_file.write_bytes(b"data")
+    window._decoded_playback_file = decoded_file
 
     window._handle_end_of_media()
     app.processEvents()
@@ -230,8 +257,9 @@ def test_handle_end_of_media_without_autoplay_cleans_up(tmp_path):
     assert window._current_playing_index is None
     assert window._sample_player._is_playing is False
     assert window._sample_player._current_index is None
-    assert not temp_file.exists()
-    assert window._temp_playback_file is None
+    # The whole-file decode is kept for later plays of the same file
+    assert decoded_file.exists()
+    assert window._decoded_playback_file == decoded_file
 
     window.deleteLater()
     app.processEvents()
@@ -304,3 +332,521 @@ def test_handle_end_of_media_autoplay_last_sample_finalizes(tmp_path):
 
     window.deleteLater()
     app.processEvents()
+
+
+def test_undo_redo_restores_segment_snapshots():
+    app = _ensure_qapp()
+    window = _make_window_with_segments([True, True])
+    segments = window._pipeline_wrapper.current_segments
+
+    window._push_undo_state()
+    window._push_undo_state()  # Unchanged state is not pushed twice
+    assert len(window._undo_stack) == 1
+
+    segments[0].end = 0.75
+    window._undo()
+    app.processEvents()
+
+    restored = window._pipeline_wrapper.current_segments
+    assert restored[0].end == pytest.approx(0.5)
+    assert restored[1] is segments[1]
+    assert len(window._redo_stack) == 1
+
+    window._redo()
+    app.processEvents()
+    assert window._pipeline_wrapper.current_segments[0].end == pytest.approx(0.75)
+    assert not window._redo_stack
+
+    window.deleteLater()
+    app.processEvents()
+
+
+def test_sample_moves_coalesce_view_refresh(monkeypatch):
+    app = _ensure_qapp()
+    window = _make_window_with_segments([True, True])
+
+    refreshes = []
+    original = window._apply_segments_to_views
+    monkeypatch.setattr(
+        window,
+        "_apply_segments_to_views",
+        lambda segments: (refreshes.append(len(segments)), original(segments)),
+    )
+
+    window._on_sample_moved(0, 0.1, 0.6)
+    window._on_sample_resized(0, 0.1, 0.8)
+
+    segments = window._pipeline_wrapper.current_segments
+    assert segments[0].end == pytest.approx(0.8)
+    assert refreshes == []
+    assert window._segment_redraw_timer.isActive()
+
+    window._spectrogram_widget.sample_edit_finished.emit()
+    app.processEvents()
+
+    assert refreshes == [2]
+    assert not window._segment_redraw_timer.isActive()
+
+    window.deleteLater()
+    app.processEvents()
+
+
+def test_sample_move_reindexes_editor_before_deferred_paint(monkeypatch):
+    app = _ensure_qapp()
+    window = _make_window_with_segments([True, True])
+    widget = window._spectrogram_widget
+
+    paints = []
+    monkeypatch.setattr(widget, "_update_overlays_only", lambda: paints.append(True))
+
+    window._on_sample_moved(1, 5.0, 5.5)
+
+    # Culling sees the new bounds right away; only the repaint is deferred
+    assert window._segment_redraw_timer.isActive()
+    assert widget._segment_indexes_in_range(4.9, 5.6) == [1]
+    assert widget._segment_indexes_in_range(1.0, 1.5) == []
+    assert paints == []
+
+    window._flush_segment_redraw()
+    assert paints == [True]
+
+    window.deleteLater()
+    app.processEvents()
+
+
+def test_display_segments_cache_invalidation():
+    app = _ensure_qapp()
+    window = _make_window_with_segments([True, False, True])
+    window._show_disabled_action.setChecked(False)
+
+    first = window._get_display_segments()
+    assert len(first) == 2
+    assert window._get_display_segments() is first
+
+    window._pipeline_wrapper.current_segments[1].attrs["enabled"] = True
+    window._invalidate_display_segments()
+    assert len(window._get_display_segments()) == 3
+
+    window._show_disabled_action.setChecked(True)
+    window._pipeline_wrapper.current_segments.pop()
+    assert len(window._get_display_segments()) == 2
+
+    window.deleteLater()
+    app.processEvents()
+
+
+def test_media_position_updates_are_throttled_while_playing(monkeypatch):
+    _ensure_qapp()
+    window = _make_window_with_segments([True])
+    playing = SimpleNamespace(
+        duration=lambda: 500,
+        playbackState=lambda: QMediaPlayer.PlaybackState.PlayingState,
+    )
+    monkeypatch.setattr(window, "_media_player", playing)
+    # A real play replaces the startup warm-up source
+    window._media_warmup_active = False
+    positions: list[int] = []
+    monkeypatch.setattr(
+        window._sample_player, "set_position", lambda pos, _duration: positions.append(pos)
+    )
+    clock = {"now": 100.0}
+    monkeypatch.setattr(main_window_module.time, "monotonic", lambda: clock["now"])
+
+    window._on_media_position_changed(10)
+    clock["now"] += 0.005
+    window._on_media_position_changed(15)
+    clock["now"] += 0.040
+    window._on_media_position_changed(55)
+    clock["now"] += 0.001
+    # Near the end of the sample updates always go through
+    window._on_media_position_changed(490)
+
+    assert positions == [10, 55, 490]
+
+
+def test_media_position_seek_while_playing_skips_throttle(monkeypatch):
+    _ensure_qapp()
+    window = _make_window_with_segments([True])
+    playing = SimpleNamespace(
+        duration=lambda: 500,
+        playbackState=lambda: QMediaPlayer.PlaybackState.PlayingState,
+    )
+    monkeypatch.setattr(window, "_media_player", playing)
+    window._media_warmup_active = False
+    positions: list[int] = []
+    monkeypatch.setattr(
+        window._sample_player, "set_position", lambda pos, _duration: positions.append(pos)
+    )
+    clock = {"now": 100.0}
+    monkeypatch.setattr(main_window_module.time, "monotonic", lambda: clock["now"])
+
+    window._on_media_position_changed(10)
+    clock["now"] += 0.005
+    # Scrubbing forward and back lands well away from the steady playback position
+    window._on_media_position_changed(300)
+    clock["now"] += 0.005
+    window._on_media_position_changed(100)
+    clock["now"] += 0.005
+    window._on_media_position_changed(105)
+
+    assert positions == [10, 300, 100]
+
+
+def test_media_warm_up_loads_silent_source_without_touching_player(monkeypatch):
+    app = _ensure_qapp()
+    window = MainWindow()
+    app.processEvents()
+
+    assert window._media_warmup_active
+    assert window._playback_buffer is not None
+    positions: list[int] = []
+    monkeypatch.setattr(
+        window._sample_player, "set_position", lambda pos, _duration: positions.append(pos)
+    )
+    window._on_media_duration_changed(100)
+    window._on_media_position_changed(50)
+    assert positions == []
+
+
+def test_reapplying_unchanged_settings_skips_invalidation(monkeypatch):
+    _ensure_qapp()
+    window = MainWindow()
+    # Whether setup already pushed the grid depends on persisted settings; push it here
+    window._apply_grid_settings()
+    calls: list[str] = []
+    monkeypatch.setattr(
+        window._spectrogram_widget, "set_frequency_range", lambda *_args: calls.append("freq")
+    )
+    monkeypatch.setattr(
+        window._spectrogram_widget, "set_grid_manager", lambda _manager: calls.append("grid")
+    )
+    settings = ProcessingSettings()
+    settings.hp = 123.0
+
+    window._apply_detection_settings(settings)
+    window._apply_detection_settings(settings)
+    window._on_settings_changed()
+    assert calls == ["freq"]
+
+    window._grid_settings.snap_interval_sec = 0.25
+    window._on_settings_changed()
+    assert calls == ["freq", "grid"]
+
+
+def test_table_selection_sync_emits_single_change():
+    app = _ensure_qapp()
+    window = _make_window_with_segments([True] * 5)
+    app.processEvents()
+    selection_model = window._sample_table_view.selectionModel()
+    emissions: list[int] = []
+    selection_model.selectionChanged.connect(lambda *_args: emissions.append(1))
+
+    window._selected_sample_indexes = [3, 0, 1]
+    window._active_sample_index = 3
+    window._sync_table_selection_from_state()
+
+    assert len(emissions) == 1
+    assert sorted(idx.column() for idx in selection_model.selectedColumns()) == [0, 1, 3]
+    assert MainWindow._contiguous_runs([5, 1, 2, 3, 7, 2]) == [(1, 3), (5, 5), (7, 7)]
+
+
+def test_auto_reorder_sorts_by_start_and_tracks_playing_sample():
+    _ensure_qapp()
+    window = _make_window_with_segments([True, True, True])
+    window._auto_order_action.setChecked(True)
+    segments = window._pipeline_wrapper.current_segments
+    playing = segments[0]
+    window._current_playing_index = 0
+    version = window._segments_version
+
+    window._maybe_auto_reorder()
+    assert window._segments_version == version
+
+    playing.start = 2.5
+    playing.end = 2.8
+    window._maybe_auto_reorder()
+
+    assert [seg.start for seg in segments] == [1.0, 2.0, 2.5]
+    assert segments[window._current_playing_index] is playing
+    assert window._segments_version > version
+
+
+def test_auto_reorder_during_bounds_edit_keeps_playing_sample_bounds(monkeypatch):
+    _ensure_qapp()
+    window = _make_window_with_segments([True, True, True, True])
+    window._auto_order_action.setChecked(True)
+    segments = window._pipeline_wrapper.current_segments
+    shown: list[tuple[object, int]] = []
+    monkeypatch.setattr(
+        window._sample_player, "set_sample", lambda seg, idx, _total: shown.append((seg, idx))
+    )
+
+    # Moving another sample past the playing one must not retarget the player
+    playing = segments[3]
+    window._current_playing_index = 3
+    window._current_playing_start, window._current_playing_end = 3.0, 3.5
+    window._on_sample_bounds_changed(2, 3.5, 3.9)
+    assert segments[window._current_playing_index] is playing
+    assert (window._current_playing_start, window._current_playing_end) == (3.0, 3.5)
+    assert shown == []
+
+    # Moving the playing sample updates the player at its post-sort index
+    playing = segments[0]
+    window._current_playing_index = 0
+    window._current_playing_start, window._current_playing_end = 0.0, 0.5
+    window._on_sample_bounds_changed(0, 2.5, 2.8)
+    assert segments[window._current_playing_index] is playing
+    assert (window._current_playing_start, window._current_playing_end) == (2.5, 2.8)
+    assert shown == [(playing, window._current_playing_index)]
+
+
+def test_created_sample_is_inserted_in_start_order():
+    _ensure_qapp()
+    window = _make_window_with_segments([True, True, True])
+    window._auto_order_action.setChecked(True)
+    segments = window._pipeline_wrapper.current_segments
+    playing = segments[2]
+    window._current_playing_index = 2
+
+    window._on_sample_created(1.5, 1.8)
+
+    assert [seg.start for seg in segments] == [0.0, 1.0, 1.5, 2.0]
+    assert segments[window._current_playing_index] is playing
+
+
+def test_navigator_view_change_updates_each_view_once(monkeypatch):
+    _ensure_qapp()
+    window = _make_window_with_segments([True])
+    window._spectrogram_widget.set_duration(10.0)
+    calls: list[str] = []
+    monkeypatch.setattr(
+        window._navigator, "set_view_range", lambda *_args: calls.append("navigator")
+    )
+    monkeypatch.setattr(
+        window._waveform_widget, "set_view_range", lambda *_args: calls.append("waveform")
+    )
+
+    view = window._spectrogram_widget
+    # The first update of a drag is applied at once, later ones are coalesced
+    window._on_navigator_view_changed(1.0, 3.0)
+    assert calls == ["waveform"]
+    assert (view._start_time, view._end_time) == (1.0, 3.0)
+    window._on_navigator_view_changed(1.5, 3.5)
+    window._on_navigator_view_changed(2.0, 4.0)
+    assert calls == ["waveform"]
+    assert window._navigator_view_timer.isActive()
+
+    window._flush_navigator_view()
+    assert calls == ["waveform", "waveform"]
+    assert (view._start_time, view._end_time) == (2.0, 4.0)
+    assert window._navigator_view_timer.isActive()
+
+    # A quiet interval ends the throttle window without re-applying anything
+    window._flush_navigator_view()
+    assert calls == ["waveform", "waveform"]
+    assert not window._navigator_view_timer.isActive()
+
+    calls.clear()
+    window._on_time_clicked(5.0)
+    assert calls == ["navigator", "waveform"]
+
+
+def test_undecodable_file_is_decoded_once_in_background(monkeypatch, tmp_path):
+    _ensure_qapp()
+    window = _make_window_with_segments([True])
+    source = tmp_path / "song.m4a"
+    source.write_bytes(b"not decodable by libsndfile")
+    window._current_audio_path = source
+    commands: list[list[str]] = []
+    started: list[playback_buffer_module.PlaybackDecodeRunnable] = []
+
+    def fake_run(cmd, **kwargs):
+        commands.append(cmd)
+        assert kwargs["stdout"] is subprocess.DEVNULL
+        assert "text" not in kwargs
+        Path(cmd[-1]).write_bytes(encode_wav(np.ones((44100 * 3, 2), dtype=np.int16), 44100))
+        return SimpleNamespace(returncode=0, stderr=b"")
+
+    monkeypatch.setattr(playback_buffer_module.subprocess, "run", fake_run)
+    monkeypatch.setattr(
+        main_window_module.QThreadPool,
+        "globalInstance",
+        lambda: SimpleNamespace(start=started.append),
+    )
+
+    # Until the whole-file copy is ready, only the requested slice is extracted
+    assert window._render_playback_slice(0.0, 0.5) is not None
+    assert len(started) == 1
+    assert "-ss" in commands[0]
+    assert window._decoded_playback_path() is None
+    assert len(started) == 1
+
+    started[0].run()
+    decoded = window._decoded_playback_path()
+    assert decoded is not None and decoded.exists()
+    assert "-ss" not in commands[1]
+    assert window._render_playback_slice(1.0, 1.5) is not None
+    assert len(commands) == 2
+
+    # Changing the file on disk invalidates the copy
+    source.write_bytes(b"different, longer contents")
+    assert window._decoded_playback_path() is None
+    assert not decoded.exists()
+    assert len(started) == 2
+
+    # A decode finishing for a superseded file is dropped
+    window._discard_decoded_playback_file()
+    started[1].run()
+    assert window._decoded_playback_file is None
+    assert not Path(commands[-1][-1]).exists()
+
+
+def test_empty_slice_of_readable_file_does_not_fall_back_to_ffmpeg(monkeypatch, tmp_path):
+    _ensure_qapp()
+    window = _make_window_with_segments([True])
+    source = tmp_path / "short.wav"
+    sf.write(source, np.zeros((4410, 2), dtype=np.int16), 44100, subtype="PCM_16")
+    window._current_audio_path = source
+
+    def fail_run(cmd, **kwargs):
+        raise AssertionError("FFmpeg should not run for a readable file")
+
+    monkeypatch.setattr(playback_buffer_module.subprocess, "run", fail_run)
+
+    assert window._render_playback_slice(5.0, 5.5) is None
+    assert window._decoded_playback_source is None
+
+
+def test_bulk_enable_change_is_one_undo_step():
+    app = _ensure_qapp()
+    window = _make_window_with_segments([True, True, True])
+
+    window._on_samples_enable_state_requested([0, 1, 2], "disable")
+    app.processEvents()
+
+    assert len(window._undo_stack) == 1
+    assert window._sample_table_model.data(
+        window._sample_table_model.index(0, 2), int(Qt.CheckStateRole)
+    ) == (Qt.Unchecked)
+
+    window._undo()
+    states = [seg.attrs["enabled"] for seg in window._pipeline_wrapper.current_segments]
+    assert states == [True, True, True]
+
+
+def test_navigator_markers_share_detector_palette():
+    window = _make_window_with_segments([True, False, True])
+    window._pipeline_wrapper.current_segments[2].detector = "voice_vad"
+    window._update_navigator_markers()
+
+    nav = window._navigator
+    assert nav._marker_palette[0] == main_window_module._DISABLED_MARKER_COLOR
+    assert window._get_segment_color("voice_vad") in nav._marker_palette
+    assert list(nav._marker_color_ids) == [1, 0, 2]
+
+
+def test_enabled_mask_tracks_segment_version():
+    app = _ensure_qapp()
+    window = _make_window_with_segments([True, False, False, True])
+
+    mask = window._get_enabled_mask()
+    assert mask.tolist() == [True, False, False, True]
+    assert window._get_enabled_mask() is mask
+    assert window._find_next_enabled_sample(0) == 3
+    assert window._find_next_enabled_sample(3) is None
+    enabled = window._get_enabled_segments()
+    assert window._get_enabled_segments() is enabled
+    assert len(enabled) == 2
+
+    window._on_samples_enable_state_requested([1], "enable")
+    assert window._get_enabled_mask().tolist() == [True, True, False, True]
+    assert len(window._get_enabled_segments()) == 3
+    assert window._find_next_enabled_sample(0) == 1
+
+    window.deleteLater()
+    app.processEvents()
+
+
+def test_center_view_on_clamps_to_audio_bounds():
+    app = _ensure_qapp()
+    window = _make_window_with_segments([True])
+    window._spectrogram_widget.set_duration(10.0)
+    window._set_view_range(0.0, 4.0)
+
+    window._on_time_clicked(9.5)
+    view = window._spectrogram_widget.view_state()
+    assert (view.start, view.end) == (6.0, 10.0)
+
+    window._on_center_clicked(0)
+    view = window._spectrogram_widget.view_state()
+    assert (view.start, view.end) == (0.0, 4.0)
+
+    window.deleteLater()
+    app.processEvents()
+
+
+def test_set_view_range_fans_out_the_clamped_range_once(monkeypatch):
+    app = _ensure_qapp()
+    window = _make_window_with_segments([True])
+    window._spectrogram_widget.set_duration(10.0)
+    navigator: list[tuple[float, float]] = []
+    waveform: list[tuple[float, float]] = []
+    editor: list[tuple[float, float]] = []
+    monkeypatch.setattr(
+        window._navigator, "set_view_range", lambda start, end: navigator.append((start, end))
+    )
+    monkeypatch.setattr(
+        window._waveform_widget, "set_view_range", lambda start, end: waveform.append((start, end))
+    )
+    window._spectrogram_widget.view_changed.connect(lambda start, end: editor.append((start, end)))
+
+    window._set_view_range(8.0, 14.0)
+
+    assert navigator == waveform == [(8.0, 10.0)]
+    # Only the main window's echo handler skips the update; other listeners still get it
+    assert editor == [(8.0, 10.0)]
+
+    window.deleteLater()
+    app.processEvents()
+
+
+def test_reorder_refreshes_each_view_once(monkeypatch):
+    app = _ensure_qapp()
+    window = _make_window_with_segments([True, True, True])
+    window._pipeline_wrapper.current_segments.reverse()  # type: ignore[attr-defined]
+    applied: list[int] = []
+    original = window._apply_segments_to_views
+
+    def counting_apply(segments, **kwargs):
+        applied.append(len(segments))
+        original(segments, **kwargs)
+
+    monkeypatch.setattr(window, "_apply_segments_to_views", counting_apply)
+
+    window._on_reorder_samples()
+
+    assert applied == [3]
+    starts = [seg.start for seg in window._pipeline_wrapper.current_segments]  # type: ignore[attr-defined]
+    assert starts == sorted(starts)
+
+    window.deleteLater()
+    app.processEvents()
+
+
+def test_repeated_table_time_edits_share_one_undo_entry():
+    app = _ensure_qapp()
+    window = _make_window_with_segments([True, True])
+
+    for step in range(1, 6):
+        window._on_model_times_edited(0, 0.0, 0.5 + step * 0.1)
+    assert len(window._undo_stack) == 1
+
+    window._on_model_times_edited(1, 1.0, 1.2)
+    assert len(window._undo_stack) == 2
+
+    window._undo()
+    window._undo()
+    assert window._pipeline_wrapper.current_segments[0].end == 0.5
+
+    window.deleteLater()
+    app.processEvents()
@@ -0,0 +1,283 @@
+"""Tests for navigator scrollbar marker mapping."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from PySide6.QtCore import QEvent, QPoint, QPointF, QRect, QSize, Qt
+from PySide6.QtGui import (
+    QColor,
+    QImage,
+    QMouseEvent,
+    QPaintEvent,
+    QResizeEvent,
+    QWheelEvent,
+)
+
+from spectrosampler.gui.navigator_scrollbar import NavigatorScrollbar
+from spectrosampler.gui.spectrogram_tiler import SpectrogramTile
+
+
+def test_marker_pixel_rects_map_clamp_and_cache(qapp):
+    nav = NavigatorScrollbar()
+    nav.set_duration(10.0)
+    nav.set_marker_array(
+        np.array([1.0, 5.0, 9.9]),
+        np.array([2.0, 5.0, 12.0]),
+        np.array([1, 0, 1]),
+        [QColor(120, 120, 120), QColor(255, 0, 0)],
+    )
+
+    rects = nav._marker_pixel_rects(100)
+
+    assert rects == [(10, 10, 1), (50, 1, 0), (99, 1, 1)]
+    assert nav._marker_pixel_rects(100) is rects
+
+    groups = nav._marker_rect_groups(100, 40)
+    assert [(color_id, [r.getRect() for r in rects]) for color_id, rects in groups] == [
+        (1, [(10, 0, 10, 40), (99, 0, 1, 40)]),
+        (0, [(50, 0, 1, 40)]),
+    ]
+    assert nav._marker_rect_groups(100, 40) is groups
+
+    nav._nav_start_time = 5.0
+    # The marker ending at 2 s is outside the window and skipped
+    assert nav._marker_pixel_rects(100) == [(0, 1, 0), (98, 2, 1)]
+    assert nav._marker_rect_groups(100, 40) is not groups
+
+
+def test_marker_pixel_rects_merge_markers_on_the_same_pixels(qapp):
+    nav = NavigatorScrollbar()
+    nav.set_duration(1000.0)
+    starts = np.array([100.0, 100.2, 100.4, 500.0, 100.1])
+    nav.set_marker_array(
+        starts, starts + 1.0, np.array([0, 0, 0, 0, 1]), [QColor(255, 0, 0), QColor(0, 0, 255)]
+    )
+
+    assert nav._marker_pixel_rects(100) == [(10, 1, 0), (50, 1, 0), (10, 1, 1)]
+
+
+def test_set_sample_markers_builds_shared_palette(qapp):
+    nav = NavigatorScrollbar()
+    red = QColor(255, 0, 0)
+    nav.set_sample_markers([(0.0, 1.0, red), (2.0, 3.0, QColor(0, 0, 255)), (4.0, 5.0, red)])
+
+    assert len(nav._marker_palette) == 2
+    np.testing.assert_array_equal(nav._marker_color_ids, [0, 1, 0])
+    np.testing.assert_array_equal(nav._marker_starts, [0.0, 2.0, 4.0])
+
+
+def test_pens_are_reused_across_marker_and_theme_updates(qapp):
+    nav = NavigatorScrollbar()
+    red = QColor(255, 0, 0)
+    nav.set_sample_markers([(0.0, 1.0, red)])
+    pen = nav._marker_pens[0]
+
+    nav.set_sample_markers([(2.0, 3.0, QColor(0, 0, 255)), (4.0, 5.0, QColor(red))])
+    assert nav._marker_pens[1] is pen
+
+    nav.set_theme_colors({"selection_border": QColor(10, 20, 30)})
+    assert nav._view_border_pen.color().rgb() == QColor(10, 20, 30).rgb()
+    assert nav._view_border_pen.width() == 2
+
+
+def _overview_tile(freq_bins: int = 16, frames: int = 100) -> SpectrogramTile:
+    rgba = np.zeros((freq_bins, frames, 4), dtype=np.uint8)
+    rgba[..., 0] = np.arange(frames, dtype=np.uint8)[None, :]
+    rgba[0, :, 1] = 255  # lowest frequency bin
+    rgba[..., 3] = 255
+    spec = np.zeros((freq_bins, frames), dtype=np.float32)
+    return SpectrogramTile(0.0, 10.0, spec, np.arange(freq_bins, dtype=np.float64), 8000, rgba)
+
+
+def test_scaled_overview_is_cached_per_window_and_size(qapp):
+    nav = NavigatorScrollbar()
+    nav.resize(100, 40)
+    nav.set_duration(10.0)
+    nav.set_overview_tile(_overview_tile())
+    nav.grab()
+
+    scaled = nav._scaled_overview_image(nav._overview_image, 50, 20)
+    assert (scaled.width(), scaled.height()) == (50, 20)
+    assert nav._scaled_overview_image(nav._overview_image, 50, 20) is scaled
+
+    nav._nav_start_time = 5.0
+    zoomed = nav._scaled_overview_image(nav._overview_image, 50, 20)
+    assert zoomed is not scaled
+    # Right half of the overview: red channel starts at frame 50
+    assert zoomed.pixelColor(0, 0).red() == 50
+
+    nav.set_overview_tile(_overview_tile())
+    assert nav._scaled_overview is None
+
+
+def test_overview_image_wraps_tile_buffer_and_flips_when_scaling(qapp):
+    nav = NavigatorScrollbar()
+    nav.set_duration(10.0)
+    nav.resize(100, 40)
+    tile = _overview_tile()
+    nav.set_overview_tile(tile)
+    nav.grab()
+
+    # The QImage reads straight from the tile's array
+    assert nav._overview_buffer is tile.rgba
+    tile.rgba[0, 10, 2] = 7
+    assert nav._overview_image.pixelColor(10, 0).blue() == 7
+
+    # Low frequencies end up at the bottom once scaled for display
+    scaled = nav._scaled_overview_image(nav._overview_image, 100, 16)
+    assert scaled.pixelColor(10, 15).green() == 255
+    assert scaled.pixelColor(10, 0).green() == 0
+
+
+def test_scaled_overview_reads_from_smallest_sufficient_level(qapp):
+    nav = NavigatorScrollbar()
+    nav.resize(100, 40)
+    nav.set_duration(10.0)
+    tile = _overview_tile(frames=1000)
+    tile.rgba[:, 500:, 2] = 255  # right half blue
+    nav.set_overview_tile(tile)
+    nav.grab()
+
+    # 1000 px overview into 100 px: levels 1000, 500, 250, 125
+    assert [lod.width() for lod in nav._overview_lods] == [1000, 500, 250, 125]
+    scaled = nav._scaled_overview_image(nav._overview_image, 100, 16)
+    assert scaled.pixelColor(10, 8).blue() == 0
+    assert scaled.pixelColor(90, 8).blue() == 255
+
+    # Zoomed to a tenth of the file the full-resolution level is already small enough
+    nav._nav_start_time, nav._nav_end_time = 4.5, 5.5
+    zoomed = nav._scaled_overview_image(nav._overview_image, 100, 16)
+    assert len(nav._overview_lods) == 4
+    assert zoomed.pixelColor(40, 8).blue() == 0
+    assert zoomed.pixelColor(60, 8).blue() == 255
+
+
+def test_overview_prefers_indexed_magnitude_with_palette(qapp):
+    nav = NavigatorScrollbar()
+    nav.set_duration(10.0)
+    tile = _overview_tile()
+    tile.magnitude = np.zeros((16, 100), dtype=np.uint8)
+    tile.magnitude[0] = 1  # lowest frequency bin
+    tile.palette = [0xFF000000 | (i << 8) for i in range(256)]
+    nav.resize(100, 40)
+    nav.set_overview_tile(tile)
+    nav.grab()
+
+    assert nav._overview_image.format() == QImage.Format.Format_Indexed8
+    assert nav._overview_buffer is tile.magnitude
+
+    scaled = nav._scaled_overview_image(nav._overview_image, 100, 16)
+    assert scaled.pixelColor(10, 15).green() == 1
+    assert scaled.pixelColor(10, 0).green() == 0
+
+
+def test_overview_image_is_built_on_first_visible_paint(qapp, monkeypatch):
+    nav = NavigatorScrollbar()
+    nav.set_duration(10.0)
+    nav.set_overview_tile(_overview_tile())
+    tile = _overview_tile()
+    nav.set_overview_tile(tile)
+    assert nav._overview_image is None
+
+    nav.resize(1, 40)
+    monkeypatch.setattr(
+        nav,
+        "_update_overview_image",
+        lambda: pytest.fail("zero-width paint should not build the image"),
+    )
+    nav.paintEvent(QPaintEvent(nav.rect()))
+    monkeypatch.undo()
+
+    nav.resize(100, 40)
+    nav.grab()
+    assert nav._overview_buffer is tile.rgba
+    assert not nav._overview_dirty
+
+
+def _mouse(kind: QEvent.Type, x: float) -> QMouseEvent:
+    button = Qt.MouseButton.LeftButton if kind != QEvent.Type.MouseMove else Qt.MouseButton.NoButton
+    return QMouseEvent(
+        kind,
+        QPointF(x, 10),
+        QPointF(x, 10),
+        button,
+        Qt.MouseButton.LeftButton,
+        Qt.KeyboardModifier.NoModifier,
+    )
+
+
+def test_view_geometry_is_cached_until_inputs_change(qapp):
+    nav = NavigatorScrollbar()
+    nav.resize(100, 40)
+    nav.set_duration(10.0)
+    nav.set_view_range(2.0, 4.0)
+
+    assert nav._pixels_per_second == 10.0
+    assert (nav._view_x1, nav._view_x2) == (20, 40)
+
+    nav.resize(200, 40)
+    nav.resizeEvent(QResizeEvent(nav.size(), QSize(100, 40)))
+    assert (nav._view_x1, nav._view_x2) == (40, 80)
+
+    nav.wheelEvent(_wheel(0.0, angle_y=120))
+    assert nav._pixels_per_second > 20.0
+
+
+def test_view_range_change_repaints_only_old_and_new_indicator(qapp, monkeypatch):
+    nav = NavigatorScrollbar()
+    nav.resize(100, 40)
+    nav.resizeEvent(QResizeEvent(nav.size(), QSize(0, 0)))
+    nav.set_duration(10.0)
+    nav.set_view_range(2.0, 3.0)
+    dirty: list[QRect] = []
+    monkeypatch.setattr(nav, "update", lambda *args: dirty.append(*args))
+
+    nav.set_view_range(3.0, 4.0)
+
+    assert dirty == [QRect(18, 0, 24, 40)]
+
+
+def test_drag_emits_latest_range_once_per_event_loop_pass(qapp):
+    nav = NavigatorScrollbar()
+    nav.resize(100, 40)
+    nav.set_duration(10.0)
+    nav.set_view_range(2.0, 4.0)
+    emitted: list[tuple[float, float]] = []
+    nav.view_changed.connect(lambda start, end: emitted.append((start, end)))
+
+    nav.mousePressEvent(_mouse(QEvent.Type.MouseButtonPress, 30))
+    for x in (31, 32, 35):
+        nav.mouseMoveEvent(_mouse(QEvent.Type.MouseMove, x))
+    assert emitted == []
+    qapp.processEvents()
+    assert np.allclose(emitted, [(2.5, 4.5)])
+
+    nav.mouseMoveEvent(_mouse(QEvent.Type.MouseMove, 40))
+    nav.mouseReleaseEvent(_mouse(QEvent.Type.MouseButtonRelease, 40))
+    assert np.allclose(emitted, [(2.5, 4.5), (3.0, 5.0)])
+
+
+def _wheel(x: float, angle_y: int = 0, pixel_y: int = 0) -> QWheelEvent:
+    return QWheelEvent(
+        QPointF(x, 10),
+        QPointF(x, 10),
+        QPoint(0, pixel_y),
+        QPoint(0, angle_y),
+        Qt.MouseButton.NoButton,
+        Qt.KeyboardModifier.NoModifier,
+        Qt.ScrollPhase.NoScrollPhase,
+        False,
+    )
+
+
+def test_wheel_zooms_navigator_window_from_angle_or_pixel_delta(qapp):
+    nav = NavigatorScrollbar()
+    nav.resize(100, 40)
+    nav.set_duration(12.0)
+
+    nav.wheelEvent(_wheel(50, angle_y=120))
+    assert np.isclose(nav._nav_end_time - nav._nav_start_time, 10.0)
+
+    nav.wheelEvent(_wheel(50, pixel_y=-3))
+    assert np.isclose(nav._nav_end_time - nav._nav_start_time, 12.0)
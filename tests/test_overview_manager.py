@@ -0,0 +1,94 @@
+"""Tests for background overview generation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+from PySide6.QtCore import QThreadPool
+
+from spectrosampler.gui.overview_manager import OverviewManager, OverviewRunnable
+from spectrosampler.gui.spectrogram_tiler import SpectrogramTile, SpectrogramTiler
+
+
+class _StubTiler(SpectrogramTiler):
+    def __init__(self, tile: SpectrogramTile):
+        super().__init__(nfft=256)
+        self._tile = tile
+
+    def generate_overview(self, audio_path, duration, sample_rate=None, cancel_event=None):
+        return self._tile
+
+
+def _run(tile: SpectrogramTile) -> list[SpectrogramTile]:
+    task = OverviewRunnable(_StubTiler(tile), Path("a.wav"), 1.0)
+    emitted: list[SpectrogramTile] = []
+    task.signals.finished.connect(emitted.append)
+    task.run()
+    return emitted
+
+
+def test_worker_ships_contiguous_uint8_rgba(qapp):
+    rgba = np.arange(6 * 8 * 4, dtype=np.int64).reshape(6, 8, 4)[:, ::2] % 256
+    tile = SpectrogramTile(0.0, 1.0, np.zeros((6, 4)), np.arange(6.0), 8000, rgba=rgba)
+
+    (emitted,) = _run(tile)
+
+    assert emitted.rgba.dtype == np.uint8
+    assert emitted.rgba.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(emitted.rgba, rgba)
+
+
+def test_worker_colormaps_overview_without_rgba(qapp):
+    spec = np.linspace(-80.0, 0.0, 6 * 4).reshape(6, 4)
+    tile = SpectrogramTile(0.0, 1.0, spec, np.arange(6.0), 8000)
+
+    (emitted,) = _run(tile)
+
+    assert emitted.rgba.shape == (6, 4, 4)
+    assert emitted.rgba.dtype == np.uint8
+
+
+def test_manager_runs_on_pool_and_drops_cancelled_results(qapp):
+    spec = np.zeros((6, 4))
+    stale = SpectrogramTile(0.0, 1.0, spec, np.arange(6.0), 8000)
+    current = SpectrogramTile(0.0, 1.0, spec, np.arange(6.0), 8000)
+    manager = OverviewManager()
+    emitted: list[SpectrogramTile] = []
+    manager.finished.connect(emitted.append)
+
+    manager.start_generation(_StubTiler(stale), Path("a.wav"), 1.0)
+    manager.start_generation(_StubTiler(current), Path("b.wav"), 1.0)
+    assert manager.is_generating()
+
+    QThreadPool.globalInstance().waitForDone()
+    qapp.processEvents()
+
+    assert emitted == [current]
+    assert not manager.is_generating()
+
+
+def test_cancel_stops_tiler_mid_generation_without_signals(qapp, tmp_path):
+    path = tmp_path / "noise.wav"
+    sf.write(path, np.zeros(8000 * 40, dtype=np.float32), 8000)
+    tiler = SpectrogramTiler(nfft=256)
+    task = OverviewRunnable(tiler, path, 40.0)
+    emitted: list[object] = []
+    task.signals.finished.connect(emitted.append)
+    task.signals.error.connect(emitted.append)
+
+    blocks = 0
+    original = tiler._batched_spectrogram
+
+    def cancel_after_first_block(*args, **kwargs):
+        nonlocal blocks
+        blocks += 1
+        task.cancel()
+        return original(*args, **kwargs)
+
+    tiler._batched_spectrogram = cancel_after_first_block
+    task.run()
+
+    assert blocks == 1
+    assert emitted == []
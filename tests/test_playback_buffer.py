@@ -0,0 +1,93 @@
+"""Tests for in-memory playback WAV rendering."""
+
+import io
+
+import numpy as np
+import soundfile as sf
+
+from spectrosampler.gui.playback_buffer import (
+    WavSliceCache,
+    can_read_in_process,
+    encode_wav,
+    read_pcm_slice,
+    render_wav_slice,
+    silent_wav,
+)
+
+
+def _write_ramp(path, sample_rate: int = 8000, seconds: float = 1.0) -> np.ndarray:
+    frames = int(sample_rate * seconds)
+    left = np.arange(frames, dtype=np.int16)
+    data = np.stack([left, -left], axis=1)
+    sf.write(path, data, sample_rate, subtype="PCM_16")
+    return data
+
+
+def test_read_pcm_slice_reads_only_requested_frames(tmp_path):
+    path = tmp_path / "ramp.wav"
+    data = _write_ramp(path)
+
+    pcm, sample_rate = read_pcm_slice(path, 0.25, 0.5)
+
+    assert sample_rate == 8000
+    assert pcm.shape == (2000, 2)
+    np.testing.assert_array_equal(pcm, data[2000:4000])
+
+
+def test_encode_wav_roundtrips_through_soundfile():
+    pcm = np.array([[1, -1], [2, -2], [3, -3]], dtype=np.int16)
+
+    decoded, sample_rate = sf.read(io.BytesIO(encode_wav(pcm, 22050)), dtype="int16")
+
+    assert sample_rate == 22050
+    np.testing.assert_array_equal(decoded, pcm)
+
+
+def test_render_wav_slice_clamps_and_handles_unreadable(tmp_path):
+    path = tmp_path / "ramp.wav"
+    _write_ramp(path)
+
+    wav = render_wav_slice(path, 0.9, 5.0)
+    assert wav is not None
+    assert sf.info(io.BytesIO(wav)).frames == 800
+
+    bogus = tmp_path / "not_audio.m4a"
+    bogus.write_bytes(b"not audio")
+    assert render_wav_slice(bogus, 0.0, 1.0) is None
+
+
+def test_silent_wav_encodes_requested_length():
+    decoded, sample_rate = sf.read(io.BytesIO(silent_wav(0.1, sample_rate=8000)), dtype="int16")
+
+    assert sample_rate == 8000
+    assert decoded.shape == (800, 2)
+    assert not decoded.any()
+
+
+def test_wav_slice_cache_is_lru_and_size_bounded(tmp_path):
+    path = tmp_path / "a.wav"
+    cache = WavSliceCache(max_bytes=10)
+
+    cache.put(path, 0.0, 1.0, b"aaaa")
+    cache.put(path, 1.0, 2.0, b"bbbb")
+    assert cache.get(path, 0.0, 1.0) == b"aaaa"
+    cache.put(path, 2.0, 3.0, b"cccc")
+
+    # (1.0, 2.0) was least recently used
+    assert cache.get(path, 1.0, 2.0) is None
+    assert cache.get(path, 0.0, 1.0) == b"aaaa"
+    assert cache.get(path, 0.0, 1.5) is None
+    cache.put(path, 5.0, 6.0, b"x" * 11)
+    assert cache.get(path, 5.0, 6.0) is None
+
+
+def test_can_read_in_process_distinguishes_unreadable_files(tmp_path):
+    readable = tmp_path / "ramp.wav"
+    _write_ramp(readable)
+    unreadable = tmp_path / "song.m4a"
+    unreadable.write_bytes(b"not audio libsndfile understands")
+
+    assert can_read_in_process(readable)
+    assert render_wav_slice(readable, 5.0, 6.0) is None
+    assert not can_read_in_process(unreadable)
+    assert not can_read_in_process(tmp_path / "missing.wav")
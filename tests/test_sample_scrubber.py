@@ -0,0 +1,50 @@
+"""Tests for the export dialog sample scrubber."""
+
+from __future__ import annotations
+
+from spectrosampler.detectors.base import Segment
+from spectrosampler.gui import sample_scrubber
+from spectrosampler.gui.sample_scrubber import SampleScrubber
+
+
+def test_tooltips_are_formatted_once_per_segment_list(qapp):
+    scrubber = SampleScrubber()
+    scrubber.set_segments(
+        [
+            Segment(start=1.0, end=2.5, detector="onset", score=1.0),
+            Segment(start=3.0, end=3.25, detector="", score=1.0),
+        ]
+    )
+
+    first = scrubber._get_sample_tooltip(1)
+    assert first == "Sample 2 of 2\nunknown\n3.000s → 3.250s (0.250s)"
+    assert scrubber._get_sample_tooltip(1) is first
+
+    scrubber.set_segments([Segment(start=0.0, end=1.0, detector="onset", score=1.0)])
+    assert scrubber._get_sample_tooltip(0) == "Sample 1 of 1\nonset\n0.000s → 1.000s (1.000s)"
+    assert scrubber._get_sample_tooltip(1) == "Sample 2 of 1"
+
+
+def test_tooltip_is_shown_once_per_timer_tick(qapp, monkeypatch):
+    scrubber = SampleScrubber()
+    scrubber.set_segments(
+        [Segment(start=float(i), end=i + 0.5, detector="x", score=1.0) for i in range(5)]
+    )
+    shown: list[str] = []
+    monkeypatch.setattr(
+        sample_scrubber.QToolTip, "showText", lambda _pos, text, _widget: shown.append(text)
+    )
+
+    scrubber._is_scrubbing = True
+    for value in (1, 2, 3):
+        scrubber.setValue(value)
+        scrubber._update_tooltip_from_slider_value()
+    assert shown == []
+    assert scrubber._tip_timer.isActive()
+
+    scrubber._tip_timer.timeout.emit()
+    assert shown == [scrubber._get_sample_tooltip(3)]
+
+    scrubber._update_tooltip_from_slider_value()
+    scrubber.cancel_scrubbing()
+    assert not scrubber._tip_timer.isActive()
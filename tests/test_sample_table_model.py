@@ -0,0 +1,128 @@
+"""Tests for SampleTableModel incremental updates."""
+
+from __future__ import annotations
+
+from PySide6.QtCore import QRect, Qt
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtWidgets import QStyleOptionViewItem
+
+from spectrosampler.detectors.base import Segment
+from spectrosampler.gui.sample_table_delegate import SampleTableDelegate
+from spectrosampler.gui.sample_table_model import SampleTableModel
+
+
+def _segments(count: int) -> list[Segment]:
+    return [Segment(float(i), float(i) + 0.5, "test", 1.0, {"enabled": True}) for i in range(count)]
+
+
+def test_set_segments_same_count_emits_only_changed_columns(qapp):
+    model = SampleTableModel()
+    segments = _segments(5)
+    model.set_segments(segments)
+    qapp.processEvents()
+    assert model.columnCount() == 5
+
+    resets: list[bool] = []
+    changed: list[tuple[int, int]] = []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.dataChanged.connect(
+        lambda tl, br, _roles=None: changed.append((tl.column(), br.column()))
+    )
+
+    segments[1].end = 1.75
+    segments[2].attrs["enabled"] = False
+    segments[4].attrs["name"] = "kick"
+    model.set_segments(segments)
+
+    assert resets == []
+    assert changed == [(1, 2), (4, 4)]
+    assert model.data(model.index(4, 1)) == "1.750"
+
+    changed.clear()
+    model.set_segments(segments)
+    assert changed == []
+
+
+def test_set_segments_count_change_resets_model(qapp):
+    model = SampleTableModel()
+    model.set_segments(_segments(3))
+    qapp.processEvents()
+
+    resets: list[bool] = []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.set_segments(_segments(2))
+    qapp.processEvents()
+
+    assert resets == [True]
+    assert model.columnCount() == 2
+
+
+def test_data_answers_only_served_roles(qapp):
+    model = SampleTableModel()
+    model.set_segments(_segments(2))
+    qapp.processEvents()
+
+    start = model.index(3, 1)
+    assert model.data(start, int(Qt.DisplayRole)) == "1.000"
+    assert model.data(start, int(Qt.TextAlignmentRole)) == int(Qt.AlignCenter)
+    assert model.data(start, int(Qt.ToolTipRole)) is None
+    assert model.data(model.index(0, 0), int(Qt.CheckStateRole)) == Qt.Checked
+    assert model.headerData(5, Qt.Vertical) == "Duration"
+
+
+def test_refresh_columns_emits_data_changed_without_edit_signals(qapp):
+    model = SampleTableModel()
+    segments = _segments(4)
+    model.set_segments(segments)
+    qapp.processEvents()
+    changed: list[tuple[int, int]] = []
+    toggled: list[int] = []
+    model.dataChanged.connect(lambda tl, br, *_: changed.append((tl.column(), br.column())))
+    model.enabledToggled.connect(lambda col, _enabled: toggled.append(col))
+
+    segments[1].attrs["enabled"] = False
+    segments[2].attrs["enabled"] = False
+    model.refresh_columns([2, 1, 3])
+
+    assert changed == [(1, 2)]
+    assert toggled == []
+    assert model.data(model.index(0, 1), int(Qt.CheckStateRole)) == Qt.Unchecked
+
+
+def test_set_segments_rebuild_never_emits_edit_signals(qapp):
+    model = SampleTableModel()
+    model.set_segments(_segments(3))
+    qapp.processEvents()
+    edits: list[str] = []
+    model.enabledToggled.connect(lambda *_: edits.append("enabled"))
+    model.timesEdited.connect(lambda *_: edits.append("times"))
+    model.durationEdited.connect(lambda *_: edits.append("duration"))
+
+    segments = _segments(3)
+    segments[0].attrs["enabled"] = False
+    segments[1].end = 9.0
+    model.set_segments(segments)
+    model.set_segments(_segments(200))
+    qapp.processEvents()
+
+    assert edits == []
+    assert model.columnCount() == 200
+
+
+def test_delegate_reuses_rendered_button_cells(qapp):
+    model = SampleTableModel()
+    model.set_segments(_segments(3))
+    qapp.processEvents()
+    delegate = SampleTableDelegate()
+    image = QImage(300, 40, QImage.Format_ARGB32)
+    painter = QPainter(image)
+    try:
+        for column in range(3):
+            option = QStyleOptionViewItem()
+            option.rect = QRect(column * 100, 0, 100, 40)
+            delegate.paint(painter, option, model.index(7, column))
+    finally:
+        painter.end()
+
+    assert len(delegate._cell_pixmaps) == 1
+    assert image.pixelColor(50, 20) == image.pixelColor(150, 20)
@@ -0,0 +1,133 @@
+"""Tests for compact undo/redo segment snapshots."""
+
+from spectrosampler.detectors.base import Segment
+from spectrosampler.gui.segment_snapshot import (
+    SnapshotHistory,
+    capture_snapshot,
+    copy_segments,
+    restore_snapshot,
+    snapshot_matches,
+)
+
+
+def _segments() -> list[Segment]:
+    return [
+        Segment(0.0, 1.0, "voice_vad", 0.5, {"enabled": True, "name": "a"}),
+        Segment(2.0, 3.0, "transient_flux", 0.7, {"enabled": False, "detectors": {"x"}}),
+        Segment(4.0, 5.0, "voice_vad", 0.9),
+    ]
+
+
+def test_snapshot_roundtrip_restores_values():
+    segments = _segments()
+    snapshot = capture_snapshot(segments)
+
+    restored = restore_snapshot(snapshot, [])
+
+    assert restored == segments
+    assert all(a is not b for a, b in zip(restored, segments, strict=True))
+
+
+def test_snapshot_is_isolated_from_later_mutation():
+    segments = _segments()
+    snapshot = capture_snapshot(segments)
+
+    segments[0].start = 0.25
+    segments[0].attrs["name"] = "renamed"
+    segments[1].attrs["detectors"].add("y")
+
+    restored = restore_snapshot(snapshot, segments)
+
+    assert restored[0].start == 0.0
+    assert restored[0].attrs["name"] == "a"
+    assert restored[1].attrs["detectors"] == {"x"}
+    # Untouched rows reuse the existing objects
+    assert restored[2] is segments[2]
+
+
+def test_consecutive_snapshots_share_unchanged_attrs():
+    segments = _segments()
+    first = capture_snapshot(segments)
+    segments[1].end = 3.5
+    second = capture_snapshot(segments, first)
+
+    assert second != first
+    assert all(a is b for a, b in zip(first.attrs, second.attrs, strict=True))
+    assert capture_snapshot(segments, second) == second
+
+
+def test_snapshot_matches_uses_tolerance():
+    segments = _segments()
+    snapshot = capture_snapshot(segments)
+
+    segments[0].start += 1e-9
+    assert snapshot_matches(snapshot, segments)
+
+    segments[1].attrs["enabled"] = True
+    assert not snapshot_matches(snapshot, segments)
+    assert not snapshot_matches(snapshot, segments[:2])
+    assert snapshot_matches(capture_snapshot([]), [])
+
+
+def test_copy_segments_detaches_segments_and_attrs():
+    original = _segments()
+    copied = copy_segments(original)
+
+    assert copied == original
+    copied[0].start = 9.0
+    copied[0].attrs["name"] = "b"
+    copied[1].attrs["detectors"].add("y")
+
+    assert original[0].start == 0.0
+    assert original[0].attrs["name"] == "a"
+    assert original[1].attrs["detectors"] == {"x"}
+
+
+def test_snapshot_history_roundtrips_through_deltas():
+    segments = _segments()
+    history = SnapshotHistory(10)
+    expected = []
+    for edit in (
+        lambda segs: setattr(segs[0], "end", 1.5),
+        lambda segs: segs.append(Segment(6.0, 7.0, "manual", 1.0)),
+        lambda segs: segs.pop(1),
+        lambda segs: segs[0].attrs.update(name="b"),
+    ):
+        snapshot = capture_snapshot(segments, history.peek())
+        history.append(snapshot)
+        expected.append(snapshot)
+        edit(segments)
+
+    assert len(history) == 4
+    while expected:
+        assert history.pop() == expected.pop()
+    assert not history
+    assert history.peek() is None
+
+
+def test_snapshot_history_is_bounded_and_stores_changed_rows_only():
+    segments = [Segment(float(i), float(i) + 0.5, "manual", 1.0) for i in range(100)]
+    history = SnapshotHistory(3)
+    snapshots = []
+    for i in range(5):
+        segments[i].end += 0.1
+        snapshots.append(capture_snapshot(segments, history.peek()))
+        history.append(snapshots[-1])
+
+    assert len(history) == 3
+    assert all(len(delta.indexes) == 1 for delta in history._older)
+    assert [history.pop() for _ in range(3)] == snapshots[:1:-1]
+    assert not history
+
+
+def test_restore_reuses_segments_shifted_by_delete():
+    segments = _segments()
+    snapshot = capture_snapshot(segments)
+    current = [segments[0], segments[2]]
+
+    restored = restore_snapshot(snapshot, current)
+
+    assert restored == segments
+    assert restored[0] is segments[0]
+    assert restored[2] is segments[2]
+    assert restored[1] is not segments[1]
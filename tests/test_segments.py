@@ -1,5 +1,7 @@
 """Tests for segment merge/pad/dedup logic."""
 
+import pickle
+
 from spectrosampler.detectors.base import Segment
 from spectrosampler.pipeline import (
     deduplicate_segments_after_padding,
@@ -24,6 +26,21 @@ def test_segment_overlap():
     assert seg1.overlaps(seg4, gap_ms=600.0)  # 0.5s gap, 0.6s tolerance
 
 
+def test_segment_attrs_never_none():
+    """Test that attrs is always a dict, even when None is passed explicitly."""
+    seg = Segment(start=0.0, end=1.0, detector="test", score=1.0, attrs=None)
+    assert seg.attrs == {}
+    seg.attrs["enabled"] = False
+    assert Segment(start=0.0, end=1.0, detector="test", score=1.0).attrs == {}
+
+
+def test_segment_is_slotted_and_picklable():
+    """Test that segments carry no per-instance __dict__ and survive pickling."""
+    seg = Segment(start=0.5, end=1.5, detector="test", score=0.7, attrs={"enabled": False})
+    assert not hasattr(seg, "__dict__")
+    assert pickle.loads(pickle.dumps(seg, protocol=5)) == seg
+
+
 def test_segment_merge():
     """Test segment merging."""
     seg1 = Segment(start=1.0, end=2.0, detector="test1", score=0.8)
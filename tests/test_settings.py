@@ -2,15 +2,12 @@
 
 import pytest
 
-from spectrosampler.gui.settings import SettingsManager
 from spectrosampler.pipeline_settings import ProcessingSettings
 
 
-def test_detection_max_samples_persistent_and_clamped(tmp_path, monkeypatch):
+def test_detection_max_samples_persistent_and_clamped(new_settings_manager):
     """Max samples should persist between manager instances and stay within 1-10,000."""
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-
-    manager = SettingsManager()
+    manager = new_settings_manager()
     manager.set_detection_max_samples(10_000)
     assert manager.get_detection_max_samples() == 10_000
 
@@ -24,7 +21,7 @@ def test_detection_max_samples_persistent_and_clamped(tmp_path, monkeypatch):
     manager.set_detection_max_samples(5_432)
 
     # A fresh manager should read the persisted value.
-    other_manager = SettingsManager()
+    other_manager = new_settings_manager()
     assert other_manager.get_detection_max_samples() == 5_432
 
 
@@ -34,27 +31,26 @@ def test_processing_settings_validation_defaults_are_valid():
     assert settings.validate() == []
 
 
-def test_processing_settings_validation_detects_duration_order():
-    """Validation should fail when min duration exceeds max duration."""
-    settings = ProcessingSettings(min_dur_ms=5000.0, max_dur_ms=1000.0)
-    issues = settings.validate()
-    assert issues
-    assert any("Minimum duration" in issue.message for issue in issues)
-
-
-def test_processing_settings_validation_detects_filter_bounds():
-    """High-pass filter must be lower than low-pass filter."""
-    settings = ProcessingSettings(hp=5000.0, lp=2000.0)
-    issues = settings.validate()
+@pytest.mark.parametrize(
+    ("kwargs", "needle"),
+    [
+        # Min duration must not exceed max duration
+        ({"min_dur_ms": 5000.0, "max_dur_ms": 1000.0}, "Minimum duration"),
+        # High-pass filter must be lower than low-pass filter
+        ({"hp": 5000.0, "lp": 2000.0}, "High-pass frequency must be lower"),
+    ],
+    ids=["duration_order", "filter_bounds"],
+)
+def test_processing_settings_validation_detects_invalid_values(kwargs, needle):
+    """Validation should report each inconsistent combination of settings."""
+    issues = ProcessingSettings(**kwargs).validate()
     assert issues
-    assert any("High-pass frequency must be lower" in issue.message for issue in issues)
+    assert any(needle in issue.message for issue in issues)
 
 
-def test_detection_settings_round_trip(tmp_path, monkeypatch):
+def test_detection_settings_round_trip(new_settings_manager):
     """Detection settings should persist across manager instances."""
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-
-    manager = SettingsManager()
+    manager = new_settings_manager()
     original = ProcessingSettings(
         mode="voice",
         detection_pre_pad_ms=125.0,
@@ -68,7 +64,7 @@ def test_detection_settings_round_trip(tmp_path, monkeypatch):
     )
     manager.set_detection_settings(original)
 
-    other = SettingsManager()
+    other = new_settings_manager()
     loaded = other.get_detection_settings()
     assert loaded is not None
     assert loaded.mode == "voice"
@@ -115,12 +111,10 @@ def test_project_round_trip_persists_overlap_preferences(tmp_path):
     assert loaded.ui_state.info_table_visible is False
 
 
-def test_export_settings_round_trip(tmp_path, monkeypatch):
+def test_export_settings_round_trip(tmp_path, new_settings_manager):
     """Export settings should persist across manager instances."""
     from spectrosampler.gui.export_models import ExportBatchSettings
 
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-
     batch = ExportBatchSettings(
         formats=["flac", "mp3"],
         sample_rate_hz=48_000,
@@ -139,10 +133,10 @@ def test_export_settings_round_trip(tmp_path, monkeypatch):
         notes="Export notes",
     )
 
-    manager = SettingsManager()
+    manager = new_settings_manager()
     manager.set_export_batch_settings(batch)
 
-    other = SettingsManager()
+    other = new_settings_manager()
     loaded = other.get_export_batch_settings()
     assert loaded.pre_pad_ms == pytest.approx(75.0)
     assert loaded.post_pad_ms == pytest.approx(150.0)
@@ -174,14 +168,50 @@ def test_compute_sample_id_prefers_attrs():
     assert auto_id.startswith("3-0.500000-1.500000")
 
 
-def test_player_auto_play_next_preference_round_trip(tmp_path, monkeypatch):
+def test_player_auto_play_next_preference_round_trip(new_settings_manager):
     """Auto-play-next preference should persist across manager instances."""
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-
-    manager = SettingsManager()
+    manager = new_settings_manager()
     manager.set_player_auto_play_next(False)
     assert manager.get_player_auto_play_next() is False
     manager.set_player_auto_play_next(True)
 
-    other = SettingsManager()
+    other = new_settings_manager()
     assert other.get_player_auto_play_next() is True
+
+
+def test_background_autosave_writes_atomically_and_prunes(tmp_path, monkeypatch):
+    """Dirty timer ticks should write off the GUI thread and keep the newest three."""
+    import os
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import QCoreApplication
+
+    from spectrosampler.gui.autosave import AutoSaveManager
+    from spectrosampler.gui.project import ProjectData
+
+    _app = QCoreApplication.instance() or QCoreApplication([])
+    monkeypatch.setattr(AutoSaveManager, "_get_autosave_directory", lambda _self: tmp_path)
+    manager = AutoSaveManager()
+    collected: list[int] = []
+    manager.set_project_data_callback(
+        lambda: collected.append(1) or ProjectData(audio_path="a.wav")
+    )
+    manager._on_timer_timeout()
+    assert not collected  # Nothing marked dirty yet
+    manager.mark_dirty()
+    for idx in range(4):
+        (tmp_path / f"autosave_2000010{idx}_000000.ssproj").write_text("{}")
+        os.utime(tmp_path / f"autosave_2000010{idx}_000000.ssproj", (idx, idx))
+
+    manager._on_timer_timeout()
+    manager.cleanup_old_autosaves(keep_count=3)
+    assert collected == [1]
+    manager._on_timer_timeout()
+    assert collected == [1]
+
+    remaining = manager.get_autosave_files()
+    assert len(remaining) == 3
+    assert not remaining[0].name.startswith("autosave_2000")
+    assert manager.get_newest_autosaves(1) == remaining[:1]
+    assert "autosave_20000101_000000.ssproj" not in {p.name for p in remaining}
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,431 @@
+"""Tests for SpectrogramTiler spectrogram computation."""
+
+import os
+import threading
+from concurrent.futures import CancelledError
+
+import numpy as np
+import pytest
+import soundfile as sf
+from scipy import signal
+
+from spectrosampler.gui.spectrogram_tiler import TILE_PRIORITY_PREFETCH, SpectrogramTiler
+from spectrosampler.gui.tile_cache import TileCache
+
+
+def test_batched_spectrogram_matches_scipy():
+    tiler = SpectrogramTiler(nfft=512)
+    data = np.random.default_rng(0).standard_normal(20000).astype(np.float32)
+
+    expected_f, expected_t, expected = signal.spectrogram(
+        data, fs=16000, nperseg=1024, noverlap=512, nfft=1024
+    )
+    freqs, times, spec = tiler._batched_spectrogram(data, 16000, 1024, 512)
+
+    np.testing.assert_allclose(freqs, expected_f)
+    np.testing.assert_allclose(times, expected_t)
+    assert spec.shape == expected.shape
+    np.testing.assert_allclose(spec, expected, rtol=1e-3, atol=1e-6 * expected.max())
+
+
+def test_generate_tile_matches_scipy_spectrogram(tmp_path):
+    sr = 8000
+    data = np.random.default_rng(2).standard_normal(sr).astype(np.float32) * 0.1
+    path = tmp_path / "noise.wav"
+    sf.write(path, data, sr, subtype="FLOAT")
+
+    tile = SpectrogramTiler(nfft=256).generate_tile(path, 0.25, 0.75)
+
+    _, _, expected = signal.spectrogram(
+        data[2000:6000], fs=sr, nperseg=256, noverlap=256 - 64, nfft=256
+    )
+    np.testing.assert_allclose(tile.spectrogram, 10 * np.log10(expected + 1e-10), atol=1e-2)
+    assert tile.spectrogram.dtype == np.float32
+
+
+def test_robust_range_estimates_percentiles_within_one_bin():
+    spec = np.random.default_rng(3).normal(-60.0, 15.0, (64, 500)).astype(np.float32)
+    spec[0, :10] = np.nan
+    bin_width = (np.nanmax(spec) - np.nanmin(spec)) / 1024
+
+    lo, hi = SpectrogramTiler._robust_range(spec)
+
+    expected_lo, expected_hi = np.nanpercentile(spec, [5, 95])
+    assert abs(lo - expected_lo) <= bin_width
+    assert abs(hi - expected_hi) <= bin_width
+
+
+def test_to_indices_normalises_between_robust_percentiles():
+    tiler = SpectrogramTiler(nfft=256)
+    spec = np.random.default_rng(4).normal(-60.0, 15.0, (64, 500)).astype(np.float32)
+    spec[0, 0] = np.nan
+
+    indices = tiler._to_indices(spec)
+
+    assert indices.dtype == np.uint8
+    lo, hi = tiler._robust_range(spec)
+    expected = np.rint(np.clip((spec[1] - lo) / (hi - lo), 0.0, 1.0) * 255.0)
+    np.testing.assert_allclose(indices[1], expected, atol=1)
+    assert indices[0, 0] == 0
+    assert indices.min() == 0 and indices.max() == 255
+
+
+def test_db_codes_reserve_zero_for_nan():
+    spec = np.array([np.nan, -np.inf, -300.0, -60.0, np.inf], dtype=np.float32)
+
+    codes = SpectrogramTiler._db_codes(spec)
+
+    assert codes.dtype == np.uint16
+    assert codes.tolist() == [0, 1, 1, (128 - 60) * 64, 65535]
+
+
+def test_stft_window_is_computed_once_per_length(monkeypatch):
+    tiler = SpectrogramTiler(nfft=256)
+    window = tiler._stft_window(512)
+    monkeypatch.setattr(tiler._signal, "get_window", lambda *_a: pytest.fail("recomputed"))
+
+    tiler._batched_spectrogram(np.zeros(2048, dtype=np.float32), 8000, 512, 256)
+
+    assert tiler._stft_window(512) is window
+    assert not window.flags.writeable
+
+
+def test_generate_overview_covers_whole_file(tmp_path):
+    sr = 8000
+    t = np.arange(sr * 3) / sr
+    path = tmp_path / "tone.wav"
+    sf.write(path, (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32), sr)
+
+    tiler = SpectrogramTiler(nfft=256)
+    overview = tiler.generate_overview(path, duration=3.0)
+
+    assert overview.spectrogram.shape[0] == 256 * 4 // 2 + 1
+    # One frame per hop (nfft*4/2) plus the shortened tail frame
+    assert overview.spectrogram.shape[1] >= (sr * 3 - 1024) // 512
+    assert overview.rgba is not None
+    assert overview.spectrogram.dtype == np.float32
+    assert overview.magnitude.dtype == np.uint8
+    assert overview.magnitude.shape == overview.spectrogram.shape
+    assert len(overview.palette) == 256
+    # Indexed colors match the precolored RGBA
+    r, g, b, a = (int(v) for v in overview.rgba[3, 5])
+    assert overview.palette[overview.magnitude[3, 5]] == (a << 24) | (r << 16) | (g << 8) | b
+    assert overview.rgba.shape[:2] == overview.spectrogram.shape
+    peak_bin = int(np.argmax(overview.spectrogram.mean(axis=1)))
+    assert abs(overview.frequencies[peak_bin] - 440) < sr / 1024
+
+
+def test_tile_cache_roundtrip_and_eviction(tmp_path):
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"x")
+    cache = TileCache(tmp_path / "cache", max_bytes=3000)
+
+    key = TileCache.make_key(audio, "overview", 2048)
+    assert key is not None
+    assert key != TileCache.make_key(audio, "overview", 1024)
+    assert cache.get(key) is None
+
+    cache.put(key, {"spectrogram": np.ones((4, 4), dtype=np.float32)})
+    np.testing.assert_array_equal(cache.get(key)["spectrogram"], np.ones((4, 4)))
+
+    for i in range(5):
+        cache.put(f"k{i}", {"data": np.zeros(200, dtype=np.float64)})
+    assert sum(p.stat().st_size for p in (tmp_path / "cache").glob("*.npz")) <= 3000
+    assert cache.get("k4") is not None
+
+
+def test_generate_overview_streams_stereo_as_mono_mix(tmp_path):
+    sr = 8000
+    stereo = np.random.default_rng(5).standard_normal((sr * 40 + 123, 2)).astype(np.float32)
+    stereo *= 0.1
+    sf.write(tmp_path / "stereo.wav", stereo, sr, subtype="FLOAT")
+    sf.write(tmp_path / "mono.wav", stereo.mean(axis=1, dtype=np.float32), sr, subtype="FLOAT")
+    tiler = SpectrogramTiler(nfft=256)
+
+    mixed = tiler.generate_overview(tmp_path / "stereo.wav", 40.0)
+    mono = tiler.generate_overview(tmp_path / "mono.wav", 40.0)
+
+    assert mixed.spectrogram.shape == mono.spectrogram.shape
+    np.testing.assert_allclose(mixed.spectrogram, mono.spectrogram, atol=1e-3)
+
+
+def test_generate_overview_stops_when_cancelled(tmp_path):
+    path = tmp_path / "tone.wav"
+    sf.write(path, np.zeros(8000, dtype=np.float32), 8000)
+    cancel = threading.Event()
+    cancel.set()
+
+    with pytest.raises(CancelledError):
+        SpectrogramTiler(nfft=256).generate_overview(path, 1.0, cancel_event=cancel)
+
+
+def test_generate_overview_uses_disk_cache(tmp_path, monkeypatch):
+    sr = 8000
+    path = tmp_path / "noise.wav"
+    sf.write(path, np.random.default_rng(1).standard_normal(sr * 2).astype(np.float32), sr)
+    cache = TileCache(tmp_path / "cache")
+
+    first = SpectrogramTiler(nfft=256, disk_cache=cache).generate_overview(path, 2.0)
+
+    tiler = SpectrogramTiler(nfft=256, disk_cache=cache)
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("overview should come from the disk cache")
+
+    monkeypatch.setattr(tiler, "_compute_overview", fail)
+    second = tiler.generate_overview(path, 2.0)
+
+    np.testing.assert_array_equal(second.spectrogram, first.spectrogram)
+    np.testing.assert_array_equal(second.rgba, first.rgba)
+    assert second.sample_rate == sr
+    np.testing.assert_array_equal(second.magnitude, first.magnitude)
+    assert second.palette == first.palette
+
+
+def test_generate_tile_uses_disk_cache_across_tilers(tmp_path, monkeypatch):
+    sr = 8000
+    path = tmp_path / "noise.wav"
+    sf.write(path, np.random.default_rng(6).standard_normal(sr * 2).astype(np.float32), sr)
+    cache = TileCache(tmp_path / "cache")
+
+    first = SpectrogramTiler(nfft=256, disk_cache=cache).generate_tile(path, 0.5, 1.5)
+
+    tiler = SpectrogramTiler(nfft=256, disk_cache=cache)
+    monkeypatch.setattr(tiler, "_batched_spectrogram", lambda *_a: pytest.fail("recomputed"))
+    second = tiler.generate_tile(path, 0.5, 1.5)
+
+    np.testing.assert_array_equal(second.spectrogram, first.spectrogram)
+    np.testing.assert_array_equal(second.rgba, first.rgba)
+    assert second.sample_rate == sr
+    assert tiler.generate_tile(path, 0.5, 1.5) is second
+
+
+def test_tile_cache_evicts_least_recently_used(tmp_path):
+    sr = 8000
+    path = tmp_path / "noise.wav"
+    sf.write(path, np.random.default_rng(7).standard_normal(sr).astype(np.float32), sr)
+    tiler = SpectrogramTiler(nfft=256)
+    tiler._max_cache_items = 2
+
+    first = tiler.generate_tile(path, 0.0, 0.25)
+    tiler.generate_tile(path, 0.25, 0.5)
+    assert tiler.generate_tile(path, 0.0, 0.25) is first
+    tiler.generate_tile(path, 0.5, 0.75)
+
+    assert list(tiler._tile_cache) == [
+        tiler._get_cache_key(path, 0.0, 0.25),
+        tiler._get_cache_key(path, 0.5, 0.75),
+    ]
+
+
+def test_tile_cache_removes_temp_file_when_write_fails(tmp_path, monkeypatch):
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"x")
+    cache = TileCache(tmp_path / "cache")
+    key = TileCache.make_key(audio, "overview", 2048)
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    cache.put(key, {"codes": np.zeros(4, dtype=np.uint8)})
+
+    assert list((tmp_path / "cache").iterdir()) == []
+    assert cache.get(key) is None
+
+
+def test_request_tile_prioritises_visible_over_prefetch(tmp_path, monkeypatch):
+    tiler = SpectrogramTiler(nfft=256)
+    tiler._pool.setMaxThreadCount(1)
+    gate = threading.Event()
+    order: list[float] = []
+
+    def fake_generate(_path, start, _end, sample_rate=None):
+        if start == 0.0:
+            gate.wait(5)
+        order.append(start)
+        return start
+
+    monkeypatch.setattr(tiler, "generate_tile", fake_generate)
+    path = tmp_path / "a.wav"
+
+    blocker = tiler.request_tile(path, 0.0, 1.0)
+    prefetch = tiler.request_tile(path, 1.0, 2.0, priority=TILE_PRIORITY_PREFETCH)
+    visible = tiler.request_tile(path, 2.0, 3.0)
+    gate.set()
+
+    assert blocker.result(5) == 0.0
+    assert visible.result(5) == 2.0
+    assert prefetch.result(5) == 1.0
+    assert order == [0.0, 2.0, 1.0]
+
+
+def test_generate_tile_slices_decoded_audio(tmp_path, monkeypatch):
+    sr = 8000
+    data = np.random.default_rng(9).standard_normal((sr * 2, 2)).astype(np.float32) * 0.1
+    path = tmp_path / "stereo.wav"
+    sf.write(path, data, sr, subtype="FLOAT")
+    tiler = SpectrogramTiler(nfft=256)
+
+    first = tiler.generate_tile(path, 0.0, 0.5)
+    tiler._pool.waitForDone()
+    monkeypatch.setattr(sf, "read", lambda *_a, **_k: pytest.fail("re-decoded"))
+    second = tiler.generate_tile(path, 1.0, 1.5)
+
+    tiler._audio_cache.clear()
+    tiler._tile_cache.clear()
+    tiler._max_audio_cache_bytes = 0
+    monkeypatch.undo()
+    np.testing.assert_array_equal(
+        tiler.generate_tile(path, 0.0, 0.5).spectrogram, first.spectrogram
+    )
+    np.testing.assert_array_equal(
+        tiler.generate_tile(path, 1.0, 1.5).spectrogram, second.spectrogram
+    )
+    assert not tiler._audio_cache
+
+
+def test_cold_tile_reads_only_its_frames_and_decodes_in_background(tmp_path, monkeypatch):
+    sr = 8000
+    data = np.random.default_rng(12).standard_normal((sr * 4, 2)).astype(np.float32) * 0.1
+    path = tmp_path / "stereo.wav"
+    sf.write(path, data, sr, subtype="FLOAT")
+    tiler = SpectrogramTiler(nfft=256)
+    reads = []
+    real_read = sf.read
+
+    def tracking_read(*args, **kwargs):
+        reads.append((kwargs.get("start"), kwargs.get("stop")))
+        return real_read(*args, **kwargs)
+
+    monkeypatch.setattr(sf, "read", tracking_read)
+    release = threading.Event()
+    tiler._pool.start(lambda: release.wait(5))
+    tiler._pool.setMaxThreadCount(1)
+
+    # The decode is queued behind the blocked worker, so this tile must read just its frames
+    tiler.generate_tile(path, 1.0, 1.5)
+    assert reads == [(sr, sr + sr // 2)]
+    assert not tiler._audio_cache
+
+    release.set()
+    tiler._pool.waitForDone()
+    decoded = tiler._audio_cache[path][1]
+    np.testing.assert_allclose(decoded, data.mean(axis=1), rtol=1e-6)
+    tiler.generate_tile(path, 2.0, 2.5)
+    assert len(reads) == 1
+
+
+def test_frequency_bounds_are_computed_once_per_configuration(tmp_path):
+    sr = 8000
+    path = tmp_path / "noise.wav"
+    sf.write(path, np.random.default_rng(10).standard_normal(sr).astype(np.float32), sr)
+    tiler = SpectrogramTiler(nfft=256, fmin=500.0, fmax=2000.0)
+
+    first = tiler.generate_tile(path, 0.0, 0.5)
+    second = tiler.generate_tile(path, 0.5, 1.0)
+
+    assert len(tiler._freq_slice_cache) == 1
+    assert second.frequencies is first.frequencies
+    assert first.frequencies[0] >= 500.0 and first.frequencies[-1] <= 2000.0
+    assert first.spectrogram.shape[0] == len(first.frequencies)
+
+    tiler.fmax = 1000.0
+    assert tiler.generate_tile(path, 0.0, 0.5).frequencies[-1] <= 1000.0
+
+
+def test_to_rgba_matches_colormap_lookup():
+    tiler = SpectrogramTiler()
+    spec_db = np.random.default_rng(11).standard_normal((64, 300)).astype(np.float32) * 20 - 60
+
+    rgba = tiler._to_rgba(spec_db)
+
+    np.testing.assert_array_equal(rgba, tiler._colormap[tiler._to_indices(spec_db)])
+    assert rgba.shape == (64, 300, 4) and rgba.flags["C_CONTIGUOUS"]
+
+
+def test_colormapping_reuses_scratch_buffers_but_not_results():
+    tiler = SpectrogramTiler()
+    rng = np.random.default_rng(12)
+    first_db = rng.standard_normal((64, 300)).astype(np.float32)
+    second_db = rng.standard_normal((64, 300)).astype(np.float32)
+
+    first = tiler._to_rgba(first_db)
+    scratch = tiler._scratch.scaled
+    expected_first = first.copy()
+    tiler._to_rgba(second_db)
+
+    assert tiler._scratch.scaled is scratch
+    np.testing.assert_array_equal(first, expected_first)
+
+
+def test_generate_tile_max_pools_time_bins_to_target(tmp_path):
+    sr = 8000
+    path = tmp_path / "noise.wav"
+    sf.write(path, np.random.default_rng(13).standard_normal(sr * 2).astype(np.float32), sr)
+    tiler = SpectrogramTiler(nfft=256)
+    full = tiler.generate_tile(path, 0.0, 2.0)
+
+    tiler.target_time_bins = 40
+    pooled = tiler.generate_tile(path, 0.0, 2.0)
+
+    n_cols = full.spectrogram.shape[1]
+    group = n_cols // 40
+    assert pooled.spectrogram.shape == (full.spectrogram.shape[0], -(-n_cols // group))
+    np.testing.assert_array_equal(pooled.spectrogram[:, 0], full.spectrogram[:, :group].max(axis=1))
+    np.testing.assert_array_equal(
+        pooled.spectrogram[:, -1],
+        full.spectrogram[:, (pooled.spectrogram.shape[1] - 1) * group :].max(axis=1),
+    )
+    assert pooled.rgba.shape[:2] == pooled.spectrogram.shape
+
+
+def test_prefetch_neighbors_generates_missing_tiles_in_one_task(tmp_path, monkeypatch):
+    sr = 8000
+    path = tmp_path / "noise.wav"
+    sf.write(path, np.random.default_rng(15).standard_normal(sr * 3).astype(np.float32), sr)
+    tiler = SpectrogramTiler(nfft=256)
+    tiler.generate_tile(path, 0.0, 1.0)
+    started: list[int] = []
+    start = tiler._pool.start
+    monkeypatch.setattr(tiler._pool, "start", lambda *a: (started.append(a[1]), start(*a)))
+
+    tiler.prefetch_neighbors(path, 1.0, 2.0)
+    tiler._pool.waitForDone(5000)
+
+    assert started == [TILE_PRIORITY_PREFETCH]
+    assert tiler._get_cache_key(path, 2.0, 3.0) in tiler._tile_cache
+
+    tiler.prefetch_neighbors(path, 1.0, 2.0)
+    assert started == [TILE_PRIORITY_PREFETCH]
+
+
+def test_tiles_share_one_read_only_frequency_array(tmp_path):
+    sr = 8000
+    path = tmp_path / "noise.wav"
+    sf.write(path, np.random.default_rng(16).standard_normal(sr).astype(np.float32), sr)
+    cache = TileCache(tmp_path / "cache")
+    tiler = SpectrogramTiler(nfft=256, disk_cache=cache)
+
+    first = tiler.generate_tile(path, 0.0, 0.5)
+    second = tiler.generate_tile(path, 0.5, 1.0)
+    tiler.clear_cache()
+    from_disk = tiler.generate_tile(path, 0.0, 0.5)
+
+    assert second.frequencies is first.frequencies
+    assert from_disk.frequencies is first.frequencies
+    assert not first.frequencies.flags.writeable
+    np.testing.assert_allclose(first.frequencies, np.fft.rfftfreq(256, 1.0 / sr))
+
+
+def test_file_info_is_revalidated_by_nanosecond_mtime(tmp_path):
+    path = tmp_path / "noise.wav"
+    sf.write(path, np.zeros(800, dtype=np.float32), 8000)
+    tiler = SpectrogramTiler()
+
+    info = tiler._get_file_info(path)
+    assert tiler._get_file_info(path) is info
+
+    sf.write(path, np.zeros(1600, dtype=np.float32), 8000)
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+    assert tiler._get_file_info(path).frames == 1600
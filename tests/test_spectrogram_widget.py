@@ -3,74 +3,92 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
+import numpy as np
 import pytest
+import soundfile as sf
+from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QApplication
 
 from spectrosampler.detectors.base import Segment
+from spectrosampler.gui.spectrogram_tiler import SpectrogramTiler
 from spectrosampler.gui.spectrogram_widget import SpectrogramWidget
+from spectrosampler.gui.tile_cache import TileCache
 
 pytestmark = [
     pytest.mark.filterwarnings("ignore:Attempting to set identical low and high xlims"),
 ]
 
+# Segment layouts shared by the selection tests; none of them modify the segments
+_FIT_SEGMENTS = (
+    Segment(start=5.0, end=10.0, detector="vad", score=0.9),
+    Segment(start=14.0, end=20.0, detector="vad", score=0.5),
+)
+_SELECTION_SEGMENTS = (
+    Segment(start=0.0, end=2.0, detector="a", score=0.5),
+    Segment(start=2.5, end=5.0, detector="b", score=0.6),
+    Segment(start=6.0, end=8.0, detector="c", score=0.7),
+)
+_ANCHOR_SEGMENTS = tuple(
+    Segment(start=idx * 2.0, end=(idx + 1) * 2.0 - 0.1, detector="t", score=0.5) for idx in range(5)
+)
+_CTRL_SHIFT_SEGMENTS = tuple(
+    Segment(start=float(i * 2), end=float(i * 2 + 1), detector="t", score=0.5) for i in range(8)
+)
 
-def _ensure_qapp() -> QApplication:
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
 
+class _NoRedrawWidget(SpectrogramWidget):
+    """Spectrogram widget that counts redraw requests instead of drawing with matplotlib."""
 
-def test_set_playback_state_throttles_updates(monkeypatch):
-    """set_playback_state should avoid redundant redraws and clamp to duration."""
-    app = _ensure_qapp()
-    widget = SpectrogramWidget()
-    widget.set_duration(5.0)
-
-    call_count = {"value": 0}
+    def __init__(self) -> None:
+        self.overlay_updates = 0
+        super().__init__()
 
-    def fake_update() -> None:
-        call_count["value"] += 1
+    def _update_display(self) -> None:
+        pass
 
-    monkeypatch.setattr(widget, "_update_overlays_only", fake_update)
+    def _update_overlays_only(self) -> None:
+        self.overlay_updates += 1
 
-    widget.set_playback_state(0, 1.0, paused=False)
-    assert call_count["value"] == 1
 
-    # Difference within tolerance should not trigger another draw.
-    widget.set_playback_state(0, 1.00001, paused=False)
-    assert call_count["value"] == 1
+@pytest.fixture
+def widget(qapp: QApplication) -> Iterator[_NoRedrawWidget]:
+    """Yield a fresh non-drawing spectrogram widget, scheduled for deletion after the test."""
+    spectrogram = _NoRedrawWidget()
+    yield spectrogram
+    spectrogram.deleteLater()
 
-    widget.set_playback_state(0, 2.0, paused=False)
-    assert call_count["value"] == 2
 
-    # Values beyond duration should clamp and still trigger.
-    widget.set_playback_state(0, 10.0, paused=False)
-    assert call_count["value"] == 3
-
-    # Clearing indicator triggers update.
-    widget.set_playback_state(None, None)
-    assert call_count["value"] == 4
-
-    widget.deleteLater()
-    app.processEvents()
+def test_set_playback_state_throttles_updates(widget):
+    """set_playback_state should avoid redundant redraws and clamp to duration."""
+    widget.set_duration(5.0)
+    widget.overlay_updates = 0
+
+    # ((segment index, playback time), expected redraw count afterwards), while playing
+    cases = [
+        ((0, 1.0), 1),
+        # Difference within tolerance should not trigger another draw.
+        ((0, 1.00001), 1),
+        ((0, 2.0), 2),
+        # Values beyond duration should clamp and still trigger.
+        ((0, 10.0), 3),
+        # Clearing indicator triggers update.
+        ((None, None), 4),
+    ]
+    for args, expected in cases:
+        widget.set_playback_state(*args)
+        assert widget.overlay_updates == expected, args
 
 
-def test_fit_selection_frames_current_segment():
+def test_fit_selection_frames_current_segment(widget):
     """fit_selection should zoom to the selected segment range with margin."""
 
-    app = _ensure_qapp()
-    widget = SpectrogramWidget()
     widget.set_duration(30.0)
 
-    segments = [
-        Segment(start=5.0, end=10.0, detector="vad", score=0.9),
-        Segment(start=14.0, end=20.0, detector="vad", score=0.5),
-    ]
-    widget.set_segments(segments)
+    widget.set_segments(list(_FIT_SEGMENTS))
     widget.set_selected_index(0)
 
     assert widget.fit_selection()
@@ -82,23 +100,13 @@ def test_fit_selection_frames_current_segment():
     assert widget._start_time <= 5.0
     assert widget._end_time >= 20.0
 
-    widget.deleteLater()
-    app.processEvents()
 
-
-def test_set_selected_indexes_emits_and_filters():
+def test_set_selected_indexes_emits_and_filters(widget):
     """set_selected_indexes should emit selection_changed with sanitized indexes."""
 
-    app = _ensure_qapp()
-    widget = SpectrogramWidget()
     widget.set_duration(15.0)
 
-    segments = [
-        Segment(start=0.0, end=2.0, detector="a", score=0.5),
-        Segment(start=2.5, end=5.0, detector="b", score=0.6),
-        Segment(start=6.0, end=8.0, detector="c", score=0.7),
-    ]
-    widget.set_segments(segments)
+    widget.set_segments(list(_SELECTION_SEGMENTS))
 
     selection_events: list[list[int]] = []
     active_events: list[int] = []
@@ -114,22 +122,13 @@ def test_set_selected_indexes_emits_and_filters():
     widget.set_selected_indexes([])
     assert selection_events[-1] == []
 
-    widget.deleteLater()
-    app.processEvents()
-
 
-def test_selection_anchor_tracks_latest_active():
+def test_selection_anchor_tracks_latest_active(widget):
     """Anchor should follow the latest selected sample for subsequent shift operations."""
 
-    app = _ensure_qapp()
-    widget = SpectrogramWidget()
     widget.set_duration(20.0)
 
-    segments = [
-        Segment(start=idx * 2.0, end=(idx + 1) * 2.0 - 0.1, detector="t", score=0.5)
-        for idx in range(5)
-    ]
-    widget.set_segments(segments)
+    widget.set_segments(list(_ANCHOR_SEGMENTS))
 
     widget.set_selected_indexes([1])
     assert widget._selection_anchor == 1
@@ -143,21 +142,13 @@ def test_selection_anchor_tracks_latest_active():
     widget.set_selected_indexes([])
     assert widget._selection_anchor is None
 
-    widget.deleteLater()
-    app.processEvents()
-
 
-def test_ctrl_shift_sequence_uses_latest_anchor():
+def test_ctrl_shift_sequence_uses_latest_anchor(widget):
     """Ctrl/Shift selection should extend from the most recently focused sample."""
 
-    app = _ensure_qapp()
-    widget = SpectrogramWidget()
     widget.set_duration(30.0)
 
-    segments = [
-        Segment(start=float(i * 2), end=float(i * 2 + 1), detector="t", score=0.5) for i in range(8)
-    ]
-    widget.set_segments(segments)
+    widget.set_segments(list(_CTRL_SHIFT_SEGMENTS))
 
     widget.handle_selection_click(1, ctrl=False, shift=False)
     widget.handle_selection_click(6, ctrl=True, shift=False)
@@ -168,5 +159,77 @@ def test_ctrl_shift_sequence_uses_latest_anchor():
     assert widget._selection_anchor == 5
     assert widget._selected_index == 5
 
-    widget.deleteLater()
-    app.processEvents()
+
+def test_segment_range_query_matches_linear_scan(widget):
+    segments = [
+        Segment(start=5.0, end=6.0, detector="a", score=1.0),
+        Segment(start=0.0, end=9.0, detector="a", score=1.0),
+        Segment(start=2.0, end=2.5, detector="a", score=1.0),
+        Segment(start=7.0, end=8.0, detector="a", score=1.0),
+    ]
+    segments[3].attrs["enabled"] = False
+    widget.set_segments(segments)
+    assert widget._segment_enabled.tolist() == [True, True, True, False]
+
+    for t0, t1 in [(0.0, 1.0), (2.2, 2.3), (6.5, 6.9), (9.5, 10.0), (0.0, 10.0)]:
+        expected = [i for i, s in enumerate(segments) if s.end >= t0 and s.start <= t1]
+        assert widget._segment_indexes_in_range(t0, t1) == expected
+
+    assert widget._find_segment_at_time(5.5) == 0
+    assert widget._find_segment_at_time(9.5) is None
+
+    # In-place drag preview of the selected segment is still found
+    widget._selected_index = 2
+    segments[2].start, segments[2].end = 9.2, 9.8
+    assert widget._find_segment_at_time(9.5) == 2
+
+
+def test_view_state_reflects_time_range_and_zoom(widget):
+    widget.set_duration(10.0)
+    widget.set_time_range(2.0, 5.0)
+    widget.set_zoom_level(4.0)
+
+    view = widget.view_state()
+
+    assert (view.start, view.end, view.duration, view.zoom) == (2.0, 5.0, 10.0, 4.0)
+    assert view.span == 3.0
+
+
+def test_segment_color_names_cached_until_theme_changes(widget):
+
+    assert widget._get_segment_color("voice_vad") == "#00ffaa"
+    assert widget._get_segment_color("unknown") == "#FFFFFF"
+    cached = widget._segment_color_names
+    widget._get_segment_color("transient_flux")
+    assert widget._segment_color_names is cached
+
+    widget.set_theme_colors({"marker_voice": QColor(0x12, 0x34, 0x56)})
+    assert widget._get_segment_color("voice_vad") == "#123456"
+
+
+def test_view_tiles_are_reused_from_disk_after_reopen(qapp, tmp_path, monkeypatch):
+    sr = 8000
+    path = tmp_path / "noise.wav"
+    sf.write(path, np.random.default_rng(3).standard_normal(sr * 2).astype(np.float32), sr)
+    cache = TileCache(tmp_path / "tiles")
+
+    def open_view() -> SpectrogramWidget:
+        view = SpectrogramWidget(tile_cache=cache)
+        view.set_duration(2.0)
+        view.set_time_range(0.5, 1.5)
+        view.set_audio_path(path)
+        view.preload_current_view()
+        return view
+
+    first = open_view()
+    expected = first._current_tile.spectrogram
+    first.deleteLater()
+
+    monkeypatch.setattr(
+        SpectrogramTiler,
+        "_batched_spectrogram",
+        lambda *_a, **_k: pytest.fail("tile recomputed instead of read from disk"),
+    )
+    second = open_view()
+    np.testing.assert_array_equal(second._current_tile.spectrogram, expected)
+    second.deleteLater()
@@ -0,0 +1,39 @@
+"""Tests for shared UI helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from PySide6.QtGui import QPixmap, QPixmapCache
+
+from spectrosampler.gui import ui_utils
+from spectrosampler.gui.ui_utils import load_svg_icon
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+
+
+def test_load_svg_icon_shares_cached_pixmaps(qapp, monkeypatch):
+    QPixmapCache.clear()
+
+    icon = load_svg_icon(ASSETS_DIR / "x.svg", 24)
+    assert not icon.isNull()
+    assert QPixmapCache.find(f"spectrosampler/{ASSETS_DIR / 'x.svg'}@24", QPixmap())
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("cached icon should not be re-rendered")
+
+    monkeypatch.setattr(ui_utils, "QSvgRenderer", fail)
+    assert not load_svg_icon(ASSETS_DIR / "x.svg", 24).isNull()
+    assert load_svg_icon(ASSETS_DIR / "missing.svg", 24).isNull()
+
+
+def test_load_svg_icon_prefers_shipped_png(qapp, monkeypatch):
+    QPixmapCache.clear()
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("pre-rendered icons should not parse the SVG")
+
+    monkeypatch.setattr(ui_utils, "QSvgRenderer", fail)
+    icon = load_svg_icon(ASSETS_DIR / "stop.svg", 32)
+
+    assert icon.availableSizes()[0].width() == 32
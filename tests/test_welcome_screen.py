@@ -0,0 +1,146 @@
+"""Tests for the welcome screen."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+from PySide6.QtCore import Qt, qInstallMessageHandler
+from PySide6.QtTest import QAbstractItemModelTester
+
+from spectrosampler.gui.settings import SettingsManager
+from spectrosampler.gui.welcome_screen import RecentFilesModel, WelcomeScreen
+
+
+def test_theme_comes_from_one_application_stylesheet(qapp, monkeypatch):
+    screen = WelcomeScreen()
+    screen.show()
+
+    assert screen.styleSheet() == ""
+    assert "WelcomeScreen QListView" in qapp.styleSheet()
+    assert qapp.styleSheet() == screen._theme_manager.get_stylesheet()
+
+    installs: list[str] = []
+    monkeypatch.setattr(qapp, "setStyleSheet", installs.append)
+    WelcomeScreen().show()
+    assert installs == []
+
+
+def test_recent_lists_are_backed_by_a_model(qapp):
+    screen = WelcomeScreen()
+    screen.show()
+    project = Path("/music/field/dawn chorus.ssproj")
+    clicked: list[Path] = []
+    screen.recent_project_clicked.connect(clicked.append)
+
+    view = screen._recent_projects_list
+    assert view.uniformItemSizes() and view.layoutMode() == view.LayoutMode.Batched
+
+    screen.update_recent_projects([])
+    model = view.model()
+    assert model.rowCount() == 1
+    assert model.index(0).data() == "No recent projects"
+    assert model.flags(model.index(0)) == Qt.ItemFlag.NoItemFlags
+
+    screen.update_recent_projects([(project, datetime(2024, 5, 1, 6, 30))])
+    index = model.index(0)
+    assert model.rowCount() == 1
+    assert index.data() == "dawn chorus (2024-05-01 06:30)"
+    assert index.data(Qt.ItemDataRole.ToolTipRole) == str(project)
+    assert model.flags(index) & Qt.ItemFlag.ItemIsSelectable
+
+    screen._recent_projects_list.doubleClicked.emit(index)
+    assert clicked == [project]
+
+
+def test_recent_files_model_updates_only_changed_rows(qapp):
+    model = RecentFilesModel("name", "No recent audio files")
+    t0, t1 = datetime(2024, 1, 1), datetime(2024, 1, 2)
+    a, b, c, d = (Path(f"/audio/{name}.wav") for name in "abcd")
+    model.set_entries([(a, t0), (b, t0), (c, t0)])
+    events: list[tuple] = []
+    model.modelReset.connect(lambda: events.append(("reset",)))
+    model.rowsRemoved.connect(lambda _p, first, last: events.append(("removed", first, last)))
+    model.rowsInserted.connect(lambda _p, first, last: events.append(("inserted", first, last)))
+    model.dataChanged.connect(lambda tl, br, *_: events.append(("changed", tl.row(), br.row())))
+
+    model.set_entries([(a, t0), (b, t0), (c, t0)])
+    assert events == []
+
+    # Reopening b moves it to the top with a new timestamp
+    model.set_entries([(b, t1), (a, t0), (c, t0)])
+    assert events == [("removed", 0, 1), ("inserted", 0, 1)]
+    assert [model.index(row).data(Qt.ItemDataRole.UserRole) for row in range(3)] == [b, a, c]
+
+    events.clear()
+    model.set_entries([(d, t1), (b, t1), (a, t0), (c, t1)])
+    assert events == [("inserted", 0, 0), ("changed", 3, 3)]
+    assert model.index(3).data() == "c.wav (2024-01-02 00:00)"
+
+    events.clear()
+    model.set_entries([])
+    assert events == [("reset",)] and model.rowCount() == 1
+
+
+def test_recent_files_model_satisfies_model_tester(qapp):
+    failures: list[str] = []
+    previous_handler = qInstallMessageHandler(lambda _mode, _ctx, message: failures.append(message))
+    try:
+        model = RecentFilesModel("name", "No recent audio files")
+        tester = QAbstractItemModelTester(
+            model, QAbstractItemModelTester.FailureReportingMode.Warning
+        )
+        t0 = datetime(2024, 1, 1)
+        a, b, c, d = (Path(f"/audio/{name}.wav") for name in "abcd")
+        model.set_entries([(a, t0), (b, t0), (c, t0)])
+        # Reopening the last file moves it to the top, so every row changes
+        model.set_entries([(c, t0), (a, t0), (b, t0)])
+        model.set_entries([(d, t0), (c, t0), (a, t0)])
+        model.set_entries([])
+        del tester
+    finally:
+        qInstallMessageHandler(previous_handler)
+
+    assert failures == []
+
+
+def test_ui_and_recent_files_are_loaded_on_first_show(qapp, monkeypatch):
+    screen = WelcomeScreen()
+    reads: list[str] = []
+    manager = screen._settings_manager
+    monkeypatch.setattr(manager, "get_recent_projects", lambda **_k: reads.append("p") or [])
+    monkeypatch.setattr(manager, "get_recent_audio_files", lambda **_k: reads.append("a") or [])
+
+    assert not hasattr(screen, "_recent_projects_list") and reads == []
+
+    screen.show()
+    screen.hide()
+    screen.show()
+
+    assert reads == ["p", "a"]
+    assert screen._recent_audio_list.model().index(0).data() == "No recent audio files"
+
+
+def test_recent_file_text_is_formatted_once_per_entry(qapp, monkeypatch):
+    model = RecentFilesModel("stem", "No recent projects")
+    calls: list[datetime] = []
+    format_timestamp = SettingsManager.format_recent_timestamp
+
+    def record(timestamp: datetime) -> str:
+        calls.append(timestamp)
+        return format_timestamp(timestamp)
+
+    monkeypatch.setattr(SettingsManager, "format_recent_timestamp", staticmethod(record))
+    first = (Path("/p/first.ssproj"), datetime(2024, 3, 1, 9, 5))
+    second = (Path("/p/second.ssproj"), datetime(2024, 3, 2, 9, 5))
+
+    model.set_entries([first])
+    model.set_entries([second, first])
+    for _ in range(3):
+        texts = [model.index(row).data() for row in range(2)]
+    tooltip = model.index(0).data(Qt.ItemDataRole.ToolTipRole)
+
+    assert texts == ["second (2024-03-02 09:05)", "first (2024-03-01 09:05)"]
+    assert tooltip == str(second[0])
+    assert calls == [first[1], second[1]]
+    assert SettingsManager.format_recent_timestamp(first[1]) == "2024-03-01 09:05"